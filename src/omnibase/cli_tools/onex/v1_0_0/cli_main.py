@@ -9,11 +9,11 @@
 # uuid: 753581a3-5600-4e60-a622-d3b5c21913bc
 # author: OmniNode Team
 # created_at: 2025-05-21T12:41:40.168780
-# last_modified_at: 2025-05-21T16:42:46.079751
+# last_modified_at: 2026-10-17T01:05:03.342381
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 4bd53e6134847b022a536e4a9a6847b42e8e2390bbe1480c611a2169719b470c
+# hash: 16842dfb75db6ac51be18fb4ef8f703d8b58bfa89257adfac01f0541da91147c
 # entrypoint: python@cli_main.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.cli_main
@@ -24,6 +24,8 @@
 import json
 import logging
 import sys
+from pathlib import Path
+from typing import Optional
 
 import typer
 
@@ -335,5 +337,50 @@ def node_info(
                 pass  # Silently ignore introspection errors
 
 
+@app.command()
+def serve(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on (default: per-user, per-project path in the temp dir)",
+    ),
+    stdio: bool = typer.Option(
+        False, "--stdio", help="Serve JSON-lines RPC on stdin/stdout instead"
+    ),
+    idle_timeout: float = typer.Option(
+        0.0, "--idle-timeout", help="Exit after this many idle seconds (0 = never)"
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Use the persistent stamp cache (.onex_cache/stamp.sqlite)",
+    ),
+) -> None:
+    """
+    Run a long-lived stamping server (stamp_file, verify, extract_block over JSON-lines RPC).
+    """
+    from omnibase.core.error_codes import OnexError
+    from omnibase.nodes.stamper_node.v1_0_0.cli_stamp import get_engine_from_env_or_flag
+    from omnibase.nodes.stamper_node.v1_0_0.helpers.stamp_client import (
+        default_socket_path,
+    )
+    from omnibase.nodes.stamper_node.v1_0_0.helpers.stamp_server import StampServer
+    from omnibase.nodes.stamper_node.v1_0_0.helpers.stamper_engine import StamperEngine
+
+    engine = get_engine_from_env_or_flag(use_cache=cache)
+    if not isinstance(engine, StamperEngine):
+        typer.echo("❌ onex serve requires the real stamper engine", err=True)
+        raise typer.Exit(1)
+    server = StampServer(engine, idle_timeout=idle_timeout or None)
+    if stdio:
+        server.serve_stdio(sys.stdin, sys.stdout)
+        return
+    try:
+        server.serve_unix(socket_path or default_socket_path())
+    except OnexError as e:
+        typer.echo(f"❌ {e.message}", err=True)
+        raise typer.Exit(1)
+
+
 if __name__ == "__main__":
     app()
@@ -9,11 +9,11 @@
 # uuid: 1e408f6b-1dcb-4311-931e-a3373c612d48
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.907897
-# last_modified_at: 2025-05-22T20:50:39.715979
+# last_modified_at: 2026-10-17T01:05:03.353901
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 5aae51d8783fb88c14d747c71ddc9a880b3a4a920cb1b120ee57044b6c23dd3f
+# hash: c1eb5600d000b6412f33ac603a9e061c9547493bedcc5c999078a86e7e6c54ea
 # entrypoint: python@test_cli_stamp_real_directory.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.test_cli_stamp_real_directory
@@ -21,6 +21,7 @@
 # === /OmniNode:Metadata ===
 
 
+import json
 from pathlib import Path
 from typing import Any
 
@@ -90,6 +91,34 @@ def test_cli_directory_command_integration(cli_stamp_dir_fixture: Any) -> None:
     assert "processed" in result.stdout
 
 
+def test_cli_directory_command_ndjson_streams_per_file(tmp_path: Path) -> None:
+    (tmp_path / "a.yaml").write_text("key: a\n")
+    (tmp_path / "b.yaml").write_text("key: b\n")
+    (tmp_path / ".onexignore").write_text("stamper:\n  patterns: []\n")
+    runner = CliRunner()
+    app = NODE_CLI_REGISTRY["stamper_node@v1_0_0"]
+    result = runner.invoke(
+        app,
+        [
+            "directory",
+            str(tmp_path),
+            "--write",
+            "--ignore-file",
+            str(tmp_path / ".onexignore"),
+            "--format",
+            "ndjson",
+        ],
+    )
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [Path(r["target"]).name for r in records] == [
+        "a.yaml",
+        "b.yaml",
+        tmp_path.name,
+    ]
+    assert records[-1]["metadata"]["processed"] == 2
+
+
 def test_cli_stamp_real_directory_with_ignore_file(tmp_path: Path) -> None:
     # Implementation of the function
     return
@@ -9,11 +9,11 @@
 # uuid: d082a39b-579f-4827-afe3-5733ccdea23d
 # author: OmniNode Team
 # created_at: 2025-05-22T12:17:04.372004
-# last_modified_at: 2025-05-22T20:50:39.720224
+# last_modified_at: 2026-10-17T01:05:03.357595
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: ce3ca9d1def0015af16b6aa36207bc43861091a9aacc5f0c1af67417d6d739a5
+# hash: 2bd940f6028b23686efa5b2da1e773a73903e559ca4189350c9a50d9a3ef1102
 # entrypoint: python@core_file_type_handler_registry.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.core_file_type_handler_registry
@@ -23,7 +23,7 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 try:
     from importlib.metadata import entry_points
@@ -234,6 +234,40 @@ class FileTypeHandlerRegistry:
             self._unhandled_specials.add(path.name.lower())
         return None
 
+    def group_by_handler(
+        self, paths: Iterable[Path]
+    ) -> Tuple[List[Tuple[ProtocolFileTypeHandler, List[Path]]], List[Path]]:
+        """
+        Batch form of get_handler: (handler, paths) groups in the order each
+        handler is first seen, and the paths no handler is registered for.
+        Each path costs one lower-casing and at most two table lookups.
+        """
+        specials = self._special_handlers
+        extensions = self._extension_handlers
+        groups: Dict[int, Tuple[ProtocolFileTypeHandler, List[Path]]] = {}
+        unhandled: List[Path] = []
+        for path in paths:
+            name = path.name.lower()
+            reg = specials.get(name)
+            ext = ""
+            if reg is None:
+                # Same as Path.suffix: a leading or trailing dot is not a suffix
+                i = name.rfind(".")
+                ext = name[i:] if 0 < i < len(name) - 1 else ""
+                reg = extensions.get(ext)
+            if reg is None:
+                if ext:
+                    self._unhandled_extensions.add(ext)
+                else:
+                    self._unhandled_specials.add(name)
+                unhandled.append(path)
+                continue
+            group = groups.get(id(reg.handler))
+            if group is None:
+                group = groups[id(reg.handler)] = (reg.handler, [])
+            group[1].append(path)
+        return list(groups.values()), unhandled
+
     def get_named_handler(self, name: str) -> Optional[ProtocolFileTypeHandler]:
         """Get a handler by name."""
         registration = self._named_handlers.get(name)
@@ -513,7 +547,7 @@ class FileTypeHandlerRegistry:
         """
         import os
 
-        import yaml
+        from omnibase.utils.yaml_backend import yaml_safe_load
 
         # Default configuration file locations
         default_paths = [
@@ -531,7 +565,7 @@ class FileTypeHandlerRegistry:
             if os.path.exists(path):
                 try:
                     with open(path, "r") as f:
-                        config = yaml.safe_load(f)
+                        config = yaml_safe_load(f)
 
                     handlers = config.get("handlers", {})
                     for name, handler_config in handlers.items():
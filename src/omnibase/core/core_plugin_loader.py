@@ -9,11 +9,11 @@
 # uuid: 1f68801f-230b-4390-b8de-92398d668021
 # author: OmniNode Team
 # created_at: 2025-05-26T10:53:14.834417
-# last_modified_at: 2025-05-26T16:53:38.726957
+# last_modified_at: 2026-10-17T01:05:03.360678
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 9509479043e67b1a2f29927c040f2c030d6af2587cd0c3b14b3317ad9aa35f76
+# hash: b042d05330ecbbfa8ca024495536d8211d41bb65183fe40aa53a53364e2eba20
 # entrypoint: python@core_plugin_loader.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.core_plugin_loader
@@ -41,9 +41,8 @@ try:
 except ImportError:
     from importlib_metadata import entry_points  # type: ignore
 
-import yaml
-
 from omnibase.core.error_codes import CoreErrorCode, OnexError
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 
 class PluginType(Enum):
@@ -302,7 +301,7 @@ class PluginLoader:
             if os.path.exists(path):
                 try:
                     with open(path, "r") as f:
-                        config = yaml.safe_load(f)
+                        config = yaml_safe_load(f)
 
                     if not config:
                         continue
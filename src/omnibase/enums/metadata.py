@@ -9,11 +9,11 @@
 # uuid: 9dc5d7dd-9701-4589-adf9-2fb575b41148
 # author: OmniNode Team
 # created_at: 2025-05-21T12:41:40.165281
-# last_modified_at: 2025-05-26T18:58:45.719295
+# last_modified_at: 2026-10-17T01:05:03.363325
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 0684061f597d48cd9c1c2e2abd68c9f538a7fb641c3b64c4f43cdb8e88d74164
+# hash: 79cd015a61211bc15b577df50b711e934dbe0a18bde4560eb6d34fc080a17ee5
 # entrypoint: python@metadata.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.metadata
@@ -86,6 +86,7 @@ class NodeMetadataField(Enum):
     STATE_CONTRACT = "state_contract"
     LIFECYCLE = "lifecycle"
     HASH = "hash"
+    HASH_ALGORITHM = "hash_algorithm"
     ENTRYPOINT = "entrypoint"
     RUNTIME_LANGUAGE_HINT = "runtime_language_hint"
     NAMESPACE = "namespace"
@@ -140,6 +141,7 @@ class NodeMetadataField(Enum):
             cls.DESCRIPTION,
             cls.STATE_CONTRACT,
             cls.LIFECYCLE,
+            cls.HASH_ALGORITHM,
             cls.RUNTIME_LANGUAGE_HINT,
             cls.META_TYPE,
             cls.TRUST_SCORE,
@@ -9,11 +9,11 @@
 # uuid: 024a3d2d-02d8-4d5d-bcab-9f704d87b237
 # author: OmniNode Team
 # created_at: 2025-05-21T12:41:40.165346
-# last_modified_at: 2025-05-26T18:58:45.710640
+# last_modified_at: 2026-10-17T01:05:03.365320
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 2bad7c577d5d6d1903eebf38406db48a4e279105398a787e60abcf6c62d82731
+# hash: ed8c61331771e9827605400f572af16bf0192d3780a51571f6e6ea6b1ea75be3
 # entrypoint: python@output_format.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.output_format
@@ -35,6 +35,7 @@ class OutputFormatEnum(str, Enum):
 
     TEXT = "text"  # Human-readable text format
     JSON = "json"  # JSON format for machine consumption
+    NDJSON = "ndjson"  # Newline-delimited JSON, one record per line (streamed)
     YAML = "yaml"  # YAML format for machine consumption
     MARKDOWN = "markdown"  # Markdown format for documentation
     TABLE = "table"  # Tabular format for terminal display
@@ -9,11 +9,11 @@
 # uuid: 5f9516d2-02c5-4cda-be6b-ff4d50bf5391
 # author: OmniNode Team
 # created_at: 2025-05-25T13:15:06.406337
-# last_modified_at: 2025-05-25T17:18:14.232923
+# last_modified_at: 2026-10-17T01:05:03.367401
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: af1b6c3abb79d48b67aaf3237ffef0cea65e772332673d3ac0e4086b4a05344d
+# hash: fce6c97eb3a03043156a99e1911a1286a4e19d18c12874a70155222f6b1aabc0
 # entrypoint: python@fixture_loader.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.fixture_loader
@@ -32,10 +32,9 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.protocol.protocol_fixture_loader import ProtocolFixtureLoader
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 
 class CentralizedFixtureLoader(ProtocolFixtureLoader):
@@ -152,7 +151,7 @@ class CentralizedFixtureLoader(ProtocolFixtureLoader):
                     return json.load(f)
             elif file_path.suffix in [".yaml", ".yml"]:
                 with open(file_path, "r") as f:
-                    return yaml.safe_load(f)
+                    return yaml_safe_load(f)
             else:
                 raise OnexError(
                     f"Unsupported fixture format: {file_path.suffix}",
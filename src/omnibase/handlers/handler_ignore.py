@@ -9,11 +9,11 @@
 # uuid: b04c529c-5d69-491f-892c-46cbb49fdd96
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:24.967653
-# last_modified_at: 2025-05-22T20:22:47.708377
+# last_modified_at: 2026-10-17T01:05:03.369702
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: fe37998fea2c08cac213302aa20034fa9776c80c9ae97e4f62ee1b6a32d35f58
+# hash: 5b8c6a3a6f159743a1fa7981ebd6888dce09f52786d23de3446e1b455bba6afe
 # entrypoint: python@handler_ignore.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.handler_ignore
@@ -31,6 +31,12 @@ from omnibase.metadata.metadata_constants import YAML_META_CLOSE, YAML_META_OPEN
 from omnibase.model.model_node_metadata import EntrypointType, NodeMetadataBlock
 from omnibase.model.model_onex_message_result import OnexResultModel
 from omnibase.protocol.protocol_file_type_handler import ProtocolFileTypeHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_parser import (
+    load_metadata_block,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_scanner import (
+    block_scanner,
+)
 from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_metadata_block import (
     MetadataBlockMixin,
 )
@@ -102,18 +108,12 @@ class IgnoreFileHandler(ProtocolFileTypeHandler, MetadataBlockMixin):
         return path.name in {".onexignore", ".gitignore"}
 
     def extract_block(self, path: Path, content: str) -> tuple[Optional[Any], str]:
-        import yaml
-
-        block_match = None
         try:
-            import re
-
-            block_match = re.search(
-                rf"(?s){YAML_META_OPEN}.*?{YAML_META_CLOSE}", content
-            )
-            if not block_match:
+            scanner = block_scanner(YAML_META_OPEN, YAML_META_CLOSE)
+            span = scanner.find(content)
+            if span is None:
                 return None, content
-            block_str = block_match.group(0)
+            block_str = content[span.start : span.end]
             block_lines = [
                 line.strip()
                 for line in block_str.splitlines()
@@ -126,7 +126,7 @@ class IgnoreFileHandler(ProtocolFileTypeHandler, MetadataBlockMixin):
             block_yaml = "\n".join(block_lines)
             prev_meta = None
             try:
-                data = yaml.safe_load(block_yaml)
+                data = load_metadata_block(block_yaml)
                 if isinstance(data, dict):
                     prev_meta = NodeMetadataBlock(**data)
                 elif isinstance(data, NodeMetadataBlock):
@@ -135,12 +135,7 @@ class IgnoreFileHandler(ProtocolFileTypeHandler, MetadataBlockMixin):
                     prev_meta = None
             except Exception:
                 prev_meta = None
-            rest = re.sub(
-                rf"(?s){YAML_META_OPEN}.*?{YAML_META_CLOSE}\n?",
-                "",
-                content,
-                count=1,
-            )
+            rest = scanner.remove(content, span)
             return prev_meta, rest
         except Exception as e:
             logger.error(f"Exception in extract_block for {path}: {e}", exc_info=True)
@@ -156,6 +151,9 @@ class IgnoreFileHandler(ProtocolFileTypeHandler, MetadataBlockMixin):
 
         from omnibase.metadata.metadata_constants import YAML_META_CLOSE, YAML_META_OPEN
         from omnibase.model.model_node_metadata import NodeMetadataBlock
+        from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_serializer import (
+            scalar_block_items,
+        )
 
         def enum_to_str(obj: Any) -> Any:
             if isinstance(obj, Enum):
@@ -174,6 +172,13 @@ class IgnoreFileHandler(ProtocolFileTypeHandler, MetadataBlockMixin):
                 CoreErrorCode.INVALID_PARAMETER,
             )
 
+        items = scalar_block_items(meta, compact_entrypoint=False)
+        if items is not None:
+            lines = [f"{YAML_META_OPEN}"]
+            lines.extend(f"# {k}: {v}" for k, v in items)
+            lines.append(f"{YAML_META_CLOSE}")
+            return "\n".join(lines)
+
         meta_dict = enum_to_str(meta.model_dump())
         lines = [f"{YAML_META_OPEN}"]
         # Convert EntrypointBlock to dict for YAML compatibility
@@ -241,6 +246,17 @@ class IgnoreFileHandler(ProtocolFileTypeHandler, MetadataBlockMixin):
         _, result = result_tuple
         return result
 
+    def verify_hash(
+        self, path: Path, content: str
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        return self.verify_with_idempotency(
+            path=path,
+            content=content,
+            extract_block_fn=self.extract_block,
+            serialize_block_fn=self.serialize_block,
+            model_cls=NodeMetadataBlock,
+        )
+
     def pre_validate(
         self, path: Path, content: str, **kwargs: Any
     ) -> Optional[OnexResultModel]:
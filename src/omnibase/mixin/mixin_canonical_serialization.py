@@ -9,11 +9,11 @@
 # uuid: e81e0d32-9125-419d-b4ca-169bb12ebff8
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:24.971514
-# last_modified_at: 2025-05-22T20:50:39.724678
+# last_modified_at: 2026-10-17T01:05:03.373526
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 64eb0e54c3be860c8bdfc0d89be56fb005c551b2eb126f96c15d2da2e81d7a87
+# hash: b9e7be41ffcb94014756008df56977c259e2be6a8ddfc4e48e71dd4ff444dbd2
 # entrypoint: python@mixin_canonical_serialization.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.mixin_canonical_serialization
@@ -21,16 +21,73 @@
 # === /OmniNode:Metadata ===
 
 
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, NamedTuple, Optional, Tuple, Union
 
-import yaml
+from pydantic import BaseModel
 
 from omnibase.enums import NodeMetadataField
 from omnibase.protocol.protocol_canonical_serializer import ProtocolCanonicalSerializer
+from omnibase.utils.canonical_hasher import canonical_digest, normalize_body
+from omnibase.utils.metadata_utils import HASH_PLACEHOLDERS
+from omnibase.utils.yaml_backend import yaml_dump
 
 if TYPE_CHECKING:
     from omnibase.model.model_node_metadata import NodeMetadataBlock
 
+# Protocol-compliant placeholders
+_PROTOCOL_PLACEHOLDERS = {
+    field.value: HASH_PLACEHOLDERS[field.value]
+    for field in (NodeMetadataField.HASH, NodeMetadataField.LAST_MODIFIED_AT)
+}
+
+
+class CanonicalFieldSchema(NamedTuple):
+    """
+    Fields of a model whose null values canonicalize to "" and to [], and
+    fields left out of the canonical form while null.
+    """
+
+    string_fields: FrozenSet[str]
+    list_fields: FrozenSet[str]
+    omit_if_null: FrozenSet[str]
+
+
+@lru_cache(maxsize=None)
+def canonical_field_schema(model_cls: type[BaseModel]) -> CanonicalFieldSchema:
+    """
+    The normalization schema of model_cls, derived once from its model_fields:
+    fields annotated str or list, or a Union containing str or list, and
+    fields marked omit_if_null in json_schema_extra.
+    """
+    string_fields = set()
+    list_fields = set()
+    omit_if_null = set()
+    for name, field in model_cls.model_fields.items():
+        extra = field.json_schema_extra
+        if isinstance(extra, dict) and extra.get("omit_if_null"):
+            omit_if_null.add(name)
+        annotation = field.annotation
+        if annotation is None:
+            continue
+        origin = getattr(annotation, "__origin__", None)
+
+        # Check for Union types
+        if origin is Union and hasattr(annotation, "__args__"):
+            args = annotation.__args__
+            if str in args:
+                string_fields.add(name)
+            if list in args:
+                list_fields.add(name)
+        # Check for direct types
+        elif annotation is str:
+            string_fields.add(name)
+        elif annotation is list:
+            list_fields.add(name)
+    return CanonicalFieldSchema(
+        frozenset(string_fields), frozenset(list_fields), frozenset(omit_if_null)
+    )
+
 
 def _strip_comment_prefix(
     block: str, comment_prefixes: Tuple[str, ...] = ("# ", "#")
@@ -60,8 +117,8 @@ class CanonicalYAMLSerializer(ProtocolCanonicalSerializer):
     """
     Canonical YAML serializer implementing ProtocolCanonicalSerializer.
     Provides protocol-compliant, deterministic serialization and normalization for stamping, hashing, and idempotency.
-    All field normalization and placeholder logic is schema-driven, using NodeMetadataBlock.model_fields.
-    No hardcoded field names or types.
+    All field normalization and placeholder logic is schema-driven, using NodeMetadataBlock.model_fields
+    (see canonical_field_schema). No hardcoded field names or types.
     """
 
     def canonicalize_metadata_block(
@@ -109,39 +166,16 @@ class CanonicalYAMLSerializer(ProtocolCanonicalSerializer):
                 block = NodeMetadataBlock.model_validate(block)
 
         block_dict = block.model_dump(mode="json")
-        # Protocol-compliant placeholders
-        protocol_placeholders = {
-            NodeMetadataField.HASH.value: "0" * 64,
-            NodeMetadataField.LAST_MODIFIED_AT.value: "1970-01-01T00:00:00Z",
-        }
-        # Dynamically determine string and list fields from the model
-        string_fields = set()
-        list_fields = set()
-
-        for name, field in NodeMetadataBlock.model_fields.items():
-            annotation = field.annotation
-            if annotation is None:
-                continue
-            origin = getattr(annotation, "__origin__", None)
-
-            # Check for Union types
-            if origin is Union and hasattr(annotation, "__args__"):
-                args = annotation.__args__
-                if str in args:
-                    string_fields.add(name)
-                if list in args:
-                    list_fields.add(name)
-            # Check for direct types
-            elif annotation is str:
-                string_fields.add(name)
-            elif annotation is list:
-                list_fields.add(name)
-
+        string_fields, list_fields, omit_if_null = canonical_field_schema(
+            NodeMetadataBlock
+        )
         normalized_dict: Dict[str, object] = {}
         for k, v in block_dict.items():
             # Replace volatile fields with protocol placeholder
-            if k in protocol_placeholders:
-                normalized_dict[k] = protocol_placeholders[k]
+            if k in _PROTOCOL_PLACEHOLDERS:
+                normalized_dict[k] = _PROTOCOL_PLACEHOLDERS[k]
+                continue
+            if v is None and k in omit_if_null:
                 continue
             # Convert NodeMetadataField to .value
             if isinstance(v, NodeMetadataField):
@@ -155,7 +189,7 @@ class CanonicalYAMLSerializer(ProtocolCanonicalSerializer):
                 normalized_dict[k] = []
                 continue
             normalized_dict[k] = v
-        yaml_str = yaml.dump(
+        yaml_str = yaml_dump(
             normalized_dict,
             sort_keys=sort_keys,
             default_flow_style=default_flow_style,
@@ -182,10 +216,7 @@ class CanonicalYAMLSerializer(ProtocolCanonicalSerializer):
         Returns:
             Normalized file body as a string.
         """
-        body = body.replace("\r\n", "\n").replace("\r", "\n")
-        norm = body.rstrip(" \t\r\n") + "\n"
-        assert "\r" not in norm, "Carriage return found after normalization"
-        return norm
+        return normalize_body(body)
 
     def canonicalize_for_hash(
         self,
@@ -211,7 +242,49 @@ class CanonicalYAMLSerializer(ProtocolCanonicalSerializer):
         Returns:
             Canonical string for hash computation.
         """
-        meta_yaml = self.canonicalize_metadata_block(
+        meta_yaml = self._metadata_for_hash(
+            block, volatile_fields, placeholder, comment_prefix
+        )
+        norm_body = self.normalize_body(body)
+        canonical = meta_yaml.rstrip("\n") + "\n\n" + norm_body.lstrip("\n")
+        return canonical
+
+    def compute_canonical_hash(
+        self,
+        block: Union[Dict[str, object], "NodeMetadataBlock"],
+        body: str,
+        volatile_fields: Tuple[NodeMetadataField, ...] = (
+            NodeMetadataField.HASH,
+            NodeMetadataField.LAST_MODIFIED_AT,
+        ),
+        placeholder: str = "<PLACEHOLDER>",
+        comment_prefix: str = "",
+    ) -> str:
+        """
+        Hex digest of canonicalize_for_hash(block, body, ...), using the
+        algorithm named by the block's hash_algorithm (SHA-256 if unset). The
+        body is normalized and hashed chunk by chunk instead of being copied
+        into the canonical string.
+        """
+        meta_yaml = self._metadata_for_hash(
+            block, volatile_fields, placeholder, comment_prefix
+        )
+        if isinstance(block, dict):
+            algorithm = block.get(NodeMetadataField.HASH_ALGORITHM.value)
+        else:
+            algorithm = block.hash_algorithm
+        return canonical_digest(
+            meta_yaml, body, str(algorithm) if algorithm is not None else None
+        )
+
+    def _metadata_for_hash(
+        self,
+        block: Union[Dict[str, object], "NodeMetadataBlock"],
+        volatile_fields: Tuple[NodeMetadataField, ...],
+        placeholder: str,
+        comment_prefix: str,
+    ) -> str:
+        return self.canonicalize_metadata_block(
             block,
             volatile_fields=volatile_fields,
             placeholder=placeholder,
@@ -219,12 +292,6 @@ class CanonicalYAMLSerializer(ProtocolCanonicalSerializer):
             explicit_end=False,
             comment_prefix=comment_prefix,
         )
-        norm_body = self.normalize_body(body)
-        canonical = meta_yaml.rstrip("\n") + "\n\n" + norm_body.lstrip("\n")
-        return canonical
-
-
-normalize_body = CanonicalYAMLSerializer().normalize_body
 
 
 def extract_metadata_block_and_body(
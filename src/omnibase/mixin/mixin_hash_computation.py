@@ -9,11 +9,11 @@
 # uuid: d1e5e882-7bc4-4c1f-ada8-79260cf45b2d
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:24.973939
-# last_modified_at: 2025-05-22T20:26:29.274576
+# last_modified_at: 2026-10-17T01:05:03.377415
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: a32c17c65ecb3e87fe165ed98f366c127611a046a407637490065fddaac20a4b
+# hash: 38107ebfe433cedefea628d09d72d82155dabc19ea00189a5ffa59f22d4d7e72
 # entrypoint: python@mixin_hash_computation.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.mixin_hash_computation
@@ -21,7 +21,6 @@
 # === /OmniNode:Metadata ===
 
 
-import hashlib
 import logging
 from typing import TYPE_CHECKING, Tuple
 
@@ -53,11 +52,10 @@ class HashComputationMixin:
         placeholder: str = "<PLACEHOLDER>",
         comment_prefix: str = "",
     ) -> str:
-        canonical = CanonicalYAMLSerializer().canonicalize_for_hash(
+        return CanonicalYAMLSerializer().compute_canonical_hash(
             self,  # type: ignore[arg-type]
             body,
             volatile_fields=volatile_fields,
             placeholder=placeholder,
             comment_prefix=comment_prefix,
         )
-        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
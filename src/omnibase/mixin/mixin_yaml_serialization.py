@@ -9,11 +9,11 @@
 # uuid: a41ba62a-36d2-4ade-ae80-1431cfb76738
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:24.976763
-# last_modified_at: 2025-05-22T20:44:58.960712
+# last_modified_at: 2026-10-17T01:05:03.379623
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: ff710b3b45d18830e05826457de9c315e3fe538267d4527d3e2ec160e3a9e63c
+# hash: 7ee32557e979be68ec4f35003dcff29f9c3a15f3ab7fbcc0b4b0ed907cc2309a
 # entrypoint: python@mixin_yaml_serialization.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.mixin_yaml_serialization
@@ -23,7 +23,7 @@
 
 from typing import TYPE_CHECKING, Any, Dict
 
-import yaml
+from omnibase.utils.yaml_backend import yaml_dump
 
 if TYPE_CHECKING:
     from typing import Protocol
@@ -50,7 +50,7 @@ class YAMLSerializationMixin:
             YAML string with each line prefixed by comment_prefix.
         """
         data = self.model_dump(mode="json")
-        yaml_str = yaml.dump(
+        yaml_str = yaml_dump(
             data, sort_keys=True, default_flow_style=False, allow_unicode=True
         )
         yaml_str = yaml_str.replace("\xa0", " ")
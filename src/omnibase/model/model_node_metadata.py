@@ -9,11 +9,11 @@
 # uuid: 92bc3783-426c-4f0b-9b8e-5c54ee86ba95
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:21.445998
-# last_modified_at: 2025-05-22T20:22:47.710441
+# last_modified_at: 2026-10-17T01:05:03.385641
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 653de640227a49b3a14307039b1817d27e321c622b2349762cb5d5e582ea898d
+# hash: 8df8016238735c5d3976c2f197072617c1d95b9d1b854b82962b133ea7bcc1f0
 # entrypoint: python@model_node_metadata.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.model_node_metadata
@@ -48,12 +48,15 @@ from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.enums import FunctionLanguageEnum
-from omnibase.mixin.mixin_canonical_serialization import CanonicalYAMLSerializer
 from omnibase.mixin.mixin_hash_computation import HashComputationMixin
 from omnibase.mixin.mixin_yaml_serialization import YAMLSerializationMixin
+from omnibase.utils.canonical_hasher import normalize_body
 
 logger = logging.getLogger(__name__)
 
+# Field value types to_serializable_dict passes through unchanged
+_PLAIN_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class Lifecycle(enum.StrEnum):
     DRAFT = "draft"
@@ -324,6 +327,10 @@ class NodeMetadataBlock(YAMLSerializationMixin, HashComputationMixin, BaseModel)
     hash: Annotated[
         str, StringConstraints(min_length=1, pattern=r"^[a-fA-F0-9]{64}$")
     ] = Field(json_schema_extra={"volatile": True})
+    # Versioned digest tag (see omnibase.utils.canonical_hasher); unset means SHA-256
+    hash_algorithm: Optional[str] = Field(
+        default=None, json_schema_extra={"omit_if_null": True}
+    )
     entrypoint: EntrypointBlock
     runtime_language_hint: Optional[str] = Field(default="python>=3.11")
     namespace: Annotated[
@@ -362,9 +369,7 @@ class NodeMetadataBlock(YAMLSerializationMixin, HashComputationMixin, BaseModel)
 
     # Canonicalization/canonicalizer policy (not Pydantic config)
     canonicalization_policy: ClassVar[dict[str, Any]] = {
-        "canonicalize_body": staticmethod(
-            lambda body: CanonicalYAMLSerializer().normalize_body(body)
-        )
+        "canonicalize_body": normalize_body
     }
 
     @classmethod
@@ -377,13 +382,12 @@ class NodeMetadataBlock(YAMLSerializationMixin, HashComputationMixin, BaseModel)
         Otherwise, extract from content using canonical utility.
         Raises OnexError if no block is found or parsing fails.
         """
-        import yaml
-
         from omnibase.metadata.metadata_constants import YAML_META_CLOSE, YAML_META_OPEN
         from omnibase.mixin.mixin_canonical_serialization import (
             extract_metadata_block_and_body,
             strip_block_delimiters_and_assert,
         )
+        from omnibase.utils.yaml_backend import yaml_safe_load
 
         logger = logging.getLogger("omnibase.model.model_node_metadata")
         if already_extracted_block is not None:
@@ -417,7 +421,7 @@ class NodeMetadataBlock(YAMLSerializationMixin, HashComputationMixin, BaseModel)
                 context="NodeMetadataBlock.from_file_or_content",
             )
         try:
-            data = yaml.safe_load(block_yaml)
+            data = yaml_safe_load(block_yaml)
         except Exception as e:
             logger.error(f"Failed to parse YAML block: {e}")
             raise OnexError(
@@ -457,7 +461,9 @@ class NodeMetadataBlock(YAMLSerializationMixin, HashComputationMixin, BaseModel)
         self, use_compact_entrypoint: bool = True
     ) -> dict[str, Any]:
         def serialize_value(val: Any) -> Any:
-            if hasattr(val, "to_serializable_dict"):
+            if type(val) in _PLAIN_VALUE_TYPES:
+                return val
+            elif hasattr(val, "to_serializable_dict"):
                 return val.to_serializable_dict()
             elif isinstance(val, enum.Enum):
                 return val.value
@@ -518,6 +524,31 @@ class NodeMetadataBlock(YAMLSerializationMixin, HashComputationMixin, BaseModel)
         Create a complete NodeMetadataBlock with sensible defaults for all required fields.
         This is the canonical way to construct metadata blocks, ensuring all required fields are present.
         """
+        return cls(
+            **cls.fields_with_defaults(  # type: ignore[arg-type]
+                name=name,
+                author=author,
+                namespace=namespace,
+                entrypoint_type=entrypoint_type,
+                entrypoint_target=entrypoint_target,
+                **additional_fields,
+            )
+        )
+
+    @classmethod
+    def fields_with_defaults(
+        cls,
+        name: Optional[str] = None,
+        author: Optional[str] = None,
+        namespace: Optional[str] = None,
+        entrypoint_type: Optional[str] = None,
+        entrypoint_target: Optional[str] = None,
+        **additional_fields: Any,
+    ) -> Dict[str, Any]:
+        """
+        The field values create_with_defaults validates, as a plain dict, so
+        callers can adjust them before constructing the model once.
+        """
         from datetime import datetime
         from uuid import uuid4
 
@@ -541,4 +572,4 @@ class NodeMetadataBlock(YAMLSerializationMixin, HashComputationMixin, BaseModel)
         # Add any additional fields provided
         data.update(additional_fields)
 
-        return cls(**data)  # type: ignore[arg-type]
+        return data
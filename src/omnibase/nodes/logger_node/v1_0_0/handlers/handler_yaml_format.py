@@ -9,11 +9,11 @@
 # uuid: c4b48098-6966-4d46-a3e6-a55825b62852
 # author: OmniNode Team
 # created_at: 2025-05-26T12:13:25.553301
-# last_modified_at: 2025-05-26T16:53:38.722963
+# last_modified_at: 2026-10-17T01:05:03.387490
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: ba105d2b3fa5f453d515fb266c7c6f03d6a6169d65893a4c0400ae636d5ef403
+# hash: 93212d1f64744152a4fe01c2eafa07174543ed64802c8f473e6e02c548752ea2
 # entrypoint: python@handler_yaml_format.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.handler_yaml_format
@@ -106,9 +106,9 @@ class YamlFormatHandler(ProtocolLogFormatHandler):
         try:
             # Try to use PyYAML if available
             try:
-                import yaml
+                from omnibase.utils.yaml_backend import yaml_dump
 
-                return yaml.dump(
+                return yaml_dump(
                     log_entry, default_flow_style=False, allow_unicode=True
                 )
             except ImportError:
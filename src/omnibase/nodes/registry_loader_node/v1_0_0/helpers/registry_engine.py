@@ -9,11 +9,11 @@
 # uuid: 88b43b31-d73c-454b-a7cd-8f51ce78e7f1
 # author: OmniNode Team
 # created_at: 2025-05-24T15:44:23.157711
-# last_modified_at: 2025-05-24T20:17:56.135195
+# last_modified_at: 2026-10-17T01:05:03.391579
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: be9819d9c37ee53feb31a7ed10c1bf6a5077e1b3ea0ce507dad60ac796c12c8c
+# hash: e7584a8e1d0fab22d2193547ba178fde2a85ae29a34dedf3b958a63813229f4e
 # entrypoint: python@registry_engine.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.registry_engine
@@ -35,10 +35,9 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from omnibase.core.core_file_type_handler_registry import FileTypeHandlerRegistry
 from omnibase.enums import OnexStatus
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 # Handle relative imports for both module and direct execution
 try:
@@ -263,7 +262,7 @@ class RegistryEngine:
                 return None
 
             with open(registry_path, "r") as f:
-                data = yaml.safe_load(f)
+                data = yaml_safe_load(f)
 
             if not isinstance(data, dict):
                 self.errors.append(
@@ -488,7 +487,7 @@ class RegistryEngine:
 
         try:
             with open(metadata_path, "r") as f:
-                metadata = yaml.safe_load(f)
+                metadata = yaml_safe_load(f)
 
             if not isinstance(metadata, dict):
                 self.errors.append(
@@ -9,11 +9,11 @@
 # uuid: 1d7e01b2-814c-4355-a6e0-8e34c2461342
 # author: OmniNode Team
 # created_at: 2025-05-22T12:17:04.435833
-# last_modified_at: 2025-05-22T20:50:39.727803
+# last_modified_at: 2026-10-17T01:13:30.753261
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: da48e519140285e4043517a65b184487fb0cc98d0293eb5a4af958f6c2fb3aef
+# hash: 060dac4185d7a301612ce9fc92ad2e375336f6ed5abb2da634b395ba265fac12
 # entrypoint: python@cli_stamp.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.cli_stamp
@@ -27,7 +27,7 @@ import logging
 import os
 import pathlib
 from pathlib import Path
-from typing import Any, List, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 import typer
 
@@ -38,15 +38,21 @@ from omnibase.core.error_codes import (
 )
 from omnibase.enums import OnexStatus, OutputFormatEnum, TemplateTypeEnum
 from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.model.model_onex_message_result import OnexResultModel
 from omnibase.protocol.protocol_stamper_engine import ProtocolStamperEngine
 from omnibase.tools.fixture_stamper_engine import FixtureStamperEngine
 from omnibase.utils.directory_traverser import (
     DirectoryTraverser,
     SchemaExclusionRegistry,
 )
+from omnibase.utils.filesystem_index import FileSystemIndex, shared_filesystem_index
+from omnibase.utils.git_file_discovery_source import GitFileDiscoverySource
+from omnibase.utils.onexignore_cache import OnexIgnoreCache, shared_onexignore_cache
 from omnibase.utils.real_file_io import RealFileIO
 
 from .error_codes import StamperError
+from .helpers.stamp_cache import StampCache
+from .helpers.stamp_watcher import StampWatcher, create_change_source
 from .helpers.stamper_engine import StamperEngine
 from .introspection import StamperNodeIntrospection
 
@@ -106,12 +112,27 @@ def _json_default(obj: object) -> str:
     )
 
 
+def _ndjson_line(result: OnexResultModel) -> str:
+    return json.dumps(
+        result.model_dump(exclude_none=True),
+        separators=(",", ":"),
+        default=_json_default,
+    )
+
+
 def get_engine_from_env_or_flag(
     fixture: Optional[str] = None,
+    use_cache: bool = False,
+    scan_threads: int = 0,
 ) -> "ProtocolStamperEngine":
     """
     Get a stamper engine from environment variables or fixture flag.
     Returns FixtureStamperEngine if fixture is provided, otherwise StamperEngine.
+    With use_cache, the StamperEngine consults the persistent stamp cache in
+    .onex_cache/stamp.sqlite, parsed .onexignore files are kept in
+    .onex_cache/onexignore.json and directory listings in
+    .onex_cache/onex_index.json. scan_threads > 0 lists directories
+    concurrently during traversal.
     """
     fixture_path = fixture or os.environ.get("STAMPER_FIXTURE_PATH")
     fixture_format = os.environ.get("STAMPER_FIXTURE_FORMAT", "json")
@@ -120,14 +141,19 @@ def get_engine_from_env_or_flag(
     )  # Registry-driven schema exclusion
     if fixture_path:
         return FixtureStamperEngine(Path(fixture_path), fixture_format=fixture_format)
+    if use_cache:
+        shared_onexignore_cache().persist_to(OnexIgnoreCache.DEFAULT_PATH)
+        shared_filesystem_index().persist_to(FileSystemIndex.DEFAULT_PATH)
 
     # Use RealFileIO for CLI mode to ensure real files are accessed
     return StamperEngine(
         schema_loader=DummySchemaLoader(),
         directory_traverser=DirectoryTraverser(
-            schema_exclusion_registry=schema_exclusion_registry
+            schema_exclusion_registry=schema_exclusion_registry,
+            scan_threads=scan_threads,
         ),
         file_io=RealFileIO(),
+        stamp_cache=StampCache() if use_cache else None,
     )
 
 
@@ -154,12 +180,17 @@ def file(
         "--fixture",
         help="Path to JSON or YAML fixture for protocol-driven testing",
     ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Skip files unchanged since their last successful stamp (.onex_cache/stamp.sqlite)",
+    ),
 ) -> int:
     """
     Stamp one or more ONEX node metadata files with a hash and timestamp.
     Usage: onex stamp file <file1> <file2> ...
     """
-    engine = get_engine_from_env_or_flag(fixture)
+    engine = get_engine_from_env_or_flag(fixture, use_cache=cache)
     template_type = TemplateTypeEnum.MINIMAL
     if template_type_str.upper() in TemplateTypeEnum.__members__:
         template_type = TemplateTypeEnum[template_type_str.upper()]
@@ -175,7 +206,7 @@ def file(
     print(f"[DEBUG] Files passed to stamper: {paths}")
     logger.info(f"[DEBUG] Files passed to stamper: {paths}")
     logger.debug(
-        f"[START] CLI command 'file' with paths={paths}, author={author}, template_type={template_type_str}, overwrite={overwrite}, repair={repair}, output_fmt={output_fmt}, fixture={fixture}"
+        f"[START] CLI command 'file' with paths={paths}, author={author}, template_type={template_type_str}, overwrite={overwrite}, repair={repair}, output_fmt={output_fmt}, fixture={fixture}, cache={cache}"
     )
     any_error = False
     for path in paths:
@@ -302,7 +333,7 @@ def directory(
         OutputFormatEnum.TEXT,
         "--format",
         "-f",
-        help="Output format (text, json)",
+        help="Output format (text, json, ndjson)",
     ),
     fixture: Optional[str] = typer.Option(
         None,
@@ -324,32 +355,88 @@ def directory(
         "--tree-only",
         help="Only process files listed in .tree (alias for tree)",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of worker processes for stamping (0 = one per CPU)",
+    ),
+    io_threads: int = typer.Option(
+        0,
+        "--io-threads",
+        help="Pipeline reads and writes on this many threads, overlapping them with stamping (0 = off)",
+    ),
+    scan_threads: int = typer.Option(
+        0,
+        "--scan-threads",
+        help="List directories on this many threads while walking, for slow or network filesystems (0 = off)",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Skip files unchanged since their last successful stamp (.onex_cache/stamp.sqlite)",
+    ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help="Only process files changed in git since REF (merge base with HEAD), plus untracked files",
+        metavar="REF",
+    ),
+    staged: bool = typer.Option(
+        False,
+        "--staged",
+        help="Only process files staged in the git index (for pre-commit)",
+    ),
 ) -> int:
     """
     Stamp all eligible files in a directory, using the selected file discovery source.
     """
-    engine = get_engine_from_env_or_flag(fixture)
+    engine = get_engine_from_env_or_flag(
+        fixture, use_cache=cache, scan_threads=scan_threads
+    )
     template_type = TemplateTypeEnum.MINIMAL
     if template_type_str.upper() in TemplateTypeEnum.__members__:
         template_type = TemplateTypeEnum[template_type_str.upper()]
     logger = logging.getLogger("omnibase.tools.cli_stamp")
     logger.debug(
-        f"[START] CLI command 'directory' with directory={directory}, recursive={recursive}, write={write}, include={include}, exclude={exclude}, ignore_file={ignore_file}, template_type={template_type_str}, author={author}, overwrite={overwrite}, repair={repair}, force={force}, output_fmt={output_fmt}, fixture={fixture}, discovery_source={discovery_source}, enforce_tree={enforce_tree}, tree_only={tree_only}"
+        f"[START] CLI command 'directory' with directory={directory}, recursive={recursive}, write={write}, include={include}, exclude={exclude}, ignore_file={ignore_file}, template_type={template_type_str}, author={author}, overwrite={overwrite}, repair={repair}, force={force}, output_fmt={output_fmt}, fixture={fixture}, discovery_source={discovery_source}, enforce_tree={enforce_tree}, tree_only={tree_only}, jobs={jobs}, io_threads={io_threads}, scan_threads={scan_threads}, cache={cache}, changed_since={changed_since}, staged={staged}"
     )
-    result = engine.process_directory(
-        Path(directory),
-        template=template_type,
-        recursive=recursive,
-        dry_run=not write,
-        include_patterns=include,
-        exclude_patterns=exclude,
-        ignore_file=ignore_file,
-        author=author,
-        overwrite=overwrite,
-        repair=repair,
-        force_overwrite=force,
-    )
-    if output_fmt == OutputFormatEnum.JSON:
+    changed_files: Optional[List[Path]] = None
+    if changed_since or staged:
+        try:
+            git_source = GitFileDiscoverySource(since=changed_since, staged=staged)
+            changed_files = sorted(git_source.get_changed_files(Path(directory)))
+        except OnexError as e:
+            typer.echo(f"[ERROR] {e}", err=True)
+            return shared_get_exit_code_for_status(OnexStatus.ERROR)
+        logger.debug(f"Git reported {len(changed_files)} changed files")
+    process_kwargs: Dict[str, Any] = {
+        "template": template_type,
+        "recursive": recursive,
+        "dry_run": not write,
+        "include_patterns": include,
+        "exclude_patterns": exclude,
+        "ignore_file": ignore_file,
+        "author": author,
+        "overwrite": overwrite,
+        "repair": repair,
+        "force_overwrite": force,
+        "jobs": jobs,
+        "files": changed_files,
+        "io_threads": io_threads,
+    }
+    if output_fmt == OutputFormatEnum.NDJSON and isinstance(engine, StamperEngine):
+        # Stream one line per file as it finishes, then the directory summary
+        for file_result in engine.iter_process_directory(
+            Path(directory), **process_kwargs
+        ):
+            typer.echo(_ndjson_line(file_result))
+        result = engine.directory_summary(Path(directory))
+    else:
+        result = engine.process_directory(Path(directory), **process_kwargs)
+    if output_fmt == OutputFormatEnum.NDJSON:
+        typer.echo(_ndjson_line(result))
+    elif output_fmt == OutputFormatEnum.JSON:
         typer.echo(json.dumps(result.model_dump(), indent=2, default=_json_default))
     else:
         typer.echo(f"Status: {result.status.value}")
@@ -375,7 +462,9 @@ def directory(
                 for f in skipped_files:
                     reason = skipped_file_reasons.get(str(f), "unknown reason")
                     typer.echo(f"- {f}: {reason}")
-                typer.echo(f"Total skipped: {len(skipped_files)}")
+                typer.echo(
+                    f"Total skipped: {result.metadata.get('skipped', len(skipped_files))}"
+                )
     logger.debug(
         f"[END] CLI command 'directory' for directory={directory}, result status={result.status}, messages={result.messages}, metadata={result.metadata}"
     )
@@ -384,6 +473,212 @@ def directory(
     return shared_get_exit_code_for_status(result.status)
 
 
+@app.command("verify")
+def verify(
+    paths: List[str] = typer.Argument(..., help="Files and/or directories to verify"),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        is_flag=True,
+        help="Recursively verify subdirectories",
+    ),
+    include: Optional[List[str]] = typer.Option(
+        None,
+        "--include",
+        "-i",
+        help="File patterns to include (e.g., '*.yaml')",
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        "-e",
+        help="File patterns to exclude",
+    ),
+    ignore_file: Optional[Path] = typer.Option(
+        None,
+        "--ignore-file",
+        help="Path to .onexignore file",
+    ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help="Only verify files changed in git since REF (merge base with HEAD), plus untracked files",
+        metavar="REF",
+    ),
+    staged: bool = typer.Option(
+        False,
+        "--staged",
+        help="Only verify files staged in the git index (for pre-commit)",
+    ),
+    output_fmt: OutputFormatEnum = typer.Option(
+        OutputFormatEnum.TEXT, "--format", "-f", help="Output format (text, json)"
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Trust files unchanged since their last successful stamp (.onex_cache/stamp.sqlite)",
+    ),
+) -> int:
+    """
+    Check that stamps are current without modifying any file.
+    Exits 0 when every stamp matches its content and 1 when any is stale or missing.
+    """
+    engine = get_engine_from_env_or_flag(use_cache=cache)
+    if not isinstance(engine, StamperEngine):
+        typer.echo("[ERROR] Verify requires the real stamper engine", err=True)
+        raise typer.Exit(shared_get_exit_code_for_status(OnexStatus.ERROR))
+    results: List[Any] = []
+    for path in paths:
+        target = Path(path)
+        if target.is_dir():
+            changed_files: Optional[List[Path]] = None
+            if changed_since or staged:
+                try:
+                    git_source = GitFileDiscoverySource(
+                        since=changed_since, staged=staged
+                    )
+                    changed_files = sorted(git_source.get_changed_files(target))
+                except OnexError as e:
+                    typer.echo(f"[ERROR] {e}", err=True)
+                    raise typer.Exit(shared_get_exit_code_for_status(OnexStatus.ERROR))
+            results.append(
+                engine.verify_directory(
+                    target,
+                    recursive=recursive,
+                    include_patterns=include,
+                    exclude_patterns=exclude,
+                    ignore_file=ignore_file,
+                    files=changed_files,
+                )
+            )
+        else:
+            results.append(engine.verify_file(target))
+    any_error = any(result.status == OnexStatus.ERROR for result in results)
+    if output_fmt == OutputFormatEnum.JSON:
+        typer.echo(
+            json.dumps(
+                [result.model_dump() for result in results],
+                indent=2,
+                default=_json_default,
+            )
+        )
+    else:
+        for result in results:
+            meta = result.metadata or {}
+            if "stale_files" in meta:
+                for f in meta["stale_files"]:
+                    typer.echo(f"[STALE] {f}")
+                for f in meta["missing_files"]:
+                    typer.echo(f"[MISSING] {f}")
+                for f, error in meta["error_files"].items():
+                    typer.echo(f"[ERROR] {f}: {error}")
+                for msg in result.messages:
+                    typer.echo(f"{result.target}: {msg.summary}")
+            elif result.status == OnexStatus.ERROR and "error" in meta:
+                typer.echo(f"[ERROR] {result.target}: {meta['error']}")
+            elif result.status == OnexStatus.ERROR:
+                label = "STALE" if "expected_hash" in meta else "MISSING"
+                typer.echo(f"[{label}] {result.target}")
+            elif result.status == OnexStatus.SUCCESS:
+                typer.echo(f"[OK] {result.target}")
+    # Unlike the stamping commands, verify is a CI gate: propagate the exit code
+    exit_code = shared_get_exit_code_for_status(
+        OnexStatus.ERROR if any_error else OnexStatus.SUCCESS
+    )
+    if exit_code:
+        raise typer.Exit(exit_code)
+    return exit_code
+
+
+@app.command("watch")
+def watch(
+    directory: str = typer.Argument(..., help="Directory to watch"),
+    debounce: float = typer.Option(
+        0.5,
+        "--debounce",
+        help="Seconds a file must be quiet before it is re-stamped",
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Use stat polling instead of inotify",
+    ),
+    poll_interval: float = typer.Option(
+        1.0,
+        "--poll-interval",
+        help="Seconds between rescans in polling mode",
+    ),
+    include: Optional[List[str]] = typer.Option(
+        None,
+        "--include",
+        "-i",
+        help="File patterns to include (e.g., '*.yaml')",
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        "-e",
+        help="File patterns to exclude",
+    ),
+    ignore_file: Optional[Path] = typer.Option(
+        None,
+        "--ignore-file",
+        help="Path to .onexignore file",
+    ),
+    author: str = typer.Option(
+        "OmniNode Team",
+        "--author",
+        "-a",
+        help="Author to include in stamp",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Skip files unchanged since their last successful stamp (.onex_cache/stamp.sqlite)",
+    ),
+) -> int:
+    """
+    Watch a directory and re-stamp files as they are modified.
+    Keeps one engine (and handler registry) warm for the whole session; stop with Ctrl-C.
+    """
+    engine = get_engine_from_env_or_flag(use_cache=cache)
+    if not isinstance(engine, StamperEngine):
+        typer.echo("[ERROR] Watch mode requires the real stamper engine", err=True)
+        return shared_get_exit_code_for_status(OnexStatus.ERROR)
+    root = Path(directory)
+    if not root.is_dir():
+        typer.echo(f"[ERROR] Not a directory: {directory}", err=True)
+        return shared_get_exit_code_for_status(OnexStatus.ERROR)
+
+    def report(path: Path, result: Any) -> None:
+        typer.echo(f"[{result.status.value}] {path}")
+        for msg in result.messages:
+            typer.echo(f"  {msg.summary}")
+
+    watcher = StampWatcher(
+        engine,
+        root,
+        change_source=create_change_source(
+            root, force_polling=poll, poll_interval=poll_interval
+        ),
+        debounce=debounce,
+        include_patterns=include,
+        exclude_patterns=exclude,
+        ignore_file=ignore_file,
+        on_result=report,
+        author=author,
+    )
+    typer.echo(
+        f"Watching {root} ({type(watcher.change_source).__name__}); press Ctrl-C to stop"
+    )
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    return shared_get_exit_code_for_status(OnexStatus.SUCCESS)
+
+
 @app.command("introspect")
 def introspect() -> int:
     """
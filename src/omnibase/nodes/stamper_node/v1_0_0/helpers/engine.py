@@ -9,11 +9,11 @@
 # uuid: b2b63423-6b39-4fb5-9e0c-5ba3acc4db37
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.888598
-# last_modified_at: 2025-05-22T20:45:53.780184
+# last_modified_at: 2026-10-17T01:05:03.396439
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 6f8320a60ff9b9fa0fb475c233df92a75c32eb60cfcf1a0ece0a7f968fb370df
+# hash: a81becbbcbfb409e4e5a46954031c6e8eeb875b3fdc1a8d47ce8d7d7ddf19d8a
 # entrypoint: python@engine.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.engine
@@ -183,10 +183,15 @@ class StamperEngine(ProtocolStamperEngine):
         overwrite: bool = False,
         repair: bool = False,
         force_overwrite: bool = False,
+        jobs: int = 1,
+        files: Optional[List[Path]] = None,
+        io_threads: int = 0,
     ) -> OnexResultModel:
         """
         Stamp all eligible files in a directory, respecting ignore patterns and options.
         Aggregates results and returns a summary OnexResultModel.
+        This engine always stamps serially; jobs, files and io_threads are accepted
+        for protocol compatibility.
         """
         results: list[OnexResultModel] = []
         patterns = self.load_ignore_patterns(ignore_file)
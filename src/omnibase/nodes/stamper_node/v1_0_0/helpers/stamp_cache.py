@@ -0,0 +1,206 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: stamp_cache.py
+# version: 1.0.0
+# uuid: e469b143-cfaa-4552-a585-fd237ee7e442
+# author: OmniNode Team
+# created_at: 2026-10-16T22:58:13.961076
+# last_modified_at: 2026-10-17T01:05:03.398506
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: dbead2b4a57c7d2591b4574d4b002891750cc3b77ddf1dd769acee77fc551dfe
+# entrypoint: python@stamp_cache.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.stamp_cache
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Persistent on-disk cache of files known to be stamped and idempotent.
+
+Each entry is keyed by absolute path and records the file's size, mtime_ns and
+inode at the moment it was last verified, together with the stamped hash and a
+handler fingerprint. A lookup only needs an os.stat, so StamperEngine can skip
+reading, extracting and re-hashing files that have not changed since the last run.
+
+Like FileSystemIndex, an entry recorded less than RACY_SECONDS after the file's
+mtime is not trusted: the file could still have changed within the same mtime
+tick, so it is read again and re-recorded next time.
+
+The whole cache is dropped when the .onexversion content or the cache schema
+changes; individual entries are ignored when the handler fingerprint differs.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from omnibase.core.error_codes import OnexError
+
+logger = logging.getLogger(__name__)
+
+
+def _load_versions_key() -> str:
+    """Serialize the active .onexversion so any version bump invalidates the cache."""
+    from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_metadata_block import (
+        get_onex_versions,
+    )
+
+    try:
+        versions = get_onex_versions()
+    except OnexError:
+        return ""
+    return json.dumps(versions, sort_keys=True, default=str)
+
+
+class StampCache:
+    """
+    SQLite-backed stamp cache (default location: .onex_cache/stamp.sqlite).
+
+    The connection is opened lazily and is not pickled, so a cache instance can
+    be handed to process pool workers; each worker opens its own connection.
+    Within a process the connection is shared by all threads behind a lock.
+    """
+
+    SCHEMA_VERSION = "2"
+    DEFAULT_PATH = Path(".onex_cache") / "stamp.sqlite"
+    RACY_SECONDS = 2.0
+
+    def __init__(
+        self, cache_path: Optional[Path] = None, versions_key: Optional[str] = None
+    ) -> None:
+        self.cache_path = Path(cache_path) if cache_path else self.DEFAULT_PATH
+        self.versions_key = (
+            versions_key if versions_key is not None else _load_versions_key()
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.cache_path), timeout=30, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._create_stamps_table(conn)
+            self._conn = conn
+            self._check_meta()
+        return self._conn
+
+    def _check_meta(self) -> None:
+        """Drop all entries if the schema or .onexversion changed since they were written."""
+        expected = {
+            "schema_version": self.SCHEMA_VERSION,
+            "onex_versions": self.versions_key,
+        }
+        conn = self.conn
+        stored = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        if stored != expected:
+            logger.debug(f"Stamp cache {self.cache_path} invalidated: {stored}")
+            # The table layout may differ between schema versions
+            conn.execute("DROP TABLE IF EXISTS stamps")
+            self._create_stamps_table(conn)
+            conn.execute("DELETE FROM meta")
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", expected.items())
+            conn.commit()
+
+    @staticmethod
+    def _create_stamps_table(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS stamps ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+            "inode INTEGER, fingerprint TEXT, hash TEXT, recorded_ns INTEGER)"
+        )
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def lookup(self, path: Path, fingerprint: str) -> Optional[str]:
+        """
+        Return the cached hash if the file is unchanged since it was recorded
+        with the same fingerprint, otherwise None. Entries recorded within
+        RACY_SECONDS of the file's mtime are treated as misses.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns, inode, fingerprint, hash, recorded_ns "
+                "FROM stamps WHERE path = ?",
+                (self._key(path),),
+            ).fetchone()
+        if row is None:
+            return None
+        if tuple(row[:4]) != (st.st_size, st.st_mtime_ns, st.st_ino, fingerprint):
+            return None
+        if row[5] - st.st_mtime_ns < self.RACY_SECONDS * 1e9:
+            return None
+        return str(row[4])
+
+    def record(self, path: Path, fingerprint: str, hash_value: str) -> None:
+        """Record the current stat of a file that was just verified or stamped."""
+        recorded_ns = time.time_ns()
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO stamps VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._key(path),
+                    st.st_size,
+                    st.st_mtime_ns,
+                    st.st_ino,
+                    fingerprint,
+                    hash_value,
+                    recorded_ns,
+                ),
+            )
+            self.conn.commit()
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self.conn.execute("DELETE FROM stamps WHERE path = ?", (self._key(path),))
+            self.conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.conn.execute("DELETE FROM stamps")
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,226 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: stamp_client.py
+# version: 1.0.0
+# uuid: b6d66290-b3b5-4bec-b969-29585b572fc1
+# author: OmniNode Team
+# created_at: 2026-10-16T23:15:29.757221
+# last_modified_at: 2026-10-17T01:05:03.400268
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: b0afbe2db2727b94381c4b2739d7295f4b477d7e552bccb46c1cb324d34ec4e6
+# entrypoint: python@stamp_client.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.stamp_client
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Thin client for the long-lived stamping server (`onex serve`).
+
+This module imports only the standard library, so a client call costs little
+more than interpreter startup; the warm StamperEngine lives in the server. The
+client starts a server for the current project on first use, and an
+auto-started server exits again after an idle period.
+
+Usage:
+  python -m omnibase.nodes.stamper_node.v1_0_0.helpers.stamp_client stamp a.py b.md
+  python -m omnibase.nodes.stamper_node.v1_0_0.helpers.stamp_client verify src/
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from io import BufferedRWPair
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
+
+SERVER_MODULE = "omnibase.cli_tools.onex.v1_0_0.cli_main"
+AUTOSTART_IDLE_TIMEOUT = 900.0
+
+
+class StampServerError(RuntimeError):
+    """
+    Error reported by (or while reaching) the stamping server. Not an OnexError:
+    importing the core error module would dominate the client's startup time.
+    """
+
+    def __init__(self, message: str, code: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def default_socket_path(root: Optional[Path] = None) -> Path:
+    """
+    Per-user, per-project socket path. It lives in the temp directory because
+    Unix socket paths are limited to about 100 bytes.
+    """
+    root = (root or Path.cwd()).resolve()
+    digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"onex-stamp-{os.getuid()}-{digest}.sock"
+
+
+class StampClient:
+    """JSON-lines RPC client for a stamping server listening on a Unix socket."""
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        autostart: bool = True,
+        start_timeout: float = 10.0,
+    ) -> None:
+        self.socket_path = socket_path or default_socket_path()
+        self.autostart = autostart
+        self.start_timeout = start_timeout
+        self._sock: Optional[socket.socket] = None
+        self._stream: Optional[BufferedRWPair] = None
+        self._next_id = 0
+
+    def connect(self) -> None:
+        if self._sock is not None:
+            return
+        try:
+            self._open()
+        except OSError:
+            if not self.autostart:
+                raise StampServerError(
+                    f"No stamping server at {self.socket_path}", "UNAVAILABLE"
+                )
+            self._start_server()
+
+    def _open(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._stream = sock.makefile("rwb")
+
+    def _start_server(self) -> None:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                SERVER_MODULE,
+                "serve",
+                "--socket",
+                str(self.socket_path),
+                "--idle-timeout",
+                str(AUTOSTART_IDLE_TIMEOUT),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            try:
+                self._open()
+                return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise StampServerError(
+                        f"Stamping server did not start at {self.socket_path}",
+                        "UNAVAILABLE",
+                    )
+                time.sleep(0.02)
+
+    def call(self, method: str, **params: Any) -> Any:
+        """Send one request and return its result, raising StampServerError on error."""
+        self.connect()
+        assert self._stream is not None
+        self._next_id += 1
+        request = {"id": self._next_id, "method": method, "params": params}
+        self._stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        self._stream.flush()
+        line = self._stream.readline()
+        if not line:
+            self.close()
+            raise StampServerError("Stamping server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise StampServerError(error.get("message", ""), error.get("code"))
+        return response.get("result")
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "StampClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="stamp_client", description="Talk to the ONEX stamping server."
+    )
+    parser.add_argument("--socket", type=Path, default=None, help="Server socket")
+    parser.add_argument(
+        "--no-autostart", action="store_true", help="Fail if no server is running"
+    )
+    parser.add_argument(
+        "command", choices=["stamp", "verify", "extract", "ping", "shutdown"]
+    )
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument("--author", default=None, help="Author to include in stamp")
+    args = parser.parse_args(argv)
+    # Only ping and shutdown are calls without a path
+    if args.command in ("ping", "shutdown"):
+        if args.paths:
+            parser.error(f"{args.command} takes no paths")
+    elif not args.paths:
+        parser.error(f"{args.command} requires at least one path")
+
+    method = {"stamp": "stamp_file", "extract": "extract_block"}.get(
+        args.command, args.command
+    )
+    failed = False
+    with StampClient(args.socket, autostart=not args.no_autostart) as client:
+        try:
+            if not args.paths:
+                print(json.dumps(client.call(method)))
+                return 0
+            for path in args.paths:
+                params: Dict[str, Any] = {"path": str(Path(path).resolve())}
+                if method == "stamp_file" and args.author:
+                    params["author"] = args.author
+                result = client.call(method, **params)
+                failed = failed or result.get("status") == "error"
+                print(json.dumps(result))
+        except StampServerError as e:
+            print(f"[ERROR] {e}", file=sys.stderr)
+            return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: stamp_pipeline.py
+# version: 1.0.0
+# uuid: 0ab778fc-42c6-4b7c-8147-69248d226988
+# author: OmniNode Team
+# created_at: 2026-10-16T23:29:35.255327
+# last_modified_at: 2026-10-17T01:05:03.402424
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 92c11781c1cfeeb13a4a58456fee26fbba732c286057d6a5488d98ae93a5deb2
+# entrypoint: python@stamp_pipeline.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.stamp_pipeline
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Pipelined stamping: overlap disk I/O with extraction and hashing.
+
+stamp_file runs read, stamp (block extraction, canonicalization, hashing) and
+write back to back. StampPipeline splits those into stages that run
+concurrently on different files:
+
+    read   -> I/O thread pool (handler lookup, stamp cache check, read)
+    stamp  -> CPU executor (a process pool for jobs > 1, otherwise one thread)
+    write  -> I/O thread pool (write back if changed, record in the stamp cache)
+
+At most max_in_flight files are between read and write at any time, so the
+contents held in memory stay bounded however large the tree is. Results come
+back in input order and carry their per-stage wall times in
+metadata["stage_seconds"]; the totals for the run are kept in stage_seconds.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from omnibase.model.model_onex_message_result import OnexResultModel
+from omnibase.protocol.protocol_file_type_handler import ProtocolFileTypeHandler
+
+if TYPE_CHECKING:
+    from .stamper_engine import StamperEngine
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("read", "stamp", "write")
+
+
+def _timed(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, float]:
+    """Call fn and return (result, seconds). Module-level so it can be pickled."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class StampPipeline:
+    """
+    Stamp files through bounded read/stamp/write stages. Usable wherever the
+    traverser takes a processor: calling it stamps one file serially, imap
+    stamps many with the stages overlapped.
+
+    stamp_fn(path, content, **kwargs) must return what StamperEngine.stamp_content
+    would; it runs on cpu_executor and must be picklable if that is a process
+    pool. The pipeline owns both executors and shuts them down on close.
+    """
+
+    def __init__(
+        self,
+        engine: "StamperEngine",
+        stamp_fn: Callable[..., OnexResultModel],
+        cpu_executor: Executor,
+        cpu_workers: int = 1,
+        io_threads: int = 4,
+        max_in_flight: Optional[int] = None,
+        **stamp_kwargs: Any,
+    ) -> None:
+        self.engine = engine
+        self.stamp_fn = stamp_fn
+        self.cpu_executor = cpu_executor
+        self.io_executor = ThreadPoolExecutor(
+            max_workers=max(1, io_threads), thread_name_prefix="onex-stamp-io"
+        )
+        self.max_in_flight = max_in_flight or 4 * (max(1, io_threads) + cpu_workers)
+        self.stamp_kwargs = stamp_kwargs
+        self.force_overwrite = bool(stamp_kwargs.get("force_overwrite", False))
+        # Options for handler.stamp; the named stamp_file options never reach it
+        self.handler_kwargs = {
+            k: v
+            for k, v in stamp_kwargs.items()
+            if k not in ("template", "overwrite", "repair", "force_overwrite", "author")
+        }
+        self.stage_seconds: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "StampPipeline":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.io_executor.shutdown(wait=True)
+        self.cpu_executor.shutdown(wait=True)
+
+    def __call__(self, file_path: Path) -> OnexResultModel:
+        return self.engine.stamp_file(file_path, **self.stamp_kwargs)
+
+    def imap(self, file_paths: Iterable[Path]) -> Iterator[OnexResultModel]:
+        """Stamp file_paths with overlapping stages, yielding results in order."""
+        pending: Deque["Future[OnexResultModel]"] = deque()
+        for file_path in file_paths:
+            pending.append(self.submit(file_path))
+            if len(pending) >= self.max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def submit(self, file_path: Path) -> "Future[OnexResultModel]":
+        """Start stamping one file; the future never raises."""
+        done: "Future[OnexResultModel]" = Future()
+        timings: Dict[str, float] = {}
+        read = self.io_executor.submit(
+            _timed,
+            self.engine._prepare_stamp,
+            file_path,
+            self.force_overwrite,
+            **self.handler_kwargs,
+        )
+        read.add_done_callback(self._guard(file_path, done, self._after_read, timings))
+        return done
+
+    def _after_read(
+        self,
+        file_path: Path,
+        done: "Future[OnexResultModel]",
+        timings: Dict[str, float],
+        read: "Future[Tuple[Any, float]]",
+    ) -> None:
+        prepared, timings["read"] = read.result()
+        if isinstance(prepared, OnexResultModel):
+            self._complete(done, prepared, timings)
+            return
+        handler, content = prepared
+        stamp = self.cpu_executor.submit(
+            _timed, self.stamp_fn, file_path, content, **self.handler_kwargs
+        )
+        stamp.add_done_callback(
+            self._guard(
+                file_path,
+                done,
+                lambda *args: self._after_stamp(handler, content, *args),
+                timings,
+            )
+        )
+
+    def _after_stamp(
+        self,
+        handler: ProtocolFileTypeHandler,
+        content: str,
+        file_path: Path,
+        done: "Future[OnexResultModel]",
+        timings: Dict[str, float],
+        stamp: "Future[Tuple[OnexResultModel, float]]",
+    ) -> None:
+        result, timings["stamp"] = stamp.result()
+        write = self.io_executor.submit(
+            _timed,
+            self.engine._finish_stamp,
+            file_path,
+            handler,
+            content,
+            result,
+            **self.handler_kwargs,
+        )
+        write.add_done_callback(
+            self._guard(file_path, done, self._after_write, timings)
+        )
+
+    def _after_write(
+        self,
+        file_path: Path,
+        done: "Future[OnexResultModel]",
+        timings: Dict[str, float],
+        write: "Future[Tuple[OnexResultModel, float]]",
+    ) -> None:
+        result, timings["write"] = write.result()
+        self._complete(done, result, timings)
+
+    def _complete(
+        self,
+        done: "Future[OnexResultModel]",
+        result: OnexResultModel,
+        timings: Dict[str, float],
+    ) -> None:
+        with self._lock:
+            for stage, seconds in timings.items():
+                self.stage_seconds[stage] += seconds
+        result.metadata = {**(result.metadata or {}), "stage_seconds": timings}
+        done.set_result(result)
+
+    def _guard(
+        self,
+        file_path: Path,
+        done: "Future[OnexResultModel]",
+        step: Callable[..., None],
+        timings: Dict[str, float],
+    ) -> Callable[["Future[Any]"], None]:
+        """
+        Wrap a stage callback so any failure, in the stage or the callback,
+        completes done with an error result instead of stalling imap.
+        """
+        from .stamper_engine import _stamp_error_result
+
+        def callback(future: "Future[Any]") -> None:
+            try:
+                step(file_path, done, timings, future)
+            except Exception as e:
+                logger.error(f"Exception in stamp pipeline for {file_path}: {e}")
+                if not done.done():
+                    done.set_result(_stamp_error_result(file_path, e))
+
+        return callback
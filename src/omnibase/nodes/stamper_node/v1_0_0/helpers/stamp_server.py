@@ -0,0 +1,263 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: stamp_server.py
+# version: 1.0.0
+# uuid: 6aac49ea-915b-45db-889e-e4b99be1f5cf
+# author: OmniNode Team
+# created_at: 2026-10-16T23:15:29.335487
+# last_modified_at: 2026-10-17T01:05:03.404584
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: d35a10ee48bb98411cd51e53b087603b926e5c90c7d7613f6232e7a865ef0d5f
+# entrypoint: python@stamp_server.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.stamp_server
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Long-lived stamping server: one warm StamperEngine answering JSON-lines RPC.
+
+Each request is one JSON object per line,
+  {"id": 1, "method": "stamp_file", "params": {"path": "/abs/file.py"}}
+and is answered by one line carrying either "result" or "error" ({"code", "message"}).
+Methods: stamp_file, stamp_content, verify, extract_block, ping, shutdown. The
+server listens on a Unix domain socket (see stamp_client for the thin client) or
+on stdin/stdout. Requests are handled one at a time, since the engine and its
+stamp cache are not thread-safe.
+"""
+
+import inspect
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TextIO
+
+from omnibase.core.error_codes import CoreErrorCode, OnexError, OnexErrorCode
+from omnibase.enums import LogLevelEnum, TemplateTypeEnum
+from omnibase.model.model_onex_message_result import OnexResultModel, OnexStatus
+
+from .stamper_engine import StamperEngine, _file_result, json_default
+
+logger = logging.getLogger(__name__)
+
+
+class StampServer:
+    """Dispatch JSON-lines RPC requests to a single StamperEngine."""
+
+    def __init__(
+        self, engine: StamperEngine, idle_timeout: Optional[float] = None
+    ) -> None:
+        self.engine = engine
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._last_activity = time.monotonic()
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "stamp_file": self.stamp_file,
+            "stamp_content": self.stamp_content,
+            "verify": self.verify,
+            "extract_block": self.extract_block,
+            "ping": self.ping,
+            "shutdown": self.shutdown,
+        }
+
+    @property
+    def shutdown_requested(self) -> bool:
+        return self._shutdown.is_set()
+
+    def stamp_file(
+        self,
+        path: str,
+        author: str = "OmniNode Team",
+        template: str = "minimal",
+        overwrite: bool = False,
+        repair: bool = False,
+        force_overwrite: bool = False,
+    ) -> Dict[str, Any]:
+        file_path = Path(path)
+        ignore_patterns = self.engine.load_onexignore(file_path.parent)
+        if self.engine.should_ignore(file_path, ignore_patterns):
+            return _dump(
+                _file_result(
+                    file_path,
+                    OnexStatus.SKIPPED,
+                    "Ignored by .onexignore",
+                    LogLevelEnum.INFO,
+                )
+            )
+        template_type = TemplateTypeEnum.__members__.get(
+            template.upper(), TemplateTypeEnum.MINIMAL
+        )
+        return _dump(
+            self.engine.stamp_file(
+                file_path,
+                template=template_type,
+                overwrite=overwrite,
+                repair=repair,
+                force_overwrite=force_overwrite,
+                author=author,
+            )
+        )
+
+    def stamp_content(self, path: str, content: str) -> Dict[str, Any]:
+        """Stamp an editor buffer; path is only a hint and is not touched."""
+        return _dump(self.engine.stamp_content(Path(path), content))
+
+    def verify(self, path: str) -> Dict[str, Any]:
+        target = Path(path)
+        if target.is_dir():
+            return _dump(self.engine.verify_directory(target))
+        return _dump(self.engine.verify_file(target))
+
+    def extract_block(self, path: str) -> Dict[str, Any]:
+        file_path = Path(path)
+        handler = self.engine.handler_registry.get_handler(file_path)
+        if handler is None:
+            raise OnexError(
+                f"No handler registered for {file_path}",
+                CoreErrorCode.UNSUPPORTED_OPERATION,
+            )
+        content = self.engine.file_io.read_text(file_path) or ""
+        block, _ = handler.extract_block(file_path, content)
+        metadata = block.model_dump(mode="json") if block is not None else None
+        return {"target": str(file_path), "metadata": metadata}
+
+    def ping(self) -> Dict[str, Any]:
+        return {"pid": os.getpid(), "cwd": str(Path.cwd())}
+
+    def shutdown(self) -> Dict[str, Any]:
+        self._shutdown.set()
+        return {"ok": True}
+
+    def handle_request(self, request: Any) -> Dict[str, Any]:
+        """Run one decoded request and return the response object."""
+        self._last_activity = time.monotonic()
+        request_id = request.get("id") if isinstance(request, dict) else None
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(request_id, "INVALID_REQUEST", "Expected a method name")
+        method = self._methods.get(request["method"])
+        if method is None:
+            return _error(
+                request_id, "METHOD_NOT_FOUND", f"Unknown method {request['method']}"
+            )
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return _error(request_id, "INVALID_PARAMS", "params must be an object")
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as e:
+            return _error(request_id, "INVALID_PARAMS", str(e))
+        try:
+            with self._lock:
+                result = method(**params)
+        except OnexError as e:
+            code = e.error_code
+            code_str = code.value if isinstance(code, OnexErrorCode) else code
+            return _error(request_id, code_str or "ONEX_ERROR", e.message)
+        except Exception as e:
+            logger.exception(f"Error handling {request['method']}")
+            return _error(request_id, "INTERNAL_ERROR", str(e))
+        return {"id": request_id, "result": result}
+
+    def handle_line(self, line: str) -> str:
+        """Decode one request line and return the encoded response line."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = _error(None, "PARSE_ERROR", str(e))
+        else:
+            response = self.handle_request(request)
+        return json.dumps(response, default=json_default)
+
+    def serve_stdio(self, stdin: TextIO, stdout: TextIO) -> None:
+        """Answer requests from stdin on stdout until EOF or shutdown."""
+        for line in stdin:
+            if not line.strip():
+                continue
+            stdout.write(self.handle_line(line) + "\n")
+            stdout.flush()
+            if self.shutdown_requested:
+                break
+
+    def serve_unix(self, socket_path: Path) -> None:
+        """
+        Listen on socket_path until shutdown is requested or the server has been
+        idle for idle_timeout seconds. A stale socket file is replaced; a live
+        one means another server already owns the path.
+        """
+        if socket_path.exists():
+            if _socket_alive(socket_path):
+                raise OnexError(
+                    f"A stamping server is already listening on {socket_path}",
+                    CoreErrorCode.RESOURCE_UNAVAILABLE,
+                )
+            socket_path.unlink()
+        server = _UnixRpcServer(str(socket_path), _RpcRequestHandler)
+        server.rpc = self
+        os.chmod(socket_path, 0o600)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.1}, daemon=True
+        )
+        thread.start()
+        logger.info(f"Stamping server listening on {socket_path}")
+        try:
+            while not self._shutdown.wait(0.1):
+                idle = time.monotonic() - self._last_activity
+                if self.idle_timeout and idle > self.idle_timeout:
+                    logger.info("Stamping server idle, shutting down")
+                    break
+        finally:
+            server.shutdown()
+            server.server_close()
+            socket_path.unlink(missing_ok=True)
+
+
+class _UnixRpcServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    rpc: StampServer
+
+
+class _RpcRequestHandler(socketserver.StreamRequestHandler):
+    server: _UnixRpcServer
+
+    def handle(self) -> None:
+        rpc = self.server.rpc
+        for raw in self.rfile:
+            line = raw.decode("utf-8")
+            if not line.strip():
+                continue
+            self.wfile.write(rpc.handle_line(line).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if rpc.shutdown_requested:
+                break
+
+
+def _dump(result: OnexResultModel) -> Dict[str, Any]:
+    return result.model_dump(mode="json", exclude_none=True)
+
+
+def _error(request_id: Any, code: str, message: str) -> Dict[str, Any]:
+    return {"id": request_id, "error": {"code": code, "message": message}}
+
+
+def _socket_alive(socket_path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
@@ -0,0 +1,290 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: stamp_watcher.py
+# version: 1.0.0
+# uuid: 43d66850-9006-484b-94d8-c25ce434a41b
+# author: OmniNode Team
+# created_at: 2026-10-16T23:01:26.970906
+# last_modified_at: 2026-10-17T01:05:03.406697
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 0dd2da3c0656ef23780673a10621ff5eaa57a72b651901ff68036bbe9abc84b6
+# entrypoint: python@stamp_watcher.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.stamp_watcher
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Watch-mode stamping: keep one warm StamperEngine and re-stamp files as they change.
+
+Change detection uses Linux inotify (through ctypes, no extra dependency) when it
+is available and falls back to periodic stat polling elsewhere. Changed paths are
+debounced, filtered with the engine's DirectoryTraverser (include/exclude patterns
+and .onexignore), and stamped. Events caused by the watcher's own writes are
+suppressed by remembering the stat signature each stamped file was left with.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Protocol, Set, Tuple
+
+from omnibase.core.error_codes import CoreErrorCode, OnexError
+from omnibase.model.model_onex_message_result import OnexResultModel
+from omnibase.utils.directory_traverser import DirectoryTraverser
+
+from .stamper_engine import StamperEngine
+
+logger = logging.getLogger(__name__)
+
+StatSignature = Tuple[int, int, int]
+
+
+def _stat_signature(path: Path) -> Optional[StatSignature]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _walk(root: Path) -> Iterator[Tuple[Path, List[str]]]:
+    """os.walk that prunes the traverser's default ignored directories."""
+    ignored = set(DirectoryTraverser.DEFAULT_IGNORE_DIRS)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in ignored]
+        yield Path(dirpath), filenames
+
+
+class ChangeSource(Protocol):
+    """Reports paths of files that may have changed."""
+
+    def wait(self, timeout: float) -> Set[Path]:
+        """Block for up to timeout seconds and return changed file paths."""
+        ...
+
+    def close(self) -> None: ...
+
+
+class PollingChangeSource:
+    """Portable change source that rescans the tree and compares stat signatures."""
+
+    def __init__(self, root: Path, interval: float = 1.0) -> None:
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, StatSignature]:
+        snapshot: Dict[Path, StatSignature] = {}
+        for dirpath, filenames in _walk(self.root):
+            for name in filenames:
+                path = dirpath / name
+                signature = _stat_signature(path)
+                if signature is not None:
+                    snapshot[path] = signature
+        return snapshot
+
+    def wait(self, timeout: float) -> Set[Path]:
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._scan()
+        changed = {
+            path
+            for path, signature in snapshot.items()
+            if self._snapshot.get(path) != signature
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyChangeSource:
+    """Linux inotify change source; watches every non-ignored directory under root."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root: Path) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or libc_name is None:
+            raise OnexError(
+                "inotify is only available on Linux",
+                CoreErrorCode.UNSUPPORTED_OPERATION,
+            )
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OnexError(
+                f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}",
+                CoreErrorCode.RESOURCE_UNAVAILABLE,
+            )
+        self.root = root
+        self._watches: Dict[int, Path] = {}
+        self._add_tree(root)
+
+    def _add_tree(self, directory: Path) -> Set[Path]:
+        """Watch directory and its subdirectories; return the files already inside."""
+        existing: Set[Path] = set()
+        for dirpath, filenames in _walk(directory):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(dirpath), self.WATCH_MASK
+            )
+            if wd < 0:
+                logger.warning(
+                    f"Cannot watch {dirpath}: {os.strerror(ctypes.get_errno())}"
+                )
+                continue
+            self._watches[wd] = dirpath
+            existing.update(dirpath / name for name in filenames)
+        return existing
+
+    def wait(self, timeout: float) -> Set[Path]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                logger.warning("inotify queue overflow; some changes may be missed")
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    if name not in DirectoryTraverser.DEFAULT_IGNORE_DIRS:
+                        changed.update(self._add_tree(path))
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_change_source(
+    root: Path, force_polling: bool = False, poll_interval: float = 1.0
+) -> ChangeSource:
+    """Return an inotify change source when possible, otherwise a polling one."""
+    if not force_polling:
+        try:
+            return InotifyChangeSource(root)
+        except (OnexError, OSError, AttributeError) as e:
+            logger.info(f"inotify unavailable ({e}); falling back to stat polling")
+    return PollingChangeSource(root, interval=poll_interval)
+
+
+class StampWatcher:
+    """
+    Re-stamp files under a directory as they change, using one warm StamperEngine.
+
+    A path is stamped once no new event has arrived for it for `debounce` seconds.
+    """
+
+    def __init__(
+        self,
+        engine: StamperEngine,
+        directory: Path,
+        change_source: Optional[ChangeSource] = None,
+        debounce: float = 0.5,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+        on_result: Optional[Callable[[Path, OnexResultModel], None]] = None,
+        **stamp_kwargs: object,
+    ) -> None:
+        self.engine = engine
+        self.directory = directory
+        self.change_source = change_source or create_change_source(directory)
+        self.debounce = debounce
+        self.include_patterns = include_patterns or engine.default_include_patterns()
+        self.exclude_patterns = exclude_patterns
+        self.ignore_file = ignore_file
+        self.on_result = on_result
+        self.stamp_kwargs = stamp_kwargs
+        self._pending: Dict[Path, float] = {}
+        self._own_writes: Dict[Path, StatSignature] = {}
+
+    def poll_once(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Wait for changes once, then stamp every pending path whose debounce window
+        has elapsed. Returns the paths that were stamped.
+        """
+        wait = self.debounce if timeout is None else timeout
+        now = time.monotonic()
+        for path in self.change_source.wait(wait):
+            # Each recorded write suppresses at most its own event; an entry
+            # that no longer matches the file is dropped too
+            own_write = self._own_writes.pop(path, None)
+            if own_write is not None and own_write == _stat_signature(path):
+                continue
+            self._pending[path] = now
+        now = time.monotonic()
+        ready = [p for p, t in self._pending.items() if now - t >= self.debounce]
+        if not ready:
+            return []
+        for path in ready:
+            del self._pending[path]
+        eligible = self.engine.directory_traverser.filter_files(
+            self.directory,
+            ready,
+            self.include_patterns,
+            self.exclude_patterns,
+            True,
+            self.ignore_file,
+        )
+        stamped = sorted(eligible)
+        for path in stamped:
+            before = _stat_signature(path)
+            result = self.engine.stamp_file(path, **self.stamp_kwargs)  # type: ignore[arg-type]
+            signature = _stat_signature(path)
+            # Only an actual write produces an event to suppress
+            if signature is not None and signature != before:
+                self._own_writes[path] = signature
+            if self.on_result is not None:
+                self.on_result(path, result)
+        return stamped
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """Watch until stop_event is set (or forever)."""
+        try:
+            while stop_event is None or not stop_event.is_set():
+                self.poll_once()
+        finally:
+            self.change_source.close()
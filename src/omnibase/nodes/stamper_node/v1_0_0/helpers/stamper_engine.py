@@ -9,11 +9,11 @@
 # uuid: af51a862-dd59-44c9-a1b9-6c7e26be3e39
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.901473
-# last_modified_at: 2025-05-22T20:47:09.031691
+# last_modified_at: 2026-10-17T01:12:36.641829
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: e492adc871076b448cd464fb0ab40d48ffed4f01098f0d2101f1633dd2a202db
+# hash: 21f56f4d8e9b06c3c309598369382782e71a22601e21fb54d1dbfeed78b21dc7
 # entrypoint: python@stamper_engine.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.stamper_engine
@@ -22,11 +22,14 @@
 
 
 import datetime
-import hashlib
 import json
 import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from omnibase.core.core_file_type_handler_registry import FileTypeHandlerRegistry
 from omnibase.core.error_codes import CoreErrorCode, OnexError
@@ -37,10 +40,16 @@ from omnibase.model.model_onex_message_result import (
     OnexStatus,
 )
 from omnibase.protocol.protocol_file_io import ProtocolFileIO
+from omnibase.protocol.protocol_file_type_handler import ProtocolFileTypeHandler
 from omnibase.protocol.protocol_schema_loader import ProtocolSchemaLoader
 from omnibase.protocol.protocol_stamper_engine import ProtocolStamperEngine
 from omnibase.runtimes.onex_runtime.v1_0_0.io.in_memory_file_io import InMemoryFileIO
+from omnibase.utils.canonical_hasher import UnsupportedHashAlgorithmError, hash_text
 from omnibase.utils.directory_traverser import DirectoryTraverser
+from omnibase.utils.path_classifier import PathClassification, PathClassifier
+
+from .stamp_cache import StampCache
+from .stamp_pipeline import StampPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +63,89 @@ def json_default(obj: object) -> str:  # type: ignore[no-untyped-def]
     )
 
 
+def _file_result(
+    path: Path,
+    status: OnexStatus,
+    summary: str,
+    level: LogLevelEnum,
+    **metadata: Any,
+) -> OnexResultModel:
+    return OnexResultModel(
+        status=status,
+        target=str(path),
+        messages=[
+            OnexMessageModel(
+                summary=summary,
+                level=level,
+                file=str(path),
+                line=None,
+                details=None,
+                code=None,
+                context=None,
+                timestamp=datetime.datetime.now(),
+                type=None,
+            )
+        ],
+        metadata={"note": summary, **metadata},
+    )
+
+
+def _stamp_error_result(path: Path, error: Exception) -> OnexResultModel:
+    return OnexResultModel(
+        status=OnexStatus.ERROR,
+        target=str(path),
+        messages=[
+            OnexMessageModel(
+                summary=f"Error stamping file: {str(error)}",
+                level=LogLevelEnum.ERROR,
+                file=str(path),
+                line=None,
+                details=None,
+                code=None,
+                context=None,
+                timestamp=datetime.datetime.now(),
+                type=None,
+            )
+        ],
+    )
+
+
+# Per-process engine for parallel stamping workers; built once by
+# _init_stamp_worker so each worker keeps a warm handler registry.
+_worker_engine: Optional["StamperEngine"] = None
+
+
+def _init_stamp_worker(
+    schema_loader: ProtocolSchemaLoader,
+    file_io: ProtocolFileIO,
+    stamp_cache: Optional[StampCache] = None,
+) -> None:
+    global _worker_engine
+    _worker_engine = StamperEngine(
+        schema_loader=schema_loader, file_io=file_io, stamp_cache=stamp_cache
+    )
+
+
+def _stamp_in_worker(file_path: Path, **kwargs: Any) -> OnexResultModel:
+    if _worker_engine is None:
+        raise OnexError(
+            "Stamp worker used before initialization",
+            CoreErrorCode.OPERATION_FAILED,
+        )
+    return _worker_engine.stamp_file(file_path, **kwargs)
+
+
+def _stamp_content_in_worker(
+    path_hint: Path, content: str, **kwargs: Any
+) -> OnexResultModel:
+    if _worker_engine is None:
+        raise OnexError(
+            "Stamp worker used before initialization",
+            CoreErrorCode.OPERATION_FAILED,
+        )
+    return _worker_engine.stamp_content(path_hint, content, **kwargs)
+
+
 class StamperEngine(ProtocolStamperEngine):
     MAX_FILE_SIZE = 5 * 1024 * 1024
 
@@ -63,8 +155,12 @@ class StamperEngine(ProtocolStamperEngine):
         directory_traverser: Optional[DirectoryTraverser] = None,
         file_io: Optional[ProtocolFileIO] = None,
         handler_registry: Optional[FileTypeHandlerRegistry] = None,
+        stamp_cache: Optional[StampCache] = None,
     ) -> None:
         self.schema_loader = schema_loader
+        self.stamp_cache = stamp_cache
+        # Stage totals of the last pipelined directory run (io_threads > 0)
+        self.last_stage_seconds: Optional[Dict[str, float]] = None
         self.directory_traverser = directory_traverser or DirectoryTraverser()
         self.file_io = file_io or InMemoryFileIO()
         logger = logging.getLogger("omnibase.tools.stamper_engine")
@@ -93,101 +189,353 @@ class StamperEngine(ProtocolStamperEngine):
             logger.debug(
                 f"[START] stamp_file for path={path}, template={template}, overwrite={overwrite}, repair={repair}, force_overwrite={force_overwrite}, author={author}, discover_functions={discover_functions}"
             )
+            prepared = self._prepare_stamp(path, force_overwrite, **kwargs)
+            if isinstance(prepared, OnexResultModel):
+                return prepared
+            handler, orig_content = prepared
+            # Delegate all stamping/idempotency to the handler
+            result = handler.stamp(path, orig_content, **kwargs)
+            logger.debug(f"Stamp result for {path}: {result}")
+            return self._finish_stamp(path, handler, orig_content, result, **kwargs)
+        except UnsupportedHashAlgorithmError as e:
+            return _file_result(
+                path, OnexStatus.ERROR, e.message, LogLevelEnum.ERROR, error=e.message
+            )
+        except Exception as e:
+            logger.error(f"Exception in stamp_file for {path}: {e}", exc_info=True)
+            return _stamp_error_result(path, e)
+
+    def stamp_content(
+        self, path_hint: Path, content: str, **kwargs: object
+    ) -> OnexResultModel:
+        """
+        Stamp an in-memory buffer without any file I/O.
+
+        path_hint selects the handler and supplies the path-derived metadata
+        (name, namespace, entrypoint); it is never read or written. On success,
+        metadata["content"] is the stamped text and metadata["hash"] its hash.
+        The stamp cache is neither consulted nor updated.
+        """
+        handler = self.handler_registry.get_handler(path_hint)
+        if handler is None:
+            return _file_result(
+                path_hint,
+                OnexStatus.WARNING,
+                f"No handler registered for file type: {path_hint.suffix}",
+                LogLevelEnum.WARNING,
+                note="Skipped: no handler registered",
+            )
+        try:
+            return handler.stamp(path_hint, content, **kwargs)
+        except Exception as e:
+            logger.error(f"Exception in stamp_content for {path_hint}: {e}")
+            return _file_result(
+                path_hint,
+                OnexStatus.ERROR,
+                f"Error stamping content: {e}",
+                LogLevelEnum.ERROR,
+            )
+
+    def stamp_contents(
+        self, batch: Iterable[Tuple[Path, str]], **kwargs: object
+    ) -> List[OnexResultModel]:
+        """stamp_content over (path_hint, content) pairs, returning results in order."""
+        return [
+            self.stamp_content(path_hint, content, **kwargs)
+            for path_hint, content in batch
+        ]
+
+    def _prepare_stamp(
+        self, path: Path, force_overwrite: bool = False, **kwargs: object
+    ) -> Union[OnexResultModel, Tuple[ProtocolFileTypeHandler, str]]:
+        """
+        Everything stamp_file does before handler.stamp: pick the handler and
+        read the file. Returns (handler, content) when the file needs stamping,
+        or the final result when it does not (no handler, stamp cache hit, or a
+        large file that was streamed or skipped).
+
+        When a stamp cache is configured, files whose stat and handler fingerprint
+        match a previous successful stamp are returned without being read. Files
+        larger than MAX_FILE_SIZE are never read whole: they are stamped in place
+        through handler.stamp_stream, or skipped if the handler cannot stream.
+        """
+        handler = self.handler_registry.get_handler(path)
+        if handler is None:
             # Special handling for ignore files
-            ignore_filenames = {".onexignore", ".gitignore"}
-            if path.name in ignore_filenames:
-                handler = self.handler_registry.get_handler(path)
-                if handler is None:
-                    logger.warning(f"No handler registered for ignore file: {path}")
-                    return OnexResultModel(
-                        status=OnexStatus.WARNING,
-                        target=str(path),
-                        messages=[
-                            OnexMessageModel(
-                                summary=f"No handler registered for ignore file type: {path.suffix}",
-                                level=LogLevelEnum.WARNING,
-                                file=str(path),
-                                line=None,
-                                details=None,
-                                code=None,
-                                context=None,
-                                timestamp=datetime.datetime.now(),
-                                type=None,
-                            )
-                        ],
-                        metadata={
-                            "note": "Skipped: no handler registered for ignore file"
-                        },
-                    )
-                # Delegate stamping to the handler
-                orig_content = self.file_io.read_text(path)
-                if orig_content is None:
-                    orig_content = ""
-                result = handler.stamp(path, orig_content, **kwargs)
-                logger.debug(f"Stamp result for ignore file {path}: {result}")
-                stamped_content = (
-                    result.metadata.get("content") if result.metadata else None
+            if path.name in {".onexignore", ".gitignore"}:
+                logger.warning(f"No handler registered for ignore file: {path}")
+                return _file_result(
+                    path,
+                    OnexStatus.WARNING,
+                    f"No handler registered for ignore file type: {path.suffix}",
+                    LogLevelEnum.WARNING,
+                    note="Skipped: no handler registered for ignore file",
                 )
-                if stamped_content is not None and stamped_content != orig_content:
-                    logger.info(f"Writing stamped content to {path}")
-                    self.file_io.write_text(path, stamped_content)
-                return result
-            # Use handler-based stamping for all other files
-            handler = self.handler_registry.get_handler(path)
-            if handler is None:
-                logger.warning(f"No handler registered for file: {path}")
+            logger.warning(f"No handler registered for file: {path}")
+            return _file_result(
+                path,
+                OnexStatus.WARNING,
+                f"No handler registered for file type: {path.suffix}",
+                LogLevelEnum.WARNING,
+                note="Skipped: no handler registered",
+            )
+        if self.stamp_cache is not None and not force_overwrite:
+            fingerprint = self._cache_fingerprint(
+                handler, bool(kwargs.get("discover_functions", False))
+            )
+            cached_hash = self.stamp_cache.lookup(path, fingerprint)
+            if cached_hash is not None:
+                logger.debug(f"Stamp cache hit for {path}")
                 return OnexResultModel(
-                    status=OnexStatus.WARNING,
+                    status=OnexStatus.SUCCESS,
                     target=str(path),
-                    messages=[
-                        OnexMessageModel(
-                            summary=f"No handler registered for file type: {path.suffix}",
-                            level=LogLevelEnum.WARNING,
-                            file=str(path),
-                            line=None,
-                            details=None,
-                            code=None,
-                            context=None,
-                            timestamp=datetime.datetime.now(),
-                            type=None,
-                        )
-                    ],
-                    metadata={"note": "Skipped: no handler registered"},
+                    messages=[],
+                    metadata={
+                        "note": "Unchanged (stamp cache hit)",
+                        "hash": cached_hash,
+                    },
                 )
-            # Read file content
-            orig_content = self.file_io.read_text(path)
-            if orig_content is None:
-                orig_content = ""
-            # Delegate all stamping/idempotency to the handler
-            result = handler.stamp(path, orig_content, **kwargs)
-            logger.debug(f"Stamp result for {path}: {result}")
-            stamped_content = (
-                result.metadata.get("content") if result.metadata else None
+        if self._exceeds_max_file_size(path):
+            streamed = handler.stamp_stream(path, **kwargs)
+            if streamed is None:
+                return _file_result(
+                    path,
+                    OnexStatus.SKIPPED,
+                    f"File exceeds {self.MAX_FILE_SIZE} bytes and "
+                    f"{handler.handler_name} cannot stream it",
+                    LogLevelEnum.INFO,
+                )
+            self._record_stamp(path, handler, streamed, **kwargs)
+            return streamed
+        orig_content = self.file_io.read_text(path)
+        return handler, orig_content or ""
+
+    def _finish_stamp(
+        self,
+        path: Path,
+        handler: ProtocolFileTypeHandler,
+        orig_content: str,
+        result: OnexResultModel,
+        **kwargs: object,
+    ) -> OnexResultModel:
+        """Write the stamped content back if it changed and record the stamp."""
+        stamped_content = result.metadata.get("content") if result.metadata else None
+        # Only write if content differs
+        if stamped_content is not None and stamped_content != orig_content:
+            logger.info(f"Writing stamped content to {path}")
+            self.file_io.write_text(path, stamped_content)
+        self._record_stamp(path, handler, result, **kwargs)
+        return result
+
+    def _record_stamp(
+        self,
+        path: Path,
+        handler: ProtocolFileTypeHandler,
+        result: OnexResultModel,
+        **kwargs: object,
+    ) -> None:
+        if (
+            self.stamp_cache is not None
+            and result.status == OnexStatus.SUCCESS
+            and result.metadata
+            and result.metadata.get("hash")
+        ):
+            fingerprint = self._cache_fingerprint(
+                handler, bool(kwargs.get("discover_functions", False))
+            )
+            self.stamp_cache.record(path, fingerprint, str(result.metadata["hash"]))
+
+    def _exceeds_max_file_size(self, path: Path) -> bool:
+        # Paths that only exist in an in-memory file_io have nothing to stat
+        try:
+            return path.stat().st_size > self.MAX_FILE_SIZE
+        except OSError:
+            return False
+
+    @staticmethod
+    def _cache_fingerprint(
+        handler: ProtocolFileTypeHandler, discover_functions: bool = False
+    ) -> str:
+        return (
+            f"{handler.handler_name}@{handler.handler_version}"
+            f":discover_functions={discover_functions}"
+        )
+
+    def verify_file(self, path: Path) -> OnexResultModel:
+        """
+        Read-only stamp check for a single file.
+
+        Compares the stored hash with the canonical hash of the existing block and
+        body, without building or serializing a replacement block. Files larger
+        than MAX_FILE_SIZE are never read whole: they are verified through
+        handler.verify_hash_stream, or skipped if the handler cannot stream.
+        Returns SUCCESS for a clean file, ERROR for a stale or missing stamp or
+        an unreadable file, and SKIPPED when no handler can verify the file.
+        """
+        handler = self.handler_registry.get_handler(path)
+        if handler is None:
+            return _file_result(
+                path, OnexStatus.SKIPPED, "No handler registered", LogLevelEnum.INFO
+            )
+        try:
+            return self._verify_with_handler(path, handler)
+        except UnsupportedHashAlgorithmError as e:
+            return _file_result(
+                path, OnexStatus.ERROR, e.message, LogLevelEnum.ERROR, error=e.message
             )
-            # Only write if content differs
-            if stamped_content is not None and stamped_content != orig_content:
-                logger.info(f"Writing stamped content to {path}")
-                self.file_io.write_text(path, stamped_content)
-            return result
         except Exception as e:
-            logger.error(f"Exception in stamp_file for {path}: {e}", exc_info=True)
-            return OnexResultModel(
-                status=OnexStatus.ERROR,
-                target=str(path),
-                messages=[
-                    OnexMessageModel(
-                        summary=f"Error stamping file: {str(e)}",
-                        level=LogLevelEnum.ERROR,
-                        file=str(path),
-                        line=None,
-                        details=None,
-                        code=None,
-                        context=None,
-                        timestamp=datetime.datetime.now(),
-                        type=None,
-                    )
-                ],
+            logger.error(f"Exception in verify_file for {path}: {e}", exc_info=True)
+            return _file_result(
+                path,
+                OnexStatus.ERROR,
+                f"Error verifying file: {e}",
+                LogLevelEnum.ERROR,
+                error=str(e),
+            )
+
+    def _verify_with_handler(
+        self, path: Path, handler: ProtocolFileTypeHandler
+    ) -> OnexResultModel:
+        fingerprint = self._cache_fingerprint(handler)
+        if self.stamp_cache is not None:
+            cached_hash = self.stamp_cache.lookup(path, fingerprint)
+            if cached_hash is not None:
+                return _file_result(
+                    path,
+                    OnexStatus.SUCCESS,
+                    "Stamp is current (stamp cache hit)",
+                    LogLevelEnum.INFO,
+                    hash=cached_hash,
+                )
+        if self._exceeds_max_file_size(path):
+            hashes = handler.verify_hash_stream(path)
+            if hashes is None:
+                return _file_result(
+                    path,
+                    OnexStatus.SKIPPED,
+                    f"File exceeds {self.MAX_FILE_SIZE} bytes and "
+                    f"{handler.handler_name} cannot stream it",
+                    LogLevelEnum.INFO,
+                )
+        else:
+            content = self.file_io.read_text(path) or ""
+            hashes = handler.verify_hash(path, content)
+        if hashes is None:
+            return _file_result(
+                path,
+                OnexStatus.SKIPPED,
+                f"{handler.handler_name} does not support verification",
+                LogLevelEnum.INFO,
             )
+        stored_hash, canonical_hash = hashes
+        if stored_hash is None:
+            return _file_result(
+                path, OnexStatus.ERROR, "Missing metadata block", LogLevelEnum.ERROR
+            )
+        if stored_hash != canonical_hash:
+            return _file_result(
+                path,
+                OnexStatus.ERROR,
+                "Stale stamp: stored hash does not match content",
+                LogLevelEnum.ERROR,
+                hash=stored_hash,
+                expected_hash=canonical_hash,
+            )
+        if self.stamp_cache is not None:
+            self.stamp_cache.record(path, fingerprint, stored_hash)
+        return _file_result(
+            path,
+            OnexStatus.SUCCESS,
+            "Stamp is current",
+            LogLevelEnum.INFO,
+            hash=stored_hash,
+        )
+
+    def verify_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+        files: Optional[List[Path]] = None,
+    ) -> OnexResultModel:
+        """
+        Verify every eligible file in a directory without modifying anything.
+
+        File selection is the same as process_directory (including files= for
+        git-aware runs), and files are verified as the walk finds them. The
+        result is ERROR if any stamp is stale or missing; metadata lists the
+        offending files.
+        """
+        if include_patterns is None:
+            include_patterns = self.default_include_patterns()
+        eligible = self.directory_traverser.iter_files(
+            directory,
+            include_patterns,
+            exclude_patterns,
+            ignore_file,
+            recursive=recursive,
+            files=files,
+        )
+        verified = 0
+        stale_files: List[str] = []
+        missing_files: List[str] = []
+        skipped_files: List[str] = []
+        error_files: Dict[str, str] = {}
+        for path in eligible:
+            result = self.verify_file(path)
+            if result.status == OnexStatus.SUCCESS:
+                verified += 1
+            elif result.status == OnexStatus.SKIPPED:
+                skipped_files.append(str(path))
+            elif result.metadata and "expected_hash" in result.metadata:
+                stale_files.append(str(path))
+            elif result.metadata and "error" in result.metadata:
+                error_files[str(path)] = result.metadata["error"]
+            else:
+                missing_files.append(str(path))
+        failed = len(stale_files) + len(missing_files) + len(error_files)
+        status = OnexStatus.ERROR if failed else OnexStatus.SUCCESS
+        return OnexResultModel(
+            status=status,
+            target=str(directory),
+            messages=[
+                OnexMessageModel(
+                    summary=f"Verified {verified} files, {len(stale_files)} stale, "
+                    f"{len(missing_files)} missing stamps, "
+                    f"{len(error_files)} errors, "
+                    f"{len(skipped_files)} skipped",
+                    level=LogLevelEnum.ERROR if failed else LogLevelEnum.INFO,
+                    file=str(directory),
+                    line=None,
+                    details=None,
+                    code=None,
+                    context=None,
+                    timestamp=datetime.datetime.now(),
+                    type=None,
+                )
+            ],
+            metadata={
+                "verified": verified,
+                "stale": len(stale_files),
+                "missing": len(missing_files),
+                "errors": len(error_files),
+                "skipped": len(skipped_files),
+                "stale_files": stale_files,
+                "missing_files": missing_files,
+                "error_files": error_files,
+                "skipped_files": skipped_files,
+            },
+        )
+
+    def default_include_patterns(self) -> List[str]:
+        """Include patterns for every extension with a registered handler."""
+        include_patterns = []
+        for ext in self.handler_registry.handled_extensions():
+            include_patterns.append(f"*.{ext.lstrip('.')}")
+            include_patterns.append(f"**/*{ext}")
+        return include_patterns
 
     def _compute_trace_hash(self, filepath: Path) -> str:
         try:
@@ -197,8 +545,7 @@ class StamperEngine(ProtocolStamperEngine):
             else:
                 data = self.file_io.read_json(filepath)
             content = json.dumps(data, sort_keys=True, default=json_default)
-            sha256 = hashlib.sha256(content.encode("utf-8"))
-            return sha256.hexdigest()
+            return hash_text(content)
         except Exception as e:
             logger.error(f"Error computing trace hash for {filepath}: {str(e)}")
             return f"error-{str(e)}"
@@ -216,35 +563,176 @@ class StamperEngine(ProtocolStamperEngine):
         overwrite: bool = False,
         repair: bool = False,
         force_overwrite: bool = False,
+        jobs: int = 1,
+        files: Optional[List[Path]] = None,
+        io_threads: int = 0,
     ) -> OnexResultModel:
-        def stamp_processor(file_path: Path) -> OnexResultModel:
-            return self.stamp_file(
-                file_path,
-                template=template,
-                overwrite=overwrite,
-                repair=repair,
-                force_overwrite=force_overwrite,
-                author=author,
+        """
+        Stamp all eligible files in a directory.
+
+        With jobs > 1 (or 0 for one worker per CPU) files are spread across a
+        process pool; each worker builds its own StamperEngine with the canonical
+        handler registry. The merged result is identical to a serial run.
+        Parallel mode needs a file I/O that workers can share, so in-memory
+        file I/O always runs serially.
+
+        When files is given (e.g. the paths changed in git), the directory is not
+        walked; the same include/exclude, .onexignore and schema rules are applied
+        to those files instead.
+
+        With io_threads > 0 files go through a StampPipeline instead: reads and
+        writes run on io_threads threads while the jobs workers extract and hash,
+        so disk and CPU work overlap. Each file result then carries its
+        per-stage times in metadata["stage_seconds"], and the directory result
+        the totals.
+        """
+        if include_patterns is None:
+            include_patterns = self.default_include_patterns()
+        with self._directory_processor(
+            jobs,
+            dry_run,
+            io_threads,
+            template=template,
+            overwrite=overwrite,
+            repair=repair,
+            force_overwrite=force_overwrite,
+            author=author,
+        ) as (processor, executor, workers):
+            result = self.directory_traverser.process_directory(
+                directory=directory,
+                processor=processor,
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns,
+                recursive=recursive,
+                ignore_file=ignore_file,
+                dry_run=dry_run,
+                # Large files are streamed or skipped per handler in _prepare_stamp
+                max_file_size=0,
+                files=files,
+                executor=executor,
+                executor_workers=workers,
             )
+        return self._directory_result(directory, result)
 
-        logger.debug(f"process_directory: exclude_patterns={exclude_patterns}")
-        # Use registry-driven include patterns if not provided
+    def iter_process_directory(
+        self,
+        directory: Path,
+        template: TemplateTypeEnum = TemplateTypeEnum.MINIMAL,
+        recursive: bool = True,
+        dry_run: bool = False,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+        author: str = "OmniNode Team",
+        overwrite: bool = False,
+        repair: bool = False,
+        force_overwrite: bool = False,
+        jobs: int = 1,
+        files: Optional[List[Path]] = None,
+        io_threads: int = 0,
+    ) -> Iterator[OnexResultModel]:
+        """
+        Streaming variant of process_directory: yield each file's stamp result,
+        in sorted order, as soon as it is available. Arguments are the same as
+        for process_directory. Once exhausted, directory_summary(directory)
+        returns the aggregate result.
+        """
         if include_patterns is None:
-            exts = list(self.handler_registry.handled_extensions())
-            include_patterns = []
-            for ext in exts:
-                include_patterns.append(f"*.{ext.lstrip('.')}")
-                include_patterns.append(f"**/*{ext}")
-        result = self.directory_traverser.process_directory(
-            directory=directory,
-            processor=stamp_processor,
-            include_patterns=include_patterns,
-            exclude_patterns=exclude_patterns,
-            recursive=recursive,
-            ignore_file=ignore_file,
-            dry_run=dry_run,
-            max_file_size=self.MAX_FILE_SIZE,
+            include_patterns = self.default_include_patterns()
+        with self._directory_processor(
+            jobs,
+            dry_run,
+            io_threads,
+            template=template,
+            overwrite=overwrite,
+            repair=repair,
+            force_overwrite=force_overwrite,
+            author=author,
+        ) as (processor, executor, workers):
+            yield from self.directory_traverser.iter_process_directory(
+                directory=directory,
+                processor=processor,
+                include_patterns=include_patterns,
+                exclude_patterns=exclude_patterns,
+                recursive=recursive,
+                ignore_file=ignore_file,
+                dry_run=dry_run,
+                # Large files are streamed or skipped per handler in _prepare_stamp
+                max_file_size=0,
+                files=files,
+                executor=executor,
+                executor_workers=workers,
+            )
+
+    @contextmanager
+    def _directory_processor(
+        self, jobs: int, dry_run: bool, io_threads: int = 0, **stamp_kwargs: Any
+    ) -> Iterator[Tuple[Callable[[Path], OnexResultModel], Optional[Executor], int]]:
+        """
+        Yield the per-file stamp processor and, for jobs > 1, the process pool
+        that runs it and its worker count; the pool is shut down when the
+        context exits. With io_threads > 0 the processor is a StampPipeline
+        that owns its pools.
+        """
+        self.last_stage_seconds = None
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        if jobs > 1 and isinstance(self.file_io, InMemoryFileIO):
+            logger.debug("process_directory: in-memory file I/O, ignoring jobs")
+            jobs = 1
+        if io_threads > 0 and not dry_run:
+            with self._stamp_pipeline(jobs, io_threads, **stamp_kwargs) as pipeline:
+                yield pipeline, None, 1
+            self.last_stage_seconds = dict(pipeline.stage_seconds)
+        elif jobs > 1 and not dry_run:
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_stamp_worker,
+                initargs=(self.schema_loader, self.file_io, self.stamp_cache),
+            ) as executor:
+                yield partial(_stamp_in_worker, **stamp_kwargs), executor, jobs
+        else:
+
+            def stamp_processor(file_path: Path) -> OnexResultModel:
+                return self.stamp_file(file_path, **stamp_kwargs)
+
+            yield stamp_processor, None, 1
+
+    def _stamp_pipeline(
+        self, jobs: int, io_threads: int, **stamp_kwargs: Any
+    ) -> StampPipeline:
+        if jobs > 1:
+            # Extraction and hashing hold the GIL, so more than one CPU worker
+            # only helps as separate processes
+            return StampPipeline(
+                self,
+                stamp_fn=_stamp_content_in_worker,
+                cpu_executor=ProcessPoolExecutor(
+                    max_workers=jobs,
+                    initializer=_init_stamp_worker,
+                    initargs=(self.schema_loader, self.file_io, self.stamp_cache),
+                ),
+                cpu_workers=jobs,
+                io_threads=io_threads,
+                **stamp_kwargs,
+            )
+        return StampPipeline(
+            self,
+            stamp_fn=self.stamp_content,
+            cpu_executor=ThreadPoolExecutor(max_workers=1),
+            io_threads=io_threads,
+            **stamp_kwargs,
+        )
+
+    def directory_summary(self, directory: Path) -> OnexResultModel:
+        """Aggregate result of the most recent iter_process_directory run."""
+        return self._directory_result(
+            directory, self.directory_traverser.summarize_directory(directory)
         )
+
+    def _directory_result(
+        self, directory: Path, result: OnexResultModel
+    ) -> OnexResultModel:
         logger.debug(
             f"process_directory: result.metadata={getattr(result, 'metadata', None)}"
         )
@@ -283,18 +771,21 @@ class StamperEngine(ProtocolStamperEngine):
                     type=None,
                 )
             ]
+        metadata: Dict[str, Any] = {
+            "processed": processed_count,
+            "failed": failed_count,
+            "skipped": skipped_count,
+            "size_bytes": total_size_bytes,
+            "skipped_files": skipped_files,
+            "skipped_file_reasons": skipped_file_reasons,
+        }
+        if self.last_stage_seconds is not None:
+            metadata["stage_seconds"] = self.last_stage_seconds
         return OnexResultModel(
             status=result.status,
             target=str(directory),
             messages=messages,
-            metadata={
-                "processed": processed_count,
-                "failed": failed_count,
-                "skipped": skipped_count,
-                "size_bytes": total_size_bytes,
-                "skipped_files": skipped_files,
-                "skipped_file_reasons": skipped_file_reasons,
-            },
+            metadata=metadata,
         )
 
     def load_ignore_patterns(self, ignore_file: Optional[Path] = None) -> list[str]:
@@ -305,6 +796,24 @@ class StamperEngine(ProtocolStamperEngine):
         """Check if a file should be ignored using the directory traverser."""
         return self.directory_traverser.should_ignore(path, patterns)
 
+    def classify(
+        self,
+        paths: Iterable[Path],
+        ignore_patterns: Optional[List[str]] = None,
+        root_dir: Optional[Path] = None,
+    ) -> PathClassification:
+        """
+        Sort paths into per-handler batches plus ignored, schema-excluded and
+        unhandled buckets (with reasons), using this engine's handler registry
+        and the traverser's schema exclusion rules.
+        """
+        return PathClassifier(
+            self.handler_registry,
+            self.directory_traverser.schema_exclusion_registry,
+            ignore_patterns,
+            root_dir,
+        ).classify(paths)
+
     def load_onexignore(self, directory: Path) -> List[str]:
         """
         Load .onexignore patterns from the given directory and parent directories,
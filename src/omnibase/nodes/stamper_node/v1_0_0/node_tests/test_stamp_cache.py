@@ -0,0 +1,183 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stamp_cache.py
+# version: 1.0.0
+# uuid: a52b23c6-540d-441c-971e-0f6a762e9141
+# author: OmniNode Team
+# created_at: 2026-10-16T22:58:14.136141
+# last_modified_at: 2026-10-17T01:05:03.411435
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 91fd5e7b8a82a93178d0322cb9e58c54328b2e25bb70865a71829570b1d64e13
+# entrypoint: python@test_stamp_cache.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stamp_cache
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the persistent stamp cache and its use by StamperEngine.
+"""
+
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.model.model_onex_message_result import OnexStatus
+from omnibase.utils.real_file_io import RealFileIO
+
+from ..helpers.stamp_cache import StampCache
+from ..helpers.stamper_engine import StamperEngine
+
+CACHE_HIT_NOTE = "Unchanged (stamp cache hit)"
+
+
+@pytest.fixture(autouse=True)
+def trust_fresh_entries() -> Iterator[None]:
+    """Files written by these tests are seconds old; trust their entries anyway."""
+    with mock.patch.object(StampCache, "RACY_SECONDS", 0.0):
+        yield
+
+
+def _engine(cache: StampCache) -> StamperEngine:
+    return StamperEngine(
+        schema_loader=DummySchemaLoader(), file_io=RealFileIO(), stamp_cache=cache
+    )
+
+
+def test_stamp_file_uses_cache_after_first_stamp(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("def f():\n    return 1\n")
+    cache = StampCache(tmp_path / ".onex_cache" / "stamp.sqlite", versions_key="v1")
+    engine = _engine(cache)
+
+    first = engine.stamp_file(target)
+    assert first.status == OnexStatus.SUCCESS
+    assert first.metadata and first.metadata["note"] != CACHE_HIT_NOTE
+    stamped = target.read_text()
+
+    with mock.patch.object(engine.file_io, "read_text") as read_text:
+        second = engine.stamp_file(target)
+    read_text.assert_not_called()
+    assert second.status == OnexStatus.SUCCESS
+    assert second.metadata == {"note": CACHE_HIT_NOTE, "hash": first.metadata["hash"]}
+    assert target.read_text() == stamped
+
+
+def test_modified_file_is_restamped(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("def f():\n    return 1\n")
+    cache = StampCache(tmp_path / "stamp.sqlite", versions_key="v1")
+    engine = _engine(cache)
+    engine.stamp_file(target)
+
+    target.write_text(target.read_text() + "\n\ndef g():\n    return 2\n")
+    result = engine.stamp_file(target)
+    assert result.metadata and result.metadata["note"] != CACHE_HIT_NOTE
+    # The fresh stamp is recorded again, so the next call hits
+    assert engine.stamp_file(target).metadata["note"] == CACHE_HIT_NOTE  # type: ignore[index]
+
+
+def test_force_overwrite_bypasses_cache(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1\n")
+    engine = _engine(StampCache(tmp_path / "stamp.sqlite", versions_key="v1"))
+    engine.stamp_file(target)
+    result = engine.stamp_file(target, force_overwrite=True)
+    assert result.metadata and result.metadata["note"] != CACHE_HIT_NOTE
+
+
+def test_cache_invalidation_on_fingerprint_and_versions(tmp_path: Path) -> None:
+    target = tmp_path / "data.yaml"
+    target.write_text("key: value\n")
+    cache_path = tmp_path / "stamp.sqlite"
+    cache = StampCache(cache_path, versions_key="v1")
+    cache.record(target, "python_handler@1.0.0", "abc")
+    assert cache.lookup(target, "python_handler@1.0.0") == "abc"
+    # Handler version bump
+    assert cache.lookup(target, "python_handler@1.1.0") is None
+    cache.close()
+
+    # Same .onexversion: entries survive reopening
+    assert StampCache(cache_path, versions_key="v1").lookup(
+        target, "python_handler@1.0.0"
+    )
+    # Changed .onexversion: the cache is dropped
+    reopened = StampCache(cache_path, versions_key="v2")
+    assert reopened.lookup(target, "python_handler@1.0.0") is None
+    assert (
+        StampCache(cache_path, versions_key="v1").lookup(target, "python_handler@1.0.0")
+        is None
+    )
+
+
+def test_stamp_cache_is_picklable(tmp_path: Path) -> None:
+    target = tmp_path / "data.yaml"
+    target.write_text("key: value\n")
+    cache = StampCache(tmp_path / "stamp.sqlite", versions_key="v1")
+    cache.record(target, "fp", "abc")
+    clone = pickle.loads(pickle.dumps(cache))
+    assert clone.lookup(target, "fp") == "abc"
+
+
+def test_racy_entry_is_not_trusted(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1\n")
+    cache = StampCache(tmp_path / "stamp.sqlite", versions_key="v1")
+    engine = _engine(cache)
+    engine.stamp_file(target)
+    assert engine.verify_file(target).status == OnexStatus.SUCCESS
+
+    # Same size, same inode, mtime put back: only the record time can tell
+    st = target.stat()
+    target.write_text(target.read_text().replace("x = 1", "x = 2"))
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+    with mock.patch.object(StampCache, "RACY_SECONDS", 2.0):
+        result = engine.verify_file(target)
+    assert result.status == OnexStatus.ERROR
+    assert result.metadata and "expected_hash" in result.metadata
+
+
+def test_entry_is_trusted_once_older_than_racy_window(tmp_path: Path) -> None:
+    target = tmp_path / "data.yaml"
+    target.write_text("key: value\n")
+    cache = StampCache(tmp_path / "stamp.sqlite", versions_key="v1")
+    with mock.patch.object(StampCache, "RACY_SECONDS", 2.0):
+        cache.record(target, "fp", "abc")
+        assert cache.lookup(target, "fp") is None
+        os.utime(target, ns=(0, target.stat().st_mtime_ns - 3 * 10**9))
+        cache.record(target, "fp", "abc")
+        assert cache.lookup(target, "fp") == "abc"
+
+
+def test_old_schema_cache_is_rebuilt(tmp_path: Path) -> None:
+    cache_path = tmp_path / "stamp.sqlite"
+    conn = sqlite3.connect(str(cache_path))
+    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute(
+        "CREATE TABLE stamps (path TEXT PRIMARY KEY, size INTEGER, "
+        "mtime_ns INTEGER, inode INTEGER, fingerprint TEXT, hash TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO meta VALUES (?, ?)",
+        [("schema_version", "1"), ("onex_versions", "v1")],
+    )
+    conn.commit()
+    conn.close()
+    target = tmp_path / "data.yaml"
+    target.write_text("key: value\n")
+    cache = StampCache(cache_path, versions_key="v1")
+    cache.record(target, "fp", "abc")
+    assert cache.lookup(target, "fp") == "abc"
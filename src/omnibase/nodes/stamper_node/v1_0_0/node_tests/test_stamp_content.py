@@ -0,0 +1,100 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stamp_content.py
+# version: 1.0.0
+# uuid: 776508e8-1664-4941-930b-2f0b3fbc59a9
+# author: OmniNode Team
+# created_at: 2026-10-16T23:17:32.483430
+# last_modified_at: 2026-10-17T01:05:03.413738
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: ee9b43ce9ba94c24f6b7632a4e64eb8e8d49a7de8b1f745f0de16fb872332fc9
+# entrypoint: python@test_stamp_content.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stamp_content
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for in-memory stamping (StamperEngine.stamp_content/stamp_contents).
+"""
+
+from pathlib import Path
+from unittest import mock
+
+from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.model.model_onex_message_result import OnexStatus
+from omnibase.utils.real_file_io import RealFileIO
+
+from ..helpers.stamp_server import StampServer
+from ..helpers.stamper_engine import StamperEngine
+
+
+def _engine() -> StamperEngine:
+    return StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+
+
+def test_stamp_content_does_no_file_io(tmp_path: Path) -> None:
+    engine = _engine()
+    hint = tmp_path / "missing" / "module.py"
+    with mock.patch.object(engine, "file_io") as file_io:
+        result = engine.stamp_content(hint, "def f():\n    return 1\n")
+    assert file_io.mock_calls == []
+    assert not hint.parent.exists()
+    assert result.status == OnexStatus.SUCCESS
+    assert result.metadata is not None
+    stamped = result.metadata["content"]
+    assert "# name: module.py" in stamped and stamped.endswith("return 1\n")
+
+    # Stamping the stamped buffer again is idempotent
+    again = engine.stamp_content(hint, stamped)
+    assert again.metadata is not None
+    assert again.metadata["hash"] == result.metadata["hash"]
+    assert again.metadata["content"] == stamped
+
+
+def test_stamp_content_matches_stamp_file(tmp_path: Path) -> None:
+    engine = _engine()
+    target = tmp_path / "data.yaml"
+    target.write_text("key: value\n")
+    on_disk = engine.stamp_file(target)
+    stamped = target.read_text()
+    in_memory = engine.stamp_content(target, stamped)
+    assert in_memory.metadata and on_disk.metadata
+    assert in_memory.metadata["hash"] == on_disk.metadata["hash"]
+    assert in_memory.metadata["content"] == stamped
+
+
+def test_stamp_contents_batch_and_rpc(tmp_path: Path) -> None:
+    engine = _engine()
+    results = engine.stamp_contents(
+        [
+            (tmp_path / "a.md", "# Title\n"),
+            (tmp_path / "b.unknown", "data\n"),
+            (tmp_path / "c.py", "x = 1\n"),
+        ]
+    )
+    assert [Path(str(r.target)).name for r in results] == ["a.md", "b.unknown", "c.py"]
+    assert [r.status for r in results] == [
+        OnexStatus.SUCCESS,
+        OnexStatus.WARNING,
+        OnexStatus.SUCCESS,
+    ]
+
+    stamped = results[2].metadata["content"]  # type: ignore[index]
+    response = StampServer(engine).handle_request(
+        {
+            "id": 1,
+            "method": "stamp_content",
+            "params": {"path": str(tmp_path / "c.py"), "content": stamped},
+        }
+    )
+    assert response["result"]["metadata"]["content"] == stamped
+    assert response["result"]["metadata"]["hash"] == results[2].metadata["hash"]  # type: ignore[index]
+    assert not (tmp_path / "c.py").exists()
@@ -0,0 +1,103 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stamp_large_file.py
+# version: 1.0.0
+# uuid: 7ede7569-8269-476e-97dd-37d821c06066
+# author: OmniNode Team
+# created_at: 2026-10-16T23:24:49.901023
+# last_modified_at: 2026-10-17T01:07:10.282474
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 2989809b52c087b98bb73783d8668d1a9f0a28ee3a5ab04c8576efa676b6ce79
+# entrypoint: python@test_stamp_large_file.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stamp_large_file
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for stamping files larger than StamperEngine.MAX_FILE_SIZE.
+"""
+
+from pathlib import Path
+from unittest import mock
+
+from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.model.model_onex_message_result import OnexStatus
+from omnibase.utils.real_file_io import RealFileIO
+
+from ..helpers.stamper_engine import StamperEngine
+
+
+def _engine() -> StamperEngine:
+    engine = StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+    engine.MAX_FILE_SIZE = 4096
+    return engine
+
+
+def test_large_file_is_streamed_not_read(tmp_path: Path) -> None:
+    engine = _engine()
+    target = tmp_path / "artifact.yaml"
+    target.write_text("items:\n" + "  - entry\n" * 2000)
+
+    with mock.patch.object(engine.file_io, "read_text") as read_text:
+        first = engine.stamp_file(target)
+        second = engine.stamp_file(target)
+    read_text.assert_not_called()
+    assert first.status == OnexStatus.SUCCESS
+    assert first.metadata and first.metadata["note"] == "Stamped (streamed)"
+    assert second.metadata and second.metadata["note"] == "Unchanged (streamed)"
+    assert second.metadata["hash"] == first.metadata["hash"]
+    assert target.read_text().endswith("  - entry\n")
+
+
+def test_large_file_is_verified_by_streaming(tmp_path: Path) -> None:
+    engine = _engine()
+    target = tmp_path / "report.md"
+    target.write_text("# Report\n\n" + "row | value\n" * 1000)
+    stamped = engine.stamp_file(target)
+
+    with mock.patch.object(engine.file_io, "read_text") as read_text:
+        verified = engine.verify_file(target)
+        target.write_text(target.read_text() + "row | edited\n")
+        stale = engine.verify_file(target)
+    read_text.assert_not_called()
+    assert verified.status == OnexStatus.SUCCESS
+    assert verified.metadata and verified.metadata["hash"] == stamped.metadata["hash"]  # type: ignore[index]
+    assert stale.status == OnexStatus.ERROR
+    assert stale.metadata and stale.metadata["expected_hash"] != stamped.metadata["hash"]  # type: ignore[index]
+
+
+def test_large_file_without_streaming_handler_is_skipped(tmp_path: Path) -> None:
+    engine = _engine()
+    target = tmp_path / "generated.py"
+    content = "x = 1\n" * 1000
+    target.write_text(content)
+    result = engine.stamp_file(target)
+    assert result.status == OnexStatus.SKIPPED
+    assert target.read_text() == content
+    with mock.patch.object(engine.file_io, "read_text") as read_text:
+        assert engine.verify_file(target).status == OnexStatus.SKIPPED
+    read_text.assert_not_called()
+
+
+def test_process_directory_includes_large_files(tmp_path: Path) -> None:
+    engine = _engine()
+    (tmp_path / ".onexignore").write_text("stamper:\n  patterns: []\n")
+    (tmp_path / "big.md").write_text("# Report\n\n" + "row | value\n" * 1000)
+    (tmp_path / "small.yaml").write_text("key: value\n")
+    results = {
+        Path(str(r.target)).name: r
+        for r in engine.iter_process_directory(
+            tmp_path, dry_run=False, ignore_file=tmp_path / ".onexignore"
+        )
+    }
+    assert results["big.md"].metadata["note"] == "Stamped (streamed)"  # type: ignore[index]
+    assert results["small.yaml"].status == OnexStatus.SUCCESS
+    assert (tmp_path / "big.md").read_text().startswith("<!-- === OmniNode:Metadata")
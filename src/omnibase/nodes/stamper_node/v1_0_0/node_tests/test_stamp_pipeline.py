@@ -0,0 +1,141 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stamp_pipeline.py
+# version: 1.0.0
+# uuid: a1fbe6e4-e2bc-4ada-b621-f8207cd6794d
+# author: OmniNode Team
+# created_at: 2026-10-16T23:29:10.682712
+# last_modified_at: 2026-10-17T01:05:03.417520
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: fba254a30eb6b9441f5450e0d7118e4bde5d06105550a217767ecde8d7d254dc
+# entrypoint: python@test_stamp_pipeline.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stamp_pipeline
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for pipelined directory stamping (StampPipeline, io_threads > 0).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.model.model_onex_message_result import OnexStatus
+from omnibase.utils.real_file_io import RealFileIO
+
+from ..helpers.stamp_pipeline import StampPipeline
+from ..helpers.stamper_engine import StamperEngine
+
+
+def _engine() -> StamperEngine:
+    return StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+
+
+def _write_tree(root: Path, count: int = 8) -> List[Path]:
+    root.mkdir()
+    (root / ".onexignore").write_text("stamper:\n  patterns: []\n")
+    paths = []
+    for i in range(count):
+        paths.append(root / f"mod_{i}.py")
+        paths[-1].write_text(f"def f_{i}():\n    return {i}\n")
+        paths.append(root / f"doc_{i}.md")
+        paths[-1].write_text(f"# Doc {i}\n\nBody {i}\n")
+    return sorted(paths)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_pipelined_directory_matches_serial(tmp_path: Path, jobs: int) -> None:
+    serial_root, piped_root = tmp_path / "serial", tmp_path / "piped"
+    _write_tree(serial_root)
+    files = _write_tree(piped_root)
+    serial = _engine().process_directory(
+        serial_root, ignore_file=serial_root / ".onexignore"
+    )
+
+    engine = _engine()
+    results = list(
+        engine.iter_process_directory(
+            piped_root, ignore_file=piped_root / ".onexignore", jobs=jobs, io_threads=2
+        )
+    )
+    assert [Path(str(r.target)) for r in results] == files
+    for result in results:
+        assert result.status == OnexStatus.SUCCESS
+        assert result.metadata is not None
+        assert set(result.metadata["stage_seconds"]) == {"read", "stamp", "write"}
+        assert "OmniNode:Metadata" in Path(str(result.target)).read_text()
+
+    summary = engine.directory_summary(piped_root)
+    assert summary.metadata and serial.metadata
+    assert summary.metadata["processed"] == serial.metadata["processed"] == len(files)
+    assert summary.metadata["stage_seconds"]["stamp"] > 0
+    assert "stage_seconds" not in serial.metadata
+
+    # A second pipelined run finds every file already stamped
+    again = engine.process_directory(
+        piped_root, ignore_file=piped_root / ".onexignore", io_threads=2
+    )
+    assert again.status == OnexStatus.SUCCESS
+    assert [p.read_text() for p in files] == [
+        r.metadata["content"] for r in results  # type: ignore[index]
+    ]
+
+
+def test_pipeline_bounds_files_in_flight(tmp_path: Path) -> None:
+    files = _write_tree(tmp_path / "tree")
+    engine = _engine()
+    submitted: List[Path] = []
+    with StampPipeline(
+        engine,
+        stamp_fn=engine.stamp_content,
+        cpu_executor=ThreadPoolExecutor(max_workers=1),
+        io_threads=2,
+        max_in_flight=3,
+    ) as pipeline:
+        submit = pipeline.submit
+
+        def counting_submit(file_path: Path) -> Any:
+            submitted.append(file_path)
+            return submit(file_path)
+
+        pipeline.submit = counting_submit  # type: ignore[method-assign]
+        results = pipeline.imap(files)
+        first = next(results)
+        assert len(submitted) == 3
+        assert Path(str(first.target)) == files[0]
+        assert len(list(results)) == len(files) - 1
+    assert pipeline.stage_seconds["write"] > 0
+
+
+def test_pipeline_stage_failure_yields_error_result(tmp_path: Path) -> None:
+    files = _write_tree(tmp_path / "tree", count=2)
+    engine = _engine()
+
+    def failing_stamp(path: Path, content: str, **kwargs: Any) -> Any:
+        if path.suffix == ".md":
+            raise ValueError("boom")
+        return engine.stamp_content(path, content, **kwargs)
+
+    with StampPipeline(
+        engine,
+        stamp_fn=failing_stamp,
+        cpu_executor=ThreadPoolExecutor(max_workers=1),
+        io_threads=2,
+    ) as pipeline:
+        results = list(pipeline.imap(files))
+    assert [Path(str(r.target)) for r in results] == files
+    statuses = {Path(str(r.target)).suffix: r.status for r in results}
+    assert statuses == {".md": OnexStatus.ERROR, ".py": OnexStatus.SUCCESS}
+    assert files[0].read_text().startswith("# Doc 0")
@@ -0,0 +1,125 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stamp_server.py
+# version: 1.0.0
+# uuid: d3377624-bdda-4587-a15c-b2c43a187057
+# author: OmniNode Team
+# created_at: 2026-10-16T23:15:29.432013
+# last_modified_at: 2026-10-17T01:05:03.419125
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: f8b98262f3fcb93a0f02f4ac2cb532894f27f68692016a1bb31946a0a4ed827c
+# entrypoint: python@test_stamp_server.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stamp_server
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the long-lived stamping server and its thin client.
+"""
+
+import io
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.utils.real_file_io import RealFileIO
+
+from ..helpers.stamp_client import StampClient, StampServerError, main
+from ..helpers.stamp_server import StampServer
+from ..helpers.stamper_engine import StamperEngine
+
+
+@pytest.fixture
+def server() -> StampServer:
+    engine = StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+    return StampServer(engine)
+
+
+def test_stdio_round_trip(server: StampServer, tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1\n")
+    requests = [
+        {"id": 1, "method": "stamp_file", "params": {"path": str(target)}},
+        {"id": 2, "method": "verify", "params": {"path": str(target)}},
+        {"id": 3, "method": "extract_block", "params": {"path": str(target)}},
+        {"id": 4, "method": "nope"},
+        {"id": 5, "method": "verify", "params": {"bad": 1}},
+        {"id": 6, "method": "shutdown"},
+        {"id": 7, "method": "ping"},
+    ]
+    stdin = io.StringIO("".join(json.dumps(r) + "\n" for r in requests) + "{oops\n")
+    stdout = io.StringIO()
+    server.serve_stdio(stdin, stdout)
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    # Nothing after shutdown is answered
+    assert [r["id"] for r in responses] == [1, 2, 3, 4, 5, 6]
+    stamped, verified, extracted = (r["result"] for r in responses[:3])
+    assert stamped["status"] == "success"
+    assert verified["status"] == "success"
+    assert verified["metadata"]["hash"] == stamped["metadata"]["hash"]
+    assert extracted["metadata"]["hash"] == stamped["metadata"]["hash"]
+    assert responses[3]["error"]["code"] == "METHOD_NOT_FOUND"
+    assert responses[4]["error"]["code"] == "INVALID_PARAMS"
+
+
+def test_malformed_line_and_unknown_handler(
+    server: StampServer, tmp_path: Path
+) -> None:
+    assert json.loads(server.handle_line("{oops"))["error"]["code"] == "PARSE_ERROR"
+    response = server.handle_request(
+        {
+            "id": 1,
+            "method": "extract_block",
+            "params": {"path": str(tmp_path / "a.txt")},
+        }
+    )
+    assert "No handler" in response["error"]["message"]
+
+
+def test_unix_socket_client(server: StampServer, tmp_path: Path) -> None:
+    socket_path = tmp_path / "stamp.sock"
+    thread = threading.Thread(target=server.serve_unix, args=(socket_path,))
+    thread.start()
+    target = tmp_path / "data.yaml"
+    target.write_text("key: value\n")
+    try:
+        deadline = time.monotonic() + 5
+        while not socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with StampClient(socket_path, autostart=False) as client:
+            result = client.call("stamp_file", path=str(target))
+            assert result["status"] == "success"
+            assert client.call("verify", path=str(target))["status"] == "success"
+            with pytest.raises(StampServerError) as excinfo:
+                client.call("verify")
+            assert excinfo.value.code == "INVALID_PARAMS"
+            client.call("shutdown")
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
+    assert not socket_path.exists()
+    with pytest.raises(StampServerError):
+        StampClient(socket_path, autostart=False).call("ping")
+
+
+@pytest.mark.parametrize(
+    "argv", [["stamp"], ["verify"], ["extract"], ["ping", "a.py"], ["shutdown", "a"]]
+)
+def test_client_cli_rejects_calls_the_server_cannot_answer(argv: list[str]) -> None:
+    # Rejected by argument parsing, before any server is contacted
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--no-autostart", *argv])
+    assert exc_info.value.code == 2
@@ -0,0 +1,131 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stamp_verify.py
+# version: 1.0.0
+# uuid: 923e9edf-e052-40bf-9c96-0702da59cfc2
+# author: OmniNode Team
+# created_at: 2026-10-16T23:08:21.097293
+# last_modified_at: 2026-10-17T01:05:36.023909
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: b129c1b20622b6f5f3d72da14cb2a4c6991fc106c6a343593473d2bf46139d19
+# entrypoint: python@test_stamp_verify.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stamp_verify
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the read-only verify path (StamperEngine.verify_file/verify_directory).
+"""
+
+from pathlib import Path
+from unittest import mock
+
+from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.model.model_onex_message_result import OnexStatus
+from omnibase.utils.real_file_io import RealFileIO
+
+from ..helpers.stamper_engine import StamperEngine
+
+
+def _engine() -> StamperEngine:
+    return StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+
+
+def test_clean_file_verifies_without_writing(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("def f():\n    return 1\n")
+    engine = _engine()
+    stamped = engine.stamp_file(target)
+    content = target.read_text()
+
+    with mock.patch.object(engine.file_io, "write_text") as write_text:
+        result = engine.verify_file(target)
+    write_text.assert_not_called()
+    assert result.status == OnexStatus.SUCCESS
+    assert result.metadata and result.metadata["hash"] == stamped.metadata["hash"]  # type: ignore[index]
+    assert target.read_text() == content
+    # The fresh stamp is already current, so restamping leaves the file alone
+    engine.stamp_file(target)
+    assert target.read_text() == content
+
+
+def test_body_edit_is_reported_stale_until_restamped(tmp_path: Path) -> None:
+    target = tmp_path / "data.yaml"
+    target.write_text("key: value\n")
+    engine = _engine()
+    engine.stamp_file(target)
+
+    target.write_text(target.read_text().replace("key: value", "key: other"))
+    stale = engine.verify_file(target)
+    assert stale.status == OnexStatus.ERROR
+    assert stale.metadata and stale.metadata["hash"] != stale.metadata["expected_hash"]
+
+    restamped = engine.stamp_file(target)
+    assert (
+        restamped.metadata
+        and restamped.metadata["hash"] == stale.metadata["expected_hash"]
+    )
+    assert engine.verify_file(target).status == OnexStatus.SUCCESS
+    # Restamping a clean file keeps the hash
+    assert engine.stamp_file(target).metadata["hash"] == restamped.metadata["hash"]  # type: ignore[index]
+
+
+def test_verify_directory_lists_stale_and_missing(tmp_path: Path) -> None:
+    (tmp_path / ".onexignore").write_text("stamper:\n  patterns: []\n")
+    engine = _engine()
+    for name in ("clean.py", "stale.py", "notes.md"):
+        (tmp_path / name).write_text("x = 1\n")
+        engine.stamp_file(tmp_path / name)
+    (tmp_path / "stale.py").write_text((tmp_path / "stale.py").read_text() + "y = 2\n")
+    (tmp_path / "unstamped.py").write_text("z = 3\n")
+
+    result = engine.verify_directory(tmp_path, ignore_file=tmp_path / ".onexignore")
+    assert result.status == OnexStatus.ERROR
+    assert result.metadata is not None
+    assert result.metadata["verified"] == 2
+    assert result.metadata["stale_files"] == [str(tmp_path / "stale.py")]
+    assert result.metadata["missing_files"] == [str(tmp_path / "unstamped.py")]
+
+
+def test_verify_directory_reports_bad_files_and_keeps_going(tmp_path: Path) -> None:
+    (tmp_path / ".onexignore").write_text("stamper:\n  patterns: []\n")
+    engine = _engine()
+    for name in ("clean.py", "foreign.py"):
+        (tmp_path / name).write_text("x = 1\n")
+        engine.stamp_file(tmp_path / name)
+    foreign = tmp_path / "foreign.py"
+    foreign.write_text(
+        foreign.read_text().replace("# hash:", "# hash_algorithm: md5/1\n# hash:")
+    )
+    (tmp_path / "latin1.py").write_bytes(b"# caf\xe9\nx = 1\n")
+
+    assert engine.verify_file(tmp_path / "latin1.py").status == OnexStatus.ERROR
+    result = engine.verify_directory(tmp_path, ignore_file=tmp_path / ".onexignore")
+    assert result.status == OnexStatus.ERROR
+    assert result.metadata is not None
+    assert result.metadata["verified"] == 1
+    assert sorted(result.metadata["error_files"]) == [
+        str(foreign),
+        str(tmp_path / "latin1.py"),
+    ]
+
+
+def test_unknown_hash_algorithm_is_reported_for_that_file(tmp_path: Path) -> None:
+    engine = _engine()
+    foreign = tmp_path / "foreign.py"
+    foreign.write_text("x = 1\n")
+    engine.stamp_file(foreign)
+    foreign.write_text(
+        foreign.read_text().replace("# hash:", "# hash_algorithm: sha3/9\n# hash:")
+    )
+    for result in (engine.verify_file(foreign), engine.stamp_file(foreign)):
+        assert result.status == OnexStatus.ERROR
+        assert result.messages[0].summary == "unsupported hash_algorithm sha3/9"
@@ -0,0 +1,139 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stamp_watcher.py
+# version: 1.0.0
+# uuid: f2dea508-1d59-4f9c-a34b-d196f930857f
+# author: OmniNode Team
+# created_at: 2026-10-16T23:02:42.659026
+# last_modified_at: 2026-10-17T01:05:03.422207
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 58452cb46932ad13c2a8f316da5d58bfbbfb843b610780f5d40287b4022c0c01
+# entrypoint: python@test_stamp_watcher.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stamp_watcher
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for watch-mode stamping (StampWatcher and its change sources).
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from omnibase.fixtures.mocks.dummy_schema_loader import DummySchemaLoader
+from omnibase.utils.real_file_io import RealFileIO
+
+from ..helpers.stamp_watcher import (
+    ChangeSource,
+    InotifyChangeSource,
+    PollingChangeSource,
+    StampWatcher,
+)
+from ..helpers.stamper_engine import StamperEngine
+
+SOURCES: dict[str, Callable[[Path], ChangeSource]] = {
+    "polling": lambda root: PollingChangeSource(root, interval=0.0),
+    "inotify": InotifyChangeSource,
+}
+
+
+@pytest.fixture(params=sorted(SOURCES))
+def make_source(request: pytest.FixtureRequest) -> Callable[[Path], ChangeSource]:
+    if request.param == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    return SOURCES[request.param]
+
+
+def _watcher(root: Path, source: ChangeSource, debounce: float = 0.0) -> StampWatcher:
+    engine = StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+    return StampWatcher(
+        engine,
+        root,
+        change_source=source,
+        debounce=debounce,
+        ignore_file=root / ".onexignore",
+    )
+
+
+def _poll_until_stamped(watcher: StampWatcher, attempts: int = 20) -> list[Path]:
+    for _ in range(attempts):
+        stamped = watcher.poll_once(timeout=0.05)
+        if stamped:
+            return stamped
+    return []
+
+
+def test_modified_file_is_stamped_once(
+    tmp_path: Path, make_source: Callable[[Path], ChangeSource]
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1\n")
+    watcher = _watcher(tmp_path, make_source(tmp_path))
+
+    target.write_text("x = 2\n")
+    assert _poll_until_stamped(watcher) == [target]
+    assert "OmniNode:Metadata" in target.read_text()
+    # The watcher's own write must not trigger another stamp
+    assert watcher.poll_once(timeout=0.1) == []
+    # ...and is forgotten once its event has been suppressed
+    assert watcher._own_writes == {}
+
+    # A later user edit is picked up again
+    target.write_text(target.read_text() + "y = 3\n")
+    assert _poll_until_stamped(watcher) == [target]
+    watcher.change_source.close()
+
+
+def test_onexignore_is_honoured(
+    tmp_path: Path, make_source: Callable[[Path], ChangeSource]
+) -> None:
+    (tmp_path / ".onexignore").write_text("stamper:\n  patterns:\n    - 'generated/'\n")
+    (tmp_path / "generated").mkdir()
+    watcher = _watcher(tmp_path, make_source(tmp_path))
+
+    (tmp_path / "generated" / "out.py").write_text("x = 1\n")
+    (tmp_path / "notes.txt").write_text("no handler pattern\n")
+    (tmp_path / "kept.py").write_text("x = 1\n")
+    assert _poll_until_stamped(watcher) == [tmp_path / "kept.py"]
+    assert "OmniNode:Metadata" not in (tmp_path / "generated" / "out.py").read_text()
+    watcher.change_source.close()
+
+
+def test_debounce_delays_stamping(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1\n")
+    watcher = _watcher(
+        tmp_path, PollingChangeSource(tmp_path, interval=0.0), debounce=0.2
+    )
+    target.write_text("x = 2\n")
+    assert watcher.poll_once(timeout=0.0) == []
+    time.sleep(0.25)
+    assert watcher.poll_once(timeout=0.0) == [target]
+
+
+def test_unchanged_restamp_records_no_own_write(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1\n")
+    watcher = _watcher(tmp_path, PollingChangeSource(tmp_path, interval=0.0))
+    target.write_text("x = 2\n")
+    assert _poll_until_stamped(watcher) == [target]
+    assert watcher.poll_once(timeout=0.0) == []
+
+    # Touching a stamped file restamps it without a write: nothing to suppress
+    stamped = target.read_text()
+    target.write_text(stamped)
+    assert _poll_until_stamped(watcher) == [target]
+    assert target.read_text() == stamped
+    assert watcher._own_writes == {}
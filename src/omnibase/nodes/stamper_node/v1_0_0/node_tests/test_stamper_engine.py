@@ -9,11 +9,11 @@
 # uuid: 574f9eb4-f06e-4e25-bff6-194384a36cba
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.902158
-# last_modified_at: 2025-05-22T20:50:39.721385
+# last_modified_at: 2026-10-17T01:05:03.425497
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 611844030dc7d09c49f4e1920a0e6977a8b4a5b9a192dedd0f26075324816fe9
+# hash: cf6be6ed5f2a7f6fc8ed910fe8d9a378e501e071ffccc213172b84ee125d9b27
 # entrypoint: python@test_stamper_engine.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.test_stamper_engine
@@ -56,6 +56,7 @@ from omnibase.tools.fixture_stamper_engine import (
     FixtureStamperEngine,  # type: ignore[import-untyped]
 )
 from omnibase.utils.directory_traverser import DirectoryTraverser
+from omnibase.utils.real_file_io import RealFileIO
 
 from ..helpers.stamper_engine import StamperEngine
 from ..node_tests.protocol_stamper_test_case import ProtocolStamperTestCase
@@ -150,6 +151,45 @@ def test_process_directory_real_engine(
     assert result.status in (OnexStatus.SUCCESS, OnexStatus.WARNING, OnexStatus.ERROR)
 
 
+def _write_sample_tree(root: Path) -> None:
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "schemas").mkdir()
+    for i in range(6):
+        (root / "pkg" / f"mod_{i}.py").write_text(f"def f_{i}():\n    return {i}\n")
+        (root / f"doc_{i}.md").write_text(f"# Doc {i}\n\nBody {i}\n")
+    (root / "pkg" / "config.yaml").write_text("key: value\n")
+    (root / "pkg" / "schemas" / "skip.yaml").write_text("key: value\n")
+    (root / "pkg" / "onex_node.yaml").write_text("key: value\n")
+
+
+def test_process_directory_parallel_matches_serial(tmp_path: Path) -> None:
+    """Parallel stamping (jobs > 1) must produce the same aggregate result as a serial run."""
+    results = {}
+    for jobs in (1, 2):
+        root = tmp_path / f"jobs_{jobs}"
+        _write_sample_tree(root)
+        engine = StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+        result = engine.process_directory(root, recursive=True, jobs=jobs)
+        assert result.status == OnexStatus.SUCCESS
+        meta = result.metadata or {}
+        results[jobs] = {
+            "processed": meta["processed"],
+            "failed": meta["failed"],
+            "skipped": meta["skipped"],
+            "skipped_files": [
+                Path(f).relative_to(root).as_posix() for f in meta["skipped_files"]
+            ],
+            "skipped_file_reasons": {
+                Path(k).relative_to(root).as_posix(): v
+                for k, v in meta["skipped_file_reasons"].items()
+            },
+        }
+        assert "OmniNode:Metadata" in (root / "pkg" / "mod_0.py").read_text()
+    assert results[1] == results[2]
+    assert results[1]["processed"] == 13
+    assert results[1]["skipped_files"] == sorted(results[1]["skipped_files"])
+
+
 def test_stamp_file_fixture_engine(fixture_engine: FixtureStamperEngine) -> None:
     """Test stamping a file using the fixture engine."""
     result: OnexResultModel = fixture_engine.stamp_file(Path("test.yaml"))
@@ -268,3 +308,17 @@ def test_stamper_uses_directory_traverser_unit() -> None:
     directory_traverser.process_directory.assert_called_once()
     args, kwargs = directory_traverser.process_directory.call_args
     assert kwargs["directory"] == Path("/mock/dir") or args[0] == Path("/mock/dir")
+
+
+def test_iter_process_directory_matches_process_directory(tmp_path: Path) -> None:
+    """Streamed per-file results are followed by the same summary as a batch run."""
+    _write_sample_tree(tmp_path)
+    engine = StamperEngine(schema_loader=DummySchemaLoader(), file_io=RealFileIO())
+    streamed = list(engine.iter_process_directory(tmp_path, recursive=True))
+    targets = [str(r.target) for r in streamed]
+    assert targets == sorted(targets)
+    assert all(r.status == OnexStatus.SUCCESS for r in streamed)
+    summary = engine.directory_summary(tmp_path)
+    batch = engine.process_directory(tmp_path, recursive=True)
+    assert summary.metadata == batch.metadata
+    assert summary.metadata and summary.metadata["processed"] == len(streamed) == 13
@@ -9,11 +9,11 @@
 # uuid: f27e1a48-d537-404f-b777-9ee08b8b2e2d
 # author: OmniNode Team
 # created_at: 2025-05-24T10:56:37.726449
-# last_modified_at: 2025-05-24T15:01:16.175703
+# last_modified_at: 2026-10-17T01:05:03.427450
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 96c0924d4ac231f055019b785ddf39ab5fe8d08c749270509dfb44d97144ca5e
+# hash: 05e4946bd256e1acecb7d9ab6ab79467700301454f583f9a1badf76283819bb2
 # entrypoint: python@tree_generator_engine.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.tree_generator_engine
@@ -33,11 +33,11 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from omnibase.core.core_file_type_handler_registry import FileTypeHandlerRegistry
 from omnibase.enums import OnexStatus
 from omnibase.model.model_onex_message_result import OnexResultModel
+from omnibase.utils.filesystem_index import FileSystemIndex, shared_filesystem_index
+from omnibase.utils.yaml_backend import yaml_dump, yaml_safe_load
 
 logger = logging.getLogger(__name__)
 
@@ -46,15 +46,20 @@ class TreeGeneratorEngine:
     """Engine for generating .onextree manifest files from directory structure analysis."""
 
     def __init__(
-        self, handler_registry: Optional[FileTypeHandlerRegistry] = None
+        self,
+        handler_registry: Optional[FileTypeHandlerRegistry] = None,
+        fs_index: Optional[FileSystemIndex] = None,
     ) -> None:
         """
         Initialize the tree generator engine.
 
         Args:
             handler_registry: Optional FileTypeHandlerRegistry for custom file processing
+            fs_index: Optional FileSystemIndex used to list directories
+                (defaults to the process-wide shared_filesystem_index())
         """
         self.handler_registry = handler_registry
+        self.fs_index = fs_index or shared_filesystem_index()
         if self.handler_registry:
             # Register canonical handlers if not already done
             self.handler_registry.register_all_handlers()
@@ -71,17 +76,21 @@ class TreeGeneratorEngine:
                 return {"name": path.name, "type": "file"}
 
             children: List[Dict[str, Any]] = []
-            for child in sorted(path.iterdir()):
+            # Listings of unchanged directories come from the filesystem index
+            for entry in self.fs_index.listdir(path):
                 # Skip hidden files and cache directories
-                if child.name.startswith(".") and child.name not in [
+                if entry.name.startswith(".") and entry.name not in [
                     ".onexignore",
                     ".wip",
                 ]:
                     continue
-                if child.name == "__pycache__":
+                if entry.name == "__pycache__":
                     continue
 
-                children.append(scan_recursive(child))
+                if entry.is_dir or (entry.is_symlink and (path / entry.name).is_dir()):
+                    children.append(scan_recursive(path / entry.name))
+                else:
+                    children.append({"name": entry.name, "type": "file"})
 
             # For the root node, use a more descriptive name
             if is_root:
@@ -91,7 +100,9 @@ class TreeGeneratorEngine:
 
             return {"name": name, "type": "directory", "children": children}
 
-        return scan_recursive(root_path, is_root=True)
+        tree = scan_recursive(root_path, is_root=True)
+        self.fs_index.save()
+        return tree
 
     def count_artifacts(self, root_path: Path) -> Dict[str, int]:
         """Count versioned artifacts in the directory structure."""
@@ -161,7 +172,7 @@ class TreeGeneratorEngine:
                             if metadata_file.exists():
                                 try:
                                     with open(metadata_file, "r") as f:
-                                        yaml.safe_load(f)
+                                        yaml_safe_load(f)
                                     validation_results["valid_artifacts"] += 1
                                 except Exception as e:
                                     validation_results["invalid_artifacts"] += 1
@@ -185,7 +196,7 @@ class TreeGeneratorEngine:
                             if metadata_file.exists():
                                 try:
                                     with open(metadata_file, "r") as f:
-                                        yaml.safe_load(f)
+                                        yaml_safe_load(f)
                                     validation_results["valid_artifacts"] += 1
                                 except Exception as e:
                                     validation_results["invalid_artifacts"] += 1
@@ -209,7 +220,7 @@ class TreeGeneratorEngine:
                             if metadata_file.exists():
                                 try:
                                     with open(metadata_file, "r") as f:
-                                        yaml.safe_load(f)
+                                        yaml_safe_load(f)
                                     validation_results["valid_artifacts"] += 1
                                 except Exception as e:
                                     validation_results["invalid_artifacts"] += 1
@@ -245,7 +256,7 @@ class TreeGeneratorEngine:
                 output_path if output_path.suffix else output_path.with_suffix("")
             )
             with open(manifest_path, "w") as f:
-                yaml.dump(tree_structure, f, default_flow_style=False, sort_keys=False)
+                yaml_dump(tree_structure, f, default_flow_style=False, sort_keys=False)
 
         return manifest_path
 
@@ -9,11 +9,11 @@
 # uuid: 2373519e-45f2-4482-aa89-82db455fd9ad
 # author: OmniNode Team
 # created_at: 2025-05-24T12:02:47.580707
-# last_modified_at: 2025-05-24T16:13:11.912144
+# last_modified_at: 2026-10-17T01:05:03.429555
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: e39476f4fe9e6e1ec5da06a2b66975592ea85122475c90bae788aab6a84f82d7
+# hash: ef2fb5e3dcb61179bfd0acd1c649a3dc1918ed76e64887b8dcd745947fc28f5b
 # entrypoint: python@tree_validator.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.tree_validator
@@ -30,8 +30,6 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
-import yaml
-
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.model.model_onextree_validation import (
     OnextreeTreeNode,
@@ -41,6 +39,7 @@ from omnibase.model.model_onextree_validation import (
     ValidationErrorCodeEnum,
     ValidationStatusEnum,
 )
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 from ..protocol.protocol_onextree_validator import ProtocolOnextreeValidator
 from .tree_generator_engine import TreeGeneratorEngine
@@ -136,7 +135,7 @@ class OnextreeValidator(ProtocolOnextreeValidator):
             if onextree_path.suffix.lower() == ".json":
                 data = json.load(f)
             else:
-                data = yaml.safe_load(f)
+                data = yaml_safe_load(f)
         if not isinstance(data, dict):
             raise OnexError(
                 f"Expected dict at root of {onextree_path}, got {type(data).__name__}",
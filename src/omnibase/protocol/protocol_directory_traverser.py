@@ -9,11 +9,11 @@
 # uuid: 9d2a62d7-7fd2-4018-87d6-e6f11e11ee33
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.904235
-# last_modified_at: 2025-05-22T20:50:39.724127
+# last_modified_at: 2026-10-17T01:05:03.431685
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 36148c234d737bb061d52bb68c35695e1e8e1c6493cb0341504c9bf2e3b37d6d
+# hash: d240d755a46b9f3fea6a4db30a5de820c6b4a2715dcf26c565172f458f29bcc0
 # entrypoint: python@protocol_directory_traverser.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.protocol_directory_traverser
@@ -26,8 +26,9 @@ Protocol for directory traversal operations.
 Defines a standardized interface for discovering and filtering files in directories.
 """
 
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Callable, List, Optional, Protocol, Set, TypeVar, Union
+from typing import Callable, Iterable, List, Optional, Protocol, Set, TypeVar, Union
 
 from omnibase.model.model_onex_message_result import OnexResultModel
 
@@ -110,6 +111,9 @@ class ProtocolDirectoryTraverser(Protocol):
         ignore_file: Optional[Path] = None,
         dry_run: bool = False,
         max_file_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        files: Optional[Iterable[Path]] = None,
+        executor_workers: int = 1,
     ) -> Union[OnexResultModel, List[T]]:
         """
         Process all eligible files in a directory using the provided processor function.
@@ -123,6 +127,10 @@ class ProtocolDirectoryTraverser(Protocol):
             ignore_file: Path to ignore file (e.g., .onexignore)
             dry_run: Whether to perform a dry run (don't modify files)
             max_file_size: Maximum file size in bytes to process
+            executor: Optional executor used to run the processor concurrently
+            files: Optional explicit candidate files to filter instead of walking
+                the directory
+            executor_workers: Number of workers executor was created with
 
         Returns:
             OnexResultModel with aggregate results or list of processor results
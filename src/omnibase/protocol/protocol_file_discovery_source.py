@@ -9,11 +9,11 @@
 # uuid: 79d256e9-ccf5-4e63-9966-753652ca5c5d
 # author: OmniNode Team
 # created_at: 2025-05-21T13:18:56.568684
-# last_modified_at: 2025-05-22T20:50:39.732558
+# last_modified_at: 2026-10-17T01:05:03.433633
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 54e565db5d08afe7ebb2a2d37298aa4910e03d054a52063135112853dbb53733
+# hash: ee189167f2fb725d51c026dd54aeb5604e2e1ab197128c7ccf462c84474e7c6d
 # entrypoint: python@protocol_file_discovery_source.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.protocol_file_discovery_source
@@ -27,7 +27,7 @@ Defines a standardized interface for discovering and validating files for stampi
 """
 
 from pathlib import Path
-from typing import Optional, Protocol, Set
+from typing import Iterator, Optional, Protocol, Set
 
 from omnibase.model.model_tree_sync_result import TreeSyncResultModel
 
@@ -57,6 +57,28 @@ class ProtocolFileDiscoverySource(Protocol):
         """
         ...
 
+    def iter_files(
+        self,
+        directory: Path,
+        include_patterns: Optional[list[str]] = None,
+        exclude_patterns: Optional[list[str]] = None,
+        ignore_file: Optional[Path] = None,
+        max_files: Optional[int] = None,
+    ) -> Iterator[Path]:
+        """
+        Lazily yield the files discover_files would return, in a deterministic
+        order, stopping once max_files have been yielded.
+        Args:
+            directory: Root directory to search
+            include_patterns: Glob patterns to include
+            exclude_patterns: Glob patterns to exclude
+            ignore_file: Optional ignore file (e.g., .onexignore)
+            max_files: Maximum number of files to yield (None for no limit)
+        Returns:
+            Iterator of Path objects for eligible files
+        """
+        ...
+
     def validate_tree_sync(
         self,
         directory: Path,
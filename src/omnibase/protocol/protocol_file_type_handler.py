@@ -9,11 +9,11 @@
 # uuid: 3a45b9c0-6155-4f59-82bf-7f130f53aab1
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.904957
-# last_modified_at: 2025-05-22T20:50:39.725147
+# last_modified_at: 2026-10-17T01:07:10.283959
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 69d0b3f0f26533aee6af6180208fd467e1928e4106db9be5150ed68d25440d5f
+# hash: 0beeaca561b94e00d3b5684de9615a4256e181e0fff0d1150f90a32090f62fce
 # entrypoint: python@protocol_file_type_handler.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.protocol_file_type_handler
@@ -87,11 +87,44 @@ class ProtocolFileTypeHandler(Protocol):
     def serialize_block(self, meta: Any) -> str: ...
 
     def stamp(self, path: Path, content: str, **kwargs: Any) -> OnexResultModel:
-        """Stamp the file and return the canonical result model (OnexResultModel)."""
+        """
+        Stamp content and return the canonical result model (OnexResultModel).
+        Works purely in memory: path is only a hint (name, namespace, entrypoint)
+        and must not be read or written. metadata["content"] carries the stamped
+        text and metadata["hash"] its hash; callers decide whether to persist it.
+        """
         ...
 
     def validate(self, path: Path, content: str, **kwargs: Any) -> OnexResultModel: ...
 
+    def verify_hash(
+        self, path: Path, content: str
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        """
+        Optional: Read-only stamp check. Return (stored_hash, canonical_hash), with
+        both None if the content has no metadata block, or None if this handler
+        cannot verify stamps.
+        """
+        return None
+
+    def verify_hash_stream(
+        self, path: Path
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        """
+        Optional: verify_hash for a file too large to read into memory, reading
+        it from path without holding its whole content. Return None if this
+        handler cannot stream.
+        """
+        return None
+
+    def stamp_stream(self, path: Path, **kwargs: Any) -> Optional[OnexResultModel]:
+        """
+        Optional: Stamp a file too large to read into memory, in place, without
+        holding its whole content. Must give the same hash and bytes as stamp.
+        Return None if this handler cannot stream.
+        """
+        return None
+
     def pre_validate(
         self, path: Path, content: str, **kwargs: Any
     ) -> Optional[OnexResultModel]:
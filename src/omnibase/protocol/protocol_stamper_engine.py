@@ -9,11 +9,11 @@
 # uuid: 0e699709-a0b4-4b73-81e1-76875dc93f75
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.905161
-# last_modified_at: 2025-05-22T20:50:39.713361
+# last_modified_at: 2026-10-17T01:05:03.437004
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: b96d30ac48469f246f4ecc7cf4551d6466938dbc406f40b2155a93d8562d0655
+# hash: 9777be83f5d14eb65846b0d0718eb75dcad2ecefeb64233ca92d217dfc0ffb1c
 # entrypoint: python@protocol_stamper_engine.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.protocol_stamper_engine
@@ -59,4 +59,7 @@ class ProtocolStamperEngine(Protocol):
         overwrite: bool = False,
         repair: bool = False,
         force_overwrite: bool = False,
+        jobs: int = 1,
+        files: Optional[List[Path]] = None,
+        io_threads: int = 0,
     ) -> OnexResultModel: ...
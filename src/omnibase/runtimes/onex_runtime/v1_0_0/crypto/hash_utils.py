@@ -9,11 +9,11 @@
 # uuid: 319e66d1-abee-487e-a37f-8acfc43bdf9d
 # author: OmniNode Team
 # created_at: 2025-05-22T05:34:29.787636
-# last_modified_at: 2025-05-22T20:50:39.731670
+# last_modified_at: 2026-10-17T01:05:03.438663
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: f0b4fe19bb243f0efd9f252f450842ee91d3fa5abce760001bfabce753908f66
+# hash: 7f5d0ba8b11aa722d2caf27b272b2a3c957f721436dabee7b08ab9f1f6092352
 # entrypoint: python@hash_utils.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.hash_utils
@@ -21,10 +21,16 @@
 # === /OmniNode:Metadata ===
 
 
-import hashlib
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
-import yaml
+from pydantic import BaseModel
+
+from omnibase.mixin.mixin_canonical_serialization import canonical_field_schema
+from omnibase.utils.canonical_hasher import (  # noqa: F401 (normalize_body re-exported)
+    canonical_digest,
+    normalize_body,
+)
+from omnibase.utils.yaml_backend import yaml_dump
 
 
 def canonicalize_metadata_block(
@@ -38,14 +44,21 @@ def canonicalize_metadata_block(
     - Replaces volatile fields (e.g., hash, last_modified_at) with a protocol placeholder.
     - Returns the canonical YAML string (UTF-8, normalized line endings).
     """
-    if hasattr(meta, "model_dump"):
+    if isinstance(meta, BaseModel):
+        omit_if_null = canonical_field_schema(type(meta)).omit_if_null
+        meta_dict = {
+            k: v
+            for k, v in meta.model_dump().items()
+            if v is not None or k not in omit_if_null
+        }
+    elif hasattr(meta, "model_dump"):
         meta_dict = meta.model_dump()
     else:
         meta_dict = dict(meta)
     for field in volatile_fields:
         if field in meta_dict:
             meta_dict[field] = placeholder
-    yaml_str = yaml.dump(
+    yaml_str = yaml_dump(
         meta_dict, sort_keys=True, default_flow_style=False, allow_unicode=True
     )
     yaml_str = yaml_str.replace("\xa0", " ")
@@ -55,35 +68,25 @@ def canonicalize_metadata_block(
     return yaml_str
 
 
-def normalize_body(body: str) -> str:
-    """
-    Canonical normalization for file body content.
-    - Strips trailing spaces
-    - Normalizes all line endings to '\n'
-    - Ensures exactly one newline at EOF
-    - Asserts only '\n' line endings are present
-    """
-    body = body.replace("\r\n", "\n").replace("\r", "\n")
-    norm = body.rstrip(" \t\r\n") + "\n"
-    assert "\r" not in norm, "Carriage return found after normalization"
-    return norm
-
-
 def compute_canonical_hash(
     meta: Any,
     body: str,
     volatile_fields: Tuple[str, ...] = ("hash", "last_modified_at"),
     placeholder: str = "<PLACEHOLDER>",
+    algorithm: Optional[str] = None,
 ) -> str:
     """
     Compute the hash for the normalized metadata block and file body.
     - Serializes the metadata block with volatile fields replaced by placeholders.
-    - Concatenates the canonicalized metadata and normalized body.
-    - Computes and returns the SHA-256 hash as a hex string.
+    - Hashes the canonicalized metadata followed by the normalized body; the
+      body is normalized chunk by chunk rather than copied whole.
+    - Returns the hex digest for algorithm, a canonical_hasher tag; by default
+      the block's own hash_algorithm, or SHA-256 if it has none.
     """
     meta_yaml = canonicalize_metadata_block(meta, volatile_fields, placeholder)
-    norm_body = normalize_body(body)
-    canonical = meta_yaml.rstrip("\n") + "\n\n" + norm_body.lstrip("\n")
-    h = hashlib.sha256()
-    h.update(canonical.encode("utf-8"))
-    return h.hexdigest()
+    if algorithm is None:
+        if isinstance(meta, dict):
+            algorithm = meta.get("hash_algorithm")
+        else:
+            algorithm = getattr(meta, "hash_algorithm", None)
+    return canonical_digest(meta_yaml, body, algorithm)
@@ -9,11 +9,11 @@
 # uuid: aebbc1dc-0ca8-4bb5-8903-51f3367463e1
 # author: OmniNode Team
 # created_at: 2025-05-22T05:34:29.788355
-# last_modified_at: 2025-05-22T20:50:39.718462
+# last_modified_at: 2026-10-17T01:05:03.440279
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: af33099b1e816b67a91c9ae9d46a790b5f490573c0f6d4ab4233b79145e20bb9
+# hash: 21a60325f07641d71d76ada5036c13c12ca73dcfcd947906d2608239d14abe8d
 # entrypoint: python@directory_traverser.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.directory_traverser
@@ -22,8 +22,9 @@
 
 
 import logging
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Callable, List, Optional, Set, TypeVar, Union
+from typing import Callable, Iterable, List, Optional, Set, TypeVar, Union
 
 from omnibase.model.model_file_filter import DirectoryProcessingResultModel
 from omnibase.model.model_onex_message_result import OnexResultModel
@@ -155,6 +156,9 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         ignore_file: Optional[Path] = None,
         dry_run: bool = False,
         max_file_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        files: Optional[Iterable[Path]] = None,
+        executor_workers: int = 1,
     ) -> Union[OnexResultModel, List[T]]:
         """
         Process all eligible files in a directory using the provided processor function.
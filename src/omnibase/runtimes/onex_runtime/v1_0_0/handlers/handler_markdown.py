@@ -9,11 +9,11 @@
 # uuid: 2424bf07-f386-4bc9-9ac3-dc6669caa497
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:24.999460
-# last_modified_at: 2025-05-22T18:43:36.762733
+# last_modified_at: 2026-10-17T01:07:10.285425
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 76dee61e50dccbb2bd2dcdf3656f65d025b1cecfa007ed609f6276ada36f29c7
+# hash: d85d5574cf704770ae38f0471ae9a22b7062fb0b4375c3ad4425f6d75b8a8eb4
 # entrypoint: python@handler_markdown.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.handler_markdown
@@ -22,7 +22,6 @@
 
 
 import logging
-import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -34,9 +33,16 @@ if TYPE_CHECKING:
 
 from omnibase.model.model_onex_message_result import OnexResultModel
 from omnibase.protocol.protocol_file_type_handler import ProtocolFileTypeHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.io.large_file_stream import StreamBodyPolicy
+from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_parser import (
+    load_metadata_block,
+)
 from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_placement import (
     BlockPlacementMixin,
 )
+from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_scanner import (
+    block_scanner,
+)
 from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_metadata_block import (
     MetadataBlockMixin,
 )
@@ -123,7 +129,9 @@ class MarkdownHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacemen
             #         f"Restamping {path} due to non-canonical metadata block: {reasons}"
             #     )
             #     prev_meta = None  # Force restamp in idempotency logic
-            logger.debug(f"[END] extract_block for {path}, result=({prev_meta}, rest)")
+            logger.debug(
+                f"[END] extract_block for {path}, found={prev_meta is not None}"
+            )
             return prev_meta, rest
         except Exception as e:
             logger.error(f"Exception in extract_block for {path}: {e}", exc_info=True)
@@ -132,30 +140,37 @@ class MarkdownHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacemen
     def _extract_block_with_delimiters(
         self, path: Path, content: str, open_delim: str, close_delim: str
     ) -> tuple[Optional[Any], str]:
-
-        import yaml
-
-        from omnibase.metadata.metadata_constants import MD_META_CLOSE, MD_META_OPEN
-
-        # Remove all well-formed metadata blocks
-        block_pattern = rf"(?s){re.escape(MD_META_OPEN)}.*?{re.escape(MD_META_CLOSE)}"
-        content_wo_blocks = re.sub(block_pattern + r"\n*", "", content)
-
-        # Remove any stray open delimiters (malformed/unmatched blocks)
-        open_delim_pattern = rf"{re.escape(MD_META_OPEN)}.*?(?=<!--|$)"
-        content_wo_open = re.sub(
-            open_delim_pattern, "", content_wo_blocks, flags=re.DOTALL
-        )
+        scanner = block_scanner(open_delim, close_delim)
+        kept = []
+        pos = 0
+        first = None
+        # Remove all well-formed metadata blocks and the newlines after them
+        for span in scanner.iter_blocks(content):
+            first = first or span
+            kept.append(content[pos : span.start])
+            pos = span.end
+            while content.startswith("\n", pos):
+                pos += 1
+        # Remove any stray open delimiters (malformed/unmatched blocks), each up
+        # to the next comment or the end of the file
+        stray = scanner.find_open(content, pos)
+        while stray != -1:
+            kept.append(content[pos:stray])
+            pos = content.find("<!--", stray + len(open_delim))
+            if pos == -1:
+                pos = len(content)
+                if content.endswith("\n") and pos - 1 >= stray + len(open_delim):
+                    pos -= 1
+                break
+            stray = scanner.find_open(content, pos)
+        kept.append(content[pos:])
 
         # Extract metadata from the first well-formed block (if any)
-        match = re.search(block_pattern, content)
         prev_meta = None
-        if match:
-            block_yaml = match.group(0)[len(MD_META_OPEN) : -len(MD_META_CLOSE)].strip(
-                "\n "
-            )
+        if first is not None:
+            block_yaml = scanner.body(content, first).strip("\n ")
             try:
-                data = yaml.safe_load(block_yaml)
+                data = load_metadata_block(block_yaml)
                 if isinstance(data, dict):
                     # Fix datetime objects - convert to ISO strings
                     for field in ["created_at", "last_modified_at"]:
@@ -179,7 +194,7 @@ class MarkdownHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacemen
                     prev_meta = data
             except Exception:
                 prev_meta = None
-        rest = content_wo_open
+        rest = "".join(kept)
         return prev_meta, rest
 
     def serialize_block(self, meta: object) -> str:
@@ -212,11 +227,8 @@ class MarkdownHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacemen
     def normalize_rest(self, rest: str) -> str:
         return rest.strip()
 
-    def stamp(self, path: Path, content: str, **kwargs: Any) -> OnexResultModel:
-        logger = logging.getLogger("omnibase.runtime.handlers.handler_markdown")
-        logger.debug(f"[START] stamp for {path}")
-        from datetime import datetime
-
+    def _idempotency_kwargs(self, path: Path) -> dict[str, Any]:
+        """Handler-specific arguments shared by stamp and stamp_stream."""
         from omnibase.model.model_node_metadata import NodeMetadataBlock
 
         # Normalize filename for namespace
@@ -233,22 +245,29 @@ class MarkdownHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacemen
             meta_type=self.default_meta_type or "tool",
         )
 
-        # Convert model to dictionary for context_defaults
-        context_defaults = default_metadata.model_dump()
+        return {
+            "author": self.default_author,
+            "entrypoint_type": self.default_entrypoint_type,
+            "namespace_prefix": self.default_namespace_prefix,
+            "meta_type": self.default_meta_type,
+            "description": self.default_description,
+            "extract_block_fn": self.extract_block,
+            "serialize_block_fn": self.serialize_block,
+            "model_cls": NodeMetadataBlock,
+            # Convert model to dictionary for context_defaults
+            "context_defaults": default_metadata.model_dump(),
+        }
+
+    def stamp(self, path: Path, content: str, **kwargs: Any) -> OnexResultModel:
+        logger = logging.getLogger("omnibase.runtime.handlers.handler_markdown")
+        logger.debug(f"[START] stamp for {path}")
+        from datetime import datetime
 
         try:
             result_tuple: tuple[str, OnexResultModel] = self.stamp_with_idempotency(
                 path=path,
                 content=content,  # Pass original content with metadata block intact
-                author=self.default_author,
-                entrypoint_type=self.default_entrypoint_type,
-                namespace_prefix=self.default_namespace_prefix,
-                meta_type=self.default_meta_type,
-                description=self.default_description,
-                extract_block_fn=self.extract_block,
-                serialize_block_fn=self.serialize_block,
-                model_cls=NodeMetadataBlock,
-                context_defaults=context_defaults,  # Pass dictionary for now
+                **self._idempotency_kwargs(path),
             )
             _, result = result_tuple
             logger.debug(f"[END] stamp for {path}, result={result}")
@@ -280,6 +299,52 @@ class MarkdownHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacemen
                 metadata={},
             )
 
+    @staticmethod
+    def _stream_body_policy() -> StreamBodyPolicy:
+        """
+        Restates the model's body canonicalizer: line endings normalized to LF,
+        leading blank lines and trailing whitespace dropped.
+        """
+        return StreamBodyPolicy(
+            lead_chars="\r\n",
+            hash_trailing_chars=" \t\r\n",
+            normalize_newlines=True,
+        )
+
+    def stamp_stream(self, path: Path, **kwargs: Any) -> Optional[OnexResultModel]:
+        """Stamp a large Markdown file in place."""
+        return self.stamp_stream_with_idempotency(
+            path=path,
+            open_delim=MD_META_OPEN,
+            close_delim=MD_META_CLOSE,
+            body_policy=self._stream_body_policy(),
+            **self._idempotency_kwargs(path),
+        )
+
+    def verify_hash(
+        self, path: Path, content: str
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        return self.verify_with_idempotency(
+            path=path,
+            content=content,
+            extract_block_fn=self.extract_block,
+            serialize_block_fn=self.serialize_block,
+            model_cls=NodeMetadataBlock,
+        )
+
+    def verify_hash_stream(
+        self, path: Path
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        return self.verify_stream_with_idempotency(
+            path=path,
+            open_delim=MD_META_OPEN,
+            close_delim=MD_META_CLOSE,
+            body_policy=self._stream_body_policy(),
+            extract_block_fn=self.extract_block,
+            serialize_block_fn=self.serialize_block,
+            model_cls=NodeMetadataBlock,
+        )
+
     def pre_validate(
         self, path: Path, content: str, **kwargs: Any
     ) -> Optional[OnexResultModel]:
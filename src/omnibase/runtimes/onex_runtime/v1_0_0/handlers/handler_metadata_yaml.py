@@ -9,11 +9,11 @@
 # uuid: 2125bd0a-bbc6-4b32-a441-098d1a55eb88
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:25.002521
-# last_modified_at: 2025-05-22T20:22:47.712361
+# last_modified_at: 2026-10-17T01:07:10.286943
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 78a4120df47ff3f60b754188ff400049f8882e717ebd192c61612dadebc99ab1
+# hash: e00fa68b71c3253d2ee3133da7eab664cffb9abd0f7d5f959fe1e270a28195c3
 # entrypoint: python@handler_metadata_yaml.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.handler_metadata_yaml
@@ -39,13 +39,21 @@ from omnibase.model.model_node_metadata import (
 from omnibase.model.model_onex_message import LogLevelEnum, OnexMessageModel
 from omnibase.model.model_onex_message_result import OnexResultModel
 from omnibase.protocol.protocol_file_type_handler import ProtocolFileTypeHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.io.large_file_stream import StreamBodyPolicy
+from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_parser import (
+    load_metadata_block,
+)
 from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_placement import (
     BlockPlacementMixin,
 )
+from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_scanner import (
+    block_scanner,
+)
 from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_metadata_block import (
     MetadataBlockMixin,
 )
 from omnibase.schemas.loader import SchemaLoader
+from omnibase.utils.yaml_backend import yaml_safe_dump
 
 logger = logging.getLogger("omnibase.runtime.handlers.handler_metadata_yaml")
 
@@ -161,7 +169,9 @@ class MetadataYAMLHandler(
             #         f"Restamping {path} due to non-canonical metadata block: {reasons}"
             #     )
             #     prev_meta = None  # Force restamp in idempotency logic
-            logger.debug(f"[END] extract_block for {path}, result=({prev_meta}, rest)")
+            logger.debug(
+                f"[END] extract_block for {path}, found={prev_meta is not None}"
+            )
             return prev_meta, rest
         except Exception as e:
             logger.error(f"Exception in extract_block for {path}: {e}", exc_info=True)
@@ -170,32 +180,23 @@ class MetadataYAMLHandler(
     def _extract_block_with_delimiters(
         self, path: Path, content: str, open_delim: str, close_delim: str
     ) -> tuple[Optional[Any], str]:
-        import re
-
-        import yaml
-
-        from omnibase.metadata.metadata_constants import YAML_META_CLOSE, YAML_META_OPEN
-        from omnibase.model.model_node_metadata import NodeMetadataBlock
-
         logger = logging.getLogger("omnibase.handlers.handler_metadata_yaml")
         logger.debug(f"[EXTRACT] Starting extraction for {path}")
 
         # Find the block between the delimiters
-        block_pattern = (
-            rf"(?s){re.escape(YAML_META_OPEN)}(.*?){re.escape(YAML_META_CLOSE)}"
-        )
-        match = re.search(block_pattern, content)
-        if not match:
+        scanner = block_scanner(open_delim, close_delim)
+        span = scanner.find(content)
+        if span is None:
             logger.debug(f"[EXTRACT] No metadata block found in {path}")
             return None, content
 
         logger.debug(f"[EXTRACT] Metadata block found in {path}")
-        block_yaml = match.group(1).strip("\n ")
+        block_yaml = scanner.body(content, span).strip("\n ")
 
         prev_meta = None
         if block_yaml:
             try:
-                data = yaml.safe_load(block_yaml)
+                data = load_metadata_block(block_yaml)
                 logger.debug(
                     f"[EXTRACT] YAML parsing successful, keys: {list(data.keys())[:5]}"
                 )
@@ -231,7 +232,7 @@ class MetadataYAMLHandler(
                 prev_meta = None
 
         # Remove the block from the content
-        rest = re.sub(block_pattern + r"\n?", "", content, count=1)
+        rest = scanner.remove(content, span)
         logger.debug(
             f"[EXTRACT] Extraction complete, prev_meta: {prev_meta is not None}"
         )
@@ -244,10 +245,12 @@ class MetadataYAMLHandler(
         """
         from enum import Enum
 
-        import yaml
-
         from omnibase.metadata.metadata_constants import YAML_META_CLOSE, YAML_META_OPEN
         from omnibase.model.model_node_metadata import NodeMetadataBlock
+        from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_serializer import (
+            emit_yaml_mapping,
+            scalar_block_items,
+        )
 
         def enum_to_str(obj: Any) -> Any:
             if isinstance(obj, Enum):
@@ -290,12 +293,19 @@ class MetadataYAMLHandler(
                 CoreErrorCode.INVALID_PARAMETER,
             )
 
+        # Flat blocks of simple values are written without the YAML emitter
+        items = scalar_block_items(meta)
+        if items is not None:
+            yaml_block = emit_yaml_mapping([(k, v) for k, v in items if v != "null"])
+            if yaml_block is not None:
+                return f"{YAML_META_OPEN}\n{yaml_block}\n{YAML_META_CLOSE}\n"
+
         # Use compact entrypoint format and filter nulls
         meta_dict = meta.to_serializable_dict(use_compact_entrypoint=True)
         meta_dict = enum_to_str(meta_dict)
         meta_dict = filter_nulls(meta_dict)
 
-        yaml_block = yaml.safe_dump(
+        yaml_block = yaml_safe_dump(
             meta_dict, sort_keys=False, default_flow_style=False
         ).strip()
         return f"{YAML_META_OPEN}\n{yaml_block}\n{YAML_META_CLOSE}\n"
@@ -432,14 +442,8 @@ class MetadataYAMLHandler(
             normalized = "file"
         return normalized
 
-    def stamp(self, path: Path, content: str, **kwargs: Any) -> OnexResultModel:
-        """
-        Use the centralized idempotency logic from MetadataBlockMixin for stamping.
-        All protocol details are sourced from metadata_constants.
-        Protocol: Must return only OnexResultModel, never the tuple from stamp_with_idempotency.
-        """
-        from omnibase.model.model_node_metadata import NodeMetadataBlock
-
+    def _idempotency_kwargs(self, path: Path) -> dict[str, Any]:
+        """Handler-specific arguments shared by stamp and stamp_stream."""
         # Normalize filename for namespace
         normalized_name = self._normalize_filename_for_namespace(path.stem)
 
@@ -459,25 +463,78 @@ class MetadataYAMLHandler(
             runtime_language_hint=self.default_runtime_language_hint,
         )
 
-        # Convert model to dictionary for context_defaults
-        context_defaults = default_metadata.model_dump()
+        return {
+            "author": self.default_author,
+            "entrypoint_type": self.default_entrypoint_type,
+            "namespace_prefix": self.default_namespace_prefix,
+            "meta_type": self.default_meta_type,
+            "description": self.default_description,
+            "extract_block_fn": self.extract_block,
+            "serialize_block_fn": self.serialize_block,
+            "model_cls": NodeMetadataBlock,
+            # Convert model to dictionary for context_defaults
+            "context_defaults": default_metadata.model_dump(),
+        }
 
+    def stamp(self, path: Path, content: str, **kwargs: Any) -> OnexResultModel:
+        """
+        Use the centralized idempotency logic from MetadataBlockMixin for stamping.
+        All protocol details are sourced from metadata_constants.
+        Protocol: Must return only OnexResultModel, never the tuple from stamp_with_idempotency.
+        """
         result_tuple: tuple[str, OnexResultModel] = self.stamp_with_idempotency(
             path=path,
             content=content,
-            author=self.default_author,
-            entrypoint_type=self.default_entrypoint_type,
-            namespace_prefix=self.default_namespace_prefix,
-            meta_type=self.default_meta_type,
-            description=self.default_description,
+            normalize_rest_fn=self.normalize_rest,
+            **self._idempotency_kwargs(path),
+        )
+        _, result = result_tuple
+        return result
+
+    @staticmethod
+    def _stream_body_policy() -> StreamBodyPolicy:
+        """
+        Restates normalize_rest: strip surrounding whitespace and a leading
+        '---' document start line.
+        """
+        return StreamBodyPolicy(
+            lead_chars=None, hash_trailing_chars=None, drop_document_start=True
+        )
+
+    def stamp_stream(self, path: Path, **kwargs: Any) -> Optional[OnexResultModel]:
+        """Stamp a large YAML file in place."""
+        return self.stamp_stream_with_idempotency(
+            path=path,
+            open_delim=YAML_META_OPEN,
+            close_delim=YAML_META_CLOSE,
+            body_policy=self._stream_body_policy(),
+            **self._idempotency_kwargs(path),
+        )
+
+    def verify_hash(
+        self, path: Path, content: str
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        return self.verify_with_idempotency(
+            path=path,
+            content=content,
             extract_block_fn=self.extract_block,
             serialize_block_fn=self.serialize_block,
             normalize_rest_fn=self.normalize_rest,
             model_cls=NodeMetadataBlock,
-            context_defaults=context_defaults,
         )
-        _, result = result_tuple
-        return result
+
+    def verify_hash_stream(
+        self, path: Path
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        return self.verify_stream_with_idempotency(
+            path=path,
+            open_delim=YAML_META_OPEN,
+            close_delim=YAML_META_CLOSE,
+            body_policy=self._stream_body_policy(),
+            extract_block_fn=self.extract_block,
+            serialize_block_fn=self.serialize_block,
+            model_cls=NodeMetadataBlock,
+        )
 
     def pre_validate(
         self, path: Path, content: str, **kwargs: Any
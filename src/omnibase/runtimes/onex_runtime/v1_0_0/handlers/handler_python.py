@@ -9,11 +9,11 @@
 # uuid: 785ba7a2-4ba6-4439-9da5-2c63f05bf615
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:25.006018
-# last_modified_at: 2025-05-22T18:43:36.756496
+# last_modified_at: 2026-10-17T01:05:03.445823
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 2b37f58f47f13ef28e5befd775d95f2ad4e4ccf674a786c873a95c71fe8919ea
+# hash: f305e6d1cda488150f204e7a17398815ffde977dce17b9feb25e6739109a1d0b
 # entrypoint: python@handler_python.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.handler_python
@@ -22,7 +22,6 @@
 
 
 import logging
-import re
 from pathlib import Path
 from typing import Any, Optional
 
@@ -35,9 +34,15 @@ from omnibase.model.model_node_metadata import (
 )
 from omnibase.model.model_onex_message_result import OnexResultModel
 from omnibase.protocol.protocol_file_type_handler import ProtocolFileTypeHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_parser import (
+    load_metadata_block,
+)
 from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_placement import (
     BlockPlacementMixin,
 )
+from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_scanner import (
+    block_scanner,
+)
 from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_metadata_block import (
     MetadataBlockMixin,
 )
@@ -149,7 +154,9 @@ class PythonHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacementM
             #         f"Restamping {path} due to non-canonical metadata block: {reasons}"
             #     )
             #     prev_meta = None  # Force restamp in idempotency logic
-            logger.debug(f"[END] extract_block for {path}, result=({prev_meta}, rest)")
+            logger.debug(
+                f"[END] extract_block for {path}, found={prev_meta is not None}"
+            )
             return prev_meta, rest
         except Exception as e:
             logger.error(f"Exception in extract_block for {path}: {e}", exc_info=True)
@@ -158,21 +165,17 @@ class PythonHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacementM
     def _extract_block_with_delimiters(
         self, path: Path, content: str, open_delim: str, close_delim: str
     ) -> tuple[Optional[Any], str]:
-        import yaml
-
-        from omnibase.metadata.metadata_constants import PY_META_CLOSE, PY_META_OPEN
-
         logger.debug(f"[EXTRACT] Starting extraction for {path}")
 
-        # Find the block between the delimiters using regex
-        block_pattern = rf"(?s){re.escape(PY_META_OPEN)}(.*?){re.escape(PY_META_CLOSE)}"
-        match = re.search(block_pattern, content)
-        if not match:
+        # Find the block between the delimiters
+        scanner = block_scanner(open_delim, close_delim)
+        span = scanner.find(content)
+        if span is None:
             logger.debug(f"[EXTRACT] No metadata block found in {path}")
             return None, content
 
         logger.debug(f"[EXTRACT] Metadata block found in {path}")
-        block_content = match.group(1).strip("\n ")
+        block_content = scanner.body(content, span).strip("\n ")
 
         # Remove '# ' prefix from each line to get clean YAML
         yaml_lines = []
@@ -190,7 +193,7 @@ class PythonHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacementM
         prev_meta = None
         if block_yaml:
             try:
-                data = yaml.safe_load(block_yaml)
+                data = load_metadata_block(block_yaml)
                 logger.debug(
                     f"[EXTRACT] YAML parsing successful, keys: {list(data.keys())[:5]}"
                 )
@@ -232,7 +235,7 @@ class PythonHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacementM
                 prev_meta = None
 
         # Remove the block from the content
-        rest = re.sub(block_pattern + r"\n?", "", content, count=1)
+        rest = scanner.remove(content, span)
         logger.debug(
             f"[EXTRACT] Extraction complete, prev_meta: {prev_meta is not None}"
         )
@@ -349,6 +352,17 @@ class PythonHandler(ProtocolFileTypeHandler, MetadataBlockMixin, BlockPlacementM
         _, result = result_tuple
         return result
 
+    def verify_hash(
+        self, path: Path, content: str
+    ) -> Optional[tuple[Optional[str], Optional[str]]]:
+        return self.verify_with_idempotency(
+            path=path,
+            content=content,
+            extract_block_fn=self.extract_block,
+            serialize_block_fn=self.serialize_block,
+            model_cls=NodeMetadataBlock,
+        )
+
     def pre_validate(
         self, path: Path, content: str, **kwargs: Any
     ) -> Optional[OnexResultModel]:
@@ -9,11 +9,11 @@
 # uuid: 73197878-eeed-497b-9db7-a414bfcbebdb
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:21.447882
-# last_modified_at: 2025-05-22T20:50:39.714617
+# last_modified_at: 2026-10-17T01:05:03.447639
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 3e7e34885de626d84a51cf75ce66b6c3f8698657288eb0a6ad608938d120a83b
+# hash: 5a3664ad99a1333d3ad5709aae0b8417b7353e9072dac3135bd8e17b2de92c38
 # entrypoint: python@in_memory_file_io.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.in_memory_file_io
@@ -26,10 +26,9 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
-
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.protocol.protocol_file_io import ProtocolFileIO
+from omnibase.utils.yaml_backend import yaml_safe_dump, yaml_safe_load
 
 
 class InMemoryFileIO(ProtocolFileIO):
@@ -63,7 +62,7 @@ class InMemoryFileIO(ProtocolFileIO):
             return content
         elif isinstance(content, str):
             try:
-                parsed = yaml.safe_load(content)
+                parsed = yaml_safe_load(content)
             except Exception as e:
                 raise OnexError(f"Malformed YAML: {e}", CoreErrorCode.VALIDATION_FAILED)
             if parsed is None:
@@ -115,7 +114,7 @@ class InMemoryFileIO(ProtocolFileIO):
         if data is None:
             self.files[key] = None
         else:
-            self.files[key] = yaml.safe_dump(data)
+            self.files[key] = yaml_safe_dump(data)
         self.file_types[key] = "yaml"
 
     def write_json(self, path: str | Path, data: Any) -> None:
@@ -0,0 +1,339 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: large_file_stream.py
+# version: 1.0.0
+# uuid: a4dfde5d-2972-43d6-84c4-cce58159ddb8
+# author: OmniNode Team
+# created_at: 2026-10-16T23:24:13.611386
+# last_modified_at: 2026-10-17T01:05:03.453014
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 753a2cda263f3c0ab363716e5fdb2b0844e3204b62aac95647cb43cb21219cd2
+# entrypoint: python@large_file_stream.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.large_file_stream
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Streaming access to files too large to stamp as one string.
+
+Only the head of the file is decoded to find the metadata block. The body is
+hashed chunk by chunk and copied into the rewritten file with
+os.copy_file_range (or os.sendfile), so memory use stays flat however large
+the file is.
+"""
+
+import codecs
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, Optional, Tuple
+
+from omnibase.core.error_codes import CoreErrorCode, OnexError
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+MAX_HEAD_SIZE = 1024 * 1024
+
+
+class StreamBodyPolicy(NamedTuple):
+    """
+    A handler's body normalization, restated so it can be applied to a stream.
+    It must match what the handler's in-memory stamp does to the text after the
+    block, or streamed and in-memory stamps of the same file will disagree.
+    """
+
+    # Characters stripped from the start of the body; None strips all whitespace
+    lead_chars: Optional[str]
+    # Characters stripped from the end before hashing; None strips all whitespace
+    hash_trailing_chars: Optional[str]
+    # Drop a leading '---' document start line (YAML)
+    drop_document_start: bool = False
+    # Write the body with CRLF/CR line endings converted to LF
+    normalize_newlines: bool = False
+
+
+def _normalize_newlines(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _is_lead(text: str, lead_chars: Optional[str]) -> bool:
+    return not text.lstrip(lead_chars)
+
+
+def read_head(
+    path: Path,
+    open_delim: str,
+    close_delim: str,
+    lead_chars: Optional[str],
+    chunk_size: Optional[int] = None,
+    limit: int = MAX_HEAD_SIZE,
+) -> Tuple[Optional[str], int]:
+    """
+    Return (block_text, body_offset) for the metadata block at the top of path,
+    or (None, 0) if the file does not start with one. Only lead characters may
+    precede the block. Reads no further than the end of the block.
+    """
+    chunk_size = chunk_size or STREAM_CHUNK_SIZE
+    open_bytes = open_delim.encode("utf-8")
+    close_bytes = close_delim.encode("utf-8")
+    head = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            head += chunk
+            start = head.find(open_bytes)
+            prefix = head if start == -1 else head[:start]
+            if start == -1:
+                # The head may end with the first bytes of the open delimiter
+                for k in range(min(len(open_bytes) - 1, len(head)), 0, -1):
+                    if open_bytes.startswith(head[-k:]):
+                        prefix = head[:-k]
+                        break
+            if not _is_lead(prefix.decode("utf-8", errors="ignore"), lead_chars):
+                return None, 0
+            if start != -1:
+                end = head.find(close_bytes, start)
+                if end != -1:
+                    end += len(close_bytes)
+                    return head[start:end].decode("utf-8"), end
+            if not chunk:
+                return None, 0
+            if len(head) > limit:
+                raise OnexError(
+                    f"Cannot stream {path}: no complete metadata block in the "
+                    f"first {limit} bytes",
+                    CoreErrorCode.UNSUPPORTED_OPERATION,
+                )
+
+
+class StreamedBody:
+    """
+    The body of a file, from a byte offset to EOF, normalized as described by a
+    StreamBodyPolicy. hash_into makes one pass that feeds the canonical body to a
+    hasher and records where the written body starts and ends; write_stamped then
+    rewrites the file as a new header followed by that byte range.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        offset: int,
+        policy: StreamBodyPolicy,
+        guard: str,
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        self.path = path
+        self.offset = offset
+        self.policy = policy
+        self.guard = guard
+        self.chunk_size = chunk_size or STREAM_CHUNK_SIZE
+        self.start = offset
+        self.end = offset
+        self.has_cr = False
+        self._scanned = False
+
+    def _lead_end(self, text: str, final: bool) -> Optional[int]:
+        """Index where the body proper starts in text, or None if more is needed."""
+        i = len(text) - len(text.lstrip(self.policy.lead_chars))
+        if i == len(text) and not final:
+            return None
+        if not self.policy.drop_document_start:
+            return i
+        if len(text) - i < 3 and not final:
+            return None
+        if not text.startswith("---", i):
+            return i
+        newline = text.find("\n", i)
+        if newline == -1:
+            return None if not final else len(text)
+        rest = text[newline + 1 :]
+        skipped = len(rest) - len(rest.lstrip("\n"))
+        if skipped == len(rest) and not final:
+            return None
+        return newline + 1 + skipped
+
+    def hash_into(self, hasher: Any) -> None:
+        """
+        Feed the canonical body (normalized lines, trailing whitespace removed,
+        one final newline) to hasher. Raises OnexError if the body contains
+        guard, i.e. a second metadata block that the in-memory path would remove.
+        """
+        guard_bytes = self.guard.encode("utf-8")
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        lead = ""
+        in_lead = True
+        pending = ""
+        tail = b""
+        hash_end = self.offset
+        tail_space = 0
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            while True:
+                chunk = f.read(self.chunk_size)
+                final = not chunk
+                if guard_bytes in tail + chunk:
+                    raise OnexError(
+                        f"Cannot stream {self.path}: it has a metadata block "
+                        "below the top of the file",
+                        CoreErrorCode.UNSUPPORTED_OPERATION,
+                    )
+                tail = (tail + chunk)[-len(guard_bytes) :]
+                text = decoder.decode(chunk, final)
+                if in_lead:
+                    lead += text
+                    split = self._lead_end(lead, final)
+                    if split is None:
+                        continue
+                    in_lead = False
+                    self.start = self.offset + len(lead[:split].encode("utf-8"))
+                    hash_end = self.start
+                    text = lead[split:]
+                    lead = ""
+                pending += text
+                kept = pending.rstrip(self.policy.hash_trailing_chars)
+                if kept:
+                    data = kept.encode("utf-8")
+                    if "\r" in kept:
+                        self.has_cr = True
+                        hasher.update(_normalize_newlines(kept).encode("utf-8"))
+                    else:
+                        hasher.update(data)
+                    hash_end += len(data)
+                    stripped = kept.rstrip()
+                    if stripped:
+                        tail_space = len(kept[len(stripped) :].encode("utf-8"))
+                    else:
+                        tail_space += len(data)
+                    pending = pending[len(kept) :]
+                if final:
+                    break
+        hasher.update(b"\n")
+        self.end = max(self.start, hash_end - tail_space)
+        self._scanned = True
+
+    def header(self, block_str: str) -> str:
+        """The text written before the body, as in stamp_with_idempotency."""
+        if self.end > self.start:
+            return f"{block_str}\n\n"
+        return block_str.rstrip() + "\n"
+
+    def is_unchanged(self, block_str: str) -> bool:
+        """True if writing block_str would reproduce the file byte for byte."""
+        self._require_scan()
+        header = self.header(block_str).encode("utf-8")
+        if self.end == self.start:
+            expected_size = len(header)
+        else:
+            if self.start != len(header):
+                return False
+            if self.policy.normalize_newlines and self.has_cr:
+                return False
+            expected_size = self.end + 1
+        if os.path.getsize(self.path) != expected_size:
+            return False
+        with open(self.path, "rb") as f:
+            if f.read(len(header)) != header:
+                return False
+            if self.end > self.start:
+                f.seek(self.end)
+                return f.read(1) == b"\n"
+        return True
+
+    def write_stamped(self, block_str: str) -> None:
+        """Atomically replace the file with block_str followed by the body."""
+        self._require_scan()
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as out, open(self.path, "rb") as src:
+                out.write(self.header(block_str).encode("utf-8"))
+                if self.end > self.start:
+                    if self.policy.normalize_newlines and self.has_cr:
+                        self._copy_normalized(src, out)
+                    else:
+                        out.flush()
+                        _copy_range(src, out, self.start, self.end - self.start)
+                        out.seek(0, os.SEEK_END)
+                    out.write(b"\n")
+            shutil.copymode(self.path, tmp_name)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _copy_normalized(self, src: BinaryIO, out: BinaryIO) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        src.seek(self.start)
+        remaining = self.end - self.start
+        carry = ""
+        while remaining > 0:
+            chunk = src.read(min(self.chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            text = carry + decoder.decode(chunk, remaining <= 0)
+            # Hold back a trailing CR in case the next chunk starts with LF
+            carry = "\r" if text.endswith("\r") and remaining > 0 else ""
+            if carry:
+                text = text[:-1]
+            out.write(_normalize_newlines(text).encode("utf-8"))
+        _check_copied(src, remaining)
+
+    def _require_scan(self) -> None:
+        if not self._scanned:
+            raise OnexError(
+                "StreamedBody.hash_into must run before the body is written",
+                CoreErrorCode.OPERATION_FAILED,
+            )
+
+
+def _copy_range(src: BinaryIO, out: BinaryIO, offset: int, count: int) -> None:
+    """
+    Copy count bytes of src from offset to the current position of out, inside
+    the kernel where possible. out must have been flushed. Raises OnexError if
+    src ends before count bytes were copied (it was truncated after the scan).
+    """
+    in_fd, out_fd = src.fileno(), out.fileno()
+    for kernel_copy in ("copy_file_range", "sendfile"):
+        if not hasattr(os, kernel_copy):
+            continue
+        try:
+            while count > 0:
+                if kernel_copy == "copy_file_range":
+                    copied = os.copy_file_range(in_fd, out_fd, count, offset)
+                else:
+                    copied = os.sendfile(out_fd, in_fd, offset, count)
+                if copied == 0:
+                    break
+                offset += copied
+                count -= copied
+            _check_copied(src, count)
+            return
+        except OSError:
+            # Not supported for this pair of files; resume with the next method
+            continue
+    src.seek(offset)
+    while count > 0:
+        data = src.read(min(STREAM_CHUNK_SIZE, count))
+        if not data:
+            break
+        out.write(data)
+        count -= len(data)
+    _check_copied(src, count)
+
+
+def _check_copied(src: BinaryIO, missing: int) -> None:
+    if missing > 0:
+        raise OnexError(
+            f"{src.name} ended {missing} bytes early while it was being stamped",
+            CoreErrorCode.FILE_READ_ERROR,
+        )
@@ -0,0 +1,177 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: metadata_block_parser.py
+# version: 1.0.0
+# uuid: 2e8ff05a-4039-40e5-96af-6b5ed1fa3c57
+# author: OmniNode Team
+# created_at: 2026-10-16T23:55:02.187310
+# last_modified_at: 2026-10-17T01:05:03.455163
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: a9d23f7418e9750829188bd88ee02b13111fb220e8edc6ad027237bbf6a3b823
+# entrypoint: python@metadata_block_parser.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.metadata_block_parser
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Fast-path loader for flat ONEX metadata blocks.
+
+serialize_metadata_block writes one `key: value` line per field, and
+CanonicalYAMLSerializer writes the same shape (between '---' and '...') for
+flat blocks. load_metadata_block parses that shape directly and only calls
+yaml.safe_load for anything else: nested values (tools, dependencies), flow
+collections, multi-line or double-quoted scalars, anchors, tags, or any line
+it does not recognize.
+
+Scalars are resolved with PyYAML's own implicit resolvers and constructors, so
+the fast path returns exactly what yaml.safe_load would (a timestamp is still
+a datetime, a 64-digit hash of zeros is still the int 0).
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+from yaml.nodes import ScalarNode
+from yaml.reader import Reader
+
+from omnibase.utils.yaml_backend import yaml_safe_load
+
+_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_.\-]*\Z")
+# First characters that make a plain scalar something other than a plain scalar
+_INDICATORS = frozenset("-?:,[]{}#&*!|>'\"%@`")
+# Characters YAML treats as line breaks, or that the flat form never contains
+_UNSUPPORTED = re.compile("[\r\t\x85\u2028\u2029\ufeff]")
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_WILDCARD = tuple(yaml.SafeLoader.yaml_implicit_resolvers.get(None, []))
+# Implicit resolvers by first character, as BaseResolver.resolve looks them up
+_RESOLVERS = {
+    first: tuple(resolvers) + _WILDCARD
+    for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+    if first is not None
+}
+_constructors = yaml.SafeLoader.yaml_constructors
+_constructor = yaml.SafeLoader("")
+
+
+def _resolve(value: str) -> str:
+    """The tag yaml.SafeLoader gives an unquoted scalar (BaseResolver.resolve)."""
+    for tag, regexp in _RESOLVERS.get(value[0] if value else "", _WILDCARD):
+        if regexp.match(value):
+            return str(tag)
+    return _STR_TAG
+
+
+@lru_cache(maxsize=1024)
+def _is_str_key(key: str) -> bool:
+    return bool(_KEY.match(key)) and _resolve(key) == _STR_TAG
+
+
+def _plain_scalar(value: str) -> Optional[str]:
+    """value if it is a single-line plain scalar, else None."""
+    if (
+        not value
+        or value[0] in _INDICATORS
+        or value[0] == " "
+        or value[-1] in " :"
+        or " #" in value
+        or ": " in value
+    ):
+        return None
+    return value
+
+
+def _single_quoted(value: str) -> Optional[str]:
+    """The text of a single-line single-quoted scalar, else None."""
+    if len(value) < 2 or value[0] != "'" or value[-1] != "'":
+        return None
+    inner = value[1:-1]
+    if "'" in inner.replace("''", ""):
+        return None
+    return inner.replace("''", "'")
+
+
+def _scalar(value: str) -> Any:
+    if value == "[]":
+        return []
+    if value == "{}":
+        return {}
+    text = _single_quoted(value)
+    if text is not None:
+        return text
+    text = _plain_scalar(value)
+    if text is None:
+        raise ValueError(value)
+    tag = _resolve(text)
+    if tag == _STR_TAG:
+        return text
+    if tag not in _constructors:
+        raise ValueError(value)
+    return _constructors[tag](_constructor, ScalarNode(tag, text))
+
+
+def _entry(line: str) -> Tuple[str, Any]:
+    key, sep, value = line.partition(": ")
+    if not sep or not _is_str_key(key):
+        raise ValueError(line)
+    return key, _scalar(value)
+
+
+def parse_flat_block(text: str) -> Optional[Dict[str, Any]]:
+    """
+    The mapping yaml.safe_load(text) returns, if text is a flat block of
+    `key: value` lines (optionally between '---' and '...', with comment and
+    blank lines, and one level of `key:` mappings indented by two spaces as
+    CanonicalYAMLSerializer writes entrypoint); None if text has any other form.
+    """
+    if _UNSUPPORTED.search(text) or Reader.NON_PRINTABLE.search(text):
+        return None
+    data: Dict[str, Any] = {}
+    parent: Optional[str] = None
+    started = ended = False
+    try:
+        for line in text.split("\n"):
+            if not line.strip(" ") or line[0] == "#":
+                continue
+            if ended:
+                return None
+            if line.startswith("  "):
+                if parent is None or line[2] == " ":
+                    return None
+                if data[parent] is None:
+                    data[parent] = {}
+                key, value = _entry(line[2:])
+                data[parent][key] = value
+                continue
+            parent = None
+            if line == "---" and not started and not data:
+                started = True
+            elif line == "...":
+                ended = True
+            elif line[-1] == ":" and _is_str_key(line[:-1]):
+                parent = line[:-1]
+                data[parent] = None
+            else:
+                key, value = _entry(line)
+                data[key] = value
+    except (ValueError, yaml.YAMLError):
+        return None
+    return data or None
+
+
+def load_metadata_block(text: str) -> Any:
+    """yaml.safe_load(text), parsing flat metadata blocks without PyYAML."""
+    data = parse_flat_block(text)
+    if data is not None:
+        return data
+    return yaml_safe_load(text)
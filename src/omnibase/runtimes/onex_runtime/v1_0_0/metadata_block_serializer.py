@@ -9,11 +9,11 @@
 # uuid: 61e8a105-29dc-410a-92c0-c18705fdc977
 # author: OmniNode Team
 # created_at: 2025-05-22T16:19:58.861708
-# last_modified_at: 2025-05-22T20:22:47.711255
+# last_modified_at: 2026-10-17T01:05:03.457220
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 90798b9288035f72d06cf66b40ea0b8dd353c4ae95635411dbb9619159750497
+# hash: d1890cff68415a587322b1420cb10def621fecbe7720d59b37ca3dbad277eb02
 # entrypoint: python@metadata_block_serializer.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.metadata_block_serializer
@@ -27,10 +27,17 @@ Centralized logic for serializing ONEX metadata blocks for all file types.
 - Flattens nested dicts for flat key-value output.
 - Parameterized by block delimiters and comment prefix.
 - Used by all file handlers to ensure consistent, null-free metadata blocks.
+
+A stamped block almost always holds only strings, enums and the entrypoint.
+For such blocks scalar_block_items reads the fields straight off the model in
+declaration order, and the flat and YAML headers are assembled as strings.
+Blocks with nested values take the general path; both paths give the same
+bytes.
 """
 
 from enum import Enum
-from typing import Any, Dict, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -88,6 +95,77 @@ def _flatten_dict(
     return dict(items)  # type: ignore[assignment]  # mypy false positive: items is list[tuple[str, Any]], return is dict[str, Any]; see review for rationale
 
 
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+@lru_cache(maxsize=None)
+def _field_names(model_cls: type) -> Tuple[str, ...]:
+    return tuple(model_cls.model_fields)  # type: ignore[attr-defined]
+
+
+def scalar_block_items(
+    model: BaseModel, compact_entrypoint: bool = True
+) -> Optional[List[Tuple[str, Any]]]:
+    """
+    The fields of a NodeMetadataBlock that a serialized block shows, in
+    declaration order: None and empty lists or dicts are left out, enums
+    become their values and the entrypoint becomes "type@target" (or a
+    {"type", "target"} dict if not compact_entrypoint). Returns None if any
+    other field holds a list, dict or model, or the model class changes how
+    it serializes; callers then take the general path.
+    """
+    from omnibase.model.model_node_metadata import EntrypointBlock, NodeMetadataBlock
+
+    model_cls = type(model)
+    to_dict = getattr(model_cls, "to_serializable_dict", None)
+    if to_dict is not NodeMetadataBlock.to_serializable_dict:
+        return None
+    items: List[Tuple[str, Any]] = []
+    for name in _field_names(model_cls):
+        value = getattr(model, name)
+        kind = type(value)
+        if kind in _SCALAR_TYPES:
+            items.append((name, value))
+        elif value is None or value == [] or value == {}:
+            continue
+        elif isinstance(value, Enum):
+            items.append((name, value.value))
+        elif kind is EntrypointBlock and name == "entrypoint":
+            entrypoint_type = value.type.value
+            if compact_entrypoint:
+                items.append((name, f"{entrypoint_type}@{value.target}"))
+            else:
+                items.append((name, {"type": entrypoint_type, "target": value.target}))
+        else:
+            return None
+    return items
+
+
+def emit_yaml_mapping(items: List[Tuple[str, Any]]) -> Optional[str]:
+    """
+    yaml_safe_dump(dict(items), sort_keys=False, default_flow_style=False)
+    without the trailing newline, for string, int and bool values. Returns
+    None if a value needs the emitter (see yaml_backend.block_scalar).
+    """
+    from omnibase.utils.yaml_backend import block_scalar
+
+    lines = []
+    for key, value in items:
+        kind = type(value)
+        if kind is str:
+            text = block_scalar(value, len(key) + 2)
+            if text is None:
+                return None
+        elif kind is bool:
+            text = "true" if value else "false"
+        elif kind is int:
+            text = str(value)
+        else:
+            return None
+        lines.append(f"{key}: {text}")
+    return "\n".join(lines)
+
+
 def serialize_metadata_block(
     model: Union[BaseModel, Dict[str, Any]],
     open_delim: str,
@@ -101,7 +179,20 @@ def serialize_metadata_block(
     - close_delim: block closing delimiter (e.g., PY_META_CLOSE)
     - comment_prefix: prefix for each line (e.g., '# ')
     """
-    import yaml
+    from omnibase.utils.yaml_backend import yaml_dump
+
+    if isinstance(model, BaseModel) and not isinstance(
+        getattr(model, "tools", None), dict
+    ):
+        items = scalar_block_items(model)
+        if items is not None:
+            lines = [open_delim]
+            for k, v in items:
+                if v != "null":
+                    lines.append(f"{comment_prefix}{k}: {v}")
+            lines.append(close_delim)
+            lines.append("")
+            return "\n".join(lines)
 
     if isinstance(model, BaseModel):
         # Use compact entrypoint format if supported
@@ -136,7 +227,7 @@ def serialize_metadata_block(
         lines.append(f"{comment_prefix}tools:")
         if tools_data:  # Non-empty tools
             # Convert tools to YAML and add with proper indentation
-            tools_yaml = yaml.dump(tools_data, default_flow_style=False, sort_keys=True)
+            tools_yaml = yaml_dump(tools_data, default_flow_style=False, sort_keys=True)
             for line in tools_yaml.strip().split("\n"):
                 if line.strip():  # Skip empty lines
                     lines.append(f"{comment_prefix}  {line}")
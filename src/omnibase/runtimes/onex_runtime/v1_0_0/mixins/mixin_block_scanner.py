@@ -0,0 +1,117 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: mixin_block_scanner.py
+# version: 1.0.0
+# uuid: 392b7ae3-2b3e-4795-9ffb-47a5dbe27a13
+# author: OmniNode Team
+# created_at: 2026-10-16T23:50:50.401023
+# last_modified_at: 2026-10-17T01:05:03.459102
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 4d8a72f5d0f1d55fae36910ecbaf9115bfbdc7a4dd16ca1bbc5073fa4f450fe3
+# entrypoint: python@mixin_block_scanner.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.mixin_block_scanner
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Single-pass scanner for delimited metadata blocks, shared by the file handlers.
+
+A block is the text from an open delimiter to the first close delimiter after
+it. The scanner finds both with str.find in one left-to-right pass and returns
+offsets (BlockSpan) into the original string, so callers slice out the block
+body or the rest of the file once, without building a regex per call or
+scanning the file a second time to remove the block.
+
+Metadata blocks live in the file header, so an open delimiter is only looked
+for in the first header_limit characters (by default the same limit the
+streaming stamper reads, MAX_HEAD_SIZE); a file with no block there is not
+scanned any further.
+"""
+
+from functools import lru_cache
+from typing import Iterator, NamedTuple, Optional
+
+from omnibase.core.error_codes import CoreErrorCode, OnexError
+from omnibase.runtimes.onex_runtime.v1_0_0.io.large_file_stream import MAX_HEAD_SIZE
+
+HEADER_REGION_SIZE = MAX_HEAD_SIZE
+
+
+class BlockSpan(NamedTuple):
+    """Offsets of one block: content[start:end] is the block including delimiters."""
+
+    start: int
+    body_start: int
+    body_end: int
+    end: int
+
+
+class MetadataBlockScanner:
+    """Finds open_delim ... close_delim blocks in a string."""
+
+    def __init__(
+        self,
+        open_delim: str,
+        close_delim: str,
+        header_limit: int = HEADER_REGION_SIZE,
+    ) -> None:
+        if not open_delim or not close_delim:
+            raise OnexError(
+                "Block delimiters must be non-empty", CoreErrorCode.INVALID_PARAMETER
+            )
+        self.open_delim = open_delim
+        self.close_delim = close_delim
+        self.header_limit = header_limit
+        self._open_len = len(open_delim)
+        self._close_len = len(close_delim)
+
+    def find_open(self, content: str, start: int = 0) -> int:
+        """Offset of the next open delimiter in the header region, or -1."""
+        return content.find(
+            self.open_delim, start, self.header_limit + self._open_len - 1
+        )
+
+    def find(self, content: str, start: int = 0) -> Optional[BlockSpan]:
+        """The first complete block at or after start, or None."""
+        open_at = self.find_open(content, start)
+        if open_at == -1:
+            return None
+        body_start = open_at + self._open_len
+        close_at = content.find(self.close_delim, body_start)
+        if close_at == -1:
+            return None
+        return BlockSpan(open_at, body_start, close_at, close_at + self._close_len)
+
+    def iter_blocks(self, content: str) -> Iterator[BlockSpan]:
+        """Every complete block, left to right, without overlaps."""
+        span = self.find(content)
+        while span is not None:
+            yield span
+            span = self.find(content, span.end)
+
+    @staticmethod
+    def body(content: str, span: BlockSpan) -> str:
+        """The text between the delimiters."""
+        return content[span.body_start : span.body_end]
+
+    @staticmethod
+    def remove(content: str, span: BlockSpan, trailing: str = "\n") -> str:
+        """content without the block and, if present, one trailing string after it."""
+        end = span.end
+        if trailing and content.startswith(trailing, end):
+            end += len(trailing)
+        return content[: span.start] + content[end:]
+
+
+@lru_cache(maxsize=None)
+def block_scanner(open_delim: str, close_delim: str) -> MetadataBlockScanner:
+    """The shared scanner for a delimiter pair."""
+    return MetadataBlockScanner(open_delim, close_delim)
@@ -9,11 +9,11 @@
 # uuid: cd951709-d940-4d2f-af91-33eb2dac7729
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:21.448053
-# last_modified_at: 2025-05-22T18:41:20.491942
+# last_modified_at: 2026-10-17T01:07:10.288827
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 049fc384efc65462454c07afbe3defc9a541d4c897babb4a0fdf6fbf713121a9
+# hash: 2fe436582cabdab20f1226b0b0a3769a3e198399dabc488a62a717f5b716e975
 # entrypoint: python@mixin_metadata_block.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.mixin_metadata_block
@@ -26,16 +26,25 @@ import os
 import sys
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
 
-import yaml
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 if TYPE_CHECKING:
     pass
 
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.model.model_onex_message_result import OnexResultModel
-from omnibase.utils.metadata_utils import canonicalize_for_hash, compute_canonical_hash
+from omnibase.runtimes.onex_runtime.v1_0_0.io.large_file_stream import (
+    StreamBodyPolicy,
+    StreamedBody,
+    read_head,
+)
+from omnibase.utils.canonical_hasher import block_hasher, new_hasher
+from omnibase.utils.metadata_utils import (
+    canonicalize_metadata_for_hash,
+    compute_canonical_hash_for,
+)
 
 # Helper to load .onexversion once per process
 _version_cache = None
@@ -60,7 +69,7 @@ def get_onex_versions() -> dict[str, Any]:
         candidate = d / ".onexversion"
         if candidate.exists():
             with open(candidate, "r") as f:
-                data: dict[str, Any] = yaml.safe_load(f)
+                data: dict[str, Any] = yaml_safe_load(f)
             for key in ("metadata_version", "protocol_version", "schema_version"):
                 if key not in data:
                     raise OnexError(
@@ -79,6 +88,23 @@ def get_onex_versions() -> dict[str, Any]:
     )
 
 
+def get_hash_algorithm() -> Optional[str]:
+    """
+    The hash_algorithm tag the repository's .onexversion opts into, or None
+    (blocks keep the algorithm they were stamped with, SHA-256 by default).
+    """
+    try:
+        versions = get_onex_versions()
+    except OnexError:
+        return None
+    algorithm = versions.get("hash_algorithm")
+    if algorithm is not None:
+        # Reject an unknown tag before anything is stamped with it
+        new_hasher(str(algorithm))
+        return str(algorithm)
+    return None
+
+
 class MetadataBlockMixin:
     def generate_uuid(self) -> str:
         return str(uuid.uuid4())
@@ -201,6 +227,196 @@ class MetadataBlockMixin:
             normalized = "file"
         return normalized
 
+    @staticmethod
+    def _normalize_rest_for_hash(
+        rest: str, normalize_rest_fn: Any, canonicalizer: Any
+    ) -> str:
+        """
+        Normalize the body with normalize_rest_fn if provided, otherwise the
+        canonicalizer.
+        """
+        if normalize_rest_fn:
+            normalized: str = normalize_rest_fn(rest)
+        else:
+            normalized = canonicalizer(rest)
+        return normalized
+
+    @staticmethod
+    def _layout_stamped_content(block_str: str, normalized_rest: str) -> str:
+        """
+        Join a serialized block and the normalized body the way the stamper
+        writes them: one blank line between, one trailing newline.
+        """
+        rest_stripped = normalized_rest.lstrip("\n")
+        new_content = (
+            f"{block_str}\n\n{rest_stripped}" if rest_stripped else f"{block_str}\n"
+        )
+        # A canonical body already ends in one newline after non-whitespace
+        if new_content[-2:-1].isspace() or not new_content.endswith("\n"):
+            new_content = new_content.rstrip() + "\n"
+        return new_content
+
+    def verify_with_idempotency(
+        self,
+        *,
+        path: Path,
+        content: str,
+        extract_block_fn: Any = None,
+        serialize_block_fn: Any = None,
+        normalize_rest_fn: Any = None,
+        model_cls: Any = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read-only counterpart of stamp_with_idempotency.
+
+        Returns (stored_hash, canonical_hash) for the existing block and body, or
+        (None, None) if the content has no metadata block. The canonical hash is
+        computed once from the existing block, never taken from the digest memo;
+        no replacement block is built, so a file is clean exactly when stamping
+        it would keep its hash.
+        """
+        try:
+            prev_meta, rest = extract_block_fn(path, content)
+        except Exception:
+            prev_meta, rest = None, content
+        if prev_meta is None:
+            return None, None
+        canonicalizer = model_cls.get_canonicalizer() if model_cls else (lambda x: x)
+        normalized_rest = self._normalize_rest_for_hash(
+            rest, normalize_rest_fn, canonicalizer
+        )
+        volatile_fields = (
+            list(model_cls.get_volatile_fields())
+            if model_cls
+            else ["hash", "last_modified_at"]
+        )
+        return prev_meta.hash, compute_canonical_hash_for(
+            prev_meta.model_dump(),
+            normalized_rest,
+            volatile_fields=volatile_fields,
+            metadata_serializer=serialize_block_fn,
+            body_canonicalizer=canonicalizer,
+        )
+
+    def verify_stream_with_idempotency(
+        self,
+        *,
+        path: Path,
+        open_delim: str,
+        close_delim: str,
+        body_policy: StreamBodyPolicy,
+        extract_block_fn: Any = None,
+        serialize_block_fn: Any = None,
+        model_cls: Any = None,
+        chunk_size: Optional[int] = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Streaming counterpart of verify_with_idempotency for files too large to
+        hold as one string. Only the block at the top of the file is decoded;
+        the body is hashed in chunks and the file is never written.
+        """
+        block_text, body_offset = read_head(
+            path, open_delim, close_delim, body_policy.lead_chars, chunk_size
+        )
+        if block_text is None:
+            return None, None
+        try:
+            prev_meta, _ = extract_block_fn(path, block_text)
+        except Exception:
+            prev_meta = None
+        if prev_meta is None:
+            return None, None
+        volatile_fields = (
+            list(model_cls.get_volatile_fields())
+            if model_cls
+            else ["hash", "last_modified_at"]
+        )
+        block_dict = prev_meta.model_dump()
+        hasher = block_hasher(block_dict.get("hash_algorithm"))
+        meta_str = canonicalize_metadata_for_hash(
+            block_dict,
+            volatile_fields=volatile_fields,
+            metadata_serializer=serialize_block_fn,
+        )
+        hasher.update(meta_str.encode("utf-8") + b"\n")
+        StreamedBody(path, body_offset, body_policy, open_delim, chunk_size).hash_into(
+            hasher
+        )
+        return prev_meta.hash, str(hasher.hexdigest())
+
+    def _resolve_stamped_block(
+        self,
+        *,
+        path: Path,
+        prev_meta: Any,
+        hash_block: Callable[[dict[str, Any], Optional[str]], str],
+        author: str,
+        entrypoint_type: str,
+        namespace_prefix: str,
+        meta_type: Optional[str],
+        description: Optional[str],
+        model_cls: Any,
+        context_defaults: Optional[dict[str, Any]],
+    ) -> Any:
+        """
+        Build the block to write for path. hash_block(block_dict, stored_hash)
+        returns the canonical hash of the block with the file body; it is called
+        exactly once, and may return stored_hash without rehashing when it is
+        known to cover the same canonical inputs.
+
+        An existing block whose stored hash is still current keeps its hash and
+        last_modified_at. The block built from it then already carries both,
+        so it is returned as is and an unchanged file costs one block
+        construction, one canonicalization and at most one hash.
+        """
+        import datetime
+
+        now = datetime.datetime.utcnow().isoformat()
+
+        # Normalize filename for namespace
+        normalized_stem = self._normalize_filename_for_namespace(path.stem)
+
+        # Prepare updates
+        updates = {
+            "author": author,
+            "entrypoint": {"type": entrypoint_type, "target": path.name},
+            "namespace": f"{namespace_prefix}.{normalized_stem}",
+            "meta_type": meta_type,
+            "description": description,
+        }
+        # Without a repository setting the previous block keeps its algorithm
+        hash_algorithm = get_hash_algorithm()
+        if hash_algorithm is not None:
+            updates["hash_algorithm"] = hash_algorithm
+        if prev_meta is None:
+            # New block: set all required fields and compute hash
+            updates["created_at"] = self.get_file_creation_date(path) or now
+            updates["last_modified_at"] = now
+            new_block = self.update_metadata_block(
+                prev_meta, updates, path, model_cls, context_defaults
+            )
+            updates["hash"] = hash_block(new_block.model_dump(), None)
+        else:
+            # Existing block: check idempotency
+            new_block = self.update_metadata_block(
+                prev_meta, updates, path, model_cls, context_defaults
+            )
+            new_computed_hash = hash_block(new_block.model_dump(), prev_meta.hash)
+
+            # Idempotent only if the stored hash already covers this exact
+            # block and body; a placeholder hash never matches.
+            if prev_meta.hash == new_computed_hash:
+                # Idempotent: new_block kept last_modified_at and hash from
+                # prev_meta, so it is the final block
+                return new_block
+            # Content changed OR placeholder hash: update last_modified_at and hash
+            updates["last_modified_at"] = now
+            updates["hash"] = new_computed_hash
+        # Final block construction
+        return self.update_metadata_block(
+            prev_meta, updates, path, model_cls, context_defaults
+        )
+
     def stamp_with_idempotency(
         self,
         *,
@@ -227,100 +443,64 @@ class MetadataBlockMixin:
             canonicalizer = (
                 model_cls.get_canonicalizer() if model_cls else (lambda x: x)
             )
-            # Apply normalize_rest_fn if provided, otherwise use canonicalizer
-            if normalize_rest_fn:
-                normalized_rest = normalize_rest_fn(rest)
-            else:
-                normalized_rest = canonicalizer(rest)
+            normalized_rest = self._normalize_rest_for_hash(
+                rest, normalize_rest_fn, canonicalizer
+            )
             volatile_fields = (
                 list(model_cls.get_volatile_fields())
                 if model_cls
                 else ["hash", "last_modified_at"]
             )
-            import datetime
-
-            now = datetime.datetime.utcnow().isoformat()
-            # Compute hash for idempotency
-            prev_block_dict = prev_meta.model_dump() if prev_meta else {}
-            prev_full_content_for_hash = canonicalize_for_hash(
-                prev_block_dict,
-                normalized_rest,
-                volatile_fields=volatile_fields,
-                metadata_serializer=serialize_block_fn,
-                body_canonicalizer=canonicalizer,
-            )
-            prev_computed_hash = compute_canonical_hash(prev_full_content_for_hash)
-
-            # Normalize filename for namespace
-            normalized_stem = self._normalize_filename_for_namespace(path.stem)
-
-            # Prepare updates
-            updates = {
-                "author": author,
-                "entrypoint": {"type": entrypoint_type, "target": path.name},
-                "namespace": f"{namespace_prefix}.{normalized_stem}",
-                "meta_type": meta_type,
-                "description": description,
-            }
-            if prev_meta is None:
-                # New block: set all required fields and compute hash
-                updates["created_at"] = self.get_file_creation_date(path) or now
-                updates["last_modified_at"] = now
-                # For new blocks, we need to compute the hash
-                new_block = self.update_metadata_block(
-                    prev_meta, updates, path, model_cls, context_defaults
-                )
-                new_block_dict = new_block.model_dump()
-                new_full_content_for_hash = canonicalize_for_hash(
-                    new_block_dict,
-                    normalized_rest,
-                    volatile_fields=volatile_fields,
-                    metadata_serializer=serialize_block_fn,
-                    body_canonicalizer=canonicalizer,
-                )
-                new_computed_hash = compute_canonical_hash(new_full_content_for_hash)
-                updates["hash"] = new_computed_hash
-            else:
-                # Existing block: check idempotency
-                new_block = self.update_metadata_block(
-                    prev_meta, updates, path, model_cls, context_defaults
-                )
-                new_block_dict = new_block.model_dump()
-                new_full_content_for_hash = canonicalize_for_hash(
-                    new_block_dict,
+
+            def hash_block(
+                block_dict: dict[str, Any], stored_hash: Optional[str]
+            ) -> str:
+                return compute_canonical_hash_for(
+                    block_dict,
                     normalized_rest,
                     volatile_fields=volatile_fields,
                     metadata_serializer=serialize_block_fn,
                     body_canonicalizer=canonicalizer,
+                    stored_hash=stored_hash,
                 )
-                new_computed_hash = compute_canonical_hash(new_full_content_for_hash)
-
-                # Check if the existing hash is a placeholder (all zeros)
-                is_placeholder_hash = prev_meta.hash == "0" * 64
-
-                if prev_computed_hash == new_computed_hash and not is_placeholder_hash:
-                    # Idempotent: preserve last_modified_at and hash
-                    updates["last_modified_at"] = prev_meta.last_modified_at
-                    updates["hash"] = prev_meta.hash
-                else:
-                    # Content changed OR placeholder hash: update last_modified_at and hash
-                    updates["last_modified_at"] = now
-                    updates["hash"] = new_computed_hash
-            # Final block construction
-            final_block = self.update_metadata_block(
-                prev_meta, updates, path, model_cls, context_defaults
+
+            final_block = self._resolve_stamped_block(
+                path=path,
+                prev_meta=prev_meta,
+                hash_block=hash_block,
+                author=author,
+                entrypoint_type=entrypoint_type,
+                namespace_prefix=namespace_prefix,
+                meta_type=meta_type,
+                description=description,
+                model_cls=model_cls,
+                context_defaults=context_defaults,
             )
             block_str = serialize_block_fn(final_block)
-            if normalized_rest:
-                rest_stripped = normalized_rest.lstrip("\n")
-                new_content = (
-                    f"{block_str}\n\n{rest_stripped}"
-                    if rest_stripped
-                    else f"{block_str}\n"
+            new_content = self._layout_stamped_content(block_str, normalized_rest)
+            if prev_meta is None:
+                # Hash a new block with the body as it reads back from the
+                # written file, so verify finds a fresh stamp clean
+                _, written_rest = extract_block_fn(path, new_content)
+                written_body = self._normalize_rest_for_hash(
+                    written_rest, normalize_rest_fn, canonicalizer
                 )
-            else:
-                new_content = block_str + "\n"
-            new_content = new_content.rstrip() + "\n"
+                if written_body != normalized_rest:
+                    final_block = final_block.model_copy(
+                        update={
+                            "hash": compute_canonical_hash_for(
+                                final_block.model_dump(),
+                                written_body,
+                                volatile_fields=volatile_fields,
+                                metadata_serializer=serialize_block_fn,
+                                body_canonicalizer=canonicalizer,
+                            )
+                        }
+                    )
+                    block_str = serialize_block_fn(final_block)
+                    new_content = self._layout_stamped_content(
+                        block_str, normalized_rest
+                    )
             logger.debug(f"[END] stamp_with_idempotency for {path}")
             return new_content, self.handle_result(
                 status="success",
@@ -338,6 +518,89 @@ class MetadataBlockMixin:
             )
             raise
 
+    def stamp_stream_with_idempotency(
+        self,
+        *,
+        path: Path,
+        open_delim: str,
+        close_delim: str,
+        body_policy: StreamBodyPolicy,
+        author: str,
+        entrypoint_type: str,
+        namespace_prefix: str,
+        meta_type: Optional[str] = None,
+        description: Optional[str] = None,
+        extract_block_fn: Any = None,
+        serialize_block_fn: Any = None,
+        model_cls: Any = None,
+        context_defaults: Optional[dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> OnexResultModel:
+        """
+        Streaming counterpart of stamp_with_idempotency for files too large to
+        hold as one string: stamps path in place and gives the same hash and
+        bytes as the in-memory path. Only the block at the top of the file is
+        decoded; the body is hashed in chunks and copied by the kernel.
+        body_policy must describe what the handler's normalize_rest (or the
+        model's body canonicalizer) does to the text after the block.
+        """
+        logger = logging.getLogger("omnibase.handlers.mixin_metadata_block")
+        logger.debug(f"[START] stamp_stream_with_idempotency for {path}")
+        block_text, body_offset = read_head(
+            path, open_delim, close_delim, body_policy.lead_chars, chunk_size
+        )
+        prev_meta = None
+        if block_text is not None:
+            try:
+                prev_meta, _ = extract_block_fn(path, block_text)
+            except Exception:
+                prev_meta = None
+        body = StreamedBody(path, body_offset, body_policy, open_delim, chunk_size)
+        volatile_fields = (
+            list(model_cls.get_volatile_fields())
+            if model_cls
+            else ["hash", "last_modified_at"]
+        )
+
+        def hash_block(block_dict: dict[str, Any], stored_hash: Optional[str]) -> str:
+            # The body is never held as one string here, so there is nothing
+            # to fingerprint for the digest memo; it is always hashed.
+            hasher = block_hasher(block_dict.get("hash_algorithm"))
+            meta_str = canonicalize_metadata_for_hash(
+                block_dict,
+                volatile_fields=volatile_fields,
+                metadata_serializer=serialize_block_fn,
+            )
+            hasher.update(meta_str.encode("utf-8") + b"\n")
+            body.hash_into(hasher)
+            return str(hasher.hexdigest())
+
+        final_block = self._resolve_stamped_block(
+            path=path,
+            prev_meta=prev_meta,
+            hash_block=hash_block,
+            author=author,
+            entrypoint_type=entrypoint_type,
+            namespace_prefix=namespace_prefix,
+            meta_type=meta_type,
+            description=description,
+            model_cls=model_cls,
+            context_defaults=context_defaults,
+        )
+        block_str = serialize_block_fn(final_block)
+        if body.is_unchanged(block_str):
+            note = "Unchanged (streamed)"
+        else:
+            body.write_stamped(block_str)
+            note = "Stamped (streamed)"
+        logger.debug(f"[END] stamp_stream_with_idempotency for {path}")
+        return self.handle_result(
+            status="success",
+            path=path,
+            messages=[],
+            metadata={"note": note, "hash": final_block.hash},
+        )
+
     @staticmethod
     def is_canonical_block(block: Any, model_cls: type) -> tuple[bool, list[str]]:
         """
@@ -436,6 +699,9 @@ class MetadataBlockMixin:
                 # Linux/other: st_ctime is not always creation time, but best available
                 ts = stat.st_ctime
             return datetime.datetime.fromtimestamp(ts).isoformat()
+        except FileNotFoundError:
+            # In-memory stamping of a buffer that has not been saved yet
+            return None
         except Exception as e:
             logging.error(f"Error getting file creation date for {path}: {e}")
             return None
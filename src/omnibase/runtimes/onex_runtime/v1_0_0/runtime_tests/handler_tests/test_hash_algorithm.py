@@ -0,0 +1,148 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_hash_algorithm.py
+# version: 1.0.0
+# uuid: 69d02e10-01dd-482b-a3d1-7395f8b368ec
+# author: OmniNode Team
+# created_at: 2026-10-17T00:22:17.396149
+# last_modified_at: 2026-10-17T01:05:03.463038
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: deb309d970f5148e57cd11d8e2d85bb6f2b8cf9c3adfceccecd9c6dd83b12590
+# entrypoint: python@test_hash_algorithm.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_hash_algorithm
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Stamping with a hash_algorithm set in .onexversion: the tag is recorded in the
+block, the hash is computed with it, and verification reads it back.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from omnibase.core.error_codes import OnexError
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_metadata_yaml import (
+    MetadataYAMLHandler,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_python import PythonHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.mixins import mixin_metadata_block
+from omnibase.utils.canonical_hasher import (
+    BLAKE2B_256,
+    SHA256,
+    UnsupportedHashAlgorithmError,
+    canonical_digest,
+    hash_algorithms,
+    new_hasher,
+)
+
+PY_BODY = "def f() -> int:\n    return 1\n"
+
+
+def _use_algorithm(monkeypatch: pytest.MonkeyPatch, algorithm: Optional[str]) -> None:
+    versions: dict[str, Any] = {
+        "metadata_version": "0.1.0",
+        "protocol_version": "0.1.0",
+        "schema_version": "0.1.0",
+    }
+    if algorithm is not None:
+        versions["hash_algorithm"] = algorithm
+    monkeypatch.setattr(mixin_metadata_block, "_version_cache", versions)
+
+
+def _stamp(handler: Any, path: Path, content: str) -> str:
+    result = handler.stamp(path, content)
+    assert result.metadata is not None
+    return str(result.metadata["content"])
+
+
+def test_engine_digests() -> None:
+    assert set(hash_algorithms()) == {SHA256, BLAKE2B_256}
+    assert (
+        canonical_digest("a: 1\n", "x\r\n")
+        == hashlib.sha256(b"a: 1\n\nx\n").hexdigest()
+    )
+    assert canonical_digest("a: 1\n", "x", BLAKE2B_256) == (
+        hashlib.blake2b(b"a: 1\n\nx\n", digest_size=32).hexdigest()
+    )
+    with pytest.raises(OnexError):
+        new_hasher("md5/1")
+
+
+@pytest.mark.parametrize(
+    "handler_cls,name,body",
+    [(PythonHandler, "mod.py", PY_BODY), (MetadataYAMLHandler, "data.yaml", "k: v\n")],
+)
+def test_opt_in_records_and_verifies_tag(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    handler_cls: Any,
+    name: str,
+    body: str,
+) -> None:
+    handler = handler_cls()
+    path = tmp_path / name
+    _use_algorithm(monkeypatch, None)
+    sha_stamped = _stamp(handler, path, body)
+    assert "hash_algorithm" not in sha_stamped
+
+    _use_algorithm(monkeypatch, BLAKE2B_256)
+    stamped = _stamp(handler, path, sha_stamped)
+    assert f"hash_algorithm: {BLAKE2B_256}\n" in stamped
+    stored, computed = handler.verify_hash(path, stamped)
+    assert stored == computed and stored not in sha_stamped
+    assert _stamp(handler, path, stamped) == stamped
+
+    # Without a repository setting the block keeps the algorithm it records
+    _use_algorithm(monkeypatch, None)
+    assert _stamp(handler, path, stamped) == stamped
+    assert handler.verify_hash(path, stamped) == (stored, stored)
+
+
+def test_stream_stamp_uses_tag(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _use_algorithm(monkeypatch, BLAKE2B_256)
+    handler = MetadataYAMLHandler()
+    path = tmp_path / "big.yaml"
+    path.write_text("items:\n" + "  - entry\n" * 100)
+    result = handler.stamp_stream(path)
+    assert result is not None and result.metadata is not None
+    content = path.read_text()
+    assert f"hash_algorithm: {BLAKE2B_256}" in content
+    assert handler.verify_hash(path, content) == (
+        result.metadata["hash"],
+        result.metadata["hash"],
+    )
+    assert _stamp(handler, path, content) == content
+
+
+def test_unknown_tag_is_rejected(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _use_algorithm(monkeypatch, "md5/1")
+    with pytest.raises(OnexError):
+        PythonHandler().stamp(tmp_path / "mod.py", PY_BODY)
+
+
+def test_unknown_block_tag_raises_unsupported(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _use_algorithm(monkeypatch, None)
+    handler = PythonHandler()
+    path = tmp_path / "foreign.py"
+    foreign = _stamp(handler, path, PY_BODY).replace(
+        "# hash:", "# hash_algorithm: sha3/9\n# hash:"
+    )
+    for call in (handler.verify_hash, handler.stamp):
+        with pytest.raises(UnsupportedHashAlgorithmError, match="sha3/9"):
+            call(path, foreign)
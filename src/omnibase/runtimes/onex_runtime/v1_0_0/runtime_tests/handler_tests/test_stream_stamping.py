@@ -0,0 +1,169 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_stream_stamping.py
+# version: 1.0.0
+# uuid: 0eb77981-8faa-485e-b246-0ad77ca79216
+# author: OmniNode Team
+# created_at: 2026-10-16T23:25:04.627951
+# last_modified_at: 2026-10-17T01:07:10.291058
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 1082f6379dac65ff780368d34c83acee3aa50f6a88aec2569f1ba3303327a0f3
+# entrypoint: python@test_stream_stamping.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_stream_stamping
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Streamed stamping (stamp_stream) must give the same hash and bytes as the
+in-memory stamp of the same file.
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from omnibase.core.error_codes import OnexError
+from omnibase.metadata.metadata_constants import MD_META_OPEN
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_markdown import (
+    MarkdownHandler,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_metadata_yaml import (
+    MetadataYAMLHandler,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.io import large_file_stream
+
+BODIES = [
+    "key: value\n",
+    "\n\n  \t\nkey: value\n\n \t\n",
+    "---\n\n\nkey: value\nother: é€\n",
+    "--- # doc\r\nkey: value\r\nlist:\r\n  - a\r\n\r\n",
+    "key: 'a b'\rnext: c\r",
+    "title: x\n\x0c\ny: 2 \n",
+    "　 text with　wide space\n",
+    "---",
+    "   \n\n",
+    "",
+]
+
+
+def _without_timestamp(text: str) -> str:
+    return re.sub(r"last_modified_at: .*", "last_modified_at: X", text)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Odd chunk size so CRLF pairs, multi-byte characters and delimiters all
+    # straddle chunk boundaries
+    monkeypatch.setattr(large_file_stream, "STREAM_CHUNK_SIZE", 3)
+
+
+@pytest.mark.parametrize(
+    "handler_cls,suffix", [(MetadataYAMLHandler, ".yaml"), (MarkdownHandler, ".md")]
+)
+@pytest.mark.parametrize("body", BODIES)
+def test_stream_matches_in_memory(
+    tmp_path: Path, handler_cls: Any, suffix: str, body: str
+) -> None:
+    handler = handler_cls()
+    path = tmp_path / f"data{suffix}"
+    path.write_text("seed: 1\n")
+    stamped = handler.stamp(path, "seed: 1\n").metadata["content"]
+    block_end = stamped.index("=== /OmniNode:Metadata ===")
+    block_end = stamped.index("\n", block_end) + 1
+    original = stamped[:block_end] + body
+    path.write_bytes(original.encode("utf-8"))
+
+    expected = handler.stamp(path, original).metadata
+    streamed = handler.stamp_stream(path)
+    assert streamed is not None and streamed.metadata is not None
+    assert streamed.metadata["hash"] == expected["hash"]
+    written = path.read_bytes().decode("utf-8")
+    assert _without_timestamp(written) == _without_timestamp(expected["content"])
+
+    # A second pass is idempotent and leaves the file untouched
+    again = handler.stamp_stream(path)
+    assert again is not None and again.metadata is not None
+    assert again.metadata["hash"] == streamed.metadata["hash"]
+    assert again.metadata["note"] == "Unchanged (streamed)"
+    assert path.read_bytes().decode("utf-8") == written
+    assert handler.stamp(path, written).metadata["content"] == written
+
+
+@pytest.mark.parametrize(
+    "handler_cls,suffix", [(MetadataYAMLHandler, ".yaml"), (MarkdownHandler, ".md")]
+)
+@pytest.mark.parametrize("body", BODIES)
+def test_stream_verify_matches_in_memory(
+    tmp_path: Path, handler_cls: Any, suffix: str, body: str
+) -> None:
+    handler = handler_cls()
+    path = tmp_path / f"data{suffix}"
+    stamped = handler.stamp(path, "seed: 1\n").metadata["content"]
+    block_end = stamped.index("=== /OmniNode:Metadata ===")
+    block_end = stamped.index("\n", block_end) + 1
+    original = stamped[:block_end] + body
+    path.write_bytes(original.encode("utf-8"))
+
+    assert handler.verify_hash_stream(path) == handler.verify_hash(path, original)
+    assert path.read_bytes().decode("utf-8") == original
+
+
+@pytest.mark.parametrize(
+    "handler_cls,suffix", [(MetadataYAMLHandler, ".yaml"), (MarkdownHandler, ".md")]
+)
+def test_stream_new_block_verifies(
+    tmp_path: Path, handler_cls: Any, suffix: str
+) -> None:
+    handler = handler_cls()
+    path = tmp_path / f"fresh{suffix}"
+    path.write_bytes(b"\r\n---\r\nitems:\r\n" + b"  - entry\r\n" * 500)
+    result = handler.stamp_stream(path)
+    assert result is not None and result.metadata is not None
+    content = path.read_bytes().decode("utf-8")
+    assert handler.verify_hash(path, content) == (
+        result.metadata["hash"],
+        result.metadata["hash"],
+    )
+
+
+def test_stream_rejects_block_below_top(tmp_path: Path) -> None:
+    path = tmp_path / "notes.md"
+    path.write_text(f"# Title\n\n{MD_META_OPEN}\nname: x\n-->\n")
+    with pytest.raises(OnexError):
+        MarkdownHandler().stamp_stream(path)
+    assert path.read_text().startswith("# Title")
+
+
+@pytest.mark.parametrize("copy", ["kernel", "read", "normalized"])
+def test_truncated_body_keeps_original(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, copy: str
+) -> None:
+    if copy == "read":
+        for name in ("copy_file_range", "sendfile"):
+            monkeypatch.delattr(os, name, raising=False)
+    newline = "\r\n" if copy == "normalized" else "\n"
+    path = tmp_path / "big.yaml"
+    path.write_bytes(f"items:{newline}".encode() + f"  - e{newline}".encode() * 50)
+    policy = large_file_stream.StreamBodyPolicy(
+        lead_chars="\n", hash_trailing_chars=None, normalize_newlines=True
+    )
+    body = large_file_stream.StreamedBody(path, 0, policy, "# ===")
+    body.hash_into(hashlib.sha256())
+    # Truncated by another writer between the scan and the copy
+    path.write_bytes(b"items:\n")
+    with pytest.raises(OnexError):
+        body.write_stamped("# block")
+    assert path.read_bytes() == b"items:\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["big.yaml"]
@@ -0,0 +1,80 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_block_scanner.py
+# version: 1.0.0
+# uuid: fdef639e-8faa-40c0-9d30-b4b4dde19093
+# author: OmniNode Team
+# created_at: 2026-10-16T23:52:43.896745
+# last_modified_at: 2026-10-17T01:05:03.466611
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: a2246123bd20de303d9a3f89b68249728bf6806d92d1a0aedf71d48abf2c866b
+# entrypoint: python@test_block_scanner.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_block_scanner
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the shared metadata block scanner used by the file handlers.
+"""
+
+from pathlib import Path
+
+from omnibase.metadata.metadata_constants import (
+    MD_META_CLOSE,
+    MD_META_OPEN,
+    PY_META_CLOSE,
+    PY_META_OPEN,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_markdown import (
+    MarkdownHandler,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_block_scanner import (
+    MetadataBlockScanner,
+    block_scanner,
+)
+
+
+def test_find_returns_offsets_into_content() -> None:
+    content = (
+        f"#!/usr/bin/env python\n{PY_META_OPEN}\n# name: a\n{PY_META_CLOSE}\nx = 1\n"
+    )
+    scanner = block_scanner(PY_META_OPEN, PY_META_CLOSE)
+    assert block_scanner(PY_META_OPEN, PY_META_CLOSE) is scanner
+    span = scanner.find(content)
+    assert span is not None
+    assert content[span.start : span.end].startswith(PY_META_OPEN)
+    assert content[span.start : span.end].endswith(PY_META_CLOSE)
+    assert scanner.body(content, span) == "\n# name: a\n"
+    assert scanner.remove(content, span) == "#!/usr/bin/env python\nx = 1\n"
+    assert scanner.find(content, span.end) is None
+    # An open delimiter without a close is not a block
+    assert scanner.find(f"{PY_META_OPEN}\n# name: a\n") is None
+
+
+def test_open_delimiter_is_only_looked_for_in_the_header_region() -> None:
+    scanner = MetadataBlockScanner(PY_META_OPEN, PY_META_CLOSE, header_limit=10)
+    block = f"{PY_META_OPEN}\n{PY_META_CLOSE}"
+    assert scanner.find("x" * 9 + block) is not None
+    assert scanner.find("x" * 10 + block) is None
+    assert scanner.find_open("x" * 10 + block) == -1
+
+
+def test_markdown_removes_every_block_and_stray_open_delimiters() -> None:
+    block = f"{MD_META_OPEN}\nname: a\n{MD_META_CLOSE}"
+    content = (
+        f"{block}\n\n# Title\n{block}\nText\n{MD_META_OPEN}\nbroken\n<!-- keep -->\n"
+    )
+    _, rest = MarkdownHandler().extract_block(Path("a.md"), content)
+    assert rest == "# Title\nText\n<!-- keep -->\n"
+    assert list(block_scanner(MD_META_OPEN, MD_META_CLOSE).iter_blocks(content)) == [
+        block_scanner(MD_META_OPEN, MD_META_CLOSE).find(content),
+        block_scanner(MD_META_OPEN, MD_META_CLOSE).find(content, len(block)),
+    ]
@@ -0,0 +1,109 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_metadata_block_parser.py
+# version: 1.0.0
+# uuid: d20906be-1bb3-40bc-ad7a-032c194b6ff0
+# author: OmniNode Team
+# created_at: 2026-10-16T23:59:28.666681
+# last_modified_at: 2026-10-17T01:05:03.468398
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 939fd4a5541625e50685ec395ccd6c3f264b9c4b71aca5c5dd5569455b01128b
+# entrypoint: python@test_metadata_block_parser.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_metadata_block_parser
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the flat metadata block fast path (load_metadata_block).
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from omnibase.metadata.metadata_constants import PY_META_CLOSE, PY_META_OPEN
+from omnibase.mixin.mixin_canonical_serialization import CanonicalYAMLSerializer
+from omnibase.model.model_node_metadata import NodeMetadataBlock
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_python import PythonHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_parser import (
+    load_metadata_block,
+    parse_flat_block,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_serializer import (
+    serialize_metadata_block,
+)
+
+FLAT_BLOCK = """\
+metadata_version: 0.1.0
+name: example.py
+version: 1.0.0
+uuid: 00a19c44-37ed-48a8-91bc-661c3485d646
+created_at: 2025-05-21T11:20:50.272634
+description: Stamped by PythonHandler
+state_contract: state_contract://default
+hash: 0000000000000000000000000000000000000000000000000000000000000000
+entrypoint: python@example.py
+runtime_language_hint: python>=3.11
+trust_score: 0.5
+quoted: 'it''s'
+enabled: yes
+missing: ~
+"""
+
+
+def _stamped_block() -> NodeMetadataBlock:
+    source = Path(__file__).parents[1] / "metadata_block_parser.py"
+    meta, _ = PythonHandler().extract_block(source, source.read_text())
+    assert isinstance(meta, NodeMetadataBlock)
+    return meta
+
+
+def test_flat_block_matches_safe_load() -> None:
+    data = parse_flat_block(FLAT_BLOCK)
+    assert data == yaml.safe_load(FLAT_BLOCK)
+    assert data is not None
+    assert [type(data[k]).__name__ for k in ("created_at", "hash", "trust_score")] == [
+        "datetime",
+        "int",
+        "float",
+    ]
+    assert data["quoted"] == "it's"
+    assert data["enabled"] is True and data["missing"] is None
+
+
+def test_round_trips_serializer_output() -> None:
+    meta = _stamped_block()
+    canonical = CanonicalYAMLSerializer().canonicalize_metadata_block(meta)
+    stamped = serialize_metadata_block(meta, PY_META_OPEN, PY_META_CLOSE, "")
+    flat = stamped.split("\n", 1)[1].rsplit(PY_META_CLOSE, 1)[0]
+    for text in (canonical, flat):
+        data = parse_flat_block(text)
+        assert data is not None
+        assert data == yaml.safe_load(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "name: a\ntools:\n  tool_a:\n    type: function\n",
+        "name: a\ndependencies:\n- name: b\n",
+        "entrypoint: {'type': 'cli', 'target': '.onexignore'}\n",
+        'metadata_version: "0.1.0"\n',
+        "on: 1\n",
+        "description: a # comment\n",
+        "description: folded\n  continuation\n",
+        "# only: comments\n",
+    ],
+)
+def test_other_forms_fall_back_to_yaml(text: str) -> None:
+    assert parse_flat_block(text) is None
+    assert load_metadata_block(text) == yaml.safe_load(text)
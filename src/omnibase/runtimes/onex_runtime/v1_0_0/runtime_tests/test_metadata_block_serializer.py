@@ -0,0 +1,129 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_metadata_block_serializer.py
+# version: 1.0.0
+# uuid: 72758038-33ee-4143-bcac-157897031fb1
+# author: OmniNode Team
+# created_at: 2026-10-17T00:35:08.001837
+# last_modified_at: 2026-10-17T01:05:03.470053
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 1e1ff643329936e4e24537609292ea8033fc653b6e161a212218ec3ba4db988a
+# entrypoint: python@test_metadata_block_serializer.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_metadata_block_serializer
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the scalar fast path of metadata block serialization: every handler
+must write the same bytes as its general (model dump, YAML emitter) path.
+"""
+
+import random
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from omnibase.handlers.handler_ignore import IgnoreFileHandler
+from omnibase.model.model_node_metadata import NodeMetadataBlock
+from omnibase.runtimes.onex_runtime.v1_0_0 import metadata_block_serializer
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_markdown import (
+    MarkdownHandler,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_metadata_yaml import (
+    MetadataYAMLHandler,
+)
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_python import PythonHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.metadata_block_serializer import (
+    emit_yaml_mapping,
+    scalar_block_items,
+)
+
+REPO_SRC = Path(__file__).resolve().parents[5]
+HANDLERS: List[Any] = [
+    PythonHandler(),
+    MetadataYAMLHandler(),
+    MarkdownHandler(),
+    IgnoreFileHandler(),
+]
+# Pieces that stress YAML quoting, type resolution and folding
+PIECES = list("ab Z09:#-'\".,_/@!&*?|>%=~[]{}\\\t\n") + [
+    "é",
+    "yes",
+    "null",
+    "1.0",
+    "2020-01-01",
+    "0x1F",
+    ": ",
+    " #",
+    "1_000",
+    "---",
+    "word " * 12,
+]
+# Fields that accept any text, including the empty string
+TEXT_FIELDS = ["license", "runtime_language_hint", "container_image_reference"]
+# Fields that accept any non-empty text
+NONEMPTY_FIELDS = ["description", "owner", "author", "created_at"]
+
+
+def _stamped_blocks() -> List[NodeMetadataBlock]:
+    blocks = []
+    for path in sorted((REPO_SRC / "omnibase" / "utils").glob("*.py")):
+        meta, _ = PythonHandler().extract_block(path, path.read_text())
+        if isinstance(meta, NodeMetadataBlock):
+            blocks.append(meta)
+    return blocks
+
+
+def _random_blocks(count: int) -> List[NodeMetadataBlock]:
+    rnd = random.Random(0)
+    base = NodeMetadataBlock.create_with_defaults(
+        name="x.py", author="A", namespace="onex.stamped.x", entrypoint_target="x.py"
+    ).model_dump()
+    blocks = []
+    for _ in range(count):
+        data = dict(base)
+        for field in rnd.sample(TEXT_FIELDS + NONEMPTY_FIELDS, 4):
+            size = rnd.choice([0, 1, 3, 8, 30])
+            if field in NONEMPTY_FIELDS:
+                size = max(size, 1)
+            data[field] = "".join(rnd.choice(PIECES) for _ in range(size))
+        blocks.append(NodeMetadataBlock(**data))
+    return blocks
+
+
+@pytest.mark.parametrize("handler", HANDLERS, ids=lambda h: type(h).__name__)
+def test_fast_path_matches_general_path(
+    handler: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    base = _random_blocks(1)[0].model_dump()
+    nested = [
+        NodeMetadataBlock(**{**base, "tags": ["a", "b"], "trust_score": 0.5}),
+        NodeMetadataBlock(**{**base, "tools": {}}),
+    ]
+    blocks = _stamped_blocks() + _random_blocks(400) + nested
+    fast = [handler.serialize_block(block) for block in blocks]
+    monkeypatch.setattr(
+        metadata_block_serializer, "scalar_block_items", lambda *a, **k: None
+    )
+    assert [handler.serialize_block(block) for block in blocks] == fast
+
+
+def test_stamped_blocks_take_the_fast_path() -> None:
+    for block in _stamped_blocks():
+        items = scalar_block_items(block)
+        assert items is not None
+        assert dict(items)["entrypoint"] == (
+            f"{block.entrypoint.type.value}@{block.entrypoint.target}"
+        )
+        assert emit_yaml_mapping(items) is not None
+    tagged = NodeMetadataBlock(**{**_stamped_blocks()[0].model_dump(), "tags": ["a"]})
+    assert scalar_block_items(tagged) is None
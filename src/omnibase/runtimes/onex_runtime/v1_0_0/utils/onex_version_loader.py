@@ -9,11 +9,11 @@
 # uuid: 482f2a10-9232-4585-81b9-79bf439ac355
 # author: OmniNode Team
 # created_at: 2025-05-22T05:34:29.793229
-# last_modified_at: 2025-05-22T20:50:39.711500
+# last_modified_at: 2026-10-17T01:05:03.471733
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 26c707fec6d82d4570e0038e285b454ac442ab3e24b39d4585e2ff367253972b
+# hash: bc8713fa0ebe066958693932e7e25652643a710d5f4bdcc1a5740f31f6bcf0fb
 # entrypoint: python@onex_version_loader.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.onex_version_loader
@@ -30,11 +30,10 @@ Implements ProtocolOnexVersionLoader and returns a strongly-typed OnexVersionInf
 import os
 from pathlib import Path
 
-import yaml
-
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.model.model_onex_version import OnexVersionInfo
 from omnibase.protocol.protocol_onex_version_loader import ProtocolOnexVersionLoader
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 _version_cache = None
 
@@ -62,7 +61,7 @@ class OnexVersionLoader(ProtocolOnexVersionLoader):
             candidate = d / ".onexversion"
             if candidate.exists():
                 with open(candidate, "r") as f:
-                    data = yaml.safe_load(f)
+                    data = yaml_safe_load(f)
                 for key in ("metadata_version", "protocol_version", "schema_version"):
                     if key not in data:
                         raise OnexError(
@@ -9,11 +9,11 @@
 # uuid: 91f96b85-cc03-42d5-91b8-1ac68ef977fa
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.905336
-# last_modified_at: 2025-05-22T20:50:39.723060
+# last_modified_at: 2026-10-17T00:07:53.433001
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 3429e4aa7270d64ab3c7df34186ed2abbcf32e196e548605f751551dd5b48a45
+# hash: d8507958ca368394f7d8a5619b411a5412f7d6f2760cb16b1331488a3df11861
 # entrypoint: python@loader.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.loader
@@ -24,12 +24,11 @@
 import json
 from pathlib import Path
 
-import yaml
-
 from omnibase.exceptions import OmniBaseError
 from omnibase.model.model_node_metadata import NodeMetadataBlock
 from omnibase.model.model_schema import SchemaModel
 from omnibase.protocol.protocol_schema_loader import ProtocolSchemaLoader
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 
 class SchemaLoader(ProtocolSchemaLoader):
@@ -46,7 +45,7 @@ class SchemaLoader(ProtocolSchemaLoader):
         """
         try:
             with path.open("r") as f:
-                data = yaml.safe_load(f)
+                data = yaml_safe_load(f)
             return NodeMetadataBlock(**data)
         except Exception as e:
             raise OmniBaseError(f"Failed to load ONEX YAML: {path}: {e}")
@@ -75,7 +74,7 @@ class SchemaLoader(ProtocolSchemaLoader):
                     # Try to open and parse to check for malformed files
                     if file.suffix == ".yaml":
                         with file.open("r") as f:
-                            yaml.safe_load(f)
+                            yaml_safe_load(f)
                     else:
                         with file.open("r") as f:
                             json.load(f)
@@ -9,11 +9,11 @@
 # uuid: 5522b60e-7a02-4dc9-964c-fbe8761fdf48
 # author: OmniNode Team
 # created_at: 2025-05-21T12:41:40.168966
-# last_modified_at: 2025-05-21T16:42:46.047508
+# last_modified_at: 2026-10-17T01:05:03.473533
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 687aa2397ad6dc129c2503f1a1b659a94422bb616389d04c1fb7e61795482413
+# hash: 8a8e3756a108a5b9d621864a7b7d7540def1c594cc7be320c5bd9d2485220f0a
 # entrypoint: python@docstring_generator.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.docstring_generator
@@ -26,10 +26,10 @@ import json
 from pathlib import Path
 from typing import Any, cast
 
-import yaml
 from jinja2 import Environment, FileSystemLoader
 
 from omnibase.core.error_codes import CoreErrorCode, OnexError
+from omnibase.utils.yaml_backend import yaml_dump, yaml_safe_load
 
 SCHEMA_DIR = Path("src/omnibase/schemas")
 TEMPLATE_PATH = Path("docs/templates/schema_doc.md.j2")
@@ -52,7 +52,7 @@ def load_schema(path: Path) -> dict[str, Any]:
     if path.suffix == ".yaml":
         with path.open("r") as f:
             # Cast to dict[str, Any] for mypy compliance
-            return cast(dict[str, Any], yaml.safe_load(f))
+            return cast(dict[str, Any], yaml_safe_load(f))
     elif path.suffix == ".json":
         with path.open("r") as f:
             # Cast to dict[str, Any] for mypy compliance
@@ -86,7 +86,7 @@ def extract_examples(schema: dict[str, Any]) -> list[str]:
     """Extract example strings from a schema dictionary."""
     examples = schema.get("examples", [])
     if isinstance(examples, list):
-        return [yaml.dump(ex, sort_keys=False) for ex in examples]
+        return [yaml_dump(ex, sort_keys=False) for ex in examples]
     return []
 
 
@@ -9,11 +9,11 @@
 # uuid: 4b2aa2a2-0cc2-402b-8ed0-d66c61277b3b
 # author: OmniNode Team
 # created_at: 2025-05-21T13:18:56.573196
-# last_modified_at: 2025-05-22T20:50:39.729182
+# last_modified_at: 2026-10-17T01:05:03.475151
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 83193040711ca5d5de14deab26fde731bcb2af2639308cde1befd296a2d02316
+# hash: 3883161ab9a11ff2f6ad23ca2054d4ad27a47eae086b03e5f0fa82a52add7753
 # entrypoint: python@fixture_stamper_engine.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.fixture_stamper_engine
@@ -25,12 +25,11 @@ import json
 from pathlib import Path
 from typing import Any, List, Optional
 
-import yaml
-
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.enums import TemplateTypeEnum
 from omnibase.model.model_onex_message_result import OnexResultModel
 from omnibase.protocol.protocol_stamper_engine import ProtocolStamperEngine
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 
 class FixtureStamperEngine(ProtocolStamperEngine):
@@ -45,7 +44,7 @@ class FixtureStamperEngine(ProtocolStamperEngine):
                 self.fixtures = json.load(f)
         elif self.fixture_format == "yaml":
             with open(self.fixture_path, "r") as f:
-                self.fixtures = yaml.safe_load(f)
+                self.fixtures = yaml_safe_load(f)
         else:
             raise OnexError(
                 f"Unsupported fixture format: {self.fixture_format}",
@@ -85,6 +84,9 @@ class FixtureStamperEngine(ProtocolStamperEngine):
         overwrite: bool = False,
         repair: bool = False,
         force_overwrite: bool = False,
+        jobs: int = 1,
+        files: Optional[List[Path]] = None,
+        io_threads: int = 0,
     ) -> OnexResultModel:
         # Use the directory name as the key to look up the fixture result
         key = str(directory)
@@ -9,11 +9,11 @@
 # uuid: e6d4804e-9c76-4cef-a466-fb65dde48cd4
 # author: OmniNode Team
 # created_at: 2025-05-24T12:13:14.580067
-# last_modified_at: 2025-05-24T16:13:22.364802
+# last_modified_at: 2026-10-17T01:05:03.476774
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 56c3d54f5558d6bf46129f3b7ae7b890131cdfb0e4621b7171f76a7fc200a12c
+# hash: 013f7454a70da90f41c8269b2865199f36d032a1369c29a29c6b1026512af539
 # entrypoint: python@onextree_validator.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.onextree_validator
@@ -29,11 +29,10 @@ import argparse
 import sys
 from pathlib import Path
 
-import yaml
-
 from omnibase.nodes.tree_generator_node.v1_0_0.helpers.tree_validator import (
     OnextreeValidator,
 )
+from omnibase.utils.yaml_backend import yaml_safe_dump
 
 
 def main() -> None:
@@ -83,7 +82,7 @@ Examples:
     if args.output_format == "json":
         print(result.model_dump_json(indent=2))
     elif args.output_format == "yaml":
-        print(yaml.safe_dump(result.model_dump(), sort_keys=False))
+        print(yaml_safe_dump(result.model_dump(), sort_keys=False))
     else:
         validator.print_results(result)
     sys.exit(validator.get_exit_code(result))
@@ -0,0 +1,292 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: canonical_hasher.py
+# version: 1.0.0
+# uuid: e6e2fd67-8c9a-4b2d-bebd-c6c7c24154a9
+# author: OmniNode Team
+# created_at: 2026-10-17T00:17:05.853902
+# last_modified_at: 2026-10-17T01:05:03.479098
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: c8f4421265c6272f0353a74d3a480b64f32950e46b6607b7ebb8692fffb3bf27
+# entrypoint: python@canonical_hasher.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.canonical_hasher
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+The ONEX hash engine: every canonical hash of a metadata block and body is
+computed here.
+
+The text behind a canonical hash is a short metadata block followed by a
+normalized file body, which may be megabytes long. Building that text as one
+string copies the body several times: two newline replacements, the trailing
+whitespace strip, the concatenation with the block, and the UTF-8 encoding.
+The functions here feed the same bytes to a hashlib object in bounded chunks
+and normalize line endings as they go, so the digest is unchanged and only
+one chunk of the body is copied at a time.
+
+The digest algorithm is named by a versioned tag. A block records its tag in
+its hash_algorithm field; a block without one was hashed with SHA-256, which
+stays the default. Every algorithm produces a 32-byte digest, so the hash
+field is always 64 hex characters. The version after the slash changes if an
+algorithm's parameters ever do, so existing tags keep verifying.
+"""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from omnibase.core.error_codes import CoreErrorCode, OnexError
+
+HASH_CHUNK_CHARS = 256 * 1024
+
+SHA256 = "sha256/1"
+BLAKE2B_256 = "blake2b-256/1"
+DEFAULT_HASH_ALGORITHM = SHA256
+
+_HASH_ALGORITHMS: Dict[str, Callable[[], Any]] = {
+    SHA256: hashlib.sha256,
+    BLAKE2B_256: functools.partial(hashlib.blake2b, digest_size=32),
+}
+
+# Whitespace normalize_body strips from the end of a body
+_BODY_TRAILING = " \t\r\n"
+# Window used to find where the body's content starts and ends
+_SCAN_CHARS = 4096
+# Digests a DigestMemo remembers before evicting the least recently used
+DIGEST_MEMO_ENTRIES = 4096
+
+
+def hash_algorithms() -> Tuple[str, ...]:
+    """The supported algorithm tags."""
+    return tuple(_HASH_ALGORITHMS)
+
+
+def new_hasher(algorithm: Optional[str] = None) -> Any:
+    """A fresh hashlib object for an algorithm tag; None means the default."""
+    try:
+        return _HASH_ALGORITHMS[algorithm or DEFAULT_HASH_ALGORITHM]()
+    except KeyError:
+        raise OnexError(
+            f"Unknown hash algorithm: {algorithm} "
+            f"(supported: {', '.join(_HASH_ALGORITHMS)})",
+            CoreErrorCode.INVALID_PARAMETER,
+        ) from None
+
+
+class UnsupportedHashAlgorithmError(OnexError):
+    """A metadata block records a hash_algorithm tag this engine does not know."""
+
+    def __init__(self, algorithm: str):
+        super().__init__(
+            f"unsupported hash_algorithm {algorithm}",
+            CoreErrorCode.UNSUPPORTED_OPERATION,
+        )
+        self.algorithm = algorithm
+
+
+def block_hasher(algorithm: Optional[str]) -> Any:
+    """
+    A fresh hashlib object for the tag recorded in one file's block. Unlike
+    new_hasher, an unknown tag raises UnsupportedHashAlgorithmError, so callers
+    can report it as that file's error and go on with the others.
+    """
+    if algorithm is not None and algorithm not in _HASH_ALGORITHMS:
+        raise UnsupportedHashAlgorithmError(algorithm)
+    return new_hasher(algorithm)
+
+
+def normalize_body(body: str) -> str:
+    """
+    Canonical normalization for file body content: CRLF and CR become LF,
+    trailing whitespace is removed and exactly one newline ends the body.
+    """
+    if "\r" in body:
+        body = body.replace("\r\n", "\n").replace("\r", "\n")
+    end = _content_bounds(body, "")[1]
+    if end == len(body) - 1 and body[end] == "\n":
+        # Already canonical, as every stamped body is: no copy
+        return body
+    return body[:end] + "\n"
+
+
+def update_text(hasher: Any, text: str, chunk_chars: Optional[int] = None) -> None:
+    """hasher.update(text.encode("utf-8")), encoding one chunk at a time."""
+    chunk_chars = chunk_chars or HASH_CHUNK_CHARS
+    for start in range(0, len(text), chunk_chars):
+        hasher.update(text[start : start + chunk_chars].encode("utf-8"))
+
+
+def _content_bounds(body: str, lead_chars: str) -> Tuple[int, int]:
+    """
+    (start, end) of body without trailing whitespace and, when lead_chars is
+    given, without leading lead_chars. Scans inward from both ends.
+    """
+    end = len(body)
+    while end:
+        start = max(0, end - _SCAN_CHARS)
+        kept = body[start:end].rstrip(_BODY_TRAILING)
+        if kept:
+            end = start + len(kept)
+            break
+        end = start
+    begin = 0
+    while lead_chars and begin < end:
+        piece = body[begin : min(begin + _SCAN_CHARS, end)]
+        skipped = len(piece) - len(piece.lstrip(lead_chars))
+        begin += skipped
+        if skipped < len(piece):
+            break
+    return begin, end
+
+
+def update_normalized_body(
+    hasher: Any,
+    body: str,
+    strip_leading_newlines: bool = False,
+    chunk_chars: Optional[int] = None,
+) -> None:
+    """
+    Feed normalize_body(body) to hasher, or normalize_body(body).lstrip("\\n")
+    if strip_leading_newlines, without building the normalized string.
+    """
+    chunk_chars = chunk_chars or HASH_CHUNK_CHARS
+    # Any run of CR and LF normalizes to LFs only, so stripping leading LFs
+    # after normalization is stripping leading CRs and LFs before it.
+    begin, end = _content_bounds(body, "\r\n" if strip_leading_newlines else "")
+    if begin == end and strip_leading_newlines:
+        return
+    carry = ""
+    pos = begin
+    while pos < end:
+        stop = min(pos + chunk_chars, end)
+        text = carry + body[pos:stop]
+        pos = stop
+        # Hold back a trailing CR in case the next chunk starts with LF
+        carry = "\r" if text.endswith("\r") and pos < end else ""
+        if carry:
+            text = text[:-1]
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        hasher.update(text.encode("utf-8"))
+    hasher.update(b"\n")
+
+
+def update_body(
+    hasher: Any, body: str, canonicalizer: Optional[Callable[[str], str]]
+) -> None:
+    """
+    Feed canonicalizer(body) to hasher (body itself if canonicalizer is None).
+    normalize_body is applied chunk by chunk; other canonicalizers are called
+    on the whole body.
+    """
+    if canonicalizer is normalize_body:
+        update_normalized_body(hasher, body)
+    else:
+        update_text(hasher, canonicalizer(body) if canonicalizer else body)
+
+
+def hash_text(text: str, algorithm: Optional[str] = None) -> str:
+    """Hex digest of text, encoded as UTF-8."""
+    hasher = new_hasher(algorithm)
+    update_text(hasher, text)
+    return str(hasher.hexdigest())
+
+
+def canonical_digest(meta_text: str, body: str, algorithm: Optional[str] = None) -> str:
+    """
+    Hex digest of the canonical block-and-body text:
+    meta_text.rstrip("\\n") + "\\n\\n" + normalize_body(body).lstrip("\\n").
+    """
+    hasher = new_hasher(algorithm)
+    hasher.update((meta_text.rstrip("\n") + "\n\n").encode("utf-8"))
+    update_normalized_body(hasher, body, strip_leading_newlines=True)
+    return str(hasher.hexdigest())
+
+
+class DigestMemo:
+    """
+    Bounded, thread-safe record of canonical digests computed in this process.
+
+    Each entry maps (algorithm tag, digest) to the metadata text, the body
+    canonicalizer and a fingerprint of the body that produced it: the body's
+    length and its str hash. Bodies themselves are not kept.
+
+    The fingerprint is only 64 bits, so the memo is an optimization for
+    restamping, never evidence for verification: a warm engine (watch mode,
+    the stamping server) keeps the stored hash of an unchanged file without
+    hashing its body again, while verify always computes the digest.
+    """
+
+    def __init__(self, max_entries: int = DIGEST_MEMO_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, Any, int, int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(algorithm: Optional[str], digest: str) -> Tuple[str, str]:
+        return (algorithm or DEFAULT_HASH_ALGORITHM, digest)
+
+    def confirms(
+        self,
+        algorithm: Optional[str],
+        digest: str,
+        meta_text: str,
+        body: str,
+        canonicalizer: Any,
+    ) -> bool:
+        """True if digest was recorded for exactly these canonical inputs."""
+        key = self._key(algorithm, digest)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            self._entries.move_to_end(key)
+        recorded_meta, recorded_canonicalizer, length, fingerprint = entry
+        return (
+            recorded_canonicalizer is canonicalizer
+            and length == len(body)
+            and recorded_meta == meta_text
+            and fingerprint == hash(body)
+        )
+
+    def record(
+        self,
+        algorithm: Optional[str],
+        digest: str,
+        meta_text: str,
+        body: str,
+        canonicalizer: Any,
+    ) -> None:
+        """Remember that these canonical inputs hash to digest."""
+        key = self._key(algorithm, digest)
+        entry = (meta_text, canonicalizer, len(body), hash(body))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_DIGEST_MEMO = DigestMemo()
+
+
+def digest_memo() -> DigestMemo:
+    """The process-wide memo of canonical digests used when stamping."""
+    return _DIGEST_MEMO
@@ -9,11 +9,11 @@
 # uuid: f3866d26-c71c-4ca5-8dd5-75cc0fd4e056
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.905802
-# last_modified_at: 2025-05-22T20:50:39.714324
+# last_modified_at: 2026-10-17T01:15:14.250052
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 7419f80faf31942f8bd55cb816a4a558398e8d669263602772a75608168398ba
+# hash: c42f51af634161525233b3d9ac5a7274497209100fade26323b739fad15f970f
 # entrypoint: python@directory_traverser.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.directory_traverser
@@ -28,9 +28,27 @@ Directory traversal utility for finding and processing files in directories.
 import fnmatch
 import importlib
 import logging
+import re
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 from types import ModuleType
-from typing import Callable, List, Optional, Set, TypeVar
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    TypeVar,
+    runtime_checkable,
+)
 
 # Try to import pathspec for better glob pattern matching
 try:
@@ -38,7 +56,7 @@ try:
 except ImportError:
     pathspec = None
 
-from omnibase.core.error_codes import OnexError
+from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.enums import IgnorePatternSourceEnum, LogLevelEnum, TraversalModeEnum
 from omnibase.model.model_file_filter import (
     DirectoryProcessingResultModel,
@@ -52,9 +70,176 @@ from omnibase.model.model_onex_message_result import (
 from omnibase.model.model_tree_sync_result import TreeSyncResultModel
 from omnibase.protocol.protocol_directory_traverser import ProtocolDirectoryTraverser
 from omnibase.protocol.protocol_file_discovery_source import ProtocolFileDiscoverySource
+from omnibase.utils.filesystem_index import (
+    FileSystemIndex,
+    IndexEntry,
+    shared_filesystem_index,
+)
+from omnibase.utils.ignore_matcher import IgnoreMatcher
+from omnibase.utils.onexignore_cache import OnexIgnoreCache, shared_onexignore_cache
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")  # Generic type variable for processor result
+T_co = TypeVar("T_co", covariant=True)
+
+
+@runtime_checkable
+class PipelinedProcessor(Protocol[T_co]):
+    """
+    A processor that can also run over many files at once, overlapping its own
+    stages (e.g. StampPipeline). Without an executor the traverser hands it the
+    whole ordered file list through imap, which must yield results in order.
+    """
+
+    def __call__(self, file_path: Path) -> T_co: ...
+
+    def imap(self, file_paths: Iterable[Path]) -> Iterator[T_co]: ...
+
+
+def _invoke_processor(
+    processor: Callable[[Path], T], file_path: Path
+) -> Tuple[Optional[T], Optional[str]]:
+    """
+    Run a processor on a single file, capturing any exception as a string.
+    Module-level so it can be shipped to process pool workers; returning the
+    error instead of raising keeps one failing file from aborting executor.map.
+    """
+    try:
+        return processor(file_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _invoke_processor_batch(
+    processor: Callable[[Path], T], file_paths: List[Path]
+) -> List[Tuple[Optional[T], Optional[str]]]:
+    """Run _invoke_processor over a chunk of files in a single executor task."""
+    return [_invoke_processor(processor, file_path) for file_path in file_paths]
+
+
+def _shard_of(file_path: Path, directory: Path, count: int) -> int:
+    """Stable partition of file_path (by its POSIX path relative to directory)."""
+    rel_path = file_path.relative_to(directory).as_posix()
+    return zlib.crc32(rel_path.encode("utf-8")) % count
+
+
+def _glob_segment_regex(segment: str) -> str:
+    """Regex for one path segment of a glob pattern; never matches '/'."""
+    out = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+                continue
+            stuff = segment[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if stuff.startswith("!"):
+                stuff = "^/" + stuff[1:]
+            elif stuff.startswith("^"):
+                stuff = "\\" + stuff
+            out.append(f"[{stuff}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+class _GlobSet:
+    """
+    Path.glob semantics for several patterns at once: one compiled regex over
+    POSIX paths relative to the glob root. Only file matches are of interest,
+    so patterns that glob resolves to directories only (a trailing '**' or '/')
+    never match. max_depth is how many directory levels the patterns can reach
+    (None for unlimited, i.e. any pattern contains '**').
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        regexes = []
+        self.max_depth: Optional[int] = 0
+        for pattern in patterns:
+            segments = [seg for seg in pattern.split("/") if seg not in ("", ".")]
+            if not segments or pattern.endswith("/") or segments[-1] == "**":
+                continue
+            parts = []
+            for segment in segments[:-1]:
+                parts.append(
+                    "(?:[^/]+/)*"
+                    if segment == "**"
+                    else _glob_segment_regex(segment) + "/"
+                )
+            parts.append(_glob_segment_regex(segments[-1]))
+            regexes.append("".join(parts))
+            if "**" in segments:
+                self.max_depth = None
+            elif self.max_depth is not None:
+                self.max_depth = max(self.max_depth, len(segments) - 1)
+        self.regex = re.compile("|".join(f"(?:{r})" for r in regexes) or "(?!)")
+
+    def match(self, rel_path: str) -> bool:
+        return self.regex.fullmatch(rel_path) is not None
+
+
+class _ListingPrefetcher:
+    """
+    Lists directories ahead of a walk on a thread pool, so that on slow or
+    network filesystems several listings are in flight at once. The walk
+    still consumes listings in its own order, so results are unchanged.
+    """
+
+    def __init__(
+        self,
+        list_dir: Callable[[Path], List[IndexEntry]],
+        threads: int,
+        max_in_flight: int,
+    ) -> None:
+        self._list_dir = list_dir
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="onex-scan"
+        )
+        self._max_in_flight = max_in_flight
+        # Directories the walk will visit, next one first
+        self._queue: Deque[Path] = deque()
+        self._pending: Dict[Path, "Future[List[IndexEntry]]"] = {}
+        self._listed: Set[Path] = set()
+
+    def schedule(self, dir_paths: List[Path]) -> None:
+        """Queue the subdirectories of the directory just listed, in walk order."""
+        self._queue.extendleft(reversed(dir_paths))
+        self._fill()
+
+    def listdir(self, dir_path: Path) -> List[IndexEntry]:
+        self._listed.add(dir_path)
+        future = self._pending.pop(dir_path, None)
+        try:
+            if future is None:
+                return self._list_dir(dir_path)
+            return future.result()
+        finally:
+            self._fill()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fill(self) -> None:
+        while self._queue and len(self._pending) < self._max_in_flight:
+            dir_path = self._queue.popleft()
+            if dir_path not in self._listed and dir_path not in self._pending:
+                self._pending[dir_path] = self._executor.submit(
+                    self._list_dir, dir_path
+                )
 
 
 class SchemaExclusionRegistry:
@@ -89,16 +274,26 @@ class SchemaExclusionRegistry:
         self.schema_patterns = set(self.DEFAULT_SCHEMA_PATTERNS)
         if extra_patterns:
             self.schema_patterns.update(extra_patterns)
+        # Single-segment patterns only ever match the file name (Path.match),
+        # so they are combined into one case-sensitive regex
+        self._name_regex = re.compile(
+            "|".join(
+                fnmatch.translate(p)
+                for p in sorted(self.schema_patterns)
+                if "/" not in p
+            )
+            or "(?!)"
+        )
+        self._path_patterns = sorted(p for p in self.schema_patterns if "/" in p)
 
     def is_schema_file(self, path: Path) -> bool:
         # Exclude if in a schema directory
-        if any(part in self.schema_dirs for part in path.parts):
+        if not self.schema_dirs.isdisjoint(path.parts):
             return True
         # Exclude if matches known schema filename patterns
-        for pat in self.schema_patterns:
-            if path.match(pat):
-                return True
-        return False
+        if self._name_regex.match(path.name):
+            return True
+        return any(path.match(pat) for pat in self._path_patterns)
 
 
 class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource):
@@ -123,12 +318,32 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         ".venv",
         "venv",
         "node_modules",
+        ".onex_cache",
     ]
 
+    # Bounds on executor work in flight during (iter_)process_directory
+    MAX_EXECUTOR_CHUNKSIZE = 256
+    MAX_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+    # Bound on directory listings in flight with scan_threads
+    MAX_LISTINGS_IN_FLIGHT_PER_THREAD = 4
+    # Bound on skipped files recorded with their reason in self.result
+    MAX_RECORDED_SKIPS = 1000
+
     def __init__(
-        self, schema_exclusion_registry: Optional[SchemaExclusionRegistry] = None
+        self,
+        schema_exclusion_registry: Optional[SchemaExclusionRegistry] = None,
+        ignore_cache: Optional[OnexIgnoreCache] = None,
+        fs_index: Optional[FileSystemIndex] = None,
+        scan_threads: int = 0,
     ) -> None:
-        """Initialize the directory traverser."""
+        """
+        Initialize the directory traverser. .onexignore files are read through
+        ignore_cache and directories are listed through fs_index, by default
+        the process-wide shared_onexignore_cache() and shared_filesystem_index().
+        With scan_threads > 0, walks list up to MAX_LISTINGS_IN_FLIGHT_PER_THREAD
+        directories per thread ahead of time, for filesystems where each
+        listing is a slow round trip (e.g. NFS).
+        """
         # Provide all required fields for DirectoryProcessingResultModel
         self.result = DirectoryProcessingResultModel(
             processed_count=0,
@@ -141,6 +356,9 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         self.schema_exclusion_registry = (
             schema_exclusion_registry or SchemaExclusionRegistry()
         )
+        self.ignore_cache = ignore_cache or shared_onexignore_cache()
+        self.fs_index = fs_index or shared_filesystem_index()
+        self.scan_threads = scan_threads
 
     def reset_counters(self) -> None:
         """Reset file counters."""
@@ -194,8 +412,145 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         )
         return self._find_files_with_config(directory, filter_config)
 
+    def iter_files(
+        self,
+        directory: Path,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+        max_files: Optional[int] = None,
+        recursive: bool = True,
+        files: Optional[Iterable[Path]] = None,
+        shard: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Path]:
+        """
+        Lazily yield the files find_files would return, in sorted order, as the
+        walk finds them. The walk stops as soon as max_files files have been
+        yielded, so callers can start on the first files immediately and
+        memory does not grow with the size of the tree.
+
+        Args:
+            directory: Directory to search
+            include_patterns: List of glob patterns to include
+            exclude_patterns: List of glob patterns to exclude
+            ignore_file: Path to ignore file (e.g., .onexignore)
+            max_files: Stop after this many files (None for no limit)
+            recursive: Whether to recursively traverse subdirectories
+            files: Optional explicit candidate files to filter instead of walking
+                the directory (see filter_files).
+            shard: Optional (index, count): only yield the files whose path
+                relative to directory hashes to index out of count partitions.
+                The partition of a file does not depend on the rest of the
+                tree, so count independent runs (processes or hosts) stamp
+                disjoint sets of files that together cover the tree.
+
+        Yields:
+            Path objects for matching files
+        """
+        filter_config = FileFilterModel(
+            traversal_mode=(
+                TraversalModeEnum.RECURSIVE if recursive else TraversalModeEnum.FLAT
+            ),
+            include_patterns=include_patterns or self.DEFAULT_INCLUDE_PATTERNS,
+            exclude_patterns=exclude_patterns or [],
+            ignore_file=ignore_file,
+            ignore_pattern_sources=[
+                IgnorePatternSourceEnum.FILE,
+                IgnorePatternSourceEnum.DEFAULT,
+            ],
+            max_file_size=5 * 1024 * 1024,
+            max_files=max_files,
+            follow_symlinks=False,
+            case_sensitive=False,
+        )
+        if shard is not None and not 0 <= shard[0] < shard[1]:
+            raise OnexError(
+                f"Invalid shard {shard[0]}/{shard[1]}: need 0 <= index < count",
+                CoreErrorCode.INVALID_PARAMETER,
+            )
+        return self._iter_files_with_config(directory, filter_config, files, shard)
+
+    def filter_files(
+        self,
+        directory: Path,
+        files: Iterable[Path],
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        recursive: bool = True,
+        ignore_file: Optional[Path] = None,
+    ) -> Set[Path]:
+        """
+        Apply the same include/exclude, .onexignore and schema rules as find_files
+        to an explicit list of files instead of walking the directory.
+
+        Args:
+            directory: Root directory the files are resolved against
+            files: Candidate file paths (absolute or relative to the working directory)
+            include_patterns: List of glob patterns to include
+            exclude_patterns: List of glob patterns to exclude
+            recursive: Whether files in subdirectories are eligible
+            ignore_file: Path to ignore file (e.g., .onexignore)
+
+        Returns:
+            Set of Path objects for eligible files
+        """
+        filter_config = FileFilterModel(
+            traversal_mode=(
+                TraversalModeEnum.RECURSIVE if recursive else TraversalModeEnum.FLAT
+            ),
+            include_patterns=include_patterns or self.DEFAULT_INCLUDE_PATTERNS,
+            exclude_patterns=exclude_patterns or [],
+            ignore_file=ignore_file,
+            ignore_pattern_sources=[
+                IgnorePatternSourceEnum.FILE,
+                IgnorePatternSourceEnum.DEFAULT,
+            ],
+            max_file_size=5 * 1024 * 1024,
+            max_files=None,
+            follow_symlinks=False,
+            case_sensitive=False,
+        )
+        return self._find_files_with_config(directory, filter_config, files)
+
+    @staticmethod
+    def _match_candidates(
+        directory: Path, candidate_files: Iterable[Path], include_patterns: List[str]
+    ) -> Set[Path]:
+        """
+        Select the candidates under directory that match an include pattern.
+
+        Paths are returned in the same form a glob of directory would produce, so
+        explicit candidates and walked files are indistinguishable downstream.
+        """
+        root = directory.resolve()
+        matched: Set[Path] = set()
+        spec = (
+            pathspec.PathSpec.from_lines("gitwildmatch", include_patterns)
+            if pathspec
+            else None
+        )
+        for candidate in candidate_files:
+            try:
+                rel_path = Path(candidate).resolve().relative_to(root).as_posix()
+            except ValueError:
+                continue
+            if spec is not None:
+                is_match = spec.match_file(rel_path)
+            else:
+                is_match = any(
+                    fnmatch.fnmatch(rel_path, pattern)
+                    or fnmatch.fnmatch(rel_path, pattern.split("**/")[-1])
+                    for pattern in include_patterns
+                )
+            if is_match:
+                matched.add(directory / rel_path)
+        return matched
+
     def _find_files_with_config(
-        self, directory: Path, filter_config: FileFilterModel
+        self,
+        directory: Path,
+        filter_config: FileFilterModel,
+        candidate_files: Optional[Iterable[Path]] = None,
     ) -> Set[Path]:
         """
         Find all files matching filter criteria in the directory.
@@ -203,10 +558,35 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         Args:
             directory: Directory to search
             filter_config: Configuration for filtering files
+            candidate_files: Optional explicit candidates (e.g. paths reported by
+                git). When given, the directory is not walked; candidates under
+                the directory are matched against the include patterns instead.
 
         Returns:
             Set of Path objects for matching files
         """
+        eligible_files = set(
+            self._iter_files_with_config(directory, filter_config, candidate_files)
+        )
+        logger.debug(
+            f"[find_files] Eligible files: {sorted(str(f) for f in eligible_files)}"
+        )
+        return eligible_files
+
+    def _iter_files_with_config(
+        self,
+        directory: Path,
+        filter_config: FileFilterModel,
+        candidate_files: Optional[Iterable[Path]] = None,
+        shard: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Path]:
+        """
+        Yield the files matching filter criteria in sorted order as the walk
+        finds them, stopping once filter_config.max_files have been yielded.
+        Skipped files are counted in self.result as they are seen, and the
+        first MAX_RECORDED_SKIPS are recorded with their reason; files outside
+        shard (see iter_files) are neither yielded nor counted.
+        """
         logger.debug(f"[_find_files_with_config] directory={directory}")
         logger.debug(
             f"[_find_files_with_config] filter_config.include_patterns={filter_config.include_patterns}"
@@ -215,7 +595,7 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
             f"[_find_files_with_config] filter_config.exclude_patterns={filter_config.exclude_patterns}"
         )
         if not directory.exists() or not directory.is_dir():
-            return set()
+            return
 
         # Reset counters for a new operation
         self.reset_counters()
@@ -240,38 +620,38 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         if filter_config.exclude_patterns:
             ignore_patterns.extend(filter_config.exclude_patterns)
 
-        # Get all files matching the include patterns
-        all_files: Set[Path] = set()
-        for pattern in filter_config.include_patterns:
-            orig_pattern = pattern
-            if recursive:
-                if pattern.startswith("**/") or pattern.startswith("**"):
-                    pass
-                elif pattern.startswith("*."):
-                    pattern = f"**/{pattern}"
-                logger.debug(
-                    f"[glob] Recursive mode: original pattern: {orig_pattern}, final pattern: {pattern}"
-                )
-                matched = list(directory.glob(pattern))
-                logger.debug(f"[glob] Pattern: {pattern}, Matched: {matched}")
-                all_files.update(matched)
-            else:
-                if pattern.startswith("**/"):
+        # Files matching the include patterns, in sorted order
+        candidates: Iterable[Tuple[Path, Optional[IndexEntry]]]
+        if candidate_files is not None:
+            matched = self._match_candidates(
+                directory, candidate_files, filter_config.include_patterns
+            )
+            candidates = ((file_path, None) for file_path in sorted(matched))
+        else:
+            patterns = []
+            for pattern in filter_config.include_patterns:
+                if recursive:
+                    if not pattern.startswith("**") and pattern.startswith("*."):
+                        pattern = f"**/{pattern}"
+                elif pattern.startswith("**/"):
                     pattern = pattern.replace("**/", "")
-                logger.debug(
-                    f"[glob] Non-recursive mode: original pattern: {orig_pattern}, final pattern: {pattern}"
-                )
-                matched = list(directory.glob(pattern))
-                logger.debug(f"[glob] Pattern: {pattern}, Matched: {matched}")
-                all_files.update(matched)
-        logger.debug(
-            f"[find_files] All files matched by include patterns: {sorted(str(f) for f in all_files)}"
-        )
+                patterns.append(pattern)
+            candidates = self._iter_scan_matching(directory, patterns, ignore_patterns)
+
         # Filter out ignored files
-        eligible_files: Set[Path] = set()
-        for file_path in all_files:
+        ignore_matcher = IgnoreMatcher.for_patterns(ignore_patterns)
+        max_files = filter_config.max_files
+        if max_files is not None and max_files <= 0:
+            return
+        yielded = 0
+        for file_path, entry in candidates:
+            if (
+                shard is not None
+                and _shard_of(file_path, directory, shard[1]) != shard[0]
+            ):
+                continue
             skip_reason = None
-            if not file_path.is_file():
+            if entry is None and not file_path.is_file():
                 skip_reason = "not a file"
             elif (
                 filter_config.traversal_mode == TraversalModeEnum.FLAT
@@ -284,33 +664,96 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
                 and file_path.parent.parent != directory
             ):
                 skip_reason = "not in immediate subdirectory (SHALLOW mode)"
-            elif self.should_ignore(file_path, ignore_patterns, root_dir=directory):
+            elif ignore_matcher.matches(file_path, directory):
                 skip_reason = "ignored by pattern"
             elif self.schema_exclusion_registry.is_schema_file(file_path):
                 skip_reason = "schema file"
             elif filter_config.max_file_size > 0:
                 try:
-                    file_size = file_path.stat().st_size
-                    if file_size > filter_config.max_file_size:
+                    # Sizes are not indexed: a file edited in place does not
+                    # change its directory's mtime
+                    if file_path.stat().st_size > filter_config.max_file_size:
                         skip_reason = "exceeds max file size"
                 except OSError as e:
                     skip_reason = f"error checking file size: {e}"
-            if (
-                filter_config.max_files is not None
-                and len(eligible_files) >= filter_config.max_files
-            ):
-                skip_reason = "max_files limit reached"
             if skip_reason:
                 logger.debug(f"[find_files] Skipping {file_path}: {skip_reason}")
                 self.result.skipped_count += 1
-                self.result.skipped_files.add(file_path)
-                self.result.skipped_file_reasons[file_path] = skip_reason
+                if len(self.result.skipped_file_reasons) < self.MAX_RECORDED_SKIPS:
+                    self.result.skipped_files.add(file_path)
+                    self.result.skipped_file_reasons[file_path] = skip_reason
                 continue
-            eligible_files.add(file_path)
-        logger.debug(
-            f"[find_files] Eligible files: {sorted(str(f) for f in eligible_files)}"
+            yield file_path
+            yielded += 1
+            if max_files is not None and yielded >= max_files:
+                logger.debug("[find_files] max_files limit reached")
+                return
+
+    def _iter_scan_matching(
+        self, directory: Path, patterns: List[str], ignore_patterns: List[str]
+    ) -> Iterator[Tuple[Path, IndexEntry]]:
+        """
+        Walk directory once and yield the files that directory.glob would
+        yield for any of patterns, as the same paths glob would produce, in
+        sorted order and only as far as the caller consumes them.
+
+        Directories are listed through fs_index, so unchanged directories are
+        not read again. Directories that ignore_patterns ignore as a whole (see
+        IgnoreMatcher.is_ignored_dir) are not descended into. Symlinked
+        directories are not followed.
+        """
+        globs = _GlobSet(patterns)
+        ignore_matcher = IgnoreMatcher.for_patterns(ignore_patterns)
+        prefetcher = (
+            _ListingPrefetcher(
+                self.fs_index.listdir,
+                self.scan_threads,
+                self.scan_threads * self.MAX_LISTINGS_IN_FLIGHT_PER_THREAD,
+            )
+            if self.scan_threads > 0
+            else None
         )
-        return eligible_files
+        list_dir = prefetcher.listdir if prefetcher else self.fs_index.listdir
+        # One iterator per open directory, with the names of the subdirectories
+        # to descend into; entries are sorted by name, so a depth-first walk
+        # yields paths in sorted order
+        stack: List[Tuple[Path, str, int, Iterator[IndexEntry], Set[str]]] = []
+
+        def push(dir_path: Path, rel_dir: str, depth: int) -> None:
+            try:
+                dir_entries = list_dir(dir_path)
+            except OSError as e:
+                logger.debug(f"[scan] Cannot read {dir_path}: {e}")
+                return
+            subdirs: List[str] = []
+            if globs.max_depth is None or depth < globs.max_depth:
+                subdirs = [
+                    e.name
+                    for e in dir_entries
+                    if e.is_dir and not ignore_matcher.is_ignored_dir(rel_dir + e.name)
+                ]
+            if prefetcher and subdirs:
+                prefetcher.schedule([dir_path / name for name in subdirs])
+            stack.append((dir_path, rel_dir, depth, iter(dir_entries), set(subdirs)))
+
+        try:
+            push(directory, "", 0)
+            while stack:
+                dir_path, rel_dir, depth, entries, subdirs = stack[-1]
+                entry = next(entries, None)
+                if entry is None:
+                    stack.pop()
+                    continue
+                rel_path = f"{rel_dir}{entry.name}"
+                if entry.is_dir:
+                    if entry.name in subdirs:
+                        push(dir_path / entry.name, rel_path + "/", depth + 1)
+                elif entry.is_file and globs.match(rel_path):
+                    yield dir_path / entry.name, entry
+        finally:
+            if prefetcher:
+                prefetcher.close()
+            self.fs_index.save()
 
     def _load_ignore_patterns_from_sources(
         self, sources: List[IgnorePatternSourceEnum], ignore_file: Optional[Path] = None
@@ -349,41 +792,14 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
             List of ignore patterns as strings, with child directory patterns taking precedence.
         """
 
-        import yaml
-
-        patterns = []
         # Determine starting directory
         if ignore_file is None:
             start_dir = Path.cwd()
         else:
             p = Path(ignore_file)
             start_dir = p if p.is_dir() else p.parent
-        # Walk up to repo root (stop at .git or filesystem root)
-        dirs = [start_dir] + list(start_dir.parents)
-        for d in dirs:
-            onexignore = d / ".onexignore"
-            if onexignore.exists():
-                try:
-                    with onexignore.open("r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f)
-                    # Canonical: merge 'all' and 'stamper' patterns
-                    if data:
-                        if "all" in data and data["all"] and "patterns" in data["all"]:
-                            patterns.extend(data["all"]["patterns"])
-                        if (
-                            "stamper" in data
-                            and data["stamper"]
-                            and "patterns" in data["stamper"]
-                        ):
-                            patterns.extend(data["stamper"]["patterns"])
-                except Exception as e:
-                    logger.warning(f"Failed to load {onexignore}: {e}")
-            # Stop at repo root
-            if (d / ".git").exists():
-                break
-            if d == d.parent:
-                break
-        return patterns
+        # Parsed files and merged results are cached until a .onexignore changes
+        return self.ignore_cache.patterns(start_dir, tool="stamper")
 
     def should_ignore(
         self, path: Path, ignore_patterns: List[str], root_dir: Optional[Path] = None
@@ -399,75 +815,7 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         Returns:
             True if the file should be ignored, False otherwise
         """
-        if not ignore_patterns:
-            logger.info(f"[should_ignore] No ignore patterns provided for {path}")
-            return False
-
-        if root_dir is None:
-            root_dir = Path.cwd()
-        try:
-            rel_path = str(path.relative_to(root_dir).as_posix())
-        except (ValueError, OnexError):
-            rel_path = str(path.as_posix())
-        rel_path = rel_path.lstrip("/")
-        logger.info(
-            f"[should_ignore] Checking {rel_path} against patterns: {ignore_patterns}"
-        )
-
-        # Use pathspec if available for robust gitignore-style matching
-        if pathspec:
-            logger.info(f"[should_ignore] Using pathspec for {rel_path}")
-            spec = pathspec.PathSpec.from_lines("gitwildmatch", ignore_patterns)
-            matched = spec.match_file(rel_path)
-            logger.info(f"[should_ignore] pathspec result for {rel_path}: {matched}")
-            if matched:
-                logger.info(
-                    f"[should_ignore] File {rel_path} is IGNORED by pathspec pattern."
-                )
-            else:
-                logger.info(
-                    f"[should_ignore] File {rel_path} is NOT ignored by pathspec pattern."
-                )
-            return bool(matched)
-        else:
-            for pattern in ignore_patterns:
-                logger.info(
-                    f"[should_ignore] Checking pattern '{pattern}' for {rel_path}"
-                )
-                if pattern.endswith("/"):
-                    dir_name = pattern.rstrip("/")
-                    parts = rel_path.split("/")
-                    if dir_name in parts[:-1]:
-                        logger.info(
-                            f"[should_ignore] {rel_path} IGNORED due to directory pattern {pattern} (in parts)"
-                        )
-                        return True
-                    for parent in path.parents:
-                        if parent.name == dir_name:
-                            logger.info(
-                                f"[should_ignore] {rel_path} IGNORED due to parent directory {parent} matching {dir_name}"
-                            )
-                            return True
-                    if rel_path.startswith(dir_name + "/"):
-                        logger.info(
-                            f"[should_ignore] {rel_path} IGNORED due to rel_path starting with {dir_name}/"
-                        )
-                        return True
-                if fnmatch.fnmatch(rel_path, pattern):
-                    logger.info(
-                        f"[should_ignore] {rel_path} IGNORED by fnmatch on rel_path with pattern '{pattern}'"
-                    )
-                    return True
-                if fnmatch.fnmatch(path.name, pattern):
-                    logger.info(
-                        f"[should_ignore] {rel_path} IGNORED by fnmatch on path.name with pattern '{pattern}'"
-                    )
-                    return True
-                logger.info(
-                    f"[should_ignore] {rel_path} NOT ignored by pattern '{pattern}'"
-                )
-        logger.info(f"[should_ignore] {rel_path} is NOT ignored by any pattern.")
-        return False
+        return IgnoreMatcher.for_patterns(ignore_patterns).matches(path, root_dir)
 
     def process_directory(
         self,
@@ -479,6 +827,9 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
         ignore_file: Optional[Path] = None,
         dry_run: bool = False,
         max_file_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        files: Optional[Iterable[Path]] = None,
+        executor_workers: int = 1,
     ) -> OnexResultModel:
         """
         Process all eligible files in a directory using the provided processor function.
@@ -491,14 +842,142 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
             recursive: Whether to recursively traverse subdirectories
             ignore_file: Path to ignore file (e.g., .onexignore)
             dry_run: Whether to perform a dry run (don't modify files)
-            max_file_size: Maximum file size in bytes to process
+            max_file_size: Maximum file size in bytes to process (default 5 MB;
+                0 disables the limit)
+            executor: Optional executor used to fan the processor out over files.
+                For a process pool the processor must be picklable. Files are
+                always handed out and merged in sorted order, so the aggregate
+                result is identical to a serial run.
+            files: Optional explicit candidate files to filter instead of walking
+                the directory (see filter_files).
+            executor_workers: Number of workers executor was created with; sizes
+                the chunks and the window of chunks in flight.
 
         Returns:
             OnexResultModel with aggregate results
         """
+        for _ in self.iter_process_directory(
+            directory,
+            processor,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            recursive=recursive,
+            ignore_file=ignore_file,
+            dry_run=dry_run,
+            max_file_size=max_file_size,
+            executor=executor,
+            files=files,
+            executor_workers=executor_workers,
+        ):
+            pass
+        return self.summarize_directory(directory)
+
+    def iter_process_directory(
+        self,
+        directory: Path,
+        processor: Callable[[Path], T],
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        recursive: bool = True,
+        ignore_file: Optional[Path] = None,
+        dry_run: bool = False,
+        max_file_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        files: Optional[Iterable[Path]] = None,
+        executor_workers: int = 1,
+    ) -> Iterator[OnexResultModel]:
+        """
+        Streaming variant of process_directory: yield one OnexResultModel per
+        eligible file, in sorted order, as soon as it has been processed.
+
+        Files are processed as the walk finds them. Neither the file list nor
+        per-file results are retained: self.result keeps counters and at most
+        MAX_RECORDED_SKIPS skip reasons, so memory does not grow with the size
+        of the tree. Once the iterator is exhausted, summarize_directory
+        returns the same aggregate result process_directory would have. With
+        an executor, at most MAX_CHUNKS_IN_FLIGHT_PER_WORKER chunks of
+        MAX_EXECUTOR_CHUNKSIZE files per worker are pending at any time. Yields
+        nothing if the directory is missing (summarize_directory reports the
+        error).
+        """
         logger.debug(f"[process_directory] directory={directory}")
         logger.debug(f"[process_directory] include_patterns={include_patterns}")
         logger.debug(f"[process_directory] exclude_patterns={exclude_patterns}")
+        if not directory.is_dir():
+            return
+        filter_config = FileFilterModel(
+            traversal_mode=(
+                TraversalModeEnum.RECURSIVE if recursive else TraversalModeEnum.FLAT
+            ),
+            include_patterns=include_patterns or self.DEFAULT_INCLUDE_PATTERNS,
+            exclude_patterns=exclude_patterns or [],
+            ignore_file=ignore_file,
+            max_file_size=(5 * 1024 * 1024 if max_file_size is None else max_file_size),
+            max_files=None,
+            follow_symlinks=False,
+            case_sensitive=False,
+            ignore_pattern_sources=[
+                IgnorePatternSourceEnum.FILE,
+                IgnorePatternSourceEnum.DEFAULT,
+            ],
+        )
+        eligible_files = self._iter_files_with_config(directory, filter_config, files)
+        if dry_run:
+            for file_path in eligible_files:
+                logger.info(f"[DRY RUN] Would process: {file_path}")
+                self.result.processed_count += 1
+                yield OnexResultModel(
+                    status=OnexStatus.INFO,
+                    target=str(file_path),
+                    messages=[],
+                    metadata={"note": "Dry run: file would be processed"},
+                )
+            return
+        outcomes = self._iter_outcomes(
+            processor, eligible_files, executor, executor_workers
+        )
+        for file_path, (result, error) in outcomes:
+            if error is not None:
+                logger.error(f"Error processing {file_path}: {error}")
+                self.result.failed_count += 1
+                yield OnexResultModel(
+                    status=OnexStatus.ERROR,
+                    target=str(file_path),
+                    messages=[
+                        OnexMessageModel(
+                            summary=f"Error processing file: {error}",
+                            level=LogLevelEnum.ERROR,
+                            file=None,
+                            line=None,
+                            details=None,
+                            code=None,
+                            context=None,
+                            timestamp=None,
+                            type=None,
+                        )
+                    ],
+                )
+                continue
+            self.result.processed_count += 1
+            try:
+                self.result.total_size_bytes += file_path.stat().st_size
+            except OSError:
+                pass
+            if isinstance(result, OnexResultModel):
+                yield result
+            else:
+                # If processor returns something else, wrap in OnexResultModel
+                yield OnexResultModel(
+                    status=OnexStatus.SUCCESS,
+                    target=str(file_path),
+                    messages=[],
+                )
+
+    def summarize_directory(self, directory: Path) -> OnexResultModel:
+        """
+        Aggregate result for the most recent (iter_)process_directory run over
+        directory, built from the counters in self.result.
+        """
         if not directory.exists():
             return OnexResultModel(
                 status=OnexStatus.ERROR,
@@ -535,76 +1014,7 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
                     )
                 ],
             )
-        filter_config = FileFilterModel(
-            traversal_mode=(
-                TraversalModeEnum.RECURSIVE if recursive else TraversalModeEnum.FLAT
-            ),
-            include_patterns=include_patterns or self.DEFAULT_INCLUDE_PATTERNS,
-            exclude_patterns=exclude_patterns or [],
-            ignore_file=ignore_file,
-            max_file_size=max_file_size or (5 * 1024 * 1024),
-            max_files=None,
-            follow_symlinks=False,
-            case_sensitive=False,
-            ignore_pattern_sources=[
-                IgnorePatternSourceEnum.FILE,
-                IgnorePatternSourceEnum.DEFAULT,
-            ],
-        )
-        eligible_files: Set[Path] = self._find_files_with_config(
-            directory, filter_config
-        )
-        logger.debug(f"[process_directory] eligible_files={list(eligible_files)}")
-        results: List[OnexResultModel] = []
-        for file_path in eligible_files:
-            try:
-                if dry_run:
-                    logger.info(f"[DRY RUN] Would process: {file_path}")
-                    self.result.processed_count += 1
-                    self.result.processed_files.add(file_path)
-                else:
-                    result = processor(file_path)
-                    if isinstance(result, OnexResultModel):
-                        results.append(result)
-                    else:
-                        # If processor returns something else, wrap in OnexResultModel
-                        results.append(
-                            OnexResultModel(
-                                status=OnexStatus.SUCCESS,
-                                target=str(file_path),
-                                messages=[],
-                            )
-                        )
-                    self.result.processed_count += 1
-                    self.result.processed_files.add(file_path)
-                    try:
-                        self.result.total_size_bytes += file_path.stat().st_size
-                    except OSError:
-                        pass
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {str(e)}")
-                self.result.failed_count += 1
-                self.result.failed_files.add(file_path)
-                results.append(
-                    OnexResultModel(
-                        status=OnexStatus.ERROR,
-                        target=str(file_path),
-                        messages=[
-                            OnexMessageModel(
-                                summary=f"Error processing file: {str(e)}",
-                                level=LogLevelEnum.ERROR,
-                                file=None,
-                                line=None,
-                                details=None,
-                                code=None,
-                                context=None,
-                                timestamp=None,
-                                type=None,
-                            )
-                        ],
-                    )
-                )
-        if not eligible_files:
+        if self.result.processed_count + self.result.failed_count == 0:
             return OnexResultModel(
                 status=OnexStatus.WARNING,
                 target=str(directory),
@@ -664,14 +1074,80 @@ class DirectoryTraverser(ProtocolDirectoryTraverser, ProtocolFileDiscoverySource
                 "failed": self.result.failed_count,
                 "skipped": self.result.skipped_count,
                 "size_bytes": self.result.total_size_bytes,
-                "skipped_files": list(self.result.skipped_files),
+                "skipped_files": sorted(self.result.skipped_files),
                 "skipped_file_reasons": {
-                    str(k): v for k, v in self.result.skipped_file_reasons.items()
+                    str(k): v
+                    for k, v in sorted(self.result.skipped_file_reasons.items())
                 },
             },
         )
         return onex_result
 
+    def _iter_outcomes(
+        self,
+        processor: Callable[[Path], T],
+        files: Iterable[Path],
+        executor: Optional[Executor],
+        workers: int = 1,
+    ) -> Iterator[Tuple[Path, Tuple[Optional[T], Optional[str]]]]:
+        """
+        Run the processor over files, yielding (file, outcome) in the same
+        order and pulling files only as they are handed out. With an executor,
+        files are submitted in chunks through a bounded window so neither the
+        files read ahead nor the pending results grow with the size of the
+        tree. A PipelinedProcessor without an executor bounds its own window.
+        """
+        files = iter(files)
+        if executor is None and isinstance(processor, PipelinedProcessor):
+            handed_out: Deque[Path] = deque()
+
+            def hand_out() -> Iterator[Path]:
+                for file_path in files:
+                    handed_out.append(file_path)
+                    yield file_path
+
+            for result in processor.imap(hand_out()):
+                yield handed_out.popleft(), (result, None)
+            return
+        if executor is None:
+            for file_path in files:
+                yield file_path, _invoke_processor(processor, file_path)
+            return
+        workers = max(1, workers)
+        window = workers * self.MAX_CHUNKS_IN_FLIGHT_PER_WORKER
+        # Size chunks from the files that fill the first window: a tree that
+        # fits in it is split evenly, a larger one uses full chunks
+        lookahead = list(islice(files, window * self.MAX_EXECUTOR_CHUNKSIZE))
+        if len(lookahead) < window * self.MAX_EXECUTOR_CHUNKSIZE:
+            chunksize = self._executor_chunksize(workers, len(lookahead))
+        else:
+            chunksize = self.MAX_EXECUTOR_CHUNKSIZE
+        remaining = chain(lookahead, files)
+        pending: Deque[
+            Tuple[List[Path], "Future[List[Tuple[Optional[T], Optional[str]]]]"]
+        ] = deque()
+        while True:
+            chunk = list(islice(remaining, chunksize))
+            if not chunk:
+                break
+            pending.append(
+                (chunk, executor.submit(_invoke_processor_batch, processor, chunk))
+            )
+            if len(pending) >= window:
+                done, future = pending.popleft()
+                yield from zip(done, future.result())
+        while pending:
+            done, future = pending.popleft()
+            yield from zip(done, future.result())
+
+    @staticmethod
+    def _executor_chunksize(workers: int, file_count: int) -> int:
+        """
+        Batch size for executor tasks: a few chunks per worker amortizes the
+        per-task IPC cost of process pools while still balancing uneven files.
+        """
+        return max(1, file_count // (workers * 4))
+
     def validate_tree_sync(
         self,
         directory: Path,
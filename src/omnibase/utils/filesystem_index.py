@@ -0,0 +1,251 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: filesystem_index.py
+# version: 1.0.0
+# uuid: 00a19c44-37ed-48a8-91bc-661c3485d646
+# author: OmniNode Team
+# created_at: 2026-10-16T23:41:34.177023
+# last_modified_at: 2026-10-17T01:14:56.209456
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: a62a7b17a7cd3e10d9049ea69ae70363eabce85e24781234cc943c131e929195
+# entrypoint: python@filesystem_index.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.filesystem_index
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Persistent index of directory listings used by the file discovery sources.
+
+Every directory listed through a FileSystemIndex is kept with its stat
+(mtime_ns, inode) and its entries (name, kind). Adding, removing or
+renaming an entry updates a directory's mtime, so a later listing re-stats the
+directory and returns the recorded entries when the stat is unchanged; only
+directories that changed are read again with os.scandir.
+
+Like git's index, a listing taken less than RACY_SECONDS after the directory's
+mtime is not trusted: the directory could still change within the same mtime
+tick, so it is listed again next time. File sizes are not indexed: a file
+edited in place does not change its directory's mtime, so callers stat files
+themselves.
+
+At most max_dirs directories are kept; the least recently listed are dropped
+first, so a long-running process (onex serve, stamp watch) does not grow
+without bound.
+
+DirectoryTraverser, TreeFileDiscoverySource and TreeGeneratorEngine share
+shared_filesystem_index() unless given their own. With persist_to the index is
+also kept in a JSON file (by default .onex_cache/onex_index.json) so later
+processes start warm.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DIR = 1
+_FILE = 2
+_SYMLINK = 4
+
+
+class IndexEntry(NamedTuple):
+    """One directory entry. kind is a bit set of is_dir/is_file/is_symlink."""
+
+    name: str
+    kind: int
+
+    @property
+    def is_dir(self) -> bool:
+        """A directory, not a symlink to one (DirEntry.is_dir(follow_symlinks=False))."""
+        return bool(self.kind & _DIR)
+
+    @property
+    def is_file(self) -> bool:
+        """A regular file or a symlink to one (DirEntry.is_file())."""
+        return bool(self.kind & _FILE)
+
+    @property
+    def is_symlink(self) -> bool:
+        return bool(self.kind & _SYMLINK)
+
+
+# (mtime_ns, inode, listed_at_ns, entries sorted by name)
+_DirRecord = Tuple[int, int, int, Sequence[Any]]
+
+
+def _entry_for(entry: "os.DirEntry[str]") -> IndexEntry:
+    kind = 0
+    try:
+        if entry.is_dir(follow_symlinks=False):
+            kind |= _DIR
+        elif entry.is_file():
+            kind |= _FILE
+        if entry.is_symlink():
+            kind |= _SYMLINK
+    except OSError:
+        pass
+    return IndexEntry(entry.name, kind)
+
+
+class FileSystemIndex:
+    """Directory listings validated by directory mtime."""
+
+    SCHEMA_VERSION = 2
+    DEFAULT_PATH = Path(".onex_cache") / "onex_index.json"
+    RACY_SECONDS = 2.0
+    MAX_DIRS = 50_000
+
+    def __init__(
+        self, index_path: Optional[Path] = None, max_dirs: Optional[int] = None
+    ) -> None:
+        # Least recently listed first
+        self._dirs: "OrderedDict[str, _DirRecord]" = OrderedDict()
+        self.max_dirs = self.MAX_DIRS if max_dirs is None else max_dirs
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.scandir_calls = 0
+        self.index_path: Optional[Path] = None
+        if index_path is not None:
+            self.persist_to(index_path)
+
+    def persist_to(self, index_path: Path) -> None:
+        """Load the index from index_path and save it there from now on."""
+        self.index_path = Path(index_path)
+        try:
+            stored = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if stored.get("schema_version") != self.SCHEMA_VERSION:
+            return
+        with self._lock:
+            for key, record in stored.get("dirs", {}).items():
+                # Entries stay as [name, kind] lists until first used
+                self._dirs.setdefault(key, tuple(record))  # type: ignore[arg-type]
+            self._evict()
+
+    def listdir(self, directory: Path) -> List[IndexEntry]:
+        """
+        Entries of directory sorted by name, from the index when the directory
+        is unchanged. Raises OSError if directory cannot be listed.
+        """
+        key = os.path.abspath(directory)
+        st = os.stat(key)
+        record = self._dirs.get(key)
+        if (
+            record is not None
+            and record[0] == st.st_mtime_ns
+            and record[1] == st.st_ino
+            and record[2] - st.st_mtime_ns >= self.RACY_SECONDS * 1e9
+        ):
+            entries = record[3]
+            with self._lock:
+                if entries and not isinstance(entries[0], IndexEntry):
+                    entries = [IndexEntry._make(e) for e in entries]
+                    self._dirs[key] = (*record[:3], entries)
+                if key in self._dirs:
+                    self._dirs.move_to_end(key)
+            return list(entries)
+        listed_at = time.time_ns()
+        with os.scandir(key) as it:
+            entries = sorted((_entry_for(e) for e in it), key=lambda e: e.name)
+        with self._lock:
+            self.scandir_calls += 1
+            self._dirs[key] = (st.st_mtime_ns, st.st_ino, listed_at, entries)
+            self._dirs.move_to_end(key)
+            self._evict()
+            self._dirty = True
+        return list(entries)
+
+    def iter_files(self, root: Path) -> Iterator[Path]:
+        """
+        Every file below root in sorted order, like sorted(root.rglob("*"))
+        filtered to files: symlinked directories are not descended into.
+        """
+        stack: List[Path] = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = self.listdir(directory)
+            except OSError as e:
+                logger.debug(f"[index] Cannot read {directory}: {e}")
+                continue
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir:
+                    subdirs.append(directory / entry.name)
+                elif entry.is_file:
+                    yield directory / entry.name
+            stack.extend(reversed(subdirs))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirs.clear()
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index to its persist_to path, if set and anything changed."""
+        if self.index_path is None or not self._dirty:
+            return
+        with self._lock:
+            self._prune()
+            payload = {
+                "schema_version": self.SCHEMA_VERSION,
+                "dirs": {
+                    key: [mtime, ino, listed_at, [list(e) for e in entries]]
+                    for key, (mtime, ino, listed_at, entries) in self._dirs.items()
+                },
+            }
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.index_path.with_suffix(".tmp")
+                tmp_path.write_text(
+                    json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+                )
+                os.replace(tmp_path, self.index_path)
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"Could not save {self.index_path}: {e}")
+
+    def _evict(self) -> None:
+        """Drop the least recently listed directories beyond max_dirs."""
+        while len(self._dirs) > self.max_dirs:
+            self._dirs.popitem(last=False)
+
+    def _prune(self) -> None:
+        """Drop directories whose indexed parent no longer lists them."""
+        dropped = set()
+        # Parents sort before their children
+        for key in sorted(self._dirs):
+            parent, name = os.path.split(key)
+            if parent in dropped:
+                dropped.add(key)
+                continue
+            record = self._dirs.get(parent)
+            if record is None or parent == key:
+                continue
+            if not any(e[0] == name and e[1] & _DIR for e in record[3]):
+                dropped.add(key)
+        for key in dropped:
+            del self._dirs[key]
+
+
+_shared_index = FileSystemIndex()
+
+
+def shared_filesystem_index() -> FileSystemIndex:
+    """The process-wide index used by the discovery sources by default."""
+    return _shared_index
@@ -0,0 +1,168 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: git_file_discovery_source.py
+# version: 1.0.0
+# uuid: d344abc7-8be6-4fb2-ac20-261533326594
+# author: OmniNode Team
+# created_at: 2026-10-16T22:59:42.073023
+# last_modified_at: 2026-10-17T01:05:03.487726
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 1ee2d2c0218a87f9ce2184741307ca65c888a20d599ccf824837704c8cfdfc41
+# entrypoint: python@git_file_discovery_source.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.git_file_discovery_source
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Git-based file discovery source for stamping/validation tools.
+Discovers only the files changed relative to a ref (or staged in the index),
+then applies the usual include/exclude and .onexignore rules.
+Implements ProtocolFileDiscoverySource.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Iterator, List, Optional, Set
+
+from omnibase.core.error_codes import CoreErrorCode, OnexError
+from omnibase.model.model_tree_sync_result import TreeSyncResultModel
+from omnibase.protocol.protocol_file_discovery_source import ProtocolFileDiscoverySource
+from omnibase.utils.directory_traverser import DirectoryTraverser
+from omnibase.utils.tree_file_discovery_source import TreeFileDiscoverySource
+
+
+class GitFileDiscoverySource(ProtocolFileDiscoverySource):
+    """
+    File discovery source that asks git for changed paths instead of walking the tree.
+
+    With staged=True only files staged in the index are returned (pre-commit use).
+    Otherwise files added, copied, modified or renamed since the merge base of
+    `since` and HEAD are returned, together with working tree changes and
+    untracked files that are not git-ignored.
+    """
+
+    def __init__(
+        self,
+        since: Optional[str] = None,
+        staged: bool = False,
+        directory_traverser: Optional[DirectoryTraverser] = None,
+    ):
+        if not staged and not since:
+            raise OnexError(
+                "GitFileDiscoverySource requires a ref or staged=True",
+                CoreErrorCode.MISSING_REQUIRED_PARAMETER,
+            )
+        self.since = since
+        self.staged = staged
+        self.fs_source = directory_traverser or DirectoryTraverser()
+        self.tree_source = TreeFileDiscoverySource()
+
+    def discover_files(
+        self,
+        directory: Path,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+    ) -> Set[Path]:
+        """
+        Discover changed files under the given directory that pass the filesystem
+        source's include/exclude, .onexignore and schema filters.
+        """
+        return self.fs_source.filter_files(
+            directory,
+            self.get_changed_files(directory),
+            include_patterns,
+            exclude_patterns,
+            True,
+            ignore_file,
+        )
+
+    def iter_files(
+        self,
+        directory: Path,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+        max_files: Optional[int] = None,
+    ) -> Iterator[Path]:
+        """
+        Yield the files discover_files would return, in sorted order, stopping
+        after max_files. git is asked for the changed paths up front.
+        """
+        return self.fs_source.iter_files(
+            directory,
+            include_patterns,
+            exclude_patterns,
+            ignore_file,
+            max_files,
+            files=self.get_changed_files(directory),
+        )
+
+    def get_changed_files(self, directory: Path) -> Set[Path]:
+        """
+        Return absolute paths of changed files in the repository containing directory.
+        Deleted files are never reported.
+        """
+        root = Path(self._git(directory, "rev-parse", "--show-toplevel").strip())
+        if self.staged:
+            names = self._git_names(
+                root, "diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z"
+            )
+        else:
+            assert self.since is not None
+            base = self._git(root, "merge-base", self.since, "HEAD").strip()
+            names = self._git_names(
+                root, "diff", "--name-only", "--diff-filter=ACMR", "-z", base
+            )
+            names |= self._git_names(
+                root, "ls-files", "--others", "--exclude-standard", "-z"
+            )
+        return {root / name for name in names}
+
+    def _git_names(self, cwd: Path, *args: str) -> Set[str]:
+        return {name for name in self._git(cwd, *args).split("\0") if name}
+
+    @staticmethod
+    def _git(cwd: Path, *args: str) -> str:
+        try:
+            completed = subprocess.run(
+                ["git", *args],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except FileNotFoundError as e:
+            raise OnexError(
+                "git executable not found", CoreErrorCode.DEPENDENCY_UNAVAILABLE
+            ) from e
+        if completed.returncode != 0:
+            raise OnexError(
+                f"git {' '.join(args)} failed: {completed.stderr.strip()}",
+                CoreErrorCode.OPERATION_FAILED,
+            )
+        return completed.stdout
+
+    def validate_tree_sync(
+        self,
+        directory: Path,
+        tree_file: Path,
+    ) -> TreeSyncResultModel:
+        """
+        Validate that the .tree file and filesystem are in sync.
+        """
+        return self.tree_source.validate_tree_sync(directory, tree_file)
+
+    def get_canonical_files_from_tree(self, tree_file: Path) -> Set[Path]:
+        """
+        Get canonical files from .tree file.
+        """
+        return self.tree_source.get_canonical_files_from_tree(tree_file)
@@ -9,11 +9,11 @@
 # uuid: 209899ad-fd9c-4b42-b924-db1db87dd9b9
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:21.448958
-# last_modified_at: 2025-05-22T20:50:39.719978
+# last_modified_at: 2026-10-17T01:05:03.492705
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 09668d249638d0c9962296f3500742c0c74936bf9d82417df68a17bc666dedab
+# hash: 835d03abf43af11a45e56bddf50ee3593218eaad595f5497e01dcffacd7ca880
 # entrypoint: python@hybrid_file_discovery_source.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.hybrid_file_discovery_source
@@ -28,7 +28,7 @@ Implements ProtocolFileDiscoverySource.
 """
 
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Iterator, List, Optional, Set
 
 from omnibase.core.error_codes import CoreErrorCode, OnexError
 from omnibase.model.model_tree_sync_result import (
@@ -62,29 +62,65 @@ class HybridFileDiscoverySource(ProtocolFileDiscoverySource):
         Discover files using filesystem, but cross-check with .tree if present.
         Warn or error on drift depending on strict_mode.
         """
-        tree_file = directory / ".tree"
         files = self.fs_source.find_files(
             directory, include_patterns, exclude_patterns, True, ignore_file
         )
-        if tree_file.exists():
-            sync_result = self.validate_tree_sync(directory, tree_file)
-            if sync_result.status == TreeSyncStatusEnum.DRIFT:
-                msg = "; ".join(m.summary for m in sync_result.messages)
-                if self.strict_mode:
-                    raise OnexError(
-                        f"Drift detected between filesystem and .tree: {msg}",
-                        CoreErrorCode.VALIDATION_FAILED,
-                    )
-                else:
-                    print(
-                        f"[WARNING] Drift detected between filesystem and .tree: {msg}"
-                    )
-            # Optionally, filter to only files in .tree if strict_mode
+        canonical_files = self._check_drift(directory)
+        # Optionally, filter to only files in .tree if strict_mode
+        if canonical_files is not None:
+            files = files & canonical_files
+        return files
+
+    def iter_files(
+        self,
+        directory: Path,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+        max_files: Optional[int] = None,
+    ) -> Iterator[Path]:
+        """
+        Lazily yield the files discover_files would return, in sorted order,
+        stopping after max_files. If a .tree is present, drift is checked
+        (and reported or raised) before the first file is yielded.
+        """
+        canonical_files = self._check_drift(directory)
+        if max_files is not None and max_files <= 0:
+            return
+        files = self.fs_source.iter_files(
+            directory, include_patterns, exclude_patterns, ignore_file
+        )
+        yielded = 0
+        for file_path in files:
+            if canonical_files is not None and file_path not in canonical_files:
+                continue
+            yield file_path
+            yielded += 1
+            if max_files is not None and yielded >= max_files:
+                return
+
+    def _check_drift(self, directory: Path) -> Optional[Set[Path]]:
+        """
+        Cross-check directory against its .tree, if present. Warn or error on
+        drift depending on strict_mode. In strict_mode, return the canonical
+        files from .tree that discovery is limited to; otherwise None.
+        """
+        tree_file = directory / ".tree"
+        if not tree_file.exists():
+            return None
+        sync_result = self.validate_tree_sync(directory, tree_file)
+        if sync_result.status == TreeSyncStatusEnum.DRIFT:
+            msg = "; ".join(m.summary for m in sync_result.messages)
             if self.strict_mode:
-                files = files & self.tree_source.get_canonical_files_from_tree(
-                    tree_file
+                raise OnexError(
+                    f"Drift detected between filesystem and .tree: {msg}",
+                    CoreErrorCode.VALIDATION_FAILED,
                 )
-        return files
+            else:
+                print(f"[WARNING] Drift detected between filesystem and .tree: {msg}")
+        if self.strict_mode:
+            return self.tree_source.get_canonical_files_from_tree(tree_file)
+        return None
 
     def validate_tree_sync(
         self,
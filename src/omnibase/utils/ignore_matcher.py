@@ -0,0 +1,171 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: ignore_matcher.py
+# version: 1.0.0
+# uuid: c2771f0c-1b72-4500-9e86-5c1ec1a7f7d4
+# author: OmniNode Team
+# created_at: 2026-10-16T23:34:36.435931
+# last_modified_at: 2026-10-17T01:05:03.495886
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 1dc08dbd81e755c071f71f04442c9737eaedded153ebaf8cd935f6090796d9f7
+# entrypoint: python@ignore_matcher.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.ignore_matcher
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Compiled ignore-pattern matcher shared by DirectoryTraverser.should_ignore and
+the directory walk.
+
+An IgnoreMatcher is built once per pattern list (IgnoreMatcher.for_patterns
+keeps the most recent ones) and combines the patterns into a single regex.
+Decisions about whole directories are cached, so once a directory is known to
+be ignored nothing below it is matched again. Matching is the same
+gitignore-style pathspec matching (or fnmatch fallback) should_ignore has
+always used.
+"""
+
+import fnmatch
+import importlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Pattern, Tuple
+
+try:
+    pathspec: Optional[ModuleType] = importlib.import_module("pathspec")
+except ImportError:
+    pathspec = None
+
+
+# Tail of a pathspec regex for a directory-only pattern ('name/')
+_DIR_ONLY = "(?P<ps_d>/).*$"
+
+
+def _combine(regexes: Iterable[str]) -> Pattern[str]:
+    # Each pathspec regex names the same group; only whether it matches matters
+    joined = "|".join(f"(?:{r.replace('(?P<ps_d>', '(?:')})" for r in regexes)
+    return re.compile(joined or "(?!)")
+
+
+class IgnoreMatcher:
+    """
+    Ignore decisions for one list of gitignore-style patterns.
+
+    With pathspec available and no negation ('!') patterns, the patterns are
+    joined into one regex; a directory matched with a trailing '/' ignores
+    everything below it. Negation patterns depend on pattern order, so they
+    are matched through the ordered PathSpec and directories are never
+    short-circuited. Without pathspec the fnmatch fallback is used: directory
+    patterns ('name/') ignore any path with a parent of that name, and every
+    pattern is also tried against the relative path and the file name.
+    """
+
+    MAX_CACHED_DIRS = 100_000
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = list(patterns)
+        self.has_negation = any(p.startswith("!") for p in self.patterns)
+        self._spec = (
+            pathspec.PathSpec.from_lines("gitwildmatch", self.patterns)
+            if pathspec
+            else None
+        )
+        # _dir_regex decides whole directories; a file below a directory that is
+        # not ignored can only match a pattern that is not directory-only
+        # ('name/'), so _regex leaves those out
+        self._regex: Optional[Pattern[str]] = None
+        self._dir_regex: Optional[Pattern[str]] = None
+        if self._spec is not None and not self.has_negation:
+            regexes = [
+                p.regex.pattern
+                for p in self._spec.patterns
+                if p.include and p.regex is not None
+            ]
+            self._dir_regex = _combine(regexes)
+            self._regex = _combine(r for r in regexes if _DIR_ONLY not in r)
+        self._dir_names = {p.rstrip("/") for p in self.patterns if p.endswith("/")}
+        self._fnmatch_regex: Optional[Pattern[str]] = None
+        if self._spec is None:
+            self._fnmatch_regex = re.compile(
+                "|".join(f"(?:{fnmatch.translate(p)})" for p in self.patterns) or "(?!)"
+            )
+        self._ignored_dirs: Dict[Tuple[str, str], bool] = {}
+
+    @staticmethod
+    def for_patterns(patterns: Iterable[str]) -> "IgnoreMatcher":
+        """The shared matcher for this pattern list, compiled on first use."""
+        return _matcher_for(tuple(patterns))
+
+    def is_ignored_dir(self, rel_dir: str) -> bool:
+        """
+        True if every file below rel_dir (a POSIX path relative to the matching
+        root) is ignored, so a walk may skip the directory entirely.
+        """
+        if self._spec is None:
+            return any(part in self._dir_names for part in rel_dir.split("/"))
+        if self._dir_regex is not None:
+            return self._dir_regex.match(rel_dir + "/") is not None
+        return False
+
+    def matches(self, path: Path, root_dir: Optional[Path] = None) -> bool:
+        """True if path is ignored; root_dir defaults to the current directory."""
+        if not self.patterns:
+            return False
+        if root_dir is None:
+            root_dir = Path.cwd()
+        # Lexical, like Path.relative_to, but on strings
+        path_str = path.as_posix()
+        root_str = root_dir.as_posix()
+        prefix = root_str if root_str.endswith("/") else root_str + "/"
+        if path_str.startswith(prefix):
+            rel_path = path_str[len(prefix) :]
+        elif path_str == root_str:
+            rel_path = "."
+        else:
+            rel_path = path_str.lstrip("/")
+        if self._parent_ignored(path, path_str, root_str, rel_path):
+            return True
+        if self._regex is not None:
+            return self._regex.match(rel_path) is not None
+        if self._spec is not None:
+            return bool(self._spec.match_file(rel_path))
+        assert self._fnmatch_regex is not None
+        return bool(
+            self._fnmatch_regex.match(rel_path) or self._fnmatch_regex.match(path.name)
+        )
+
+    def _parent_ignored(
+        self, path: Path, path_str: str, root_str: str, rel_path: str
+    ) -> bool:
+        """Cached whole-directory decision for the directory containing path."""
+        if self._spec is not None and self._regex is None:
+            return False
+        key = (root_str, path_str.rpartition("/")[0])
+        ignored = self._ignored_dirs.get(key)
+        if ignored is None:
+            rel_dir = rel_path.rpartition("/")[0]
+            if self._spec is not None:
+                ignored = bool(rel_dir) and self.is_ignored_dir(rel_dir)
+            else:
+                ignored = any(
+                    part in self._dir_names for part in rel_dir.split("/") if part
+                ) or any(parent.name in self._dir_names for parent in path.parents)
+            if len(self._ignored_dirs) >= self.MAX_CACHED_DIRS:
+                self._ignored_dirs.clear()
+            self._ignored_dirs[key] = ignored
+        return ignored
+
+
+@lru_cache(maxsize=32)
+def _matcher_for(patterns: Tuple[str, ...]) -> IgnoreMatcher:
+    return IgnoreMatcher(patterns)
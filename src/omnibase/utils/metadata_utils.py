@@ -9,11 +9,11 @@
 # uuid: c59268b5-88b9-433f-9df5-7e4dc7037691
 # author: OmniNode Team
 # created_at: 2025-05-22T14:05:21.449308
-# last_modified_at: 2025-05-22T20:50:39.712639
+# last_modified_at: 2026-10-17T01:05:03.499045
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: be4418331d4279b7e59df0688a615ec5e912ad9601cafcf173520381ecc226f4
+# hash: e862e5dd2221cdee1bcb7671900ad234163dc161ef9381bb9f264c58691c643b
 # entrypoint: python@metadata_utils.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.metadata_utils
@@ -21,17 +21,68 @@
 # === /OmniNode:Metadata ===
 
 
-import hashlib
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
+
+from omnibase.utils.canonical_hasher import (
+    block_hasher,
+    digest_memo,
+    hash_text,
+    update_body,
+    update_text,
+)
+
+# Values volatile fields take in the hashed form of a metadata block
+HASH_PLACEHOLDERS: Dict[str, Any] = {
+    "hash": "0" * 64,  # Use valid dummy hash
+    "last_modified_at": "1970-01-01T00:00:00Z",
+}
 
 
 def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
-def compute_canonical_hash(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+def compute_canonical_hash(content: str, algorithm: Optional[str] = None) -> str:
+    return hash_text(content, algorithm)
+
+
+def compute_canonical_hash_for(
+    metadata: Dict[str, Any],
+    body: str,
+    volatile_fields: List[str] = ["hash", "last_modified_at"],
+    metadata_serializer: Any = None,
+    body_canonicalizer: Any = None,
+    stored_hash: Optional[str] = None,
+) -> str:
+    """
+    compute_canonical_hash(canonicalize_for_hash(...)) without building the
+    canonicalized string: the metadata and the body are fed to the hasher in
+    turn, and a normalize_body canonicalizer is applied chunk by chunk.
+    The digest uses the algorithm named by the block's hash_algorithm.
+
+    If stored_hash was already computed in this process from the same
+    canonical metadata and body (see DigestMemo), it is returned without
+    hashing the body again. Only the restamp path passes stored_hash;
+    verification always hashes.
+    """
+    algorithm = metadata.get("hash_algorithm")
+    meta_str = canonicalize_metadata_for_hash(
+        metadata,
+        volatile_fields=volatile_fields,
+        metadata_serializer=metadata_serializer,
+    )
+    memo = digest_memo()
+    if stored_hash and memo.confirms(
+        algorithm, stored_hash, meta_str, body, body_canonicalizer
+    ):
+        return stored_hash
+    hasher = block_hasher(algorithm)
+    update_text(hasher, meta_str + "\n")
+    update_body(hasher, body, body_canonicalizer)
+    digest = str(hasher.hexdigest())
+    memo.record(algorithm, digest, meta_str, body, body_canonicalizer)
+    return digest
 
 
 def canonicalize_for_hash(
@@ -43,12 +94,48 @@ def canonicalize_for_hash(
 ) -> str:
     """
     Canonicalize metadata and body for hash computation.
-    - Constructs a complete NodeMetadataBlock model from metadata dict
-    - Masks volatile fields in metadata with a constant placeholder.
+    - Fills in defaults for missing fields and masks volatile fields in
+      metadata with a constant placeholder.
+    - Constructs a complete NodeMetadataBlock model from the result.
     - Canonicalizes the body (if a canonicalizer is provided).
     - Serializes metadata (if a serializer is provided).
     Returns the concatenated canonicalized metadata and body as a string.
     """
+    meta_str = canonicalize_metadata_for_hash(
+        metadata,
+        volatile_fields=volatile_fields,
+        metadata_serializer=metadata_serializer,
+    )
+    body_str = body_canonicalizer(body) if body_canonicalizer else body
+    return meta_str + "\n" + body_str
+
+
+def mask_volatile_fields(
+    metadata: Dict[str, Any], volatile_fields: Iterable[str]
+) -> Dict[str, Any]:
+    """
+    A copy of metadata with each volatile field replaced by its hash
+    placeholder (None for fields without one).
+    """
+    masked = dict(metadata)
+    for field in volatile_fields:
+        masked[field] = HASH_PLACEHOLDERS.get(field)
+    return masked
+
+
+def canonicalize_metadata_for_hash(
+    metadata: Dict[str, Any],
+    volatile_fields: List[str] = ["hash", "last_modified_at"],
+    metadata_serializer: Any = None,
+) -> str:
+    """
+    Metadata half of canonicalize_for_hash: the serialized block with volatile
+    fields masked. The hashed string is this, a newline, then the canonical body,
+    so callers that stream the body can feed this prefix to the hasher first.
+
+    Defaults are filled in and volatile fields masked on the plain field dict,
+    so the model is validated once before it is serialized.
+    """
     from omnibase.model.model_node_metadata import NodeMetadataBlock
 
     # Extract key fields from metadata dict, use model defaults for missing fields
@@ -70,8 +157,7 @@ def canonicalize_for_hash(
         entrypoint_type = "python"
         entrypoint_target = "main.py"
 
-    # Create complete model using the canonical constructor
-    model = NodeMetadataBlock.create_with_defaults(
+    fields = NodeMetadataBlock.fields_with_defaults(
         name=name,
         author=author,
         namespace=namespace,
@@ -83,24 +169,10 @@ def canonicalize_for_hash(
             if k not in ["name", "author", "namespace", "entrypoint"]
         },
     )
+    meta_for_hash = NodeMetadataBlock(**mask_volatile_fields(fields, volatile_fields))
 
-    # Now mask volatile fields for hash computation
-    model_dict = model.model_dump()
-    for field in volatile_fields:
-        if field == "hash":
-            model_dict[field] = "0" * 64  # Use valid dummy hash
-        elif field == "last_modified_at":
-            model_dict[field] = "1970-01-01T00:00:00Z"
-        else:
-            model_dict[field] = None
-
-    # Reconstruct model with masked fields
-    meta_for_hash = NodeMetadataBlock(**model_dict)
-
-    meta_str = (
+    return (
         metadata_serializer(meta_for_hash)
         if metadata_serializer
         else str(meta_for_hash.model_dump())
     )
-    body_str = body_canonicalizer(body) if body_canonicalizer else body
-    return meta_str + "\n" + body_str
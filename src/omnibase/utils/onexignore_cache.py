@@ -0,0 +1,175 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: onexignore_cache.py
+# version: 1.0.0
+# uuid: 58e38089-39df-4ae1-9154-36f55c31e9ab
+# author: OmniNode Team
+# created_at: 2026-10-16T23:36:36.906967
+# last_modified_at: 2026-10-17T01:05:03.501313
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 672e255daa532f2cddb2cf8b2bcf896593905def58444e47187e51432dc6b977
+# entrypoint: python@onexignore_cache.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.onexignore_cache
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Process-wide cache of parsed .onexignore files.
+
+DirectoryTraverser.load_ignore_patterns merges the .onexignore files from a
+directory up to the repository root. Each file is parsed once and kept with
+its stat (mtime_ns, size, inode); the merged pattern list for a directory is
+kept together with the stats of the chain it was built from. A lookup re-stats
+that chain and returns the cached list when nothing changed, so no YAML is
+read or parsed again until a .onexignore (or a .git root marker) is added,
+removed or edited.
+
+Every DirectoryTraverser shares shared_onexignore_cache() unless given its own.
+With persist_to, parsed files are also kept in a JSON file (by default
+.onex_cache/onexignore.json) so later processes start warm.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from omnibase.utils.yaml_backend import yaml_safe_load
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size, inode) of a .onexignore, or None if it does not exist
+StatSignature = Optional[Tuple[int, int, int]]
+
+
+def _stat_signature(path: Path) -> StatSignature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _parse_sections(path: Path) -> Dict[str, List[Any]]:
+    """Read one .onexignore: {tool section: patterns} for sections with patterns."""
+    sections: Dict[str, List[Any]] = {}
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = yaml_safe_load(f)
+        if isinstance(data, dict):
+            for section, value in data.items():
+                if isinstance(value, dict) and value.get("patterns"):
+                    sections[str(section)] = list(value["patterns"])
+    except Exception as e:
+        logger.warning(f"Failed to load {path}: {e}")
+    return sections
+
+
+class OnexIgnoreCache:
+    """Parsed .onexignore files and merged per-directory pattern lists."""
+
+    SCHEMA_VERSION = 1
+    DEFAULT_PATH = Path(".onex_cache") / "onexignore.json"
+
+    def __init__(self, cache_path: Optional[Path] = None) -> None:
+        self._files: Dict[str, Tuple[StatSignature, Dict[str, List[Any]]]] = {}
+        self._merged: Dict[
+            Tuple[str, str], Tuple[Tuple[StatSignature, ...], List[str]]
+        ] = {}
+        self._lock = threading.Lock()
+        self.cache_path: Optional[Path] = None
+        if cache_path is not None:
+            self.persist_to(cache_path)
+
+    def persist_to(self, cache_path: Path) -> None:
+        """Load parsed files from cache_path and save them there from now on."""
+        self.cache_path = Path(cache_path)
+        try:
+            stored = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if stored.get("schema_version") != self.SCHEMA_VERSION:
+            return
+        with self._lock:
+            for key, (signature, sections) in stored.get("files", {}).items():
+                self._files.setdefault(
+                    key, (tuple(signature) if signature else None, sections)
+                )
+
+    def patterns(self, start_dir: Path, tool: str = "stamper") -> List[str]:
+        """
+        Patterns for tool from every .onexignore from start_dir up to the first
+        directory containing .git (or the filesystem root): the 'all' section
+        then the tool section of each file, nearest directory first.
+        """
+        chain: List[Tuple[Path, StatSignature]] = []
+        for d in [start_dir, *start_dir.parents]:
+            onexignore = d / ".onexignore"
+            chain.append((onexignore, _stat_signature(onexignore)))
+            # Stop at repo root
+            if (d / ".git").exists() or d == d.parent:
+                break
+        signatures = tuple(signature for _, signature in chain)
+        key = (os.path.abspath(start_dir), tool)
+        cached = self._merged.get(key)
+        if cached is not None and cached[0] == signatures:
+            return list(cached[1])
+        merged: List[str] = []
+        for onexignore, signature in chain:
+            if signature is None:
+                continue
+            sections = self._sections(onexignore, signature)
+            merged.extend(sections.get("all", []))
+            merged.extend(sections.get(tool, []))
+        with self._lock:
+            self._merged[key] = (signatures, merged)
+        return list(merged)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._merged.clear()
+
+    def _sections(
+        self, onexignore: Path, signature: StatSignature
+    ) -> Dict[str, List[Any]]:
+        key = os.path.abspath(onexignore)
+        entry = self._files.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        sections = _parse_sections(onexignore)
+        with self._lock:
+            self._files[key] = (signature, sections)
+        self._save()
+        return sections
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+        with self._lock:
+            payload = {"schema_version": self.SCHEMA_VERSION, "files": self._files}
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(payload, default=str), encoding="utf-8")
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                logger.debug(f"Could not save {self.cache_path}: {e}")
+
+
+_shared_cache = OnexIgnoreCache()
+
+
+def shared_onexignore_cache() -> OnexIgnoreCache:
+    """The process-wide cache used by DirectoryTraverser by default."""
+    return _shared_cache
@@ -0,0 +1,105 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: path_classifier.py
+# version: 1.0.0
+# uuid: b350f738-2d8f-4b71-a28d-db1ec5b258f7
+# author: OmniNode Team
+# created_at: 2026-10-16T23:47:36.089526
+# last_modified_at: 2026-10-17T01:05:03.503791
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 0c711900af881f0d6c7a747300411cc9437e44e238b0bb645b86e321887581a4
+# entrypoint: python@path_classifier.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.path_classifier
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Batch classification of paths for stamping: ignored, schema-excluded,
+unhandled, or grouped by the handler that processes them.
+
+DirectoryTraverser and StamperEngine decide these one path at a time with
+separate calls (ignore check, SchemaExclusionRegistry.is_schema_file,
+FileTypeHandlerRegistry.get_handler). PathClassifier makes the same decisions
+for a whole batch. Ignore patterns are compiled once (IgnoreMatcher), schema
+file names are matched with one combined regex, and handlers are found with
+the registry's filename and extension tables. Callers can then dispatch one
+batch per handler.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from omnibase.core.core_file_type_handler_registry import FileTypeHandlerRegistry
+from omnibase.protocol.protocol_file_type_handler import ProtocolFileTypeHandler
+from omnibase.utils.directory_traverser import SchemaExclusionRegistry
+from omnibase.utils.ignore_matcher import IgnoreMatcher
+
+
+@dataclass
+class PathClassification:
+    """Result of PathClassifier.classify; every input path is in exactly one bucket."""
+
+    batches: List[Tuple[ProtocolFileTypeHandler, List[Path]]] = field(
+        default_factory=list
+    )
+    ignored: Dict[Path, str] = field(default_factory=dict)
+    excluded: Dict[Path, str] = field(default_factory=dict)
+    unhandled: Dict[Path, str] = field(default_factory=dict)
+
+    def by_handler_name(self) -> Dict[str, List[Path]]:
+        """Handled paths keyed by handler_name."""
+        grouped: Dict[str, List[Path]] = {}
+        for handler, paths in self.batches:
+            grouped.setdefault(handler.handler_name, []).extend(paths)
+        return grouped
+
+
+class PathClassifier:
+    """
+    Classify paths the way a stamping run would, in the same order of checks
+    as DirectoryTraverser: ignore patterns, then schema exclusion, then handler
+    lookup. ignore_patterns are matched relative to root_dir (default: cwd).
+    """
+
+    def __init__(
+        self,
+        handler_registry: FileTypeHandlerRegistry,
+        schema_exclusion_registry: Optional[SchemaExclusionRegistry] = None,
+        ignore_patterns: Optional[List[str]] = None,
+        root_dir: Optional[Path] = None,
+    ) -> None:
+        self.handler_registry = handler_registry
+        self.schema_exclusion_registry = (
+            schema_exclusion_registry or SchemaExclusionRegistry()
+        )
+        self.ignore_matcher = IgnoreMatcher.for_patterns(ignore_patterns or [])
+        self.root_dir = root_dir
+
+    def classify(self, paths: Iterable[Path]) -> PathClassification:
+        """Sort paths into handler batches and ignored/excluded/unhandled buckets."""
+        result = PathClassification()
+        root_dir = self.root_dir or Path.cwd()
+        is_schema_file = self.schema_exclusion_registry.is_schema_file
+        candidates: List[Path] = []
+        for path in paths:
+            if self.ignore_matcher.matches(path, root_dir):
+                result.ignored[path] = "ignored by pattern"
+            elif is_schema_file(path):
+                result.excluded[path] = "schema file"
+            else:
+                candidates.append(path)
+        result.batches, unhandled = self.handler_registry.group_by_handler(candidates)
+        for path in unhandled:
+            result.unhandled[path] = (
+                f"No handler registered for file type: {path.suffix or path.name}"
+            )
+        return result
@@ -9,11 +9,11 @@
 # uuid: 5d5f2ff7-cfc6-49df-aa90-78823b42ab17
 # author: OmniNode Team
 # created_at: 2025-05-21T13:18:56.574773
-# last_modified_at: 2025-05-22T20:50:39.728314
+# last_modified_at: 2026-10-17T01:05:03.506043
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 456b5e57eb14e278793a630c2a42ff25ba5aef79b8b1b7adecba6c13189bc881
+# hash: 29be5aeadc248f10e948a27047c6ed8b862edbd20b45c5d585098e229f674426
 # entrypoint: python@real_file_io.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.real_file_io
@@ -25,15 +25,14 @@ import builtins
 import json
 from pathlib import Path
 
-import yaml
-
 from omnibase.protocol.protocol_file_io import ProtocolFileIO
+from omnibase.utils.yaml_backend import yaml_safe_dump, yaml_safe_load
 
 
 class RealFileIO(ProtocolFileIO):
     def read_yaml(self, path: str | Path) -> object:
         with builtins.open(path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml_safe_load(f)
 
     def read_json(self, path: str | Path) -> object:
         with builtins.open(path, "r") as f:
@@ -41,7 +40,7 @@ class RealFileIO(ProtocolFileIO):
 
     def write_yaml(self, path: str | Path, data: object) -> None:
         with builtins.open(path, "w") as f:
-            yaml.safe_dump(data, f)
+            yaml_safe_dump(data, f)
 
     def write_json(self, path: str | Path, data: object) -> None:
         with builtins.open(path, "w") as f:
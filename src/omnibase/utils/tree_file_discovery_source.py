@@ -9,11 +9,11 @@
 # uuid: 1a930ceb-7bb2-4fd7-9023-e99695b142b5
 # author: OmniNode Team
 # created_at: 2025-05-22T14:03:21.906534
-# last_modified_at: 2025-05-22T20:50:39.712131
+# last_modified_at: 2026-10-17T01:05:03.508126
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: c8a039d4b838c0bb4a866f32ac9e15504752a63b91519b9acd1c3eb53f002e4b
+# hash: 4de12cf56c298366e042cbb0ea699d7467492feb478f91766e212f647851aac0
 # entrypoint: python@tree_file_discovery_source.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.tree_file_discovery_source
@@ -26,10 +26,9 @@
 Implements ProtocolFileDiscoverySource.
 """
 
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Set
-
-import yaml
+from typing import Iterator, List, Optional, Set
 
 from omnibase.enums import LogLevelEnum
 from omnibase.model.model_onex_message_result import OnexMessageModel
@@ -38,6 +37,8 @@ from omnibase.model.model_tree_sync_result import (
     TreeSyncStatusEnum,
 )
 from omnibase.protocol.protocol_file_discovery_source import ProtocolFileDiscoverySource
+from omnibase.utils.filesystem_index import FileSystemIndex, shared_filesystem_index
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 
 class TreeFileDiscoverySource(ProtocolFileDiscoverySource):
@@ -45,6 +46,9 @@ class TreeFileDiscoverySource(ProtocolFileDiscoverySource):
     File discovery source that uses a .tree file as the canonical source of truth.
     """
 
+    def __init__(self, fs_index: Optional[FileSystemIndex] = None):
+        self.fs_index = fs_index or shared_filesystem_index()
+
     def discover_files(
         self,
         directory: Path,
@@ -59,6 +63,27 @@ class TreeFileDiscoverySource(ProtocolFileDiscoverySource):
         tree_file = directory / ".tree"
         return self.get_canonical_files_from_tree(tree_file)
 
+    def iter_files(
+        self,
+        directory: Path,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        ignore_file: Optional[Path] = None,
+        max_files: Optional[int] = None,
+    ) -> Iterator[Path]:
+        """
+        Yield the files listed in the .tree file in the given directory, in .tree
+        order and without duplicates, stopping after max_files.
+        Ignores include/exclude patterns; only files in .tree are returned.
+        """
+        tree_file = directory / ".tree"
+        if not tree_file.exists():
+            return iter(())
+        with open(tree_file, "r") as f:
+            data = yaml_safe_load(f)
+        files = self._iter_files_from_tree_data(tree_file.parent, data)
+        return islice(_unique(files), max_files)
+
     def validate_tree_sync(
         self,
         directory: Path,
@@ -68,7 +93,8 @@ class TreeFileDiscoverySource(ProtocolFileDiscoverySource):
         Validate that the .tree file and filesystem are in sync.
         """
         canonical_files = self.get_canonical_files_from_tree(tree_file)
-        files_on_disk = set(p for p in directory.rglob("*") if p.is_file())
+        files_on_disk = set(self.fs_index.iter_files(directory))
+        self.fs_index.save()
         extra_files = files_on_disk - canonical_files
         missing_files = canonical_files - files_on_disk
         status = (
@@ -119,22 +145,36 @@ class TreeFileDiscoverySource(ProtocolFileDiscoverySource):
         if not tree_file.exists():
             return set()
         with open(tree_file, "r") as f:
-            data = yaml.safe_load(f)
+            data = yaml_safe_load(f)
         return set(self._extract_files_from_tree_data(tree_file.parent, data))
 
     def _extract_files_from_tree_data(self, base_dir: Path, data: object) -> List[Path]:
         """
         Recursively extract file paths from .tree data structure.
         """
-        files = []
+        return list(self._iter_files_from_tree_data(base_dir, data))
+
+    def _iter_files_from_tree_data(
+        self, base_dir: Path, data: object
+    ) -> Iterator[Path]:
+        """
+        Recursively yield file paths from .tree data structure, in .tree order.
+        """
         if isinstance(data, dict):
             if data.get("type") == "file" and "name" in data:
-                files.append(base_dir / data["name"])
+                yield base_dir / data["name"]
             elif data.get("type") == "directory" and "children" in data:
                 dir_path = base_dir / data.get("name", "")
                 for child in data["children"]:
-                    files.extend(self._extract_files_from_tree_data(dir_path, child))
+                    yield from self._iter_files_from_tree_data(dir_path, child)
         elif isinstance(data, list):
             for item in data:
-                files.extend(self._extract_files_from_tree_data(base_dir, item))
-        return files
+                yield from self._iter_files_from_tree_data(base_dir, item)
+
+
+def _unique(paths: Iterator[Path]) -> Iterator[Path]:
+    seen: Set[Path] = set()
+    for path in paths:
+        if path not in seen:
+            seen.add(path)
+            yield path
@@ -0,0 +1,169 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_canonical_hasher.py
+# version: 1.0.0
+# uuid: 64d1c1ab-3448-4513-a027-2f7bf242a436
+# author: OmniNode Team
+# created_at: 2026-10-17T00:17:03.125023
+# last_modified_at: 2026-10-17T01:05:03.513850
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: cd7f8d9bfb9b9051c31bfabd515fe841e510ec82d28f5a385faad55170b9036a
+# entrypoint: python@test_canonical_hasher.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_canonical_hasher
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for incremental canonical hashing: every streamed digest must equal the
+digest of the canonical string built in one piece.
+"""
+
+import hashlib
+import random
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from omnibase.mixin.mixin_canonical_serialization import CanonicalYAMLSerializer
+from omnibase.model.model_node_metadata import NodeMetadataBlock
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_python import PythonHandler
+from omnibase.runtimes.onex_runtime.v1_0_0.mixins.mixin_metadata_block import (
+    MetadataBlockMixin,
+)
+from omnibase.utils import metadata_utils
+from omnibase.utils.canonical_hasher import (
+    DigestMemo,
+    digest_memo,
+    normalize_body,
+    update_normalized_body,
+    update_text,
+)
+from omnibase.utils.metadata_utils import (
+    canonicalize_for_hash,
+    compute_canonical_hash,
+    compute_canonical_hash_for,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _bodies() -> List[str]:
+    rnd = random.Random(0)
+    bodies = ["", "\n", " \t\r\n", "a", "\r\n\r\na\r\n b \r", "\r" * 5000 + "b"]
+    bodies.append("\n" * 9000 + "a\r\nb" + " \r\n" * 3000)
+    bodies.extend(
+        "".join(rnd.choice(" \t\r\n\r\nab é\U0001f600") for _ in range(40))
+        for _ in range(300)
+    )
+    return bodies
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 2, 7, None])
+def test_streamed_body_matches_normalize_body(chunk_chars: int) -> None:
+    for body in _bodies():
+        for strip in (False, True):
+            expected = normalize_body(body)
+            if strip:
+                expected = expected.lstrip("\n")
+            hasher = hashlib.sha256()
+            update_normalized_body(hasher, body, strip, chunk_chars)
+            assert hasher.hexdigest() == _sha256(expected), (body, strip)
+            hasher = hashlib.sha256()
+            update_text(hasher, body, chunk_chars)
+            assert hasher.hexdigest() == _sha256(body)
+
+
+def test_streamed_hashes_match_canonical_strings() -> None:
+    source = REPO_ROOT / "src" / "omnibase" / "utils" / "canonical_hasher.py"
+    meta, rest = PythonHandler().extract_block(source, source.read_text())
+    assert isinstance(meta, NodeMetadataBlock)
+    serializer = CanonicalYAMLSerializer()
+    for body in _bodies()[:20] + [rest]:
+        assert meta.compute_hash(body) == _sha256(
+            serializer.canonicalize_for_hash(meta, body)
+        )
+        for canonicalizer in (NodeMetadataBlock.get_canonicalizer(), str.strip, None):
+            args = (
+                meta.model_dump(),
+                body,
+                ["hash", "last_modified_at"],
+                PythonHandler().serialize_block,
+                canonicalizer,
+            )
+            assert compute_canonical_hash_for(*args) == compute_canonical_hash(
+                canonicalize_for_hash(*args)
+            )
+
+
+def test_digest_memo_confirms_only_recorded_inputs() -> None:
+    memo = DigestMemo(max_entries=2)
+    memo.record(None, "d1", "meta", "body", normalize_body)
+    assert memo.confirms("sha256/1", "d1", "meta", "body", normalize_body)
+    assert not memo.confirms(None, "d1", "meta", "bodx", normalize_body)
+    assert not memo.confirms(None, "d1", "meta2", "body", normalize_body)
+    assert not memo.confirms(None, "d1", "meta", "body", str.strip)
+    assert not memo.confirms("blake2b-256/1", "d1", "meta", "body", normalize_body)
+    memo.record(None, "d2", "meta", "b2", None)
+    memo.record(None, "d3", "meta", "b3", None)
+    assert not memo.confirms(None, "d1", "meta", "body", normalize_body)
+    assert memo.confirms(None, "d3", "meta", "b3", None)
+
+
+def _stamp(handler: PythonHandler, path: Path, content: str) -> str:
+    result = handler.stamp(path, content)
+    assert result.metadata is not None
+    return str(result.metadata["content"])
+
+
+def test_clean_restamp_skips_rehash_and_rebuild(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    handler = PythonHandler()
+    path = tmp_path / "mod.py"
+    stamped = _stamp(handler, path, "x = 1\n" * 50)
+
+    hashed: List[str] = []
+    built: List[Any] = []
+    real_block_hasher = metadata_utils.block_hasher
+    real_update = MetadataBlockMixin.update_metadata_block
+
+    def counting_block_hasher(algorithm: Any = None) -> Any:
+        hashed.append(algorithm)
+        return real_block_hasher(algorithm)
+
+    def counting_update(self: Any, *args: Any, **kwargs: Any) -> Any:
+        built.append(args)
+        return real_update(self, *args, **kwargs)
+
+    monkeypatch.setattr(metadata_utils, "block_hasher", counting_block_hasher)
+    monkeypatch.setattr(MetadataBlockMixin, "update_metadata_block", counting_update)
+
+    assert _stamp(handler, path, stamped) == stamped
+    assert hashed == [] and len(built) == 1
+    # Verification never takes the memo's word for it
+    stored, computed = handler.verify_hash(path, stamped) or (None, None)
+    assert stored == computed and stored and stored in stamped
+    assert len(hashed) == 1
+
+    digest_memo().clear()
+    assert _stamp(handler, path, stamped) == stamped
+    assert len(hashed) == 2
+
+    # Same length, different body: the memo must not vouch for the stored hash
+    edited = stamped.replace("x = 1\n", "x = 2\n", 1)
+    assert _stamp(handler, path, edited) != edited and len(hashed) == 3
+    stored, computed = handler.verify_hash(path, edited) or (None, None)
+    assert stored != computed
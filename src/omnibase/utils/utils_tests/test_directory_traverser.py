@@ -9,11 +9,11 @@
 # uuid: 696af254-2812-4afc-b892-12e79ba182be
 # author: OmniNode Team
 # created_at: 2025-05-21T12:41:40.172640
-# last_modified_at: 2025-05-21T16:42:46.069256
+# last_modified_at: 2026-10-17T01:13:30.761693
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 5921b393e2ff2b91348ea5533f065882de17fe6c22e413b17dd9af5772d1d417
+# hash: af2cbd3aa01481864a3ac2ef8c97ec71219374787b28d21b6905be6b8dc5f5d4
 # entrypoint: python@test_directory_traverser.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.test_directory_traverser
@@ -480,3 +480,196 @@ def make_filter_config(
         case_sensitive=case_sensitive,
         **overrides,
     )
+
+
+def test_iter_process_directory_streams_with_bounded_window(tmp_path: Path) -> None:
+    """Streaming results arrive in sorted order with few chunks in flight."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    for i in range(40):
+        (tmp_path / f"f_{i:02d}.yaml").write_text(f"n: {i}\n")
+    (tmp_path / "bad.yaml").write_text("n: bad\n")
+    ignore_file = tmp_path / ".onexignore"
+    ignore_file.write_text("stamper:\n  patterns: []\n")
+
+    def processor(path: Path) -> None:
+        if path.name == "bad.yaml":
+            raise ValueError("boom")
+
+    traverser = DirectoryTraverser()
+    traverser.MAX_EXECUTOR_CHUNKSIZE = 2
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        submit = mock.Mock(wraps=executor.submit)
+        with mock.patch.object(executor, "submit", submit):
+            stream = traverser.iter_process_directory(
+                tmp_path,
+                processor,
+                ignore_file=ignore_file,
+                executor=executor,
+                executor_workers=2,
+            )
+            first = next(stream)
+            # 2 workers x 2 chunks in flight before the first result is consumed
+            assert submit.call_count == 4
+            rest = list(stream)
+    targets = [Path(str(r.target)).name for r in [first, *rest]]
+    assert targets == sorted(targets) and len(targets) == 41
+    assert [r.status.value for r in [first, *rest]].count("error") == 1
+
+    summary = traverser.summarize_directory(tmp_path)
+    assert summary.metadata is not None
+    assert (summary.metadata["processed"], summary.metadata["failed"]) == (40, 1)
+    assert summary == traverser.process_directory(
+        tmp_path, processor, ignore_file=ignore_file
+    )
+
+
+def test_iter_process_directory_walks_as_results_are_consumed(
+    tmp_path: Path,
+) -> None:
+    """Processing starts on the first files before the rest of the tree is listed."""
+    for rel in ["a/1.yaml", "b/2.yaml", "c/3.yaml"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("k: v\n")
+    ignore_file = tmp_path / ".onexignore"
+    ignore_file.write_text("stamper:\n  patterns: []\n")
+    traverser = DirectoryTraverser()
+    listdir = mock.Mock(wraps=traverser.fs_index.listdir)
+    with mock.patch.object(traverser.fs_index, "listdir", listdir):
+        stream = traverser.iter_process_directory(
+            tmp_path, lambda path: None, ignore_file=ignore_file
+        )
+        assert Path(str(next(stream).target)) == tmp_path / "a" / "1.yaml"
+        listed = {Path(c.args[0]) for c in listdir.call_args_list}
+        assert tmp_path / "c" not in listed
+        assert len(list(stream)) == 2
+
+
+def test_process_directory_keeps_counters_not_file_lists(tmp_path: Path) -> None:
+    """Only counters and a bounded sample of skip reasons are retained."""
+    for i in range(5):
+        (tmp_path / f"skip_{i}.yaml").write_text("k: v\n")
+        (tmp_path / f"keep_{i}.yaml").write_text("k: v\n")
+    ignore_file = tmp_path / ".onexignore"
+    ignore_file.write_text("stamper:\n  patterns: ['skip_*']\n")
+    traverser = DirectoryTraverser()
+    traverser.MAX_RECORDED_SKIPS = 2
+
+    summary = traverser.process_directory(
+        tmp_path, lambda path: None, ignore_file=ignore_file
+    )
+    assert summary.metadata is not None
+    assert (summary.metadata["processed"], summary.metadata["skipped"]) == (5, 5)
+    assert summary.metadata["skipped_files"] == [
+        tmp_path / "skip_0.yaml",
+        tmp_path / "skip_1.yaml",
+    ]
+    assert len(summary.metadata["skipped_file_reasons"]) == 2
+    assert not traverser.result.processed_files and not traverser.result.failed_files
+
+
+def test_find_files_single_scandir_pass(tmp_path: Path) -> None:
+    """The walk matches Path.glob and never descends into ignored directories."""
+    import os
+
+    for rel in [
+        "a.yaml",
+        "pkg/b.yml",
+        "pkg/deep/c.json",
+        "pkg/deep/notes.txt",
+        "build/out.yaml",
+        ".git/objects/x.json",
+        "node_modules/dep/package.json",
+    ]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("k: v\n")
+    (tmp_path / "dir.yaml").mkdir()
+    ignore_file = tmp_path / ".onexignore"
+    ignore_file.write_text("stamper:\n  patterns: ['build/']\n")
+
+    include = ["*.yaml", "**/*.yml", "pkg/**/*.json"]
+    with mock.patch("os.scandir", wraps=os.scandir) as scandir:
+        files = DirectoryTraverser().find_files(
+            tmp_path, include, ignore_file=ignore_file
+        )
+    scanned = {
+        Path(call.args[0]).relative_to(tmp_path).as_posix()
+        for call in scandir.call_args_list
+    }
+    assert scanned == {".", "pkg", "pkg/deep", "dir.yaml"}
+    assert {f.relative_to(tmp_path).as_posix() for f in files} == {
+        "a.yaml",
+        "pkg/b.yml",
+        "pkg/deep/c.json",
+    }
+
+    flat = DirectoryTraverser().find_files(
+        tmp_path, include, recursive=False, ignore_file=ignore_file
+    )
+    assert {f.name for f in flat} == {"a.yaml"}
+
+
+def test_iter_files_is_lazy_and_stops_at_max_files(tmp_path: Path) -> None:
+    """iter_files lists a directory only once the walk reaches it."""
+    for rel in ["a/1.yaml", "a/2.yaml", "b/3.yaml", "c/4.yaml"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("k: v\n")
+    traverser = DirectoryTraverser()
+    listdir = mock.Mock(wraps=traverser.fs_index.listdir)
+    with mock.patch.object(traverser.fs_index, "listdir", listdir):
+        files = traverser.iter_files(tmp_path, max_files=3)
+        assert listdir.call_count == 0
+        assert next(files) == tmp_path / "a" / "1.yaml"
+        assert listdir.call_count == 2
+        assert list(files) == [tmp_path / "a" / "2.yaml", tmp_path / "b" / "3.yaml"]
+    assert tmp_path / "c" not in {Path(c.args[0]) for c in listdir.call_args_list}
+    assert traverser.result.skipped_count == 0
+
+
+def test_concurrent_enumeration_matches_serial_walk(tmp_path: Path) -> None:
+    """scan_threads lists directories ahead of the walk without changing results."""
+    import threading
+    import time
+
+    for i in range(6):
+        for j in range(3):
+            (tmp_path / f"d{i}" / f"s{j}").mkdir(parents=True)
+            (tmp_path / f"d{i}" / f"s{j}" / "x.yaml").write_text("k: v\n")
+        (tmp_path / f"d{i}.yaml").write_text("k: v\n")
+    serial = list(DirectoryTraverser().iter_files(tmp_path))
+
+    traverser = DirectoryTraverser(scan_threads=3)
+    list_dir = traverser.fs_index.listdir
+    lock = threading.Lock()
+    active = peak = 0
+
+    def slow_listdir(directory: Path) -> Any:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return list_dir(directory)
+
+    with mock.patch.object(traverser.fs_index, "listdir", slow_listdir):
+        assert list(traverser.iter_files(tmp_path)) == serial
+    assert len(serial) == 24
+    assert 1 < peak <= 3 * traverser.MAX_LISTINGS_IN_FLIGHT_PER_THREAD
+
+
+def test_iter_files_shards_partition_the_tree(tmp_path: Path) -> None:
+    for i in range(20):
+        (tmp_path / f"pkg{i % 3}").mkdir(exist_ok=True)
+        (tmp_path / f"pkg{i % 3}" / f"f{i}.yaml").write_text("k: v\n")
+    traverser = DirectoryTraverser()
+    everything = list(traverser.iter_files(tmp_path))
+    shards = [list(traverser.iter_files(tmp_path, shard=(i, 3))) for i in range(3)]
+    assert sorted(f for shard in shards for f in shard) == everything
+    assert all(shard == sorted(shard) for shard in shards)
+    assert shards == [
+        list(traverser.iter_files(tmp_path, shard=(i, 3))) for i in range(3)
+    ]
+    with pytest.raises(OnexError):
+        traverser.iter_files(tmp_path, shard=(3, 3))
@@ -0,0 +1,158 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_filesystem_index.py
+# version: 1.0.0
+# uuid: ab301c8f-cae9-407b-90aa-160986f58198
+# author: OmniNode Team
+# created_at: 2026-10-16T23:42:13.058511
+# last_modified_at: 2026-10-17T01:14:34.757663
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: ec0346a8d711a4c5fc49dcd31af8c213e27b810e2d87dd353a879d28904e2c26
+# entrypoint: python@test_filesystem_index.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_filesystem_index
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the persistent directory-listing index behind the discovery sources.
+"""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+from omnibase.model.model_tree_sync_result import TreeSyncStatusEnum
+from omnibase.nodes.tree_generator_node.v1_0_0.helpers.tree_generator_engine import (
+    TreeGeneratorEngine,
+)
+from omnibase.utils.directory_traverser import DirectoryTraverser
+from omnibase.utils.filesystem_index import FileSystemIndex, shared_filesystem_index
+from omnibase.utils.tree_file_discovery_source import TreeFileDiscoverySource
+
+# Old enough that listings are never racy
+_PAST_NS = 1_000_000_000 * 10**9
+
+
+def _age(root: Path, offset_ns: int = 0) -> None:
+    """Move every directory's mtime into the past."""
+    for dir_path, _, _ in os.walk(root):
+        os.utime(dir_path, ns=(_PAST_NS, _PAST_NS + offset_ns))
+
+
+def _write_tree(root: Path) -> None:
+    for rel in ["a.yaml", "pkg/b.yaml", "pkg/deep/c.yaml", "other/d.yaml"]:
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text("k: v\n")
+    _age(root)
+
+
+def test_unchanged_directories_are_not_listed_again(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+    index = FileSystemIndex()
+    first = sorted(index.iter_files(tmp_path))
+    assert index.scandir_calls == 4
+
+    with mock.patch("os.scandir") as scandir:
+        assert sorted(index.iter_files(tmp_path)) == first
+    scandir.assert_not_called()
+
+    (tmp_path / "pkg" / "e.yaml").write_text("k: v\n")
+    _age(tmp_path / "pkg", offset_ns=1)
+    assert tmp_path / "pkg" / "e.yaml" in set(index.iter_files(tmp_path))
+    # Only pkg and pkg/deep changed mtime
+    assert index.scandir_calls == 6
+
+
+def test_racy_listing_is_not_trusted(tmp_path: Path) -> None:
+    (tmp_path / "a.yaml").write_text("k: v\n")
+    index = FileSystemIndex()
+    assert [e.name for e in index.listdir(tmp_path)] == ["a.yaml"]
+    # Written within the same mtime tick as the listing
+    mtime_ns = tmp_path.stat().st_mtime_ns
+    (tmp_path / "b.yaml").write_text("k: v\n")
+    os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    assert [e.name for e in index.listdir(tmp_path)] == ["a.yaml", "b.yaml"]
+    assert index.scandir_calls == 2
+
+
+def test_persisted_index_starts_warm_and_drops_removed_dirs(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    _write_tree(root)
+    index_path = tmp_path / "cache" / "onex_index.json"
+    index = FileSystemIndex(index_path)
+    expected = sorted(index.iter_files(root))
+    index.save()
+
+    warm = FileSystemIndex(index_path)
+    assert sorted(warm.iter_files(root)) == expected
+    assert warm.scandir_calls == 0
+
+    (root / "other" / "d.yaml").unlink()
+    (root / "other").rmdir()
+    _age(root, offset_ns=1)
+    assert root / "other" / "d.yaml" not in set(warm.iter_files(root))
+    warm.save()
+    assert str(root / "other") not in index_path.read_text()
+
+
+def test_discovery_sources_share_the_index(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+    assert DirectoryTraverser().fs_index is shared_filesystem_index()
+    index = FileSystemIndex()
+    files = DirectoryTraverser(fs_index=index).find_files(tmp_path, ["**/*.yaml"])
+    assert len(files) == 4
+    calls = index.scandir_calls
+
+    tree = TreeGeneratorEngine(fs_index=index).scan_directory_structure(tmp_path)
+    assert [c["name"] for c in tree["children"]] == ["a.yaml", "other", "pkg"]
+    tree_file = tmp_path / ".tree"
+    tree_file.write_text("type: directory\nname: ''\nchildren: []\n")
+    sync = TreeFileDiscoverySource(fs_index=index).validate_tree_sync(
+        tmp_path, tree_file
+    )
+    assert sync.status == TreeSyncStatusEnum.DRIFT
+    assert tree_file in sync.extra_files_on_disk
+    # Only the root changed (.tree was added)
+    assert index.scandir_calls == calls + 1
+
+
+def test_size_filter_sees_in_place_edits(tmp_path: Path) -> None:
+    (tmp_path / "a.yaml").write_text("k: v\n")
+    _age(tmp_path)
+    traverser = DirectoryTraverser(fs_index=FileSystemIndex())
+    summary = traverser.process_directory(
+        tmp_path, lambda path: None, max_file_size=1024
+    )
+    assert summary.metadata is not None and summary.metadata["processed"] == 1
+
+    # Growing a file does not change its directory's mtime
+    (tmp_path / "a.yaml").write_text("k: v\n" * 1024)
+    _age(tmp_path)
+    summary = traverser.process_directory(
+        tmp_path, lambda path: None, max_file_size=1024
+    )
+    assert summary.metadata is not None and summary.metadata["processed"] == 0
+    assert traverser.fs_index.scandir_calls == 1
+
+
+def test_least_recently_listed_directories_are_dropped(tmp_path: Path) -> None:
+    _write_tree(tmp_path)
+    index = FileSystemIndex(max_dirs=2)
+    index.listdir(tmp_path / "pkg")
+    index.listdir(tmp_path / "other")
+    index.listdir(tmp_path / "pkg")
+    index.listdir(tmp_path)
+    assert index.scandir_calls == 3
+
+    # other was least recently listed and has been dropped
+    index.listdir(tmp_path / "pkg")
+    index.listdir(tmp_path / "other")
+    assert index.scandir_calls == 4
@@ -0,0 +1,130 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_git_file_discovery_source.py
+# version: 1.0.0
+# uuid: a7e3ac9e-29ac-4e36-a846-e802e0e428f3
+# author: OmniNode Team
+# created_at: 2026-10-16T23:00:09.453594
+# last_modified_at: 2026-10-17T01:05:03.528112
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 7e21a6f3facaf1ae0b2e6caf6811b53258bdfa90f278ccfd09e040e7b6925d74
+# entrypoint: python@test_git_file_discovery_source.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_git_file_discovery_source
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for GitFileDiscoverySource (git-aware incremental discovery).
+Each test builds a throwaway git repository under tmp_path.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from omnibase.core.error_codes import OnexError
+from omnibase.utils.directory_traverser import DirectoryTraverser
+from omnibase.utils.git_file_discovery_source import GitFileDiscoverySource
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+
+INCLUDE = ["**/*.py", "**/*.yaml"]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    (tmp_path / ".onexignore").write_text("stamper:\n  patterns:\n    - 'generated/'\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "generated").mkdir()
+    for name in ("pkg/a.py", "pkg/b.py", "pkg/gone.py", "top.yaml"):
+        (tmp_path / name).write_text("x = 1\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def _rel(root: Path, files: set[Path]) -> list[str]:
+    return sorted(f.relative_to(root).as_posix() for f in files)
+
+
+def test_changed_since_applies_ignore_and_exclude_rules(repo: Path) -> None:
+    (repo / "pkg" / "a.py").write_text("x = 2\n")
+    (repo / "pkg" / "new.py").write_text("y = 1\n")
+    (repo / "pkg" / "skip_me.py").write_text("z = 1\n")
+    (repo / "pkg" / "notes.txt").write_text("not included\n")
+    (repo / "generated" / "out.py").write_text("ignored\n")
+    (repo / "pkg" / "gone.py").unlink()
+
+    source = GitFileDiscoverySource(since="HEAD")
+    assert _rel(repo, source.get_changed_files(repo)) == [
+        "generated/out.py",
+        "pkg/a.py",
+        "pkg/new.py",
+        "pkg/notes.txt",
+        "pkg/skip_me.py",
+    ]
+    discovered = source.discover_files(
+        repo,
+        include_patterns=INCLUDE,
+        exclude_patterns=["**/skip_*.py"],
+        ignore_file=repo / ".onexignore",
+    )
+    assert _rel(repo, discovered) == ["pkg/a.py", "pkg/new.py"]
+
+
+def test_staged_only_reports_index(repo: Path) -> None:
+    (repo / "pkg" / "a.py").write_text("x = 2\n")
+    (repo / "pkg" / "b.py").write_text("x = 3\n")
+    _git(repo, "add", "pkg/b.py")
+    source = GitFileDiscoverySource(staged=True)
+    assert _rel(repo, source.discover_files(repo, include_patterns=INCLUDE)) == [
+        "pkg/b.py"
+    ]
+
+
+def test_subdirectory_scope(repo: Path) -> None:
+    (repo / "pkg" / "a.py").write_text("x = 2\n")
+    (repo / "top.yaml").write_text("k: v\n")
+    source = GitFileDiscoverySource(since="HEAD")
+    discovered = source.discover_files(repo / "pkg", include_patterns=INCLUDE)
+    assert _rel(repo, discovered) == ["pkg/a.py"]
+
+
+def test_filter_files_matches_find_files(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    traverser = DirectoryTraverser()
+    all_files = [p for p in repo.rglob("*") if ".git" not in p.parts]
+    expected = traverser.find_files(repo, include_patterns=INCLUDE)
+    assert traverser.filter_files(repo, all_files, include_patterns=INCLUDE) == expected
+    # Relative candidates resolve against the working directory
+    monkeypatch.chdir(repo.parent)
+    relative = [p.relative_to(repo.parent) for p in all_files]
+    assert traverser.filter_files(
+        Path(repo.name), relative, include_patterns=INCLUDE
+    ) == {Path(repo.name) / p.relative_to(repo) for p in expected}
+
+
+def test_bad_ref_raises_onex_error(repo: Path) -> None:
+    with pytest.raises(OnexError):
+        GitFileDiscoverySource(since="no-such-ref").get_changed_files(repo)
@@ -0,0 +1,96 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_ignore_matcher.py
+# version: 1.0.0
+# uuid: 7c1a046d-a880-4ee4-ab8a-7428a333d5e3
+# author: OmniNode Team
+# created_at: 2026-10-16T23:35:11.213023
+# last_modified_at: 2026-10-17T01:05:03.530799
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: dc60a1a996b5f6fb018c6e7fb4d15d4946af3f29a5276bd6722f406daefc58b9
+# entrypoint: python@test_ignore_matcher.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_ignore_matcher
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the compiled ignore-pattern matcher used by DirectoryTraverser.
+"""
+
+import re
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from omnibase.utils import ignore_matcher
+from omnibase.utils.directory_traverser import DirectoryTraverser
+from omnibase.utils.ignore_matcher import IgnoreMatcher
+
+ROOT = Path("/repo")
+
+CASES = [
+    (["build/", "*.pyc"], "build/gen/x.py", True),
+    (["build/", "*.pyc"], "src/build/x.py", True),
+    (["build/", "*.pyc"], "src/cache.pyc", True),
+    (["build/", "*.pyc"], "src/builder.py", False),
+    (["/top/", "docs/*.md"], "top/a.py", True),
+    (["/top/", "docs/*.md"], "src/top/a.py", False),
+    (["/top/", "docs/*.md"], "docs/index.md", True),
+    (["/top/", "docs/*.md"], "docs/api/index.md", False),
+    (["*.py", "!keep.py"], "pkg/keep.py", False),
+    (["*.py", "!keep.py"], "pkg/drop.py", True),
+    ([], "anything.py", False),
+]
+
+
+@pytest.mark.parametrize("patterns,rel_path,ignored", CASES)
+def test_matches_gitignore_semantics(
+    patterns: List[str], rel_path: str, ignored: bool
+) -> None:
+    assert (
+        IgnoreMatcher.for_patterns(patterns).matches(ROOT / rel_path, ROOT) is ignored
+    )
+    assert (
+        DirectoryTraverser().should_ignore(ROOT / rel_path, patterns, ROOT) is ignored
+    )
+
+
+def test_matcher_is_compiled_once_and_ignored_dirs_short_circuit() -> None:
+    patterns = ["vendor/", "*.log"]
+    matcher = IgnoreMatcher.for_patterns(patterns)
+    assert IgnoreMatcher.for_patterns(list(patterns)) is matcher
+    assert matcher.is_ignored_dir("vendor") and matcher.is_ignored_dir("a/vendor/b")
+    assert not matcher.is_ignored_dir("src")
+
+    matcher = IgnoreMatcher(patterns)
+    assert matcher.matches(ROOT / "vendor" / "lib" / "a.py", ROOT)
+    # Once vendor/lib is known to be ignored, its files are not matched again
+    matcher._regex = matcher._dir_regex = re.compile("(?!)")
+    assert matcher.matches(ROOT / "vendor" / "lib" / "b.py", ROOT)
+
+
+def test_negation_disables_directory_pruning() -> None:
+    matcher = IgnoreMatcher.for_patterns(["vendor/", "!vendor/keep.py"])
+    assert not matcher.is_ignored_dir("vendor")
+    assert not matcher.matches(ROOT / "vendor" / "keep.py", ROOT)
+    assert matcher.matches(ROOT / "vendor" / "drop.py", ROOT)
+
+
+def test_fnmatch_fallback_without_pathspec(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ignore_matcher, "pathspec", None)
+    matcher = IgnoreMatcher(["build/", "*.pyc", "docs/*"])
+    assert matcher.is_ignored_dir("src/build")
+    assert matcher.matches(ROOT / "src" / "build" / "x.py", ROOT)
+    assert matcher.matches(ROOT / "deep" / "cache.pyc", ROOT)
+    # fnmatch '*' crosses '/', unlike gitignore
+    assert matcher.matches(ROOT / "docs" / "api" / "index.md", ROOT)
+    assert not matcher.matches(ROOT / "src" / "main.py", ROOT)
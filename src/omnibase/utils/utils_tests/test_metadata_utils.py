@@ -0,0 +1,113 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_metadata_utils.py
+# version: 1.0.0
+# uuid: 0c08fb15-6d17-4ba6-acda-d52f5bf2c267
+# author: OmniNode Team
+# created_at: 2026-10-17T00:14:07.929532
+# last_modified_at: 2026-10-17T01:05:03.533836
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 7488c5a43dd78d711dd3c94d6ac19cc9c9be471af09c533b8c040f68445a1813
+# entrypoint: python@test_metadata_utils.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_metadata_utils
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for metadata canonicalization for hashing: defaults and volatile-field
+masks are applied to the plain field dict and the model is validated once.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from omnibase.mixin.mixin_canonical_serialization import (
+    CanonicalYAMLSerializer,
+    canonical_field_schema,
+)
+from omnibase.model.model_node_metadata import NodeMetadataBlock
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_python import PythonHandler
+from omnibase.utils.metadata_utils import (
+    HASH_PLACEHOLDERS,
+    canonicalize_metadata_for_hash,
+    mask_volatile_fields,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
+def _reference(metadata: Dict[str, Any], volatile_fields: List[str]) -> str:
+    """Build, dump, mask and rebuild the model, then serialize it."""
+    entrypoint = metadata.get("entrypoint", {})
+    model = NodeMetadataBlock.create_with_defaults(
+        name=metadata.get("name", "unknown"),
+        author=metadata.get("author", "unknown"),
+        namespace=metadata.get("namespace", "onex.stamped.unknown"),
+        entrypoint_type=entrypoint.get("type", "python"),
+        entrypoint_target=entrypoint.get("target", "main.py"),
+        **{
+            k: v
+            for k, v in metadata.items()
+            if k not in ["name", "author", "namespace", "entrypoint"]
+        },
+    )
+    model_dict = model.model_dump()
+    for field in volatile_fields:
+        model_dict[field] = HASH_PLACEHOLDERS.get(field)
+    return PythonHandler().serialize_block(NodeMetadataBlock(**model_dict))
+
+
+def _stamped_metadata() -> Dict[str, Any]:
+    source = REPO_ROOT / "src" / "omnibase" / "utils" / "metadata_utils.py"
+    meta, _ = PythonHandler().extract_block(source, source.read_text())
+    assert isinstance(meta, NodeMetadataBlock)
+    return meta.model_dump()
+
+
+def test_mask_volatile_fields_copies_and_masks() -> None:
+    metadata = {"hash": "a" * 64, "last_modified_at": "now", "owner": "x", "k": 1}
+    masked = mask_volatile_fields(metadata, ["hash", "last_modified_at", "owner"])
+    assert masked == {
+        "hash": "0" * 64,
+        "last_modified_at": "1970-01-01T00:00:00Z",
+        "owner": None,
+        "k": 1,
+    }
+    assert metadata["hash"] == "a" * 64
+
+
+@pytest.mark.parametrize(
+    "volatile_fields",
+    [["hash", "last_modified_at"], ["hash"], [], ["last_modified_at", "license"]],
+)
+def test_single_construction_matches_rebuilt_model(volatile_fields: List[str]) -> None:
+    metadata = _stamped_metadata()
+    serialize = PythonHandler().serialize_block
+    assert canonicalize_metadata_for_hash(
+        metadata, volatile_fields, serialize
+    ) == _reference(metadata, volatile_fields)
+    partial = {k: v for k, v in metadata.items() if k not in ("author", "namespace")}
+    assert canonicalize_metadata_for_hash(
+        partial, volatile_fields, serialize
+    ) == _reference(partial, volatile_fields)
+
+
+def test_field_schema_is_computed_once_per_model() -> None:
+    schema = canonical_field_schema(NodeMetadataBlock)
+    assert canonical_field_schema(NodeMetadataBlock) is schema
+    assert {"description", "license", "owner"} <= schema.string_fields
+    block = _stamped_metadata()
+    block["license"] = None
+    canonical = CanonicalYAMLSerializer().canonicalize_metadata_block(block)
+    assert "\nlicense: ''\n" in canonical
+    assert f"\nhash: '{'0' * 64}'\n" in canonical
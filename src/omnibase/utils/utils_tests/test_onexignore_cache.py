@@ -0,0 +1,104 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_onexignore_cache.py
+# version: 1.0.0
+# uuid: 9f00bf18-0129-4a9d-b39a-ba622054907f
+# author: OmniNode Team
+# created_at: 2026-10-16T23:37:00.207401
+# last_modified_at: 2026-10-17T01:05:03.535991
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 7ceb7336b3ee3d18493b2d68273217c3c39730a2131eb199f31631af1c451f59
+# entrypoint: python@test_onexignore_cache.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_onexignore_cache
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the shared .onexignore cache behind DirectoryTraverser.load_ignore_patterns.
+"""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+from omnibase.utils import onexignore_cache
+from omnibase.utils.directory_traverser import DirectoryTraverser
+from omnibase.utils.onexignore_cache import OnexIgnoreCache, shared_onexignore_cache
+
+
+def _write_repo(root: Path) -> Path:
+    (root / ".git").mkdir(parents=True)
+    (root / ".onexignore").write_text(
+        "all:\n  patterns: ['*.tmp']\nstamper:\n  patterns: ['build/']\n"
+    )
+    child = root / "pkg" / "sub"
+    child.mkdir(parents=True)
+    (root / "pkg" / ".onexignore").write_text("stamper:\n  patterns: ['gen/']\n")
+    return child
+
+
+def test_patterns_are_parsed_once_and_merged_child_first(tmp_path: Path) -> None:
+    child = _write_repo(tmp_path)
+    cache = OnexIgnoreCache()
+    with mock.patch.object(
+        onexignore_cache, "yaml_safe_load", wraps=onexignore_cache.yaml_safe_load
+    ) as safe_load:
+        first = cache.patterns(child)
+        second = cache.patterns(child)
+        cache.patterns(tmp_path / "pkg")
+    assert first == second == ["gen/", "*.tmp", "build/"]
+    assert cache.patterns(child, tool="tree") == ["*.tmp"]
+    assert safe_load.call_count == 2
+
+
+def test_edits_and_new_files_invalidate(tmp_path: Path) -> None:
+    child = _write_repo(tmp_path)
+    cache = OnexIgnoreCache()
+    assert cache.patterns(child) == ["gen/", "*.tmp", "build/"]
+
+    pkg_ignore = tmp_path / "pkg" / ".onexignore"
+    pkg_ignore.write_text("stamper:\n  patterns: ['generated/']\n")
+    st = pkg_ignore.stat()
+    os.utime(pkg_ignore, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.patterns(child)[0] == "generated/"
+
+    (child / ".onexignore").write_text("stamper:\n  patterns: ['*.bak']\n")
+    assert cache.patterns(child)[:2] == ["*.bak", "generated/"]
+    (child / ".onexignore").unlink()
+    assert cache.patterns(child)[0] == "generated/"
+
+
+def test_traversers_share_the_process_cache(tmp_path: Path) -> None:
+    child = _write_repo(tmp_path)
+    assert DirectoryTraverser().ignore_cache is shared_onexignore_cache()
+    assert DirectoryTraverser().load_ignore_patterns(child) == [
+        "gen/",
+        "*.tmp",
+        "build/",
+    ]
+    with mock.patch.object(onexignore_cache, "_parse_sections") as parse:
+        assert DirectoryTraverser().load_ignore_patterns(child / "x.py") == [
+            "gen/",
+            "*.tmp",
+            "build/",
+        ]
+    parse.assert_not_called()
+
+
+def test_persisted_cache_starts_warm(tmp_path: Path) -> None:
+    child = _write_repo(tmp_path / "repo")
+    cache_path = tmp_path / "cache" / "onexignore.json"
+    expected = OnexIgnoreCache(cache_path).patterns(child)
+    assert cache_path.exists()
+
+    with mock.patch.object(onexignore_cache, "_parse_sections") as parse:
+        assert OnexIgnoreCache(cache_path).patterns(child) == expected
+    parse.assert_not_called()
@@ -0,0 +1,102 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_path_classifier.py
+# version: 1.0.0
+# uuid: e364d982-4a83-4536-9266-e64ff1314b40
+# author: OmniNode Team
+# created_at: 2026-10-16T23:48:01.397835
+# last_modified_at: 2026-10-17T01:05:03.537224
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 58ac136cee451b3dc26f64be77405c098aee3b92dca69f9d3b4153654187b54a
+# entrypoint: python@test_path_classifier.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_path_classifier
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for batch path classification (PathClassifier, FileTypeHandlerRegistry.group_by_handler).
+"""
+
+from pathlib import Path
+
+from omnibase.core.core_file_type_handler_registry import FileTypeHandlerRegistry
+from omnibase.utils.directory_traverser import SchemaExclusionRegistry
+from omnibase.utils.ignore_matcher import IgnoreMatcher
+from omnibase.utils.path_classifier import PathClassifier
+
+ROOT = Path("/repo")
+PATHS = [
+    ROOT / rel
+    for rel in [
+        "src/a.py",
+        "src/B.PY",
+        "docs/index.md",
+        "nodes/node.yaml",
+        "nodes/node.yml",
+        "src/.onexignore",
+        "build/gen.py",
+        "src/schemas/x.yaml",
+        "src/tree_format.yaml",
+        "src/thing_schema.json",
+        "Makefile",
+        "src/archive.tar.gz",
+        "src/trailing.",
+    ]
+]
+IGNORE = ["build/"]
+
+
+def _registry() -> FileTypeHandlerRegistry:
+    registry = FileTypeHandlerRegistry()
+    registry.register_all_handlers()
+    return registry
+
+
+def test_classify_matches_per_path_decisions() -> None:
+    registry = _registry()
+    schema_registry = SchemaExclusionRegistry()
+    result = PathClassifier(registry, schema_registry, IGNORE, ROOT).classify(PATHS)
+
+    matcher = IgnoreMatcher(IGNORE)
+    expected_ignored = {p for p in PATHS if matcher.matches(p, ROOT)}
+    expected_excluded = {
+        p
+        for p in PATHS
+        if p not in expected_ignored and schema_registry.is_schema_file(p)
+    }
+    rest = [p for p in PATHS if p not in expected_ignored | expected_excluded]
+    assert set(result.ignored) == expected_ignored == {ROOT / "build/gen.py"}
+    assert set(result.excluded) == expected_excluded
+    assert len(expected_excluded) == 3
+    assert set(result.unhandled) == {p for p in rest if registry.get_handler(p) is None}
+    for handler, paths in result.batches:
+        assert all(registry.get_handler(p) is handler for p in paths)
+    handled = [p for _, paths in result.batches for p in paths]
+    assert sorted(handled) == sorted(p for p in rest if p not in result.unhandled)
+    assert result.ignored[ROOT / "build/gen.py"] == "ignored by pattern"
+
+
+def test_batches_group_by_handler_in_first_seen_order() -> None:
+    result = PathClassifier(_registry(), root_dir=ROOT).classify(PATHS)
+    by_name = result.by_handler_name()
+    python_paths = [p for p in by_name.values() if ROOT / "src/a.py" in p][0]
+    assert python_paths == [ROOT / "src/a.py", ROOT / "src/B.PY", ROOT / "build/gen.py"]
+    assert result.batches[0][1][0] == ROOT / "src/a.py"
+    assert ROOT / "src/archive.tar.gz" in result.unhandled
+    assert ROOT / "src/trailing." in result.unhandled
+
+
+def test_group_by_handler_tracks_unhandled_types() -> None:
+    registry = _registry()
+    _, unhandled = registry.group_by_handler([ROOT / "x.gz", ROOT / "Makefile"])
+    assert unhandled == [ROOT / "x.gz", ROOT / "Makefile"]
+    assert registry._unhandled_extensions == {".gz"}
+    assert "makefile" in registry._unhandled_specials
@@ -0,0 +1,157 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: test_yaml_backend.py
+# version: 1.0.0
+# uuid: 4ac732ef-6c65-4cff-81ce-842c1cd50112
+# author: OmniNode Team
+# created_at: 2026-10-17T00:09:01.490961
+# last_modified_at: 2026-10-17T01:05:03.538575
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 50ebd3f34da0e0e0327e5bd31cdf32d30932884e96e9b8284affa7e8657bf037
+# entrypoint: python@test_yaml_backend.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.test_yaml_backend
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+Tests for the YAML backend layer: loads and canonical dumps must not depend on
+whether libyaml is used.
+"""
+
+import random
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+
+from omnibase.core.error_codes import OnexError
+from omnibase.mixin.mixin_canonical_serialization import CanonicalYAMLSerializer
+from omnibase.runtimes.onex_runtime.v1_0_0.handlers.handler_python import PythonHandler
+from omnibase.utils import yaml_backend
+from omnibase.utils.yaml_backend import (
+    LIBYAML,
+    PYTHON,
+    block_scalar,
+    set_yaml_backend,
+    yaml_dump,
+    yaml_safe_dump,
+    yaml_safe_load,
+    yaml_stats,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+requires_libyaml = pytest.mark.skipif(
+    not yaml_backend.HAS_LIBYAML, reason="PyYAML built without libyaml"
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_backend() -> Iterator[None]:
+    backend = yaml_backend.get_yaml_backend()
+    yield
+    set_yaml_backend(backend)
+
+
+def _on_both(fn: Callable[[], Any]) -> List[Any]:
+    results = []
+    for backend in (PYTHON, LIBYAML):
+        set_yaml_backend(backend)
+        results.append(fn())
+    return results
+
+
+def _random_strings(count: int) -> List[str]:
+    rnd = random.Random(0)
+    chars = "ab :#'\"-\n\t\\{}[],&*!|>%@`~?=<09.eE+_\x85 é日\U0001f600"
+    return [
+        "".join(rnd.choice(chars) for _ in range(rnd.randint(0, 12)))
+        * rnd.choice([1, 1, 1, 10])
+        for _ in range(count)
+    ]
+
+
+@requires_libyaml
+def test_loads_are_identical_across_backends() -> None:
+    texts = [p.read_text() for p in sorted((REPO_ROOT / "src").rglob("*.yaml"))]
+    texts.append("a: 1\n\ufeffb: 2\n")
+    for text in texts:
+        python, libyaml = _on_both(lambda: yaml_safe_load(text))
+        assert python == libyaml
+
+
+@requires_libyaml
+def test_canonical_dumps_are_byte_identical_across_backends() -> None:
+    source = REPO_ROOT / "src" / "omnibase" / "utils" / "yaml_backend.py"
+    meta, _ = PythonHandler().extract_block(source, source.read_text())
+    assert meta is not None
+    serializer = CanonicalYAMLSerializer()
+    python, libyaml = _on_both(lambda: serializer.canonicalize_metadata_block(meta))
+    assert python == libyaml
+
+    options: List[Dict[str, Any]] = [
+        {},
+        {"sort_keys": False, "default_flow_style": False},
+        {"sort_keys": True, "allow_unicode": True, "explicit_start": True},
+        {"width": 20},
+    ]
+    for value in _random_strings(200):
+        data = {"k": value, "l": [value, {"n": value, "i": 1, "f": 0.5, "z": None}]}
+        for kwargs in options:
+            for dump in (yaml_dump, yaml_safe_dump):
+                python, libyaml = _on_both(lambda: dump(data, **kwargs))
+                assert python == libyaml, (value, kwargs)
+
+
+def test_block_scalar_matches_safe_dump() -> None:
+    rnd = random.Random(1)
+    pieces = list("abZ09 :#-.,_/@!&*?|>%=~()<>;^$+") + [
+        "true",
+        "null",
+        "1.0",
+        "1e3",
+        "2020-01-01T10:00:00",
+        "0o7",
+        "1_000",
+        "1:20",
+        ".inf",
+        "...",
+        "<<",
+    ]
+    values = [
+        "".join(rnd.choice(pieces) for _ in range(rnd.choice([1, 2, 4, 10, 40])))
+        for _ in range(3000)
+    ]
+    accepted = 0
+    for value in values + [""]:
+        key = "k" * rnd.choice([1, 10, 30])
+        text = block_scalar(value, len(key) + 2)
+        if text is None:
+            continue
+        accepted += 1
+        for dumped in _on_both(
+            lambda: yaml_safe_dump({key: value}, default_flow_style=False)
+        ):
+            assert f"{key}: {text}\n" == dumped, value
+    assert accepted > 500
+
+
+def test_stats_count_loads_and_dumps() -> None:
+    stats = yaml_stats()
+    stats.reset()
+    yaml_safe_dump(yaml_safe_load("a: [1, 2]\n"))
+    counters = stats.as_dict()
+    assert counters["parse_calls"] == 1 and counters["dump_calls"] == 1
+    assert counters["parse_seconds"] > 0 and counters["dump_seconds"] > 0
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(OnexError):
+        set_yaml_backend("ruamel")
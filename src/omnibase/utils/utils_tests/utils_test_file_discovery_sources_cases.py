@@ -9,11 +9,11 @@
 # uuid: d020480f-07aa-4b51-9d1b-e608da184444
 # author: OmniNode Team
 # created_at: 2025-05-21T12:41:40.173091
-# last_modified_at: 2025-05-21T16:42:46.070637
+# last_modified_at: 2026-10-17T01:05:03.540266
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: f128935775741b5993a1e7106c8f7a059b401583a0d058ffc14b64d15e14dc69
+# hash: 8e3b32e664ad9dc29846e43e9682f268f616bdd880473492010e55c1bc213ec1
 # entrypoint: python@utils_test_file_discovery_sources_cases.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.utils_test_file_discovery_sources_cases
@@ -170,3 +170,46 @@ class HybridStrictDriftCase:
 
         with pytest.raises(OnexError):
             discovery_source.discover_files(tmp_path)
+
+
+@register_file_discovery_test_case("iter_files_max_files")
+class IterFilesMaxFilesCase:
+    supported_sources: list[str] = ["filesystem", "tree", "hybrid_warn"]
+    """
+    Test case: iter_files yields discover_files' result in sorted order and stops at max_files.
+    """
+
+    def setup(self, tmp_path: Path) -> Path:
+        (tmp_path / "sub").mkdir()
+        for name in ["a.yaml", "b.json", "sub/c.yaml", "z.yaml"]:
+            (tmp_path / name).write_text("foo: 1")
+        tree_data = {
+            "type": "directory",
+            "name": "",
+            "children": [
+                {"type": "file", "name": "a.yaml"},
+                {"type": "file", "name": "b.json"},
+                {
+                    "type": "directory",
+                    "name": "sub",
+                    "children": [{"type": "file", "name": "c.yaml"}],
+                },
+                {"type": "file", "name": "z.yaml"},
+            ],
+        }
+        import yaml
+
+        (tmp_path / ".tree").write_text(yaml.safe_dump(tree_data))
+        return tmp_path
+
+    def run(self, discovery_source: Any, tmp_path: Path) -> None:
+        found = list(discovery_source.iter_files(tmp_path))
+        assert found == sorted(discovery_source.discover_files(tmp_path))
+        assert [p.relative_to(tmp_path).as_posix() for p in found] == [
+            "a.yaml",
+            "b.json",
+            "sub/c.yaml",
+            "z.yaml",
+        ]
+        assert list(discovery_source.iter_files(tmp_path, max_files=2)) == found[:2]
+        assert list(discovery_source.iter_files(tmp_path, max_files=0)) == []
@@ -0,0 +1,282 @@
+# === OmniNode:Metadata ===
+# metadata_version: 0.1.0
+# protocol_version: 1.1.0
+# owner: OmniNode Team
+# copyright: OmniNode Team
+# schema_version: 1.1.0
+# name: yaml_backend.py
+# version: 1.0.0
+# uuid: 66dd21a8-6d9c-40fb-95bd-dc3929628799
+# author: OmniNode Team
+# created_at: 2026-10-17T00:07:27.903416
+# last_modified_at: 2026-10-17T01:05:03.542093
+# description: Stamped by PythonHandler
+# state_contract: state_contract://default
+# lifecycle: active
+# hash: 6d0254a901f07336371fe4fcf4c10338311a0f94916bb859f8a08473f7f788a1
+# entrypoint: python@yaml_backend.py
+# runtime_language_hint: python>=3.11
+# namespace: onex.stamped.yaml_backend
+# meta_type: tool
+# === /OmniNode:Metadata ===
+
+
+"""
+YAML loading and dumping for omnibase.
+
+Every YAML load and dump goes through this module, so the backend is chosen in
+one place. When PyYAML is built with libyaml, loads use CSafeLoader and dumps
+use the libyaml emitter (CSafeDumper/CDumper). Otherwise the pure-Python
+SafeLoader/SafeDumper/Dumper are used. set_yaml_backend("python") forces the
+pure-Python classes.
+
+Results never depend on the backend:
+- Both loaders build objects with the same Python constructors. libyaml
+  rejects a byte order mark anywhere but the start of the stream, so such
+  input is loaded with SafeLoader.
+- The two emitters quote, escape and fold some strings differently (line
+  breaks, tabs, non-ASCII text). Data goes to the libyaml emitter only when
+  every string in it is printable ASCII and the options are ones both
+  emitters agree on; anything else is dumped by the pure-Python emitter.
+  Canonical YAML, and the hashes computed from it, are therefore
+  byte-identical with or without libyaml.
+
+yaml_stats() counts the calls and the time spent loading and dumping.
+
+block_scalar() predicts, without running an emitter, how safe_dump writes a
+simple string value, so flat mappings can be emitted by string assembly.
+"""
+
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import IO, Any, Dict, Optional, Type, overload
+
+import yaml
+
+from omnibase.core.error_codes import CoreErrorCode, OnexError
+
+LIBYAML = "libyaml"
+PYTHON = "python"
+HAS_LIBYAML = bool(getattr(yaml, "__with_libyaml__", False))
+
+# Dump options the two emitters produce identical output for
+_NEUTRAL_DUMP_OPTIONS = frozenset(
+    {"sort_keys", "allow_unicode", "explicit_start", "explicit_end"}
+)
+_SCALAR_TYPES = (bool, int, float)
+
+# Printable ASCII strings no YAML indicator can start and no line break,
+# quote or backslash can appear in. Indicators that only matter inside
+# (": ", " #", a trailing ":") are checked separately.
+_BLOCK_PLAIN_CANDIDATE = re.compile(
+    r"[A-Za-z0-9_(/][A-Za-z0-9 _./:@+=()<>,;~^$%&*!?|-]*"
+)
+# Emitter line width: plain and quoted scalars may be folded at a space past it
+_BEST_WIDTH = 80
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolver = yaml.resolver.Resolver()
+
+
+class YamlStats:
+    """Calls and seconds spent in YAML loads and dumps."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.parse_calls = 0
+        self.parse_seconds = 0.0
+        self.dump_calls = 0
+        self.dump_seconds = 0.0
+
+    def add_parse(self, seconds: float) -> None:
+        with self._lock:
+            self.parse_calls += 1
+            self.parse_seconds += seconds
+
+    def add_dump(self, seconds: float) -> None:
+        with self._lock:
+            self.dump_calls += 1
+            self.dump_seconds += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self.parse_calls = 0
+            self.parse_seconds = 0.0
+            self.dump_calls = 0
+            self.dump_seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": _backend,
+                "parse_calls": self.parse_calls,
+                "parse_seconds": self.parse_seconds,
+                "dump_calls": self.dump_calls,
+                "dump_seconds": self.dump_seconds,
+            }
+
+
+_stats = YamlStats()
+_backend = PYTHON
+_safe_loader: Type[Any] = yaml.SafeLoader
+_safe_dumper: Type[Any] = yaml.SafeDumper
+_dumper: Type[Any] = yaml.Dumper
+
+
+def set_yaml_backend(backend: str) -> None:
+    """Use the libyaml or the pure-Python loader and dumpers from now on."""
+    global _backend, _safe_loader, _safe_dumper, _dumper
+    if backend == LIBYAML:
+        if not HAS_LIBYAML:
+            raise OnexError(
+                "PyYAML was built without libyaml",
+                CoreErrorCode.DEPENDENCY_UNAVAILABLE,
+            )
+        _safe_loader, _safe_dumper, _dumper = (
+            yaml.CSafeLoader,
+            yaml.CSafeDumper,
+            yaml.CDumper,
+        )
+    elif backend == PYTHON:
+        _safe_loader, _safe_dumper, _dumper = (
+            yaml.SafeLoader,
+            yaml.SafeDumper,
+            yaml.Dumper,
+        )
+    else:
+        raise OnexError(
+            f"Unknown YAML backend: {backend}", CoreErrorCode.INVALID_PARAMETER
+        )
+    _backend = backend
+
+
+def get_yaml_backend() -> str:
+    return _backend
+
+
+def yaml_stats() -> YamlStats:
+    """The process-wide YAML counters."""
+    return _stats
+
+
+def _has_inner_bom(data: Any) -> bool:
+    if isinstance(data, str):
+        return "\ufeff" in data[1:]
+    if isinstance(data, bytes):
+        return b"\xef\xbb\xbf" in data[1:]
+    return False
+
+
+def _is_plain_ascii(data: Any) -> bool:
+    """
+    Whether data is built only from dicts, lists, printable ASCII strings and
+    bool/int/float/None, with no container appearing twice.
+    """
+    stack = [data]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is str:
+            if not (item.isascii() and item.isprintable()):
+                return False
+        elif kind is dict or kind is list:
+            if id(item) in seen:
+                return False
+            seen.add(id(item))
+            if kind is dict:
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            else:
+                stack.extend(item)
+        elif item is not None and kind not in _SCALAR_TYPES:
+            return False
+    return True
+
+
+def _emitter_neutral(data: Any, kwargs: Dict[str, Any]) -> bool:
+    options = set(kwargs)
+    if kwargs.get("default_flow_style") is False:
+        options.discard("default_flow_style")
+    return options <= _NEUTRAL_DUMP_OPTIONS and _is_plain_ascii(data)
+
+
+def yaml_safe_load(stream: Any) -> Any:
+    """yaml.safe_load on the selected backend. stream may be a str, bytes or file."""
+    start = time.perf_counter()
+    try:
+        if hasattr(stream, "read"):
+            stream = stream.read()
+        loader = _safe_loader
+        if loader is not yaml.SafeLoader and _has_inner_bom(stream):
+            loader = yaml.SafeLoader
+        return yaml.load(stream, Loader=loader)
+    finally:
+        _stats.add_parse(time.perf_counter() - start)
+
+
+def _dump(
+    data: Any, stream: Any, dumper: Type[Any], fallback: Type[Any], **kwargs: Any
+) -> Any:
+    start = time.perf_counter()
+    try:
+        if dumper is not fallback and not _emitter_neutral(data, kwargs):
+            dumper = fallback
+        return yaml.dump(data, stream, Dumper=dumper, **kwargs)
+    finally:
+        _stats.add_dump(time.perf_counter() - start)
+
+
+@overload
+def yaml_safe_dump(data: Any, stream: None = None, **kwargs: Any) -> str: ...
+
+
+@overload
+def yaml_safe_dump(data: Any, stream: IO[str], **kwargs: Any) -> None: ...
+
+
+def yaml_safe_dump(data: Any, stream: Optional[IO[str]] = None, **kwargs: Any) -> Any:
+    """yaml.safe_dump on the selected backend."""
+    return _dump(data, stream, _safe_dumper, yaml.SafeDumper, **kwargs)
+
+
+@overload
+def yaml_dump(data: Any, stream: None = None, **kwargs: Any) -> str: ...
+
+
+@overload
+def yaml_dump(data: Any, stream: IO[str], **kwargs: Any) -> None: ...
+
+
+def yaml_dump(data: Any, stream: Optional[IO[str]] = None, **kwargs: Any) -> Any:
+    """yaml.dump (full representer) on the selected backend."""
+    return _dump(data, stream, _dumper, yaml.Dumper, **kwargs)
+
+
+@lru_cache(maxsize=4096)
+def block_scalar(value: str, column: int) -> Optional[str]:
+    """
+    The text yaml_safe_dump writes for the string value of a block mapping
+    entry that starts at column (the length of "key: "), or None when it may
+    need escaping, double quotes or folding. Plain text that would load back
+    as another type (timestamps, numbers, booleans) is single-quoted.
+    Both emitters agree on every string this accepts.
+    """
+    if not value:
+        return "''"
+    if (
+        _BLOCK_PLAIN_CANDIDATE.fullmatch(value) is None
+        or value.endswith((" ", ":"))
+        or ": " in value
+        or " #" in value
+        or (" " in value and column + len(value) + 2 > _BEST_WIDTH)
+    ):
+        return None
+    if _resolver.resolve(yaml.ScalarNode, value, (True, False)) == _STR_TAG:
+        return value
+    return f"'{value}'"
+
+
+if HAS_LIBYAML:
+    set_yaml_backend(LIBYAML)
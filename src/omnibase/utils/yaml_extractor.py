@@ -9,11 +9,11 @@
 # uuid: a8fec6df-2244-43cd-88ee-a7360a0403f8
 # author: OmniNode Team
 # created_at: 2025-05-21T12:41:40.169899
-# last_modified_at: 2025-05-21T16:42:46.044379
+# last_modified_at: 2026-10-17T01:05:03.544506
 # description: Stamped by PythonHandler
 # state_contract: state_contract://default
 # lifecycle: active
-# hash: 772a66a47311e9da78797cfdde5eef56e64424c6e4fa0ba5e2a834e0605f1d34
+# hash: fdaac8b54728b5df41434a20b64a35319128437bcbca227186dafedd3a3fa670
 # entrypoint: python@yaml_extractor.py
 # runtime_language_hint: python>=3.11
 # namespace: onex.stamped.yaml_extractor
@@ -24,9 +24,8 @@
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from omnibase.exceptions import OmniBaseError
+from omnibase.utils.yaml_backend import yaml_safe_load
 
 
 def extract_example_from_schema(
@@ -39,7 +38,7 @@ def extract_example_from_schema(
     """
     try:
         with schema_path.open("r") as f:
-            data = yaml.safe_load(f)
+            data = yaml_safe_load(f)
         examples = data.get("examples")
         if not examples or not isinstance(examples, list):
             raise OmniBaseError(f"No 'examples' section found in schema: {schema_path}")